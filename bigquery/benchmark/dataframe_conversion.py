@@ -0,0 +1,135 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the conversions of BigQuery Storage API pages to a DataFrame.
+
+The benchmark builds Arrow record batches like the pages of a BigQuery
+Storage API read session, without calling the API, and converts them to a
+single DataFrame either page by page followed by ``pandas.concat`` (the
+previous ``RowIterator.to_dataframe`` behavior), or with one
+``pyarrow.Table.to_pandas`` call. Each conversion runs in its own process, and
+the benchmark reports its time and the peak memory of the process.
+
+Usage:
+
+  $ python benchmark/dataframe_conversion.py --rows 10000000 100000000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+import numpy
+import pandas
+import pyarrow
+
+from google.cloud.bigquery import _pandas_helpers
+
+
+def parse_options():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10000000],
+        help="The numbers of rows of the simulated tables.",
+    )
+    parser.add_argument(
+        "--page-rows",
+        type=int,
+        default=100000,
+        help="The number of rows per page of the read session.",
+    )
+    return parser.parse_args()
+
+
+def make_record_batches(num_rows, page_rows):
+    """Return pages with an INT64, a FLOAT64 and a TIMESTAMP column."""
+    record_batches = []
+    for start in range(0, num_rows, page_rows):
+        size = min(page_rows, num_rows - start)
+        values = numpy.arange(start, start + size, dtype="int64")
+        record_batches.append(
+            pyarrow.RecordBatch.from_arrays(
+                [
+                    pyarrow.array(values),
+                    pyarrow.array(values.astype("float64")),
+                    pyarrow.array(values, type=pyarrow.timestamp("us", tz="UTC")),
+                ],
+                names=["int_col", "float_col", "ts_col"],
+            )
+        )
+    return record_batches
+
+
+def concat_frames(record_batches, column_names):
+    frames = [record_batch.to_pandas()[column_names] for record_batch in record_batches]
+    del record_batches[:]
+    return pandas.concat(frames, ignore_index=True)
+
+
+def single_conversion(record_batches, column_names):
+    return _pandas_helpers.record_batches_to_dataframe(record_batches, column_names, {})
+
+
+def max_rss_mb():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    if sys.platform == "darwin":
+        max_rss /= 1024
+    return max_rss / 1024.0
+
+
+def run(convert, num_rows, page_rows, results):
+    record_batches = make_record_batches(num_rows, page_rows)
+    column_names = ["int_col", "float_col", "ts_col"]
+    baseline_mb = max_rss_mb()
+
+    start = time.perf_counter()
+    dataframe = convert(record_batches, column_names)
+    elapsed = time.perf_counter() - start
+
+    assert len(dataframe) == num_rows
+    results.put((elapsed, baseline_mb, max_rss_mb()))
+
+
+def main():
+    options = parse_options()
+    conversions = [
+        ("per page + concat", concat_frames),
+        ("single to_pandas", single_conversion),
+    ]
+
+    for num_rows in options.rows:
+        for name, convert in conversions:
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=run, args=(convert, num_rows, options.page_rows, results)
+            )
+            process.start()
+            elapsed, baseline_mb, peak_mb = results.get()
+            process.join()
+            print(
+                "{:>11} rows {:<18} {:>7.2f} s, peak memory {:>8.0f} MB "
+                "({:>8.0f} MB above the record batches)".format(
+                    num_rows, name, elapsed, peak_mb, peak_mb - baseline_mb
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
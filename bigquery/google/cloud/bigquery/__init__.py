@@ -32,6 +32,7 @@ from pkg_resources import get_distribution
 
 __version__ = get_distribution("google-cloud-bigquery").version
 
+from google.cloud.bigquery.async_client import AsyncClient
 from google.cloud.bigquery.client import Client
 from google.cloud.bigquery.dataset import AccessEntry
 from google.cloud.bigquery.dataset import Dataset
@@ -68,6 +69,7 @@ from google.cloud.bigquery.query import ArrayQueryParameter
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
+from google.cloud.bigquery.query_cache import QueryCache
 from google.cloud.bigquery.retry import DEFAULT_RETRY
 from google.cloud.bigquery.routine import Routine
 from google.cloud.bigquery.routine import RoutineArgument
@@ -80,14 +82,18 @@ from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import TimePartitioningType
 from google.cloud.bigquery.table import TimePartitioning
+from google.cloud.bigquery.writer import InsertRowError
+from google.cloud.bigquery.writer import StreamingInsertWriter
 from google.cloud.bigquery.encryption_configuration import EncryptionConfiguration
 
 __all__ = [
     "__version__",
+    "AsyncClient",
     "Client",
     # Queries
     "QueryJob",
     "QueryJobConfig",
+    "QueryCache",
     "ArrayQueryParameter",
     "ScalarQueryParameter",
     "StructQueryParameter",
@@ -103,6 +109,8 @@ __all__ = [
     "Row",
     "TimePartitioning",
     "TimePartitioningType",
+    "StreamingInsertWriter",
+    "InsertRowError",
     # Jobs
     "CopyJob",
     "CopyJobConfig",
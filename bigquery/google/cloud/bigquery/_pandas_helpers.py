@@ -15,10 +15,14 @@
 """Shared helper functions for connecting BigQuery and pandas."""
 
 import concurrent.futures
+import datetime
 import functools
 import logging
+import os
+import time
 import warnings
 
+import pkg_resources
 from six.moves import queue
 
 try:
@@ -31,12 +35,18 @@ try:
 except ImportError:  # pragma: NO COVER
     pandas = None
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
 try:
     import pyarrow
     import pyarrow.parquet
 except ImportError:  # pragma: NO COVER
     pyarrow = None
 
+from google.cloud.bigquery import _helpers
 from google.cloud.bigquery import schema
 
 
@@ -49,6 +59,26 @@ _NO_BQSTORAGE_ERROR = (
 
 _PROGRESS_INTERVAL = 0.2  # Maximum time between download status checks, in seconds.
 
+_MAX_QUEUE_SIZE_DEFAULT = object()  # Max queue size sentinel for BQ Storage downloads.
+
+# Approximate in-memory size of the dataframe rows encoded at once when
+# streaming a dataframe as Parquet.
+_PARQUET_ROW_GROUP_BYTES = 16 * 1024 * 1024
+
+# Number of rows whose deep in-memory size is measured to estimate the size of
+# all rows, because measuring object columns means visiting every value.
+_PARQUET_ROW_SAMPLE_SIZE = 1000
+
+# Options of pyarrow.Table.to_pandas to avoid holding both the Arrow and the
+# pandas copies of a large table in memory. self_destruct was added in pyarrow
+# 0.17.0. split_blocks is not used: it lets pyarrow convert the columns of a
+# single record batch without copying them, into read-only arrays.
+_ARROW_TO_PANDAS_KWARGS = {}
+if pyarrow is not None:
+    _PYARROW_VERSION = pkg_resources.parse_version(pyarrow.__version__)
+    if _PYARROW_VERSION >= pkg_resources.parse_version("0.17.0"):
+        _ARROW_TO_PANDAS_KWARGS["self_destruct"] = True
+
 _PANDAS_DTYPE_TO_BQ = {
     "bool": "BOOLEAN",
     "datetime64[ns, UTC]": "TIMESTAMP",
@@ -486,7 +516,316 @@ def dataframe_to_parquet(dataframe, bq_schema, filepath, parquet_compression="SN
     pyarrow.parquet.write_table(arrow_table, filepath, compression=parquet_compression)
 
 
-def _tabledata_list_page_to_arrow(page, column_names, arrow_types):
+class _BytesSink(object):
+    """Writable file-like object appending the bytes to a ``bytearray``."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self.closed = False
+
+    def write(self, data):
+        self._buffer.extend(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _estimate_row_bytes(dataframe):
+    """Estimate the average in-memory size of a dataframe row, in bytes.
+
+    The values of object columns, such as strings, are included in the size,
+    measured on evenly spaced rows of the dataframe.
+    """
+    if not len(dataframe):
+        return 0
+    step = max(len(dataframe) // _PARQUET_ROW_SAMPLE_SIZE, 1)
+    sample = dataframe.iloc[::step]
+    return sample.memory_usage(index=True, deep=True).sum() / len(sample)
+
+
+class ParquetStream(object):
+    """Readable file-like object encoding a dataframe as Parquet on demand.
+
+    The dataframe is converted to Arrow and encoded one row group at a time,
+    when the bytes are read, so that at most one encoded row group and the
+    last chunk read are held in memory. The stream can only seek back within
+    the last chunk read, which is enough to recover a resumable upload.
+
+    Args:
+        dataframe (pandas.DataFrame):
+            DataFrame to convert to Parquet.
+        bq_schema (Sequence[Union[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            Mapping[str, Any] \
+        ]]):
+            Desired BigQuery schema. Number of columns must match number of
+            columns in the DataFrame.
+        parquet_compression (str):
+            (optional) The compression codec used by the
+            ``pyarrow.parquet.ParquetWriter``. Defaults to "SNAPPY".
+        row_group_size (int):
+            (optional) The number of rows per row group. By default, row
+            groups of about :data:`_PARQUET_ROW_GROUP_BYTES` bytes in memory
+            are written.
+    """
+
+    def __init__(
+        self, dataframe, bq_schema, parquet_compression="SNAPPY", row_group_size=None
+    ):
+        if pyarrow is None:
+            raise ValueError("pyarrow is required for BigQuery schema conversion.")
+
+        if row_group_size is None:
+            row_bytes = _estimate_row_bytes(dataframe)
+            row_group_size = int(_PARQUET_ROW_GROUP_BYTES // max(row_bytes, 1))
+
+        self._dataframe = dataframe
+        self._bq_schema = schema._to_schema_fields(bq_schema)
+        self._parquet_compression = parquet_compression
+        self._row_group_size = max(row_group_size, 1)
+        self._next_row = 0
+        self._writer = None
+        self._finished = False
+
+        self._buffer = bytearray()  # Encoded bytes not read yet.
+        self._last_read = b""  # The last chunk read, to seek back into.
+        self._position = 0
+
+    def _encode_row_group(self):
+        """Append the next row group, or the file footer, to the buffer."""
+        start = self._next_row
+        if start >= len(self._dataframe):
+            if self._writer is None:  # Empty dataframe, write the schema.
+                self._open_writer(dataframe_to_arrow(self._dataframe, self._bq_schema))
+            self._writer.close()
+            self._finished = True
+            return
+
+        self._next_row = start + self._row_group_size
+        row_group = self._dataframe.iloc[start : self._next_row]
+        arrow_table = dataframe_to_arrow(row_group, self._bq_schema)
+        if self._writer is None:
+            self._open_writer(arrow_table)
+        self._writer.write_table(arrow_table)
+
+    def _open_writer(self, arrow_table):
+        self._writer = pyarrow.parquet.ParquetWriter(
+            _BytesSink(self._buffer),
+            arrow_table.schema,
+            compression=self._parquet_compression,
+        )
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, or all the remaining bytes.
+
+        Fewer than ``size`` bytes are returned only at the end of the stream.
+        """
+        while not self._finished and (size < 0 or len(self._buffer) < size):
+            self._encode_row_group()
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._last_read = data
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move back to an ``offset`` within the last chunk read.
+
+        Raises:
+            ValueError: If ``offset`` is outside of the last chunk read.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence != os.SEEK_SET:
+            raise ValueError("Parquet streams can only seek from the start.")
+
+        last_read_start = self._position - len(self._last_read)
+        if not last_read_start <= offset <= self._position:
+            raise ValueError(
+                "Cannot seek to {}, outside of the last chunk read from {} to "
+                "{}.".format(offset, last_read_start, self._position)
+            )
+
+        split = offset - last_read_start
+        self._buffer[:0] = self._last_read[split:]
+        self._last_read = self._last_read[:split]
+        self._position = offset
+        return offset
+
+
+def _series_to_json_values(series, field):
+    """Convert a column to the values of ``insertAll`` JSON rows.
+
+    The values are the same as those of
+    :func:`google.cloud.bigquery._helpers._field_to_json`, but columns of the
+    common NumPy types are converted at once rather than value by value.
+    Missing values are converted to ``None``.
+    """
+    isnull = pandas.isnull(series).values
+    field_type = field.field_type.upper()
+    dtype = series.dtype
+    values = None
+
+    if field.mode == "REPEATED" or not isinstance(dtype, numpy.dtype):
+        pass
+    elif field_type in ("INTEGER", "INT64") and dtype.kind in "iu":
+        values = series.values.astype(str)
+    elif field_type in ("INTEGER", "INT64") and dtype.kind == "f":
+        # E.g. an integer column with missing values. Other floats are sent
+        # as they are, like in _helpers._int_to_json.
+        floats = numpy.where(isnull, 0.0, series.values)
+        if numpy.all(numpy.mod(floats, 1) == 0):
+            values = floats.astype("int64").astype(str)
+    elif field_type in ("FLOAT", "FLOAT64") and dtype.kind in "iuf":
+        values = series.values.astype("float64")
+    elif field_type in ("BOOLEAN", "BOOL") and dtype.kind == "b":
+        values = numpy.where(series.values, "true", "false")
+    elif field_type == "STRING" and dtype.kind in "OU":
+        values = series.values
+    elif field_type == "TIMESTAMP" and dtype.kind == "M":
+        # Naive datetimes are UTC, like in _helpers._timestamp_to_json_row.
+        values = (series.values.astype("datetime64[us]").view("int64")) * 1e-6
+    elif field_type == "DATETIME" and dtype.kind == "M":
+        values = numpy.datetime_as_string(series.values, unit="us")
+    elif field_type == "DATE" and dtype.kind == "M":
+        values = numpy.datetime_as_string(series.values, unit="D")
+
+    if values is None:
+        values = [_helpers._field_to_json(field, value) for value in series.tolist()]
+    else:
+        values = values.tolist()
+
+    if isnull.any():
+        for index in numpy.flatnonzero(isnull):
+            values[index] = None
+    return values
+
+
+def dataframe_to_json_rows(dataframe, bq_schema):
+    """Convert a DataFrame to the JSON rows of a ``tabledata.insertAll`` request.
+
+    The rows are built column by column. Timestamp columns with a time zone
+    are converted to UTC.
+
+    Args:
+        dataframe (Union[pandas.DataFrame, pyarrow.Table]):
+            The data to convert. Columns not in ``bq_schema`` are ignored.
+        bq_schema (Sequence[Union[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+            Mapping[str, Any] \
+        ]]):
+            The schema of the destination table. The fields missing from
+            ``dataframe`` are set to ``None``.
+
+    Returns:
+        List[Mapping[str, Any]]: One JSON-serializable mapping per row.
+    """
+    bq_schema = schema._to_schema_fields(bq_schema)
+    is_arrow = pyarrow is not None and isinstance(dataframe, pyarrow.Table)
+    num_rows = dataframe.num_rows if is_arrow else len(dataframe)
+
+    columns = []
+    for field in bq_schema:
+        if is_arrow:
+            column_index = dataframe.schema.get_field_index(field.name)
+            series = None
+            if column_index >= 0:
+                series = pandas.Series(dataframe.column(column_index).to_pandas())
+        else:
+            series = dataframe[field.name] if field.name in dataframe.columns else None
+
+        if series is None:
+            columns.append([None] * num_rows)
+            continue
+        if getattr(series.dtype, "tz", None) is not None:
+            series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        columns.append(_series_to_json_values(series, field))
+
+    field_names = [field.name for field in bq_schema]
+    return [dict(zip(field_names, row)) for row in zip(*columns)]
+
+
+def _json_column_to_arrow(values, arrow_type):
+    """Parse a whole column of strings from the JSON API with ``pyarrow``."""
+    return pyarrow.array(values, type=pyarrow.string()).cast(arrow_type)
+
+
+def _json_timestamp_column_to_arrow(values, arrow_type):
+    """Parse a whole column of TIMESTAMP values from the JSON API.
+
+    The values are floats, in seconds since the epoch (to microsecond
+    precision), which are rounded to microseconds just like
+    :func:`google.cloud.bigquery._helpers._timestamp_from_json` does.
+    """
+    seconds = _json_column_to_arrow(values, pyarrow.float64())
+    # Nulls become NaNs, and are masked again once rounded.
+    microseconds = numpy.round(seconds.to_numpy(zero_copy_only=False) * 1e6)
+    nulls = numpy.isnan(microseconds)
+    microseconds[nulls] = 0
+    return pyarrow.array(microseconds.astype("int64"), type=arrow_type, mask=nulls)
+
+
+_JSON_COLUMN_TO_ARROW = {
+    "BOOL": _json_column_to_arrow,
+    "BOOLEAN": _json_column_to_arrow,
+    "FLOAT": _json_column_to_arrow,
+    "FLOAT64": _json_column_to_arrow,
+    "INT64": _json_column_to_arrow,
+    "INTEGER": _json_column_to_arrow,
+    "TIMESTAMP": _json_timestamp_column_to_arrow,
+}
+"""Converters of whole tabledata.list columns, by BigQuery type.
+
+Columns of the other types are converted cell by cell.
+"""
+
+
+def _tabledata_list_column_to_arrow(page, column_index, field):
+    """Convert a tabledata.list page column at once, if its type allows it.
+
+    Args:
+        page (google.api_core.page_iterator.Page): A page of tabledata.list
+            results, which has been fetched already.
+        column_index (int): The index of the column in the page rows.
+        field (google.cloud.bigquery.schema.SchemaField): The column field.
+
+    Returns:
+        Optional[pyarrow.Array]:
+            The column values, or :data:`None` if the column has to be
+            converted cell by cell, e.g. because a value could not be parsed.
+    """
+    rows = getattr(page, "_rows_json", None)
+    if rows is None or numpy is None:
+        return None
+    if field.mode is not None and field.mode.upper() == "REPEATED":
+        return None
+
+    field_type_upper = field.field_type.upper() if field.field_type else ""
+    converter = _JSON_COLUMN_TO_ARROW.get(field_type_upper)
+    if converter is None:
+        return None
+
+    values = [row["f"][column_index]["v"] for row in rows]
+    try:
+        return converter(values, bq_to_arrow_data_type(field))
+    except (NotImplementedError, TypeError, ValueError):
+        # Older pyarrow versions cannot cast all the types, and the values
+        # Arrow fails to parse are left for the per-cell converters to handle
+        # (or reject) exactly like when iterating over the rows.
+        return None
+
+
+def _tabledata_list_page_to_arrow(page, column_names, arrow_types, bq_schema):
     # Iterate over the page to force the API request to get the page data.
     try:
         next(iter(page))
@@ -495,7 +834,12 @@ def _tabledata_list_page_to_arrow(page, column_names, arrow_types):
 
     arrays = []
     for column_index, arrow_type in enumerate(arrow_types):
-        arrays.append(pyarrow.array(page._columns[column_index], type=arrow_type))
+        array = _tabledata_list_column_to_arrow(
+            page, column_index, bq_schema[column_index]
+        )
+        if array is None:
+            array = pyarrow.array(page._columns[column_index], type=arrow_type)
+        arrays.append(array)
 
     if isinstance(column_names, pyarrow.Schema):
         return pyarrow.RecordBatch.from_arrays(arrays, schema=column_names)
@@ -505,6 +849,9 @@ def _tabledata_list_page_to_arrow(page, column_names, arrow_types):
 def download_arrow_tabledata_list(pages, bq_schema):
     """Use tabledata.list to construct an iterable of RecordBatches.
 
+    The INT64, FLOAT64, BOOL and TIMESTAMP columns are parsed a whole column
+    at a time, rather than value by value.
+
     Args:
         pages (Iterator[:class:`google.api_core.page_iterator.Page`]):
             An iterator over the result pages.
@@ -522,10 +869,28 @@ def download_arrow_tabledata_list(pages, bq_schema):
     arrow_types = [bq_to_arrow_data_type(field) for field in bq_schema]
 
     for page in pages:
-        yield _tabledata_list_page_to_arrow(page, column_names, arrow_types)
+        yield _tabledata_list_page_to_arrow(page, column_names, arrow_types, bq_schema)
+
+
+def _tabledata_list_column_to_series(page, column_index, field, dtype):
+    array = None
+    if pyarrow is not None:
+        array = _tabledata_list_column_to_arrow(page, column_index, field)
+
+    if array is not None:
+        try:
+            series = pandas.Series(array.to_pandas())
+        except ValueError:
+            # E.g. a timestamp outside of the range of pandas timestamps,
+            # which is converted to an object column cell by cell.
+            pass
+        else:
+            return series if dtype is None else series.astype(dtype)
+
+    return pandas.Series(page._columns[column_index], dtype=dtype)
 
 
-def _tabledata_list_page_to_dataframe(page, column_names, dtypes):
+def _tabledata_list_page_to_dataframe(page, column_names, dtypes, bq_schema):
     # Iterate over the page to force the API request to get the page data.
     try:
         next(iter(page))
@@ -535,7 +900,9 @@ def _tabledata_list_page_to_dataframe(page, column_names, dtypes):
     columns = {}
     for column_index, column_name in enumerate(column_names):
         dtype = dtypes.get(column_name)
-        columns[column_name] = pandas.Series(page._columns[column_index], dtype=dtype)
+        columns[column_name] = _tabledata_list_column_to_series(
+            page, column_index, bq_schema[column_index], dtype
+        )
 
     return pandas.DataFrame(columns, columns=column_names)
 
@@ -543,6 +910,9 @@ def _tabledata_list_page_to_dataframe(page, column_names, dtypes):
 def download_dataframe_tabledata_list(pages, bq_schema, dtypes):
     """Use (slower, but free) tabledata.list to construct a DataFrame.
 
+    If ``pyarrow`` is installed, the INT64, FLOAT64, BOOL and TIMESTAMP
+    columns are parsed a whole column at a time, rather than value by value.
+
     Args:
         pages (Iterator[:class:`google.api_core.page_iterator.Page`]):
             An iterator over the result pages.
@@ -561,7 +931,7 @@ def download_dataframe_tabledata_list(pages, bq_schema, dtypes):
     bq_schema = schema._to_schema_fields(bq_schema)
     column_names = [field.name for field in bq_schema]
     for page in pages:
-        yield _tabledata_list_page_to_dataframe(page, column_names, dtypes)
+        yield _tabledata_list_page_to_dataframe(page, column_names, dtypes, bq_schema)
 
 
 def _bqstorage_page_to_arrow(page):
@@ -574,6 +944,170 @@ def _bqstorage_page_to_dataframe(column_names, dtypes, page):
     return page.to_dataframe(dtypes=dtypes)[column_names]
 
 
+def record_batches_to_dataframe(record_batches, column_names, dtypes):
+    """Convert record batches to a DataFrame with a single conversion.
+
+    The batches are combined into a :class:`pyarrow.Table` without copying
+    them, then converted to pandas at once, rather than converting each batch
+    and concatenating the DataFrames. If pyarrow supports it, the Arrow
+    buffers are released as the columns are converted.
+
+    Args:
+        record_batches (List[pyarrow.RecordBatch]):
+            The record batches to convert. The list is emptied, so that the
+            table owns the only references to the batches.
+        column_names (Sequence[str]):
+            The columns of the DataFrame, in order.
+        dtypes (Mapping[str, numpy.dtype]):
+            The types of columns in result data to hint construction of the
+            resulting DataFrame. Not all column types have to be specified.
+
+    Returns:
+        pandas.DataFrame
+    """
+    arrow_table = pyarrow.Table.from_batches(record_batches)
+    del record_batches[:]
+
+    # The read session may not return the columns in the order of the schema.
+    # Selecting the columns of a table does not copy them.
+    columns = []
+    for name in column_names:
+        column_index = arrow_table.schema.get_field_index(name)
+        if column_index < 0:
+            raise ValueError(
+                "Column '{}' is not in the record batches, which have columns "
+                "{}.".format(name, arrow_table.schema.names)
+            )
+        columns.append(arrow_table.column(column_index))
+    arrow_table = pyarrow.Table.from_arrays(columns, names=column_names)
+
+    dataframe = arrow_table.to_pandas(**_ARROW_TO_PANDAS_KWARGS)
+    del arrow_table
+
+    for column in dtypes:
+        if column in dataframe.columns:
+            dataframe[column] = pandas.Series(dataframe[column], dtype=dtypes[column])
+    return dataframe
+
+
+def _bqstorage_partition_row_restriction(table, partition_id):
+    """Return a BQ Storage API row restriction selecting a single partition.
+
+    The partitioning is read from the ``time_partitioning`` and
+    ``range_partitioning`` properties of ``table``. If ``table`` is a
+    reference, which does not have them, the table is assumed to be
+    partitioned by ingestion time.
+
+    Args:
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+        ]):
+            The partitioned table.
+        partition_id (str):
+            The partition decorator, e.g. ``20181225`` for ``my_table$20181225``.
+
+    Returns:
+        str: The row restriction.
+
+    Raises:
+        ValueError: If the partition decorator is not supported. Only daily
+            and integer range partitions, and the ``__NULL__`` and
+            ``__UNPARTITIONED__`` partitions, are supported.
+            ``__UNPARTITIONED__`` is not supported for tables partitioned by
+            a time column.
+    """
+    range_partitioning = getattr(table, "range_partitioning", None)
+    if range_partitioning is not None and range_partitioning.field:
+        field = "`{}`".format(range_partitioning.field)
+        partition_range = range_partitioning.range_
+        if partition_id == "__NULL__":
+            return "{} IS NULL".format(field)
+        if partition_id == "__UNPARTITIONED__":
+            return "{0} < {1} OR {0} >= {2}".format(
+                field, partition_range.start, partition_range.end
+            )
+        try:
+            start = int(partition_id)
+        except ValueError:
+            raise ValueError("Invalid range partition '{}'.".format(partition_id))
+        # The last partition ends at the end of the range, even if it is
+        # shorter than the interval.
+        end = min(start + partition_range.interval, partition_range.end)
+        return "{0} >= {1} AND {0} < {2}".format(field, start, end)
+
+    time_partitioning = getattr(table, "time_partitioning", None)
+    field_name = time_partitioning.field if time_partitioning is not None else None
+    if field_name is None:
+        if partition_id == "__UNPARTITIONED__":
+            return "_PARTITIONTIME IS NULL"
+        day = _parse_partition_day(partition_id)
+        return '_PARTITIONTIME = TIMESTAMP "{}"'.format(day.isoformat())
+
+    field = "`{}`".format(field_name)
+    if partition_id == "__NULL__":
+        return "{} IS NULL".format(field)
+    if partition_id == "__UNPARTITIONED__":
+        raise ValueError(
+            "Reading the __UNPARTITIONED__ partition of a table partitioned by "
+            "column '{}' is not supported.".format(field_name)
+        )
+    day = _parse_partition_day(partition_id)
+    field_types = {
+        bq_field.name: bq_field.field_type.upper()
+        for bq_field in getattr(table, "schema", ())
+    }
+    field_type = field_types.get(field_name, "TIMESTAMP")
+    if field_type == "DATE":
+        return '{} = DATE "{}"'.format(field, day.isoformat())
+    return '{0} >= {1} "{2}" AND {0} < {1} "{3}"'.format(
+        field,
+        field_type,
+        day.isoformat(),
+        (day + datetime.timedelta(days=1)).isoformat(),
+    )
+
+
+def _parse_partition_day(partition_id):
+    try:
+        return datetime.datetime.strptime(partition_id, "%Y%m%d").date()
+    except ValueError:
+        raise ValueError(
+            "Reading partition '{}' is not supported, expected a daily "
+            "partition in YYYYMMDD format.".format(partition_id)
+        )
+
+
+def _bqstorage_snapshot_modifiers(snapshot_id):
+    """Return BQ Storage API table modifiers selecting a snapshot.
+
+    Args:
+        snapshot_id (str):
+            The snapshot decorator, e.g. ``1234567890000`` for
+            ``my_table@1234567890000``, in milliseconds since the epoch, or
+            relative to the current time if negative.
+
+    Returns:
+        google.cloud.bigquery_storage_v1beta1.types.TableModifiers
+
+    Raises:
+        ValueError: If the snapshot decorator is not supported.
+    """
+    try:
+        snapshot_millis = int(snapshot_id)
+    except ValueError:
+        # E.g. a range decorator, such as my_table@1234567890000-1234567899999.
+        raise ValueError("Reading snapshot '{}' is not supported.".format(snapshot_id))
+    if snapshot_millis == 0:
+        raise ValueError("Reading the oldest available snapshot is not supported.")
+    if snapshot_millis < 0:
+        snapshot_millis += int(time.time() * 1000)
+
+    table_modifiers = bigquery_storage_v1beta1.types.TableModifiers()
+    table_modifiers.snapshot_time.FromMilliseconds(snapshot_millis)
+    return table_modifiers
+
+
 def _download_table_bqstorage_stream(
     download_state, bqstorage_client, session, stream, worker_queue, page_to_item
 ):
@@ -584,7 +1118,15 @@ def _download_table_bqstorage_stream(
         if download_state.done:
             return
         item = page_to_item(page)
-        worker_queue.put(item)
+        while True:
+            try:
+                # Block while the queue is full, but check regularly whether
+                # the download has been stopped in the meantime.
+                worker_queue.put(item, timeout=_PROGRESS_INTERVAL)
+                break
+            except queue.Full:
+                if download_state.done:
+                    return
 
 
 def _nowait(futures):
@@ -608,19 +1150,35 @@ def _download_table_bqstorage(
     preserve_order=False,
     selected_fields=None,
     page_to_item=None,
+    max_queue_size=_MAX_QUEUE_SIZE_DEFAULT,
+    max_workers=None,
 ):
-    """Use (faster, but billable) BQ Storage API to construct DataFrame."""
-    if "$" in table.table_id:
-        raise ValueError(
-            "Reading from a specific partition is not currently supported."
-        )
-    if "@" in table.table_id:
-        raise ValueError("Reading from a specific snapshot is not currently supported.")
+    """Use (faster, but billable) BQ Storage API to construct DataFrame.
+
+    The streams are read by at most ``max_workers`` threads (one per stream by
+    default), which block while ``max_queue_size`` pages wait to be consumed
+    (as many as there are streams by default, ``None`` for no limit).
+    """
+    table_id = table.table_id
+    snapshot_id = None
+    partition_id = None
+    if "@" in table_id:
+        table_id, snapshot_id = table_id.split("@", 1)
+    if "$" in table_id:
+        table_id, partition_id = table_id.split("$", 1)
 
     read_options = bigquery_storage_v1beta1.types.TableReadOptions()
     if selected_fields is not None:
         for field in selected_fields:
             read_options.selected_fields.append(field.name)
+    if partition_id is not None:
+        read_options.row_restriction = _bqstorage_partition_row_restriction(
+            table, partition_id
+        )
+
+    session_kwargs = {}
+    if snapshot_id is not None:
+        session_kwargs["table_modifiers"] = _bqstorage_snapshot_modifiers(snapshot_id)
 
     requested_streams = 0
     if preserve_order:
@@ -632,6 +1190,7 @@ def _download_table_bqstorage(
         format_=bigquery_storage_v1beta1.enums.DataFormat.ARROW,
         read_options=read_options,
         requested_streams=requested_streams,
+        **session_kwargs
     )
     _LOGGER.debug(
         "Started reading table '{}.{}.{}' with BQ Storage API session '{}'.".format(
@@ -650,9 +1209,22 @@ def _download_table_bqstorage(
     download_state = _DownloadState()
 
     # Create a queue to collect frames as they are created in each thread.
-    worker_queue = queue.Queue()
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=total_streams) as pool:
+    #
+    # The queue is bounded by default, because if the frames are consumed
+    # slower than they are downloaded, the whole table could otherwise end up
+    # in memory.
+    if max_queue_size is _MAX_QUEUE_SIZE_DEFAULT:
+        max_queue_size = total_streams
+    elif max_queue_size is None:
+        max_queue_size = 0  # Unbounded.
+    worker_queue = queue.Queue(maxsize=max_queue_size)
+
+    if max_workers is None:
+        max_workers = total_streams
+    max_workers = min(max_workers, total_streams)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        not_done = []
         try:
             # Manually submit jobs and wait for download to complete rather
             # than using pool.map because pool.map continues running in the
@@ -706,13 +1278,23 @@ def _download_table_bqstorage(
             # definition (enforced by the global interpreter lock).
             download_state.done = True
 
+            # Don't start reading the streams waiting for a worker thread.
+            for future in not_done:
+                future.cancel()
+
             # Shutdown all background threads, now that they should know to
             # exit early.
             pool.shutdown(wait=True)
 
 
 def download_arrow_bqstorage(
-    project_id, table, bqstorage_client, preserve_order=False, selected_fields=None
+    project_id,
+    table,
+    bqstorage_client,
+    preserve_order=False,
+    selected_fields=None,
+    max_queue_size=_MAX_QUEUE_SIZE_DEFAULT,
+    max_workers=None,
 ):
     return _download_table_bqstorage(
         project_id,
@@ -721,6 +1303,8 @@ def download_arrow_bqstorage(
         preserve_order=preserve_order,
         selected_fields=selected_fields,
         page_to_item=_bqstorage_page_to_arrow,
+        max_queue_size=max_queue_size,
+        max_workers=max_workers,
     )
 
 
@@ -732,6 +1316,8 @@ def download_dataframe_bqstorage(
     dtypes,
     preserve_order=False,
     selected_fields=None,
+    max_queue_size=_MAX_QUEUE_SIZE_DEFAULT,
+    max_workers=None,
 ):
     page_to_item = functools.partial(_bqstorage_page_to_dataframe, column_names, dtypes)
     return _download_table_bqstorage(
@@ -741,4 +1327,6 @@ def download_dataframe_bqstorage(
         preserve_order=preserve_order,
         selected_fields=selected_fields,
         page_to_item=page_to_item,
+        max_queue_size=max_queue_size,
+        max_workers=max_workers,
     )
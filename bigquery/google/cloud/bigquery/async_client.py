@@ -0,0 +1,815 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Send BigQuery API requests concurrently from an asyncio event loop.
+
+This module is only functional on Python 3.5 or newer. It does not use the
+async / await syntax, so that the package can still be installed on Python
+2.7. The coroutines are written as generators yielding the awaitables they
+wait for, and run with :func:`_run`.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import json
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+try:
+    import aiohttp
+except ImportError:  # pragma: NO COVER
+    aiohttp = None
+
+import google.api_core.exceptions
+import google.api_core.retry
+import google.auth.transport.requests
+from google.cloud import _http
+from google.cloud import exceptions
+
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import job
+from google.cloud.bigquery.client import _insert_rows_json_data
+from google.cloud.bigquery.client import _make_job_id
+from google.cloud.bigquery.client import _NEED_TABLE_ARGUMENT
+from google.cloud.bigquery.query import _QueryResults
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.table import _table_arg_to_table
+from google.cloud.bigquery.table import _table_arg_to_table_ref
+from google.cloud.bigquery.table import Row
+from google.cloud.bigquery.table import Table
+
+
+_NO_AIOHTTP_ERROR = (
+    "The aiohttp library is not installed, please install "
+    "aiohttp, or pass a session, to use the asyncio client."
+)
+
+
+class _Return(object):
+    """Yielded by a generator run with :func:`_run` to return ``value``.
+
+    Generators cannot ``return`` a value on Python 2.
+    """
+
+    def __init__(self, value=None):
+        self.value = value
+
+
+def _run(generator, loop):
+    """Run a generator as a coroutine on an event loop.
+
+    The generator yields awaitables. It is sent their results, or has their
+    exceptions raised, as if it awaited them. It ends by yielding a
+    :class:`_Return`.
+
+    Args:
+        generator (Generator): The generator to run.
+        loop (asyncio.AbstractEventLoop): The event loop to run it on.
+
+    Returns:
+        asyncio.Future:
+            The value returned by the generator. Cancelling the future
+            cancels the awaitable the generator is waiting for.
+    """
+    result = loop.create_future()
+    waiting = [None]
+
+    def step(value=None, exc=None):
+        waiting[0] = None
+        if result.done():  # Cancelled.
+            generator.close()
+            return
+        try:
+            if exc is None:
+                yielded = generator.send(value)
+            else:
+                yielded = generator.throw(exc)
+        except StopIteration:
+            result.set_result(None)
+            return
+        except Exception as generator_exc:
+            result.set_exception(generator_exc)
+            return
+
+        if isinstance(yielded, _Return):
+            generator.close()
+            result.set_result(yielded.value)
+            return
+
+        future = asyncio.ensure_future(yielded, loop=loop)
+        waiting[0] = future
+        future.add_done_callback(resume)
+
+    def resume(future):
+        if future.cancelled():
+            result.cancel()
+            step()
+        elif future.exception() is not None:
+            step(exc=future.exception())
+        else:
+            step(future.result())
+
+    def cancel(_):
+        if result.cancelled() and waiting[0] is not None:
+            waiting[0].cancel()
+
+    result.add_done_callback(cancel)
+    loop.call_soon(step)
+    return result
+
+
+def _retry_settings(retry):
+    """Return the settings of a retry object, to apply it asynchronously.
+
+    :class:`google.api_core.retry.Retry` only retries synchronous calls, and
+    has no public accessors for its settings. These private attributes are
+    those of google-api-core 1.x, the versions this package depends on.
+
+    Args:
+        retry (google.api_core.retry.Retry): The retry object.
+
+    Returns:
+        Tuple[Callable[[Exception], bool], float, float, float, Optional[float]]:
+            The predicate, the initial and maximum delays, the delay
+            multiplier and the deadline, in seconds.
+    """
+    return (
+        retry._predicate,
+        retry._initial,
+        retry._maximum,
+        retry._multiplier,
+        retry._deadline,
+    )
+
+
+class AsyncClient(object):
+    """Send BigQuery API requests concurrently, from an asyncio event loop.
+
+    The methods return :class:`asyncio.Future` objects, to ``await`` in
+    coroutines. The requests are sent with :mod:`aiohttp`, so that any
+    number of them can wait for their responses at once, without a thread
+    each. The results are the same resource objects as those of ``client``,
+    such as :class:`~google.cloud.bigquery.table.Table` and
+    :class:`~google.cloud.bigquery.job.QueryJob`.
+
+    The project, location, credentials and API endpoint of ``client`` are
+    used. Requests failing with a transient error are retried, sleeping on
+    the event loop. Use :func:`asyncio.wait_for` to limit the time of a
+    call: cancelling its future cancels the pending request.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client to send the requests for.
+        session (Optional[aiohttp.ClientSession]):
+            The session to send the requests with. By default, a session is
+            created with the first request, and closed by :meth:`close`.
+        loop (Optional[asyncio.AbstractEventLoop]):
+            The event loop to run on. Defaults to the current event loop.
+
+    Raises:
+        RuntimeError: If :mod:`asyncio` is not available.
+        ValueError:
+            If ``session`` is not set and the :mod:`aiohttp` library is not
+            installed.
+    """
+
+    def __init__(self, client, session=None, loop=None):
+        if asyncio is None:
+            raise RuntimeError("The asyncio client requires Python 3.5 or newer.")
+        if session is None and aiohttp is None:
+            raise ValueError(_NO_AIOHTTP_ERROR)
+
+        self._client = client
+        self._session = session
+        self._owns_session = session is None
+        self._loop = loop
+        self._refreshing = None
+
+    @property
+    def client(self):
+        """google.cloud.bigquery.client.Client: The client sending the
+        requests."""
+        return self._client
+
+    def close(self):
+        """Close the session created by this client, if any.
+
+        Returns:
+            asyncio.Future: Done when the session is closed.
+        """
+        return self._run(self._close())
+
+    def __aenter__(self):
+        future = self._get_loop().create_future()
+        future.set_result(self)
+        return future
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return self.close()
+
+    def get_table(self, table, retry=DEFAULT_RETRY):
+        """Fetch the table referenced by ``table``.
+
+        See :meth:`google.cloud.bigquery.client.Client.get_table`.
+
+        Args:
+            table (Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableReference, \
+                str, \
+            ]):
+                A reference to the table to fetch from the BigQuery API.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPC.
+
+        Returns:
+            asyncio.Future:
+                A :class:`~google.cloud.bigquery.table.Table` instance.
+        """
+        table_ref = _table_arg_to_table_ref(table, default_project=self._client.project)
+        return self._run(self._get_table(table_ref, retry))
+
+    def query(
+        self,
+        query,
+        job_config=None,
+        job_id=None,
+        job_id_prefix=None,
+        location=None,
+        project=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Start a SQL query.
+
+        See :meth:`google.cloud.bigquery.client.Client.query`. The client's
+        query cache, if any, is not used.
+
+        Args:
+            query (str):
+                SQL query to be executed. Defaults to the standard SQL
+                dialect. Use the ``job_config`` parameter to change dialects.
+            job_config (Optional[google.cloud.bigquery.job.QueryJobConfig]):
+                Extra configuration options for the job, merged with the
+                client's ``default_query_job_config``.
+            job_id (Optional[str]): ID to use for the query job.
+            job_id_prefix (Optional[str]):
+                The prefix to use for a randomly generated job ID. This
+                parameter will be ignored if a ``job_id`` is also given.
+            location (Optional[str]):
+                Location where to run the job. Defaults to the client's
+                location.
+            project (Optional[str]):
+                Project ID of the project of where to run the job. Defaults
+                to the client's project.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPC.
+
+        Returns:
+            asyncio.Future:
+                The started :class:`~google.cloud.bigquery.job.QueryJob`.
+                Wait for its rows with :meth:`query_result`.
+        """
+        job_id = _make_job_id(job_id, job_id_prefix)
+
+        if project is None:
+            project = self._client.project
+
+        if location is None:
+            location = self._client.location
+
+        job_config = self._client._query_job_config(job_config)
+        job_ref = job._JobReference(job_id, project=project, location=location)
+        query_job = job.QueryJob(
+            job_ref, query, client=self._client, job_config=job_config
+        )
+        return self._run(self._begin(query_job, retry))
+
+    def query_result(
+        self, query_job, page_size=None, max_results=None, retry=DEFAULT_RETRY
+    ):
+        """Wait for a query job to complete and get its rows.
+
+        The job is polled like :meth:`google.cloud.bigquery.job.QueryJob.result`
+        does, sleeping on the event loop between the polls.
+
+        Args:
+            query_job (google.cloud.bigquery.job.QueryJob):
+                A job started with :meth:`query`, or by ``client``.
+            page_size (Optional[int]):
+                The maximum number of rows in each page of results.
+            max_results (Optional[int]):
+                The maximum total number of rows.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+
+        Returns:
+            asyncio.Future:
+                An :class:`AsyncRowIterator` over the rows of the results,
+                with ``total_rows`` set. Its exception is a
+                :class:`~google.cloud.exceptions.GoogleCloudError` if the job
+                failed.
+        """
+        return self._run(self._query_result(query_job, page_size, max_results, retry))
+
+    def list_rows(
+        self,
+        table,
+        selected_fields=None,
+        max_results=None,
+        page_size=None,
+        start_index=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """List the rows of a table.
+
+        See :meth:`google.cloud.bigquery.client.Client.list_rows`.
+
+        Args:
+            table (Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableListItem, \
+                google.cloud.bigquery.table.TableReference, \
+                str, \
+            ]):
+                The table to list, or a reference to it. When the table has
+                no schema and ``selected_fields`` is not set, the table is
+                fetched first to get its schema.
+            selected_fields (Optional[Sequence[ \
+                google.cloud.bigquery.schema.SchemaField \
+            ]]):
+                The fields to return.
+            max_results (Optional[int]):
+                Maximum number of rows to return.
+            page_size (Optional[int]):
+                The maximum number of rows in each page of results.
+            start_index (Optional[int]):
+                The zero-based index of the starting row to read.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+
+        Returns:
+            asyncio.Future: An :class:`AsyncRowIterator` over the rows.
+        """
+        table = _table_arg_to_table(table, default_project=self._client.project)
+
+        if not isinstance(table, Table):
+            raise TypeError(_NEED_TABLE_ARGUMENT)
+
+        return self._run(
+            self._list_rows(
+                table, selected_fields, max_results, page_size, start_index, retry
+            )
+        )
+
+    def insert_rows_json(
+        self,
+        table,
+        json_rows,
+        row_ids=None,
+        skip_invalid_rows=None,
+        ignore_unknown_values=None,
+        template_suffix=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Insert rows into a table without applying local type conversions.
+
+        See :meth:`google.cloud.bigquery.client.Client.insert_rows_json`.
+
+        Args:
+            table (Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableReference, \
+                str, \
+            ]):
+                The destination table for the row data, or a reference to it.
+            json_rows (Sequence[Dict]):
+                Row data to be inserted. Keys must match the table schema
+                fields and values must be JSON-compatible representations.
+            row_ids (Optional[Sequence[Optional[str]]]):
+                Unique IDs, one per row being inserted. By default, unique
+                IDs are created.
+            skip_invalid_rows (Optional[bool]):
+                Insert all valid rows of a request, even if invalid rows
+                exist.
+            ignore_unknown_values (Optional[bool]):
+                Accept rows that contain values that do not match the schema.
+            template_suffix (Optional[str]):
+                Treat ``name`` as a template table and provide a suffix.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPC.
+
+        Returns:
+            asyncio.Future:
+                One mapping per row with insert errors: the "index" key
+                identifies the row, and the "errors" key contains a list of
+                the mappings describing one or more problems with the row.
+        """
+        table = _table_arg_to_table_ref(table, default_project=self._client.project)
+        data = _insert_rows_json_data(
+            json_rows,
+            row_ids,
+            skip_invalid_rows,
+            ignore_unknown_values,
+            template_suffix,
+        )
+        return self._run(self._insert_rows_json(table, data, retry))
+
+    def _get_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
+
+    def _run(self, generator):
+        return _run(generator, self._get_loop())
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    def _refresh_credentials(self):
+        """Refresh the credentials in the default executor.
+
+        Concurrent requests wait for the same refresh.
+        """
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = self._get_loop().run_in_executor(
+                None,
+                self._client._credentials.refresh,
+                google.auth.transport.requests.Request(),
+            )
+        return self._refreshing
+
+    def _call_api(self, retry, method, path, query_params=None, data=None):
+        """Send an API request, retrying transient errors with ``retry``.
+
+        Returns:
+            asyncio.Future: The decoded JSON response.
+        """
+        return self._run(self._retry_request(retry, method, path, query_params, data))
+
+    def _retry_request(self, retry, method, path, query_params, data):
+        if retry is None:
+            response = yield self._run(
+                self._api_request(method, path, query_params, data)
+            )
+            yield _Return(response)
+
+        predicate, initial, maximum, multiplier, deadline = _retry_settings(retry)
+        loop = self._get_loop()
+        if deadline is not None:
+            deadline = loop.time() + deadline
+        delays = google.api_core.retry.exponential_sleep_generator(
+            initial, maximum, multiplier=multiplier
+        )
+
+        for delay in delays:
+            try:
+                response = yield self._run(
+                    self._api_request(method, path, query_params, data)
+                )
+            except Exception as exc:
+                if not predicate(exc):
+                    raise
+                if deadline is not None and loop.time() + delay > deadline:
+                    raise
+            else:
+                yield _Return(response)
+            yield asyncio.sleep(delay)
+
+    def _api_request(self, method, path, query_params, data):
+        connection = self._client._connection
+        url = connection.build_api_url(path=path, query_params=query_params)
+
+        headers = dict(connection.extra_headers)
+        headers["Accept-Encoding"] = "gzip"
+        headers[_http.CLIENT_INFO_HEADER] = connection.user_agent
+        headers["User-Agent"] = connection.user_agent
+        body = None
+        if data is not None:
+            headers["Content-Type"] = "application/json"
+            body = json.dumps(data)
+
+        credentials = self._client._credentials
+        if not credentials.valid:
+            yield self._refresh_credentials()
+        credentials.apply(headers)
+
+        response = yield self._get_session().request(
+            method, url, headers=headers, data=body
+        )
+        content = yield response.read()
+        content = content.decode("utf-8")
+
+        try:
+            payload = json.loads(content) if content else {}
+        except ValueError:
+            payload = {"error": {"message": content or "unknown error"}}
+
+        if not 200 <= response.status < 300:
+            error = payload.get("error", {})
+            message = "{method} {url}: {error}".format(
+                method=method, url=url, error=error.get("message", "unknown error")
+            )
+            raise google.api_core.exceptions.from_http_status(
+                response.status, message, errors=error.get("errors", ())
+            )
+
+        yield _Return(payload)
+
+    def _close(self):
+        if self._owns_session and self._session is not None:
+            session, self._session = self._session, None
+            yield session.close()
+        yield _Return()
+
+    def _get_table(self, table_ref, retry):
+        api_response = yield self._call_api(retry, "GET", table_ref.path)
+        yield _Return(Table.from_api_repr(api_response))
+
+    def _begin(self, query_job, retry):
+        path = "/projects/%s/jobs" % (query_job.project,)
+        try:
+            api_response = yield self._call_api(
+                retry, "POST", path, data=query_job.to_api_repr()
+            )
+        except exceptions.GoogleCloudError as exc:
+            exc.message += query_job._format_for_exception(
+                query_job.query, query_job.job_id
+            )
+            exc.query_job = query_job
+            raise
+
+        query_job._set_properties(api_response)
+        yield _Return(query_job)
+
+    def _reload_job(self, query_job, retry):
+        query_params = {}
+        if query_job.location:
+            query_params["location"] = query_job.location
+
+        api_response = yield self._call_api(
+            retry, "GET", query_job.path, query_params=query_params
+        )
+        query_job._set_properties(api_response)
+        yield _Return(query_job)
+
+    def _get_query_results(self, query_job, retry):
+        # The request waits up to 10 seconds for the query to complete.
+        query_params = {"maxResults": 0}
+        if query_job.location:
+            query_params["location"] = query_job.location
+
+        path = "/projects/{}/queries/{}".format(query_job.project, query_job.job_id)
+        api_response = yield self._call_api(
+            retry, "GET", path, query_params=query_params
+        )
+        yield _Return(_QueryResults.from_api_repr(api_response))
+
+    def _query_result(self, query_job, page_size, max_results, retry):
+        query_results = None
+        delay = None
+        try:
+            while query_job.state != job._DONE_STATE:
+                if delay is not None:
+                    yield asyncio.sleep(delay)
+
+                query_results = yield self._run(
+                    self._get_query_results(query_job, retry)
+                )
+
+                # Reload the job once the query is complete, to get its
+                # destination table, or to estimate its remaining time.
+                if query_results.complete or (
+                    delay is not None and delay >= job._POLL_STATISTICS_MIN_DELAY_SECS
+                ):
+                    yield self._run(self._reload_job(query_job, retry))
+
+                delay = job._poll_delay(delay, query_job._estimate_remaining_secs())
+
+            if query_job.error_result is not None:
+                raise job._error_result_to_exception(query_job.error_result)
+
+            if query_results is None:
+                query_results = yield self._run(
+                    self._get_query_results(query_job, retry)
+                )
+        except exceptions.GoogleCloudError as exc:
+            exc.message += query_job._format_for_exception(
+                query_job.query, query_job.job_id
+            )
+            exc.query_job = query_job
+            raise
+
+        query_job._query_results = query_results
+
+        # A special job, such as a DDL query, has no rows to list.
+        if query_results.total_rows is None:
+            yield _Return(AsyncRowIterator(self, None, ()))
+
+        yield _Return(
+            AsyncRowIterator(
+                self,
+                "%s/data" % (query_job.destination.path,),
+                query_results.schema,
+                page_size=page_size,
+                max_results=max_results,
+                total_rows=query_results.total_rows,
+                retry=retry,
+            )
+        )
+
+    def _list_rows(
+        self, table, selected_fields, max_results, page_size, start_index, retry
+    ):
+        schema = table.schema
+
+        # selected_fields can override the table schema.
+        if selected_fields is not None:
+            schema = selected_fields
+
+        # No schema, but no selected_fields. Assume the developer wants all
+        # columns, so get the table resource for them rather than failing.
+        elif len(schema) == 0:
+            table = yield self.get_table(table.reference, retry=retry)
+            schema = table.schema
+
+        params = {}
+        if selected_fields is not None:
+            params["selectedFields"] = ",".join(field.name for field in selected_fields)
+        if start_index is not None:
+            params["startIndex"] = start_index
+
+        yield _Return(
+            AsyncRowIterator(
+                self,
+                "%s/data" % (table.path,),
+                schema,
+                page_size=page_size,
+                max_results=max_results,
+                extra_params=params,
+                total_rows=table.num_rows,
+                retry=retry,
+            )
+        )
+
+    def _insert_rows_json(self, table, data, retry):
+        # We can always retry, because every row has an insert ID.
+        response = yield self._call_api(
+            retry, "POST", "%s/insertAll" % (table.path,), data=data
+        )
+
+        errors = []
+        for error in response.get("insertErrors", ()):
+            errors.append({"index": int(error["index"]), "errors": error["errors"]})
+
+        yield _Return(errors)
+
+
+class AsyncRowIterator(object):
+    """Iterate asynchronously over the rows of a table or query results.
+
+    Iterate over the rows with ``async for``, or await :meth:`next_page` to
+    get them a page at a time. A page is requested when the previous one
+    has been consumed, so the iterator must not be used by several
+    coroutines at once.
+
+    The rows are :class:`~google.cloud.bigquery.table.Row` objects, as with
+    :class:`~google.cloud.bigquery.table.RowIterator`.
+
+    Args:
+        client (AsyncClient): The client sending the requests.
+        path (Optional[str]):
+            The ``tabledata.list`` path of the table, or ``None`` if there
+            are no rows.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The fields of the rows.
+        page_size (Optional[int]):
+            The maximum number of rows in each page.
+        max_results (Optional[int]):
+            The maximum total number of rows.
+        extra_params (Optional[Dict[str, object]]):
+            Extra query string parameters for the API call.
+        total_rows (Optional[int]):
+            Total number of rows, if known before the first page.
+        retry (Optional[google.api_core.retry.Retry]):
+            How to retry the RPCs.
+    """
+
+    def __init__(
+        self,
+        client,
+        path,
+        schema,
+        page_size=None,
+        max_results=None,
+        extra_params=None,
+        total_rows=None,
+        retry=DEFAULT_RETRY,
+    ):
+        self._client = client
+        self._path = path
+        self._schema = list(schema)
+        self._field_to_index = _helpers._field_to_index_mapping(self._schema)
+        self._page_size = page_size
+        self._max_results = max_results
+        self._extra_params = dict(extra_params or {})
+        self._total_rows = total_rows
+        self._retry = retry
+        self._started = False
+        self._rows = collections.deque()
+        self.next_page_token = None
+        self.num_results = 0
+
+    @property
+    def schema(self):
+        """List[google.cloud.bigquery.schema.SchemaField]: The fields of the
+        rows."""
+        return list(self._schema)
+
+    @property
+    def total_rows(self):
+        """Optional[int]: The total number of rows in the table or query
+        results, updated with each page."""
+        return self._total_rows
+
+    def next_page(self):
+        """Get the next page of rows.
+
+        Returns:
+            asyncio.Future:
+                The list of :class:`~google.cloud.bigquery.table.Row` objects
+                of the page, or ``None`` after the last page.
+        """
+        return self._client._run(self._next_page())
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        return self._client._run(self._next_row())
+
+    def _has_next_page(self):
+        if self._path is None:
+            return False
+        if self._max_results is not None and self.num_results >= self._max_results:
+            return False
+        return not self._started or self.next_page_token is not None
+
+    def _next_page(self):
+        if not self._has_next_page():
+            yield _Return(None)
+
+        params = dict(self._extra_params)
+        page_size = self._page_size
+        if self._max_results is not None:
+            remaining = self._max_results - self.num_results
+            page_size = remaining if page_size is None else min(page_size, remaining)
+        if page_size is not None:
+            params["maxResults"] = page_size
+        if self.next_page_token is not None:
+            params["pageToken"] = self.next_page_token
+
+        response = yield self._client._call_api(
+            self._retry, "GET", self._path, query_params=params
+        )
+
+        self._started = True
+        self.next_page_token = response.get("pageToken")
+        total_rows = response.get("totalRows")
+        if total_rows is not None:
+            self._total_rows = int(total_rows)
+
+        rows = [
+            Row(
+                _helpers._row_tuple_from_json(resource, self._schema),
+                self._field_to_index,
+            )
+            for resource in response.get("rows", ())
+        ]
+        self.num_results += len(rows)
+        yield _Return(rows)
+
+    def _next_row(self):
+        while not self._rows:
+            rows = yield self.next_page()
+            if rows is None:
+                raise StopAsyncIteration  # noqa: F821 (Python 3 only)
+            self._rows.extend(rows)
+
+        yield _Return(self._rows.popleft())
@@ -22,16 +22,16 @@ try:
 except ImportError:  # Python 2.7
     import collections as collections_abc
 
+import collections
 import concurrent.futures
 import copy
 import functools
 import gzip
 import io
-import itertools
 import json
-import math
 import os
 import tempfile
+import time
 import uuid
 import warnings
 
@@ -93,6 +93,10 @@ _READ_LESS_THAN_SIZE = (
 _NEED_TABLE_ARGUMENT = (
     "The table argument should be a table ID string, Table, or TableReference"
 )
+_DEFAULT_INSERT_CHUNK_BYTES = 5 * 1024 * 1024  # Half of the insertAll request limit.
+_INSERT_ROW_OVERHEAD_BYTES = 64  # For the insertId and the row's JSON object.
+# Reasons of insertAll row errors worth retrying, besides invalid data.
+_RETRYABLE_INSERT_REASONS = frozenset(["backendError", "internalError", "timeout"])
 
 
 class Project(object):
@@ -150,6 +154,9 @@ class Client(ClientWithProject):
         client_options (Union[google.api_core.client_options.ClientOptions, Dict]):
             (Optional) Client options used to set user options on the client.
             API Endpoint should be set through client_options.
+        query_cache (google.cloud.bigquery.query_cache.QueryCache):
+            (Optional) Cache of the results of the queries sent with the
+            ``query`` method. By default, results are not cached.
 
     Raises:
         google.auth.exceptions.DefaultCredentialsError:
@@ -172,6 +179,7 @@ class Client(ClientWithProject):
         default_query_job_config=None,
         client_info=None,
         client_options=None,
+        query_cache=None,
     ):
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=_http
@@ -190,6 +198,7 @@ class Client(ClientWithProject):
         self._connection = Connection(self, **kw_args)
         self._location = location
         self._default_query_job_config = copy.deepcopy(default_query_job_config)
+        self._query_cache = query_cache
 
     @property
     def location(self):
@@ -1491,6 +1500,100 @@ class Client(ClientWithProject):
             extra_params=extra_params,
         )
 
+    def wait_for_jobs(
+        self,
+        jobs,
+        timeout=None,
+        return_when=concurrent.futures.ALL_COMPLETED,
+        retry=DEFAULT_RETRY,
+    ):
+        """Wait for many jobs to complete, polling them together.
+
+        Rather than polling each job, the jobs of a project created since its
+        oldest unfinished job are listed with a single ``jobs.list`` request
+        per poll. Jobs missing from the list, such as the jobs of other users,
+        are polled one by one. The delay between polls grows exponentially,
+        unless the statistics of running query jobs give an estimate of their
+        remaining time.
+
+        Args:
+            jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+                The started jobs to wait for.
+            timeout (Optional[float]):
+                The maximum number of seconds to wait. If ``None``, wait
+                indefinitely.
+            return_when (Optional[str]):
+                When to return, as for :func:`concurrent.futures.wait`:
+                :data:`~concurrent.futures.FIRST_COMPLETED`,
+                :data:`~concurrent.futures.FIRST_EXCEPTION` (once a job has
+                failed) or :data:`~concurrent.futures.ALL_COMPLETED`, the
+                default.
+            retry (Optional[google.api_core.retry.Retry]):
+                How to retry the RPCs.
+
+        Returns:
+            Tuple[Set[google.cloud.bigquery.job._AsyncJob], \
+                Set[google.cloud.bigquery.job._AsyncJob]]:
+                The jobs which are done and the jobs which are not done.
+        """
+        jobs = set(jobs)
+        deadline = None if timeout is None else time.time() + timeout
+        delay = None
+
+        while True:
+            self._poll_jobs(
+                [job_ for job_ in jobs if job_.state != job._DONE_STATE], retry
+            )
+            done = set(job_ for job_ in jobs if job_.state == job._DONE_STATE)
+            not_done = jobs - done
+            if (
+                not not_done
+                or (return_when == concurrent.futures.FIRST_COMPLETED and done)
+                or (
+                    return_when == concurrent.futures.FIRST_EXCEPTION
+                    and any(job_.error_result is not None for job_ in done)
+                )
+            ):
+                return done, not_done
+
+            estimates = [
+                job_._estimate_remaining_secs()
+                for job_ in not_done
+                if isinstance(job_, job.QueryJob)
+            ]
+            estimates = [estimate for estimate in estimates if estimate is not None]
+            delay = job._poll_delay(delay, min(estimates) if estimates else None)
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return done, not_done
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def _poll_jobs(self, jobs, retry):
+        """Refresh the state and statistics of unfinished jobs."""
+        jobs_by_project = collections.defaultdict(dict)
+        for job_ in jobs:
+            if job_.created is None:  # Not started, or never fetched.
+                job_.reload(retry=retry)
+            else:
+                jobs_by_project[job_.project][job_.job_id] = job_
+
+        for project, unlisted in six.iteritems(jobs_by_project):
+            min_creation_time = min(job_.created for job_ in unlisted.values())
+            listed_jobs = self.list_jobs(
+                project=project, min_creation_time=min_creation_time, retry=retry
+            )
+            for listed_job in listed_jobs:
+                job_ = unlisted.pop(listed_job.job_id, None)
+                if job_ is not None:
+                    job_._set_properties(listed_job._properties)
+                if not unlisted:
+                    break
+
+            for job_ in unlisted.values():
+                job_.reload(retry=retry)
+
     def load_table_from_uri(
         self,
         source_uris,
@@ -1686,6 +1789,7 @@ class Client(ClientWithProject):
         project=None,
         job_config=None,
         parquet_compression="snappy",
+        streaming=False,
     ):
         """Upload the contents of a table from a pandas DataFrame.
 
@@ -1742,6 +1846,13 @@ class Client(ClientWithProject):
                  argument is directly passed as the ``compression`` argument
                  to the underlying ``DataFrame.to_parquet()`` method.
                  https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.to_parquet.html#pandas.DataFrame.to_parquet
+            streaming (bool):
+                 [Beta] If ``True``, encode ``dataframe`` as Parquet row
+                 groups while they are uploaded, rather than writing a
+                 temporary file first. Only about one row group and one
+                 upload chunk are held in memory at a time. Requires the
+                 :mod:`pyarrow` library and a complete schema. Defaults to
+                 ``False``.
 
         Returns:
             google.cloud.bigquery.job.LoadJob: A new load job.
@@ -1754,6 +1865,9 @@ class Client(ClientWithProject):
             TypeError:
                 If ``job_config`` is not an instance of :class:`~google.cloud.bigquery.job.LoadJobConfig`
                 class.
+            ValueError:
+                If ``streaming`` is set, but :mod:`pyarrow` is not installed
+                or the schema could not be determined.
         """
         job_id = _make_job_id(job_id, job_id_prefix)
 
@@ -1807,14 +1921,36 @@ class Client(ClientWithProject):
                 stacklevel=2,
             )
 
+        if parquet_compression == "snappy" and pyarrow and job_config.schema:
+            parquet_compression = parquet_compression.upper()  # adjust the default
+
+        if streaming:
+            if not pyarrow or not job_config.schema:
+                raise ValueError(
+                    "Streaming a dataframe requires pyarrow and a schema for "
+                    "all columns."
+                )
+            parquet_stream = _pandas_helpers.ParquetStream(
+                dataframe, job_config.schema, parquet_compression=parquet_compression
+            )
+            # The size is unknown, so the stream is sent with a resumable
+            # upload, one chunk at a time.
+            return self.load_table_from_file(
+                parquet_stream,
+                destination,
+                num_retries=num_retries,
+                job_id=job_id,
+                job_id_prefix=job_id_prefix,
+                location=location,
+                project=project,
+                job_config=job_config,
+            )
+
         tmpfd, tmppath = tempfile.mkstemp(suffix="_job_{}.parquet".format(job_id[:8]))
         os.close(tmpfd)
 
         try:
             if pyarrow and job_config.schema:
-                if parquet_compression == "snappy":  # adjust the default value
-                    parquet_compression = parquet_compression.upper()
-
                 _pandas_helpers.dataframe_to_parquet(
                     dataframe,
                     job_config.schema,
@@ -2300,7 +2436,10 @@ class Client(ClientWithProject):
                 before using ``retry``.
 
         Returns:
-            google.cloud.bigquery.job.QueryJob: A new query job instance.
+            google.cloud.bigquery.job.QueryJob:
+                A new query job instance. If the client has a ``query_cache``
+                with the results of the same query, the finished job which
+                produced them is returned instead, and no job is started.
 
         Raises:
             TypeError:
@@ -2315,6 +2454,28 @@ class Client(ClientWithProject):
         if location is None:
             location = self.location
 
+        job_config = self._query_job_config(job_config)
+
+        cache_key = None
+        if self._query_cache is not None:
+            cache_key = self._query_cache._key(query, job_config, project, location)
+        if cache_key is not None:
+            cached = self._query_cache._get(self, cache_key)
+            if cached is not None:
+                job_resource, rows = cached
+                query_job = job.QueryJob.from_api_repr(job_resource, self)
+                query_job._cached_rows = rows
+                return query_job
+
+        job_ref = job._JobReference(job_id, project=project, location=location)
+        query_job = job.QueryJob(job_ref, query, client=self, job_config=job_config)
+        query_job._query_cache_key = cache_key
+        query_job._begin(retry=retry, timeout=timeout)
+
+        return query_job
+
+    def _query_job_config(self, job_config):
+        """Copy a query job configuration, with the client's defaults."""
         job_config = copy.deepcopy(job_config)
 
         if self._default_query_job_config:
@@ -2336,11 +2497,7 @@ class Client(ClientWithProject):
                 )
                 job_config = copy.deepcopy(self._default_query_job_config)
 
-        job_ref = job._JobReference(job_id, project=project, location=location)
-        query_job = job.QueryJob(job_ref, query, client=self, job_config=job_config)
-        query_job._begin(retry=retry, timeout=timeout)
-
-        return query_job
+        return job_config
 
     def insert_rows(self, table, rows, selected_fields=None, **kwargs):
         """Insert rows into a table via the streaming API.
@@ -2378,6 +2535,13 @@ class Client(ClientWithProject):
         Raises:
             ValueError: if table's schema is not set
         """
+        table, schema = self._insert_table_and_schema(table, selected_fields)
+        json_rows = [_record_field_to_json(schema, row) for row in rows]
+
+        return self.insert_rows_json(table, json_rows, **kwargs)
+
+    def _insert_table_and_schema(self, table, selected_fields):
+        """Return the table to insert rows into, and the schema of the rows."""
         table = _table_arg_to_table(table, default_project=self.project)
 
         if not isinstance(table, Table):
@@ -2396,16 +2560,24 @@ class Client(ClientWithProject):
                     "or pass in a list of schema fields to the selected_fields argument."
                 ).format(table)
             )
-
-        json_rows = [_record_field_to_json(schema, row) for row in rows]
-
-        return self.insert_rows_json(table, json_rows, **kwargs)
+        return table, schema
 
     def insert_rows_from_dataframe(
-        self, table, dataframe, selected_fields=None, chunk_size=500, **kwargs
+        self,
+        table,
+        dataframe,
+        selected_fields=None,
+        chunk_size=500,
+        max_chunk_bytes=_DEFAULT_INSERT_CHUNK_BYTES,
+        max_workers=None,
+        max_row_retries=3,
+        **kwargs
     ):
         """Insert rows into a table from a dataframe via the streaming API.
 
+        The rows are converted to JSON column by column, then sent in chunks
+        limited both in number of rows and in size.
+
         Args:
             table (Union[ \
                 google.cloud.bigquery.table.Table, \
@@ -2413,16 +2585,34 @@ class Client(ClientWithProject):
                 str, \
             ]):
                 The destination table for the row data, or a reference to it.
-            dataframe (pandas.DataFrame):
-                A :class:`~pandas.DataFrame` containing the data to load.
+            dataframe (Union[pandas.DataFrame, pyarrow.Table]):
+                A :class:`~pandas.DataFrame` or a :class:`pyarrow.Table`
+                containing the data to load.
             selected_fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
                 The fields to return. Required if ``table`` is a
                 :class:`~google.cloud.bigquery.table.TableReference`.
-            chunk_size (int):
-                The number of rows to stream in a single chunk. Must be positive.
+            chunk_size (Optional[int]):
+                The maximum number of rows to stream in a single chunk. Must
+                be positive. If ``None``, the chunks are only limited by
+                ``max_chunk_bytes``.
+            max_chunk_bytes (Optional[int]):
+                The approximate maximum size of the JSON rows of a single
+                chunk, in bytes. A row larger than the limit is sent in a
+                chunk of its own. Defaults to 5 MiB. If ``None``, the chunks
+                are only limited by ``chunk_size``.
+            max_workers (Optional[int]):
+                The maximum number of chunks to send concurrently. By
+                default, the chunks are sent one after the other.
+            max_row_retries (int):
+                The number of times the rows of a chunk which failed with a
+                transient error (e.g. ``backendError``) are sent again. Only
+                the failed rows are sent again, with the same insert IDs.
+                Rows without an insert ID are not sent again.
             kwargs (Dict):
                 Keyword arguments to
                 :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+                If ``row_ids`` is passed, it must contain one ID per row of
+                the dataframe.
 
         Returns:
             Sequence[Sequence[Mappings]]:
@@ -2435,20 +2625,98 @@ class Client(ClientWithProject):
         Raises:
             ValueError: if table's schema is not set
         """
-        insert_results = []
-
-        chunk_count = int(math.ceil(len(dataframe) / chunk_size))
-        rows_iter = (
-            dict(six.moves.zip(dataframe.columns, row))
-            for row in dataframe.itertuples(index=False, name=None)
+        if chunk_size is None and max_chunk_bytes is None:
+            raise ValueError("chunk_size and max_chunk_bytes cannot both be None.")
+
+        table, schema = self._insert_table_and_schema(table, selected_fields)
+        json_rows = _pandas_helpers.dataframe_to_json_rows(dataframe, schema)
+
+        row_ids = kwargs.pop("row_ids", None)
+        if row_ids is None:
+            row_ids = [str(uuid.uuid4()) for _ in json_rows]
+
+        send_chunk = functools.partial(
+            self._insert_json_rows_chunk,
+            table,
+            json_rows,
+            row_ids,
+            max_row_retries,
+            kwargs,
         )
+        chunks = _json_rows_chunks(json_rows, chunk_size, max_chunk_bytes)
+
+        if max_workers is None:
+            return [send_chunk(chunk) for chunk in chunks]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(send_chunk, chunk) for chunk in chunks]
+            return [future.result() for future in futures]
+
+    def _insert_json_rows_chunk(
+        self,
+        table,
+        json_rows,
+        row_ids,
+        max_row_retries,
+        kwargs,
+        chunk,
+        on_attempt_done=None,
+    ):
+        """Insert the rows of a chunk, then retry the rows with transient errors.
+
+        Args:
+            on_attempt_done (Optional[Callable[[List[int], List[Mapping]], None]]):
+                Called after each request with the indexes of the rows it
+                inserted and the errors of the rows which are not retried,
+                relative to the chunk, so that their outcome is known even if
+                a later request fails.
+
+        Returns:
+            Sequence[Mappings]:
+                The insert errors, with row indexes relative to the chunk.
+        """
+        start, stop = chunk
+        indexes = list(range(start, stop))
+        errors = []
+
+        for attempt in range(max_row_retries + 1):
+            attempt_errors = self.insert_rows_json(
+                table,
+                [json_rows[index] for index in indexes],
+                row_ids=[row_ids[index] for index in indexes],
+                **kwargs
+            )
+
+            retry_indexes = []
+            failed_indexes = set()
+            final_errors = []
+            for error in attempt_errors:
+                index = indexes[error["index"]]
+                failed_indexes.add(index)
+                reasons = set(item.get("reason") for item in error["errors"])
+                if (
+                    attempt < max_row_retries
+                    and row_ids[index] is not None
+                    and reasons <= _RETRYABLE_INSERT_REASONS
+                ):
+                    retry_indexes.append(index)
+                else:
+                    final_errors.append(
+                        {"index": index - start, "errors": error["errors"]}
+                    )
+            errors.extend(final_errors)
+
+            if on_attempt_done is not None:
+                inserted = [
+                    index - start for index in indexes if index not in failed_indexes
+                ]
+                on_attempt_done(inserted, final_errors)
 
-        for _ in range(chunk_count):
-            rows_chunk = itertools.islice(rows_iter, chunk_size)
-            result = self.insert_rows(table, rows_chunk, selected_fields, **kwargs)
-            insert_results.append(result)
+            if not retry_indexes:
+                break
+            indexes = retry_indexes
 
-        return insert_results
+        return sorted(errors, key=lambda error: error["index"])
 
     def insert_rows_json(
         self,
@@ -2510,25 +2778,13 @@ class Client(ClientWithProject):
         # insert_rows_json doesn't need the table schema. It's not doing any
         # type conversions.
         table = _table_arg_to_table_ref(table, default_project=self.project)
-        rows_info = []
-        data = {"rows": rows_info}
-
-        for index, row in enumerate(json_rows):
-            info = {"json": row}
-            if row_ids is not None:
-                info["insertId"] = row_ids[index]
-            else:
-                info["insertId"] = str(uuid.uuid4())
-            rows_info.append(info)
-
-        if skip_invalid_rows is not None:
-            data["skipInvalidRows"] = skip_invalid_rows
-
-        if ignore_unknown_values is not None:
-            data["ignoreUnknownValues"] = ignore_unknown_values
-
-        if template_suffix is not None:
-            data["templateSuffix"] = template_suffix
+        data = _insert_rows_json_data(
+            json_rows,
+            row_ids,
+            skip_invalid_rows,
+            ignore_unknown_values,
+            template_suffix,
+        )
 
         # We can always retry, because every row has an insert ID.
         response = self._call_api(
@@ -2600,6 +2856,8 @@ class Client(ClientWithProject):
         page_size=None,
         retry=DEFAULT_RETRY,
         timeout=None,
+        prefetch_pages=None,
+        download_workers=None,
     ):
         """List the rows of the table.
 
@@ -2649,6 +2907,18 @@ class Client(ClientWithProject):
                 before using ``retry``.
                 If multiple requests are made under the hood, ``timeout`` is
                 interpreted as the approximate total time of **all** requests.
+            prefetch_pages (Optional[int]):
+                Optional. The number of pages to fetch in a background thread,
+                ahead of the page being processed. The pages are still
+                returned in order, and at most ``prefetch_pages`` of them wait
+                in memory. By default, each page is fetched only once the
+                previous one has been processed.
+            download_workers (Optional[int]):
+                Optional. The number of threads downloading ranges of rows in
+                parallel in the ``to_arrow()`` and ``to_dataframe()`` methods
+                of the returned iterator, if the table has a known number of
+                rows. The ranges are merged in order. By default, all the
+                pages are fetched one after the other, from a single thread.
 
         Returns:
             google.cloud.bigquery.table.RowIterator:
@@ -2699,6 +2969,8 @@ class Client(ClientWithProject):
             # Pass in selected_fields separately from schema so that full
             # tables can be fetched without a column filter.
             selected_fields=selected_fields,
+            prefetch_pages=prefetch_pages,
+            download_workers=download_workers,
         )
         return row_iterator
 
@@ -2881,6 +3153,76 @@ def _check_mode(stream):
             )
 
 
+def _json_rows_chunks(json_rows, chunk_size, max_chunk_bytes):
+    """Split rows into insert chunks, limited in rows and in bytes.
+
+    Args:
+        json_rows (Sequence[Mapping[str, Any]]): The JSON rows to insert.
+        chunk_size (Optional[int]): The maximum number of rows of a chunk.
+        max_chunk_bytes (Optional[int]):
+            The approximate maximum size of a chunk. A larger row is in a
+            chunk of its own.
+
+    Returns:
+        List[Tuple[int, int]]: The start and stop row indexes of each chunk.
+    """
+    chunks = []
+    start = 0
+    chunk_bytes = 0
+
+    for index, row in enumerate(json_rows):
+        row_bytes = 0
+        if max_chunk_bytes is not None:
+            row_bytes = len(json.dumps(row)) + _INSERT_ROW_OVERHEAD_BYTES
+
+        rows_full = chunk_size is not None and index - start >= chunk_size
+        bytes_full = (
+            max_chunk_bytes is not None and chunk_bytes + row_bytes > max_chunk_bytes
+        )
+        if index > start and (rows_full or bytes_full):
+            chunks.append((start, index))
+            start = index
+            chunk_bytes = 0
+        chunk_bytes += row_bytes
+
+    if start < len(json_rows):
+        chunks.append((start, len(json_rows)))
+    return chunks
+
+
+def _insert_rows_json_data(
+    json_rows, row_ids, skip_invalid_rows, ignore_unknown_values, template_suffix
+):
+    """Make the body of a ``tabledata.insertAll`` request.
+
+    If ``row_ids`` is ``None``, each row gets a random insert ID, so that
+    the request can be retried. Otherwise, the IDs are used as is, and a
+    ``None`` ID is sent as a null ``insertId``, for which BigQuery does not
+    deduplicate the row.
+    """
+    rows_info = []
+    data = {"rows": rows_info}
+
+    for index, row in enumerate(json_rows):
+        info = {"json": row}
+        if row_ids is not None:
+            info["insertId"] = row_ids[index]
+        else:
+            info["insertId"] = str(uuid.uuid4())
+        rows_info.append(info)
+
+    if skip_invalid_rows is not None:
+        data["skipInvalidRows"] = skip_invalid_rows
+
+    if ignore_unknown_values is not None:
+        data["ignoreUnknownValues"] = ignore_unknown_values
+
+    if template_suffix is not None:
+        data["templateSuffix"] = template_suffix
+
+    return data
+
+
 def _get_upload_headers(user_agent):
     """Get the headers for an upload request.
 
@@ -23,10 +23,14 @@ class Connection(object):
 
     Args:
         client (google.cloud.bigquery.Client): A client used to connect to BigQuery.
+        bqstorage_client (google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient):
+            (Optional) A client used to fetch the query results with the
+            BigQuery Storage API.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, bqstorage_client=None):
         self._client = client
+        self._bqstorage_client = bqstorage_client
 
     def close(self):
         """No-op."""
@@ -43,17 +47,25 @@ class Connection(object):
         return cursor.Cursor(self)
 
 
-def connect(client=None):
+def connect(client=None, bqstorage_client=None):
     """Construct a DB-API connection to Google BigQuery.
 
     Args:
         client (google.cloud.bigquery.Client):
             (Optional) A client used to connect to BigQuery. If not passed, a
             client is created using default options inferred from the environment.
+        bqstorage_client (google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient):
+            (Optional) A client used to fetch the query results with the
+            BigQuery Storage API, rather than with ``tabledata.list``
+            requests. The results are streamed from several read streams at
+            once, unless the query has an ``ORDER BY`` clause, and decoded a
+            record batch at a time. This API is billed separately, and
+            requires the ``pyarrow`` and ``google-cloud-bigquery-storage``
+            libraries.
 
     Returns:
         google.cloud.bigquery.dbapi.Connection: A new DB-API connection to BigQuery.
     """
     if client is None:
         client = bigquery.Client()
-    return Connection(client)
+    return Connection(client, bqstorage_client=bqstorage_client)
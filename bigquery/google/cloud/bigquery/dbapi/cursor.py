@@ -15,6 +15,7 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import itertools
 
 try:
     from collections import abc as collections_abc
@@ -23,11 +24,26 @@ except ImportError:  # Python 2.7
 
 import six
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+import google.api_core.exceptions
+from google.cloud.bigquery import _helpers as bq_helpers
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery import job
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.dbapi import exceptions
+from google.cloud.bigquery.table import Row
 import google.cloud.exceptions
 
+
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to fetch the results as record batches."
+)
+
 # Per PEP 249: A 7-item sequence containing information describing one result
 # column. The first two items (name and type_code) are mandatory, the other
 # five are optional and are set to None if no meaningful values can be
@@ -192,6 +208,20 @@ class Cursor(object):
         for parameters in seq_of_parameters:
             self.execute(operation, parameters)
 
+    def _is_dml(self):
+        return (
+            self._query_job.statement_type
+            and self._query_job.statement_type.upper() != "SELECT"
+        )
+
+    def _list_rows(self):
+        client = self.connection._client
+        return client.list_rows(
+            self._query_job.destination,
+            selected_fields=self._query_job._query_results.schema,
+            page_size=self.arraysize,
+        )
+
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
 
@@ -202,22 +232,61 @@ class Cursor(object):
                 "No query results: execute() must be called before fetch."
             )
 
-        is_dml = (
-            self._query_job.statement_type
-            and self._query_job.statement_type.upper() != "SELECT"
-        )
-        if is_dml:
+        if self._is_dml():
             self._query_data = iter([])
             return
 
         if self._query_data is None:
-            client = self.connection._client
-            rows_iter = client.list_rows(
-                self._query_job.destination,
-                selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize,
+            bqstorage_client = self.connection._bqstorage_client
+            if bqstorage_client is not None:
+                self._query_data = self._bqstorage_fetch(bqstorage_client)
+            else:
+                self._query_data = iter(self._list_rows())
+
+    def _bqstorage_fetch(self, bqstorage_client):
+        """Start reading the query results with the BigQuery Storage API.
+
+        If the read session cannot be created or read, as for some small
+        anonymous query results tables, the rows are listed with
+        tabledata.list instead, like
+        :meth:`~google.cloud.bigquery.table.RowIterator.to_arrow` does.
+
+        Returns:
+            _ArrowRows: The rows, decoded a record batch at a time.
+
+        Raises:
+            google.cloud.bigquery.dbapi.DatabaseError:
+                if reading the results is not allowed, e.g. because the
+                BigQuery Storage API is not enabled.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        schema = self._query_job._query_results.schema
+        record_batches = _pandas_helpers.download_arrow_bqstorage(
+            self.connection._client.project,
+            self._query_job.destination,
+            bqstorage_client,
+            preserve_order=job._contains_order_by(self._query_job.query),
+            selected_fields=schema,
+        )
+        try:
+            # Start reading, so that errors creating the read session are
+            # raised here, while the rows can still be listed instead.
+            first_batch = next(record_batches, None)
+        except google.api_core.exceptions.Forbidden as exc:
+            # Don't hide errors such as insufficient permissions to create a
+            # read session, or the API not being enabled.
+            raise exceptions.DatabaseError(exc)
+        except google.api_core.exceptions.GoogleAPICallError:
+            rows_iter = self._list_rows()
+            record_batches = _pandas_helpers.download_arrow_tabledata_list(
+                rows_iter.pages, rows_iter.schema
             )
-            self._query_data = iter(rows_iter)
+        else:
+            if first_batch is not None:
+                record_batches = itertools.chain([first_batch], record_batches)
+        return _ArrowRows(_raise_database_errors(record_batches), schema)
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -263,6 +332,10 @@ class Cursor(object):
             size = self.arraysize if self.arraysize else 1
 
         self._try_fetch(size=size)
+
+        if isinstance(self._query_data, _ArrowRows):
+            return self._query_data.take(size)
+
         rows = []
 
         for row in self._query_data:
@@ -282,8 +355,54 @@ class Cursor(object):
             google.cloud.bigquery.dbapi.InterfaceError: if called before ``execute()``.
         """
         self._try_fetch()
+
+        if isinstance(self._query_data, _ArrowRows):
+            return self._query_data.take()
+
         return list(self._query_data)
 
+    def fetch_arrow_batches(self):
+        """Fetch the remaining results of the last ``execute*()`` call as
+        Arrow record batches.
+
+        This is an extension to the DB-API, to read the results in columnar
+        format. With a BigQuery Storage API client, the batches are those
+        decoded from the read streams. Otherwise, a batch is made from each
+        page of rows, and the results must not have been fetched with the
+        other ``fetch*()`` methods before.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: The remaining results.
+
+        Raises:
+            google.cloud.bigquery.dbapi.InterfaceError:
+                if called before ``execute()``, or after fetching rows
+                without a BigQuery Storage API client.
+            ValueError: if the :mod:`pyarrow` library is not installed.
+        """
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        if self._query_data is None and self._query_job is not None:
+            if self.connection._bqstorage_client is None and not self._is_dml():
+                rows_iter = self._list_rows()
+                self._query_data = iter([])
+                return _pandas_helpers.download_arrow_tabledata_list(
+                    rows_iter.pages, rows_iter.schema
+                )
+
+        self._try_fetch()
+
+        if isinstance(self._query_data, _ArrowRows):
+            return self._query_data.record_batches()
+        if self._is_dml():
+            return iter([])
+
+        raise exceptions.InterfaceError(
+            "fetch_arrow_batches() cannot be called after rows were fetched, "
+            "unless the connection has a BigQuery Storage API client."
+        )
+
     def setinputsizes(self, sizes):
         """No-op."""
 
@@ -291,6 +410,94 @@ class Cursor(object):
         """No-op."""
 
 
+class _ArrowRows(six.Iterator):
+    """Rows of query results, decoded from Arrow record batches.
+
+    Each record batch is converted to rows, column by column, when the rows
+    before it have been consumed.
+
+    Args:
+        record_batches (Iterable[pyarrow.RecordBatch]):
+            The query results.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The fields of the rows.
+    """
+
+    def __init__(self, record_batches, schema):
+        self._record_batches = iter(record_batches)
+        self._field_names = [field.name for field in schema]
+        self._field_to_index = bq_helpers._field_to_index_mapping(schema)
+        self._batch = None
+        self._rows = []
+        self._offset = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._fill():
+            raise StopIteration
+        row = self._rows[self._offset]
+        self._offset += 1
+        return row
+
+    def take(self, size=None):
+        """Return the next ``size`` rows, or all the remaining rows."""
+        rows = []
+        while (size is None or len(rows) < size) and self._fill():
+            end = None if size is None else self._offset + size - len(rows)
+            chunk = self._rows[self._offset : end]
+            rows.extend(chunk)
+            self._offset += len(chunk)
+        return rows
+
+    def record_batches(self):
+        """Yield the remaining rows as record batches."""
+        if self._offset < len(self._rows):
+            batch = self._batch.slice(self._offset)
+            self._rows = []
+            self._offset = 0
+            yield batch
+
+        for batch in self._record_batches:
+            yield batch
+
+    def _fill(self):
+        """Decode the next record batch if all rows have been consumed.
+
+        Returns:
+            bool: ``False`` if there are no more rows.
+        """
+        while self._offset >= len(self._rows):
+            batch = next(self._record_batches, None)
+            if batch is None:
+                return False
+            self._batch = batch
+            self._rows = _record_batch_to_rows(
+                batch, self._field_names, self._field_to_index
+            )
+            self._offset = 0
+        return True
+
+
+def _raise_database_errors(iterable):
+    """Re-raise API errors raised while iterating as DB-API errors."""
+    try:
+        for item in iterable:
+            yield item
+    except google.api_core.exceptions.GoogleAPICallError as exc:
+        raise exceptions.DatabaseError(exc)
+
+
+def _record_batch_to_rows(record_batch, field_names, field_to_index):
+    """Convert a record batch to rows, a column at a time."""
+    column_index = {name: index for index, name in enumerate(record_batch.schema.names)}
+    columns = [
+        record_batch.column(column_index[name]).to_pylist() for name in field_names
+    ]
+    return [Row(values, field_to_index) for values in zip(*columns)]
+
+
 def _format_operation_list(operation, parameters):
     """Formats parameters in operation in the way BigQuery expects.
 
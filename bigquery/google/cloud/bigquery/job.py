@@ -18,8 +18,10 @@ from __future__ import division
 
 import concurrent.futures
 import copy
+import functools
 import re
 import threading
+import time
 
 import requests
 import six
@@ -36,6 +38,7 @@ from google.cloud.bigquery.encryption_configuration import EncryptionConfigurati
 from google.cloud.bigquery.external_config import ExternalConfig
 from google.cloud.bigquery.external_config import HivePartitioningOptions
 from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery.query import _query_param_from_api_repr
 from google.cloud.bigquery.query import ArrayQueryParameter
 from google.cloud.bigquery.query import ScalarQueryParameter
@@ -56,6 +59,16 @@ _DONE_STATE = "DONE"
 _STOPPED_REASON = "stopped"
 _TIMEOUT_BUFFER_SECS = 0.1
 _SERVER_TIMEOUT_MARGIN_SECS = 1.0
+# Jobs are polled quickly at first, then with an exponentially growing delay.
+_POLL_INITIAL_DELAY_SECS = 0.1
+_POLL_MAX_DELAY_SECS = 60.0
+_POLL_DELAY_MULTIPLIER = 2.0
+# Query jobs with progress statistics are polled again after this fraction of
+# their estimated remaining time.
+_POLL_ESTIMATE_FRACTION = 0.5
+# The statistics of a query job are refreshed while polling only once the
+# delay between polls is at least this long.
+_POLL_STATISTICS_MIN_DELAY_SECS = 2.0
 _CONTAINS_ORDER_BY = re.compile(r"ORDER\s+BY", re.IGNORECASE)
 
 _ERROR_REASON_TO_EXCEPTION = {
@@ -80,6 +93,30 @@ _ERROR_REASON_TO_EXCEPTION = {
 }
 
 
+def _poll_delay(delay, remaining_secs=None):
+    """Return the number of seconds to wait before polling jobs again.
+
+    Args:
+        delay (Optional[float]):
+            The previous delay, or ``None`` after the first poll.
+        remaining_secs (Optional[float]):
+            The estimated remaining time of the jobs, if known.
+
+    Returns:
+        float:
+            A fraction of ``remaining_secs`` if set, otherwise a delay
+            growing exponentially from :data:`_POLL_INITIAL_DELAY_SECS`. The
+            delay is at most :data:`_POLL_MAX_DELAY_SECS`.
+    """
+    if remaining_secs is not None:
+        delay = remaining_secs * _POLL_ESTIMATE_FRACTION
+    elif delay is None:
+        delay = _POLL_INITIAL_DELAY_SECS
+    else:
+        delay *= _POLL_DELAY_MULTIPLIER
+    return max(_POLL_INITIAL_DELAY_SECS, min(delay, _POLL_MAX_DELAY_SECS))
+
+
 def _error_result_to_exception(error_result):
     """Maps BigQuery error reasons to an exception.
 
@@ -770,6 +807,60 @@ class _AsyncJob(google.api_core.future.polling.PollingFuture):
             else:
                 self.set_result(self)
 
+    def _next_poll_delay(self, delay):
+        """Return the number of seconds to wait before polling the job again.
+
+        Args:
+            delay (Optional[float]):
+                The previous delay, or ``None`` after the first poll.
+
+        Returns:
+            float: The delay, growing exponentially from
+            :data:`_POLL_INITIAL_DELAY_SECS` to :data:`_POLL_MAX_DELAY_SECS`.
+        """
+        return _poll_delay(delay)
+
+    def _blocking_poll(self, timeout=None):
+        """Poll the job until it is done.
+
+        Rather than waiting a fixed delay between polls, as
+        :class:`~google.api_core.future.polling.PollingFuture` does, the
+        delay is given by :meth:`_next_poll_delay`.
+
+        Args:
+            timeout (Optional[float]):
+                How long (in seconds) to wait for the job to complete. If
+                ``None``, wait indefinitely.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the job did not complete in the given timeout.
+        """
+        if self._result_set:
+            return
+
+        deadline = None if timeout is None else time.time() + timeout
+        delay = None
+        while True:
+            try:
+                if self.done():
+                    return
+                delay = self._next_poll_delay(delay)
+            except Exception as exc:
+                # Transient polling errors, as retried by PollingFuture.
+                if not google.api_core.future.polling.RETRY_PREDICATE(exc):
+                    raise
+                delay = _poll_delay(delay)
+
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise concurrent.futures.TimeoutError(
+                        "Operation did not complete within the designated timeout."
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
     def done(self, retry=DEFAULT_RETRY, timeout=None):
         """Refresh the job and checks if it is complete.
 
@@ -2602,6 +2693,9 @@ class QueryJob(_AsyncJob):
         self._configuration = job_config
         self._query_results = None
         self._done_timeout = None
+        # Set by Client.query when a query cache is used.
+        self._query_cache_key = None
+        self._cached_rows = None
 
     @property
     def allow_large_results(self):
@@ -3097,6 +3191,39 @@ class QueryJob(_AsyncJob):
         self._done_timeout = timeout
         super(QueryJob, self)._blocking_poll(timeout=timeout)
 
+    def _next_poll_delay(self, delay):
+        """Return the number of seconds to wait before polling the job again.
+
+        Once the polls are far enough apart, the job statistics are refreshed
+        to estimate the remaining time of the query from its latest
+        :attr:`timeline` sample. The delay is then a fraction of this
+        estimate, rather than growing exponentially.
+        """
+        if delay is not None and delay >= _POLL_STATISTICS_MIN_DELAY_SECS:
+            self.reload()
+
+        return _poll_delay(delay, self._estimate_remaining_secs())
+
+    def _estimate_remaining_secs(self):
+        """Estimate the remaining time of the query from its progress.
+
+        Returns:
+            Optional[float]:
+                The elapsed time, scaled by the ratio of the pending to the
+                completed units of work, or ``None`` without progress.
+        """
+        timeline = self.timeline
+        if not timeline:
+            return None
+        sample = timeline[-1]
+        if (
+            not sample.elapsed_ms
+            or not sample.completed_units
+            or sample.pending_units is None
+        ):
+            return None
+        return sample.elapsed_ms / 1000 * sample.pending_units / sample.completed_units
+
     @staticmethod
     def _format_for_exception(query, job_id):
         """Format a query for the output in exception message.
@@ -3182,12 +3309,21 @@ class QueryJob(_AsyncJob):
                 set** (this is distinct from the total number of rows in the
                 current page: ``iterator.page.num_items``).
 
+                If the client has a
+                :class:`~google.cloud.bigquery.query_cache.QueryCache`, the
+                rows are cached when they are all downloaded with the
+                iterator's ``to_arrow()`` or ``to_dataframe()`` methods,
+                unless ``max_results`` is set.
+
         Raises:
             google.cloud.exceptions.GoogleCloudError:
                 If the job failed.
             concurrent.futures.TimeoutError:
                 If the job did not complete in the given timeout.
         """
+        if self._cached_rows is not None:
+            return self._cached_rows
+
         try:
             guard = TimeoutGuard(
                 timeout, timeout_error_type=concurrent.futures.TimeoutError
@@ -3236,6 +3372,19 @@ class QueryJob(_AsyncJob):
             timeout=timeout,
         )
         rows._preserve_order = _contains_order_by(self.query)
+
+        if (
+            self._query_cache_key is not None
+            and max_results is None
+            and self.statement_type == "SELECT"
+        ):
+            rows._on_arrow_table = functools.partial(
+                self._client._query_cache._put,
+                self._client,
+                self._query_cache_key,
+                self,
+                bq_schema=schema,
+            )
         return rows
 
     # If changing the signature of this method, make sure to apply the same
@@ -3245,6 +3394,8 @@ class QueryJob(_AsyncJob):
         progress_bar_type=None,
         bqstorage_client=None,
         create_bqstorage_client=False,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
     ):
         """[Beta] Create a class:`pyarrow.Table` by loading all pages of a
         table or query.
@@ -3276,8 +3427,10 @@ class QueryJob(_AsyncJob):
                 This method requires the ``pyarrow`` and
                 ``google-cloud-bigquery-storage`` libraries.
 
-                Reading from a specific partition or snapshot is not
-                currently supported by this method.
+                A partition decorator, such as ``my_table$20181225``, is
+                read as a row restriction, and a snapshot decorator, such as
+                ``my_table@1234567890000``, as the read session snapshot time.
+                Only daily and integer range partitions are supported.
             create_bqstorage_client (bool):
                 **Beta Feature** Optional. If ``True``, create a BigQuery
                 Storage API client using the default API settings. The
@@ -3288,6 +3441,17 @@ class QueryJob(_AsyncJob):
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
                 ..versionadded:: 1.24.0
+            max_queue_size (Optional[int]):
+                The maximum number of result pages to hold in memory, waiting
+                to be processed, when reading with the BigQuery Storage API.
+
+                See
+                :func:`~google.cloud.bigquery.table.RowIterator.to_arrow`
+                for details.
+            max_workers (Optional[int]):
+                The maximum number of threads reading the streams of the
+                BigQuery Storage API read session. By default, one thread per
+                stream.
 
         Returns:
             pyarrow.Table
@@ -3305,6 +3469,8 @@ class QueryJob(_AsyncJob):
             progress_bar_type=progress_bar_type,
             bqstorage_client=bqstorage_client,
             create_bqstorage_client=create_bqstorage_client,
+            max_queue_size=max_queue_size,
+            max_workers=max_workers,
         )
 
     # If changing the signature of this method, make sure to apply the same
@@ -3315,6 +3481,8 @@ class QueryJob(_AsyncJob):
         dtypes=None,
         progress_bar_type=None,
         create_bqstorage_client=False,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
     ):
         """Return a pandas DataFrame from a QueryJob
 
@@ -3327,8 +3495,10 @@ class QueryJob(_AsyncJob):
                 This method requires the ``fastavro`` and
                 ``google-cloud-bigquery-storage`` libraries.
 
-                Reading from a specific partition or snapshot is not
-                currently supported by this method.
+                A partition decorator, such as ``my_table$20181225``, is
+                read as a row restriction, and a snapshot decorator, such as
+                ``my_table@1234567890000``, as the read session snapshot time.
+                Only daily and integer range partitions are supported.
 
                 **Caution**: There is a known issue reading small anonymous
                 query result tables with the BQ Storage API. Write your query
@@ -3358,6 +3528,17 @@ class QueryJob(_AsyncJob):
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
                 ..versionadded:: 1.24.0
+            max_queue_size (Optional[int]):
+                The maximum number of result pages to hold in memory, waiting
+                to be processed, when reading with the BigQuery Storage API.
+
+                See
+                :func:`~google.cloud.bigquery.table.RowIterator.to_dataframe`
+                for details.
+            max_workers (Optional[int]):
+                The maximum number of threads reading the streams of the
+                BigQuery Storage API read session. By default, one thread per
+                stream.
 
         Returns:
             A :class:`~pandas.DataFrame` populated with row data and column
@@ -3372,6 +3553,8 @@ class QueryJob(_AsyncJob):
             dtypes=dtypes,
             progress_bar_type=progress_bar_type,
             create_bqstorage_client=create_bqstorage_client,
+            max_queue_size=max_queue_size,
+            max_workers=max_workers,
         )
 
     def __iter__(self):
@@ -0,0 +1,356 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of query results."""
+
+from __future__ import absolute_import
+
+import collections
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+import google.api_core.exceptions
+from google.cloud.bigquery import table
+
+
+_NO_PYARROW_ERROR = (
+    "The pyarrow library is not installed, please install "
+    "pyarrow to use the query cache."
+)
+
+# Quoted strings, identifiers and comments are kept as-is when normalizing a
+# query. Only the whitespace between them is collapsed.
+_QUERY_TOKEN_RE = re.compile(
+    r"""
+    (?P<verbatim>
+        '''(?:\\.|[^\\])*?'''
+        | \"\"\"(?:\\.|[^\\])*?\"\"\"
+        | '(?:\\.|[^\\'\n])*'
+        | "(?:\\.|[^\\"\n])*"
+        | `(?:\\.|[^\\`])*`
+        | (?:--|\#)[^\n]*\n?
+        | /\*.*?\*/
+    )
+    | (?P<whitespace>\s+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_CacheEntry = collections.namedtuple(
+    "_CacheEntry",
+    ("job_resource", "schema", "rows", "num_bytes", "expires", "table_versions"),
+)
+
+
+def normalize_query(query):
+    """Collapse the whitespace of a query outside of strings and comments.
+
+    Args:
+        query (str): SQL query.
+
+    Returns:
+        str: The query, without leading or trailing whitespace and with
+        other runs of whitespace replaced by a single space.
+    """
+
+    def replace(match):
+        if match.group("whitespace"):
+            return " "
+        return match.group("verbatim")
+
+    return _QUERY_TOKEN_RE.sub(replace, query).strip()
+
+
+def _table_id(table_ref):
+    return "{}.{}.{}".format(
+        table_ref.project, table_ref.dataset_id, table_ref.table_id
+    )
+
+
+class QueryCache(object):
+    """Cache of query results, shared by the queries of a client.
+
+    Pass the cache to :class:`~google.cloud.bigquery.client.Client` to use
+    it. The results are cached when all the rows of a query job's
+    :meth:`~google.cloud.bigquery.job.QueryJob.result` are downloaded with
+    ``to_arrow()`` or ``to_dataframe()``, including by
+    :meth:`~google.cloud.bigquery.job.QueryJob.to_arrow` and
+    :meth:`~google.cloud.bigquery.job.QueryJob.to_dataframe`. The next
+    :meth:`~google.cloud.bigquery.client.Client.query` call with the same
+    query and configuration returns the cached job without starting a new
+    one, and its ``result()`` reads the cached rows without any request.
+
+    Queries are identified by their text, with the whitespace normalized, and
+    their job configuration, including query parameters. Only ``SELECT``
+    statements without a destination table are cached, and not when
+    :attr:`~google.cloud.bigquery.job.QueryJobConfig.use_query_cache` is
+    ``False``. Results which depend on the time or on random values are not
+    detected, expire them with ``ttl``.
+
+    The rows are kept as :class:`pyarrow.Table` objects, in memory, or in
+    Arrow IPC files in ``directory``. The least recently used results are
+    evicted when the cache is larger than ``max_bytes``.
+
+    Args:
+        ttl (Optional[float]):
+            The number of seconds the results of a query are used. Defaults
+            to 5 minutes.
+        max_bytes (Optional[int]):
+            The maximum size of the cached results, in bytes. Defaults to
+            256 MiB.
+        directory (Optional[str]):
+            If set, write the results as Arrow IPC files to this existing
+            directory, rather than keeping them in memory.
+        check_modified (Optional[bool]):
+            If ``True``, the default, fetch the tables referenced by a query
+            before using its cached results, and drop the results if any of
+            the tables were modified since.
+
+    Raises:
+        ValueError: If the :mod:`pyarrow` library is not installed.
+    """
+
+    def __init__(
+        self,
+        ttl=300.0,
+        max_bytes=256 * 1024 * 1024,
+        directory=None,
+        check_modified=True,
+    ):
+        if pyarrow is None:
+            raise ValueError(_NO_PYARROW_ERROR)
+
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._directory = directory
+        self._check_modified = check_modified
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # Least recently used first.
+        self._num_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def hits(self):
+        """int: The number of queries answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """int: The number of cacheable queries not found in the cache."""
+        return self._misses
+
+    @property
+    def evictions(self):
+        """int: The number of results dropped because they expired or the
+        cache was full."""
+        return self._evictions
+
+    @property
+    def invalidations(self):
+        """int: The number of results dropped because a referenced table was
+        modified, or by :meth:`invalidate`."""
+        return self._invalidations
+
+    @property
+    def num_bytes(self):
+        """int: The size of the cached results, in bytes."""
+        return self._num_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def invalidate(self, table_ref=None):
+        """Drop cached results.
+
+        Args:
+            table_ref (Union[ \
+                google.cloud.bigquery.table.Table, \
+                google.cloud.bigquery.table.TableReference, \
+                str, \
+            ]):
+                Optional. Only drop the results of the queries which
+                reference this table. By default, all results are dropped.
+        """
+        table_id = None
+        if table_ref is not None:
+            table_id = _table_id(table._table_arg_to_table_ref(table_ref))
+
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if table_id is None or table_id in entry.table_versions:
+                    self._remove(key)
+                    self._invalidations += 1
+
+    def _key(self, query, job_config, project, location):
+        """Return the cache key of a query, or ``None`` if it is not cacheable."""
+        if job_config is not None and (
+            job_config.dry_run
+            or job_config.destination is not None
+            or job_config.use_query_cache is False
+        ):
+            return None
+
+        config = job_config.to_api_repr() if job_config is not None else {}
+        config.setdefault("query", {}).pop("query", None)
+        config["query"].setdefault("useLegacySql", False)  # As in QueryJob.
+        key = json.dumps(
+            {
+                "query": normalize_query(query),
+                "configuration": config,
+                "project": project,
+                "location": location,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get(self, client, key):
+        """Return the cached job resource and rows, or ``None``.
+
+        Returns:
+            Optional[Tuple[ \
+                Mapping[str, Any], \
+                google.cloud.bigquery.table._ArrowRowIterator, \
+            ]]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.time():
+                self._remove(key)
+                self._evictions += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+
+        if self._check_modified and self._is_stale(client, entry):
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._remove(key)
+                    self._invalidations += 1
+                self._misses += 1
+            return None
+
+        with self._lock:
+            if self._entries.get(key) is not entry:  # Dropped meanwhile.
+                self._misses += 1
+                return None
+            self._entries[key] = self._entries.pop(key)  # Most recently used.
+            self._hits += 1
+
+        rows = entry.rows
+        if self._directory is not None:
+            rows = pyarrow.ipc.open_file(pyarrow.memory_map(rows, "r")).read_all()
+        return entry.job_resource, table._ArrowRowIterator(rows, entry.schema)
+
+    def _put(self, client, key, query_job, arrow_table, bq_schema):
+        """Cache the results of a finished query job.
+
+        The results are not cached if a table referenced by the query was
+        modified after the job started, as they may predate the recorded
+        version of the table.
+
+        Returns:
+            bool:
+                ``True`` if the cache keeps a reference to ``arrow_table``,
+                which must then not be modified.
+        """
+        table_versions = {}
+        for table_ref in query_job.referenced_tables:
+            modified = None
+            if self._check_modified:
+                modified = client.get_table(table_ref).modified
+                started = query_job.started
+                if started is None or modified is None or modified > started:
+                    return False
+            table_versions[_table_id(table_ref)] = modified
+
+        rows = arrow_table
+        num_bytes = arrow_table.nbytes
+        if self._directory is not None:
+            # Unique file names, in case the results of a query are replaced
+            # while they are being read.
+            rows = os.path.join(
+                self._directory, "{}-{}.arrow".format(key, uuid.uuid4().hex)
+            )
+            with pyarrow.OSFile(rows, "wb") as sink:
+                writer = pyarrow.ipc.new_file(sink, arrow_table.schema)
+                writer.write_table(arrow_table)
+                writer.close()
+            num_bytes = os.path.getsize(rows)
+
+        entry = _CacheEntry(
+            job_resource=copy.deepcopy(query_job._properties),
+            schema=list(bq_schema),
+            rows=rows,
+            num_bytes=num_bytes,
+            expires=time.time() + self._ttl,
+            table_versions=table_versions,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if num_bytes > self._max_bytes:
+                if self._directory is not None:
+                    os.remove(rows)
+                return False
+            self._entries[key] = entry
+            self._num_bytes += num_bytes
+            self._evict()
+
+        return self._directory is None
+
+    def _is_stale(self, client, entry):
+        """Check if a table referenced by the query was modified since."""
+        for table_id, modified in entry.table_versions.items():
+            try:
+                if client.get_table(table_id).modified != modified:
+                    return True
+            except google.api_core.exceptions.NotFound:
+                return True
+        return False
+
+    def _evict(self):
+        """Drop the least recently used results. Must be called with the
+        lock held."""
+        while self._num_bytes > self._max_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._evictions += 1
+
+    def _remove(self, key):
+        """Drop the results of a query. Must be called with the lock held."""
+        entry = self._entries.pop(key)
+        self._num_bytes -= entry.num_bytes
+        if self._directory is not None:
+            try:
+                os.remove(entry.rows)
+            except OSError:  # pragma: NO COVER
+                pass
@@ -16,14 +16,20 @@
 
 from __future__ import absolute_import
 
+import collections
+import concurrent.futures
 import copy
 import datetime
 import functools
+import itertools
 import logging
 import operator
+import threading
 import warnings
 
+import requests
 import six
+from six.moves import queue
 
 try:
     from google.cloud import bigquery_storage_v1beta1
@@ -51,6 +57,7 @@ from google.api_core.page_iterator import HTTPIterator
 import google.cloud._helpers
 from google.cloud.bigquery import _helpers
 from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery.retry import _should_retry
 from google.cloud.bigquery.schema import _build_schema_resource
 from google.cloud.bigquery.schema import _parse_schema_resource
 from google.cloud.bigquery.schema import _to_schema_fields
@@ -1274,6 +1281,47 @@ class Row(object):
         return "Row({}, {})".format(self._xxx_values, f2i)
 
 
+_PREFETCH_INTERVAL = 0.2
+"""Maximum time a page prefetching thread waits before checking whether the
+pages are still needed, in seconds."""
+
+
+_MIN_SHARD_ROWS = 10000
+"""Minimum number of rows downloaded by a thread in a parallel download,
+as splitting small tables only adds requests."""
+
+_MAX_SHARD_ROWS = 100000
+"""Maximum number of rows downloaded by a thread in a parallel download, which
+bounds the number of rows waiting to be merged in order."""
+
+_MAX_SHARD_ATTEMPTS = 3
+"""The number of times downloading a range of rows is attempted in a parallel
+download, in case of transient errors."""
+
+
+def _should_retry_shard(exc):
+    """Predicate for restarting the download of a range of rows."""
+    return _should_retry(exc) or isinstance(
+        exc,
+        (google.api_core.exceptions.ServerError, requests.exceptions.ConnectionError),
+    )
+
+
+def _put_unless_done(items, item, done):
+    """Put an item into a bounded queue, unless ``done`` gets set first.
+
+    Returns:
+        bool: Whether the item has been put into the queue.
+    """
+    while not done.is_set():
+        try:
+            items.put(item, timeout=_PREFETCH_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
 class _NoopProgressBarQueue(object):
     """A fake Queue class that does nothing.
 
@@ -1315,6 +1363,20 @@ class RowIterator(HTTPIterator):
             it. Used to call the BigQuery Storage API to fetch rows.
         selected_fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
             Optional. A subset of columns to select from this table.
+        prefetch_pages (Optional[int]):
+            Optional. The number of pages to fetch in a background thread,
+            ahead of the page being processed, e.g. decoded by
+            :meth:`to_dataframe`. The pages are still returned in order, and
+            at most ``prefetch_pages`` of them wait in memory. By default,
+            each page is fetched only once the previous one has been
+            processed.
+        download_workers (Optional[int]):
+            Optional. The number of threads downloading ranges of rows in
+            parallel in :meth:`to_arrow` and :meth:`to_dataframe`, if the
+            number of rows is known from the ``table``. The ranges are merged
+            in order, and downloading a range is restarted on transient
+            errors. By default, all the pages are fetched one after the
+            other, from a single thread.
 
     """
 
@@ -1330,6 +1392,8 @@ class RowIterator(HTTPIterator):
         extra_params=None,
         table=None,
         selected_fields=None,
+        prefetch_pages=None,
+        download_workers=None,
     ):
         super(RowIterator, self).__init__(
             client,
@@ -1346,12 +1410,18 @@ class RowIterator(HTTPIterator):
         schema = _to_schema_fields(schema)
         self._field_to_index = _helpers._field_to_index_mapping(schema)
         self._page_size = page_size
+        self._prefetch_pages = prefetch_pages
+        self._download_workers = download_workers
         self._preserve_order = False
         self._project = client.project
         self._schema = schema
         self._selected_fields = selected_fields
         self._table = table
         self._total_rows = getattr(table, "num_rows", None)
+        # Called with the table downloaded by to_arrow() or to_dataframe(),
+        # e.g. to cache query results. Returns True if it keeps a reference
+        # to the table.
+        self._on_arrow_table = None
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1367,6 +1437,174 @@ class RowIterator(HTTPIterator):
             method=self._HTTP_METHOD, path=self.path, query_params=params
         )
 
+    def _page_iter(self, increment):
+        """Generator of pages of API responses.
+
+        If ``prefetch_pages`` is set, the pages are fetched in a background
+        thread, and counted in ``page_number`` and ``num_results`` as soon as
+        they are fetched, regardless of ``increment``.
+        """
+        if not self._prefetch_pages:
+            return super(RowIterator, self)._page_iter(increment)
+        return self._prefetching_page_iter()
+
+    def _items_iter(self):
+        """Iterator for each row returned."""
+        if not self._prefetch_pages:
+            return super(RowIterator, self)._items_iter()
+        # The rows are counted in num_results when their page is fetched.
+        return (item for page in self._page_iter(increment=True) for item in page)
+
+    def _prefetching_page_iter(self):
+        pages = queue.Queue()
+        # A free slot is needed to fetch a page, and the page keeps it until
+        # it is handed over to the caller, which bounds the waiting pages.
+        slots = queue.Queue(maxsize=self._prefetch_pages)
+        done = threading.Event()
+
+        worker = threading.Thread(
+            target=self._prefetch_pages_worker,
+            args=(pages, slots, done),
+            name="Thread-RowIterator-Prefetch",
+        )
+        worker.daemon = True
+        worker.start()
+
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                slots.get_nowait()
+                yield page
+        finally:
+            # Stop the worker if the caller stops early, or on errors.
+            done.set()
+
+    def _prefetch_pages_worker(self, pages, slots, done):
+        try:
+            while _put_unless_done(slots, True, done):
+                page = self._next_page()
+                if page is None:
+                    break
+                self.page_number += 1
+                self.num_results += page.num_items
+                pages.put(page)
+        except Exception as exc:  # pylint: disable=broad-except
+            pages.put(exc)
+            return
+        pages.put(None)
+
+    def _download_shards(self):
+        """Split the rows to download into ranges, if it is worth it.
+
+        Returns:
+            Optional[List[Tuple[int, Optional[int]]]]:
+                The start index and the maximum number of rows of each range,
+                or :data:`None` if the rows are to be fetched page by page.
+        """
+        if not self._download_workers or self._download_workers < 2:
+            return None
+        if self._total_rows is None or self.next_page_token is not None:
+            return None
+
+        start_index = int(self.extra_params.get("startIndex", 0))
+        num_rows = self._total_rows - start_index
+        if self.max_results is not None:
+            num_rows = min(num_rows, self.max_results)
+
+        shard_rows = -(-num_rows // self._download_workers)
+        shard_rows = min(max(shard_rows, _MIN_SHARD_ROWS), _MAX_SHARD_ROWS)
+        if num_rows <= shard_rows:
+            return None
+
+        end_index = start_index + num_rows
+        shards = [
+            (shard_start, min(shard_rows, end_index - shard_start))
+            for shard_start in six.moves.range(start_index, end_index, shard_rows)
+        ]
+        if self.max_results is None:
+            # The table may have more rows than it had when num_rows was last
+            # updated, e.g. in its streaming buffer.
+            shards[-1] = (shards[-1][0], None)
+        return shards
+
+    def _download_shard(self, start_index, max_results):
+        """Fetch all the pages of a range of rows.
+
+        The download is restarted from the start of the range on transient
+        errors, at most ``_MAX_SHARD_ATTEMPTS`` times in all.
+        """
+        extra_params = dict(self.extra_params, startIndex=start_index)
+        for attempt in six.moves.range(1, _MAX_SHARD_ATTEMPTS + 1):
+            shard = RowIterator(
+                self.client,
+                self.api_request,
+                self.path,
+                self._schema,
+                max_results=max_results,
+                page_size=self._page_size,
+                extra_params=extra_params,
+                table=self._table,
+                selected_fields=self._selected_fields,
+            )
+            try:
+                return list(shard.pages)
+            except Exception as exc:  # pylint: disable=broad-except
+                if attempt == _MAX_SHARD_ATTEMPTS or not _should_retry_shard(exc):
+                    raise
+                _LOGGER.warning(
+                    "Restarting the download of the rows from index %s: %s",
+                    start_index,
+                    exc,
+                )
+
+    def _sharded_page_iter(self, shards):
+        num_workers = min(self._download_workers, len(shards))
+        shards = iter(shards)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as pool:
+            # Only num_workers ranges are downloaded ahead of the one whose
+            # pages are being returned, to bound the memory used.
+            downloads = collections.deque(
+                pool.submit(self._download_shard, *shard)
+                for shard in itertools.islice(shards, num_workers)
+            )
+            try:
+                while downloads:
+                    pages = downloads.popleft().result()
+                    for shard in itertools.islice(shards, 1):
+                        downloads.append(pool.submit(self._download_shard, *shard))
+
+                    for page in pages:
+                        self.page_number += 1
+                        self.num_results += page.num_items
+                        yield page
+            finally:
+                for download in downloads:
+                    download.cancel()
+
+    def _tabledata_list_pages(self):
+        """Iterator of the pages to download for :meth:`to_arrow` and
+        :meth:`to_dataframe`.
+
+        The pages are fetched in parallel if ``download_workers`` is set and
+        the table is large enough.
+
+        Raises:
+            ValueError: If the iterator has already been started.
+        """
+        shards = self._download_shards()
+        if shards is None:
+            return iter(self.pages)
+
+        if self._started:
+            raise ValueError("Iterator has already started", self)
+        self._started = True
+        return self._sharded_page_iter(shards)
+
     @property
     def schema(self):
         """List[google.cloud.bigquery.schema.SchemaField]: The subset of
@@ -1435,7 +1673,12 @@ class RowIterator(HTTPIterator):
         for item in tabledata_list_download():
             yield item
 
-    def _to_arrow_iterable(self, bqstorage_client=None):
+    def _to_arrow_iterable(
+        self,
+        bqstorage_client=None,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
+    ):
         """Create an iterable of arrow RecordBatches, to process the table as a stream."""
         bqstorage_download = functools.partial(
             _pandas_helpers.download_arrow_bqstorage,
@@ -1444,9 +1687,13 @@ class RowIterator(HTTPIterator):
             bqstorage_client,
             preserve_order=self._preserve_order,
             selected_fields=self._selected_fields,
+            max_queue_size=max_queue_size,
+            max_workers=max_workers,
         )
         tabledata_list_download = functools.partial(
-            _pandas_helpers.download_arrow_tabledata_list, iter(self.pages), self.schema
+            _pandas_helpers.download_arrow_tabledata_list,
+            self._tabledata_list_pages(),
+            self.schema,
         )
         return self._to_page_iterable(
             bqstorage_download,
@@ -1461,6 +1708,8 @@ class RowIterator(HTTPIterator):
         progress_bar_type=None,
         bqstorage_client=None,
         create_bqstorage_client=False,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
     ):
         """[Beta] Create a class:`pyarrow.Table` by loading all pages of a
         table or query.
@@ -1492,8 +1741,12 @@ class RowIterator(HTTPIterator):
                 This method requires the ``pyarrow`` and
                 ``google-cloud-bigquery-storage`` libraries.
 
-                Reading from a specific partition or snapshot is not
-                currently supported by this method.
+                A partition decorator, such as ``my_table$20181225``, is
+                read as a row restriction, and a snapshot decorator, such as
+                ``my_table@1234567890000``, as the read session snapshot time.
+                Only daily and integer range partitions are supported,
+                and the ``__UNPARTITIONED__`` partition is not supported for
+                tables partitioned by a time column.
             create_bqstorage_client (bool):
                 **Beta Feature** Optional. If ``True``, create a BigQuery
                 Storage API client using the default API settings. The
@@ -1504,6 +1757,20 @@ class RowIterator(HTTPIterator):
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
                 ..versionadded:: 1.24.0
+            max_queue_size (Optional[int]):
+                The maximum number of result pages to hold in memory, waiting
+                to be processed, when reading with the BigQuery Storage API.
+                The threads reading the streams block while the limit is
+                reached. Ignored if the BigQuery Storage API is not used.
+
+                By default, as many pages as there are streams. If ``None``,
+                the number of pages is not limited, which can use as much
+                memory as the whole table if the pages are processed slower
+                than they are downloaded.
+            max_workers (Optional[int]):
+                The maximum number of threads reading the streams of the
+                BigQuery Storage API read session. Ignored if the BigQuery
+                Storage API is not used. By default, one thread per stream.
 
         Returns:
             pyarrow.Table
@@ -1516,6 +1783,26 @@ class RowIterator(HTTPIterator):
 
         ..versionadded:: 1.17.0
         """
+        arrow_table = self._to_arrow(
+            progress_bar_type=progress_bar_type,
+            bqstorage_client=bqstorage_client,
+            create_bqstorage_client=create_bqstorage_client,
+            max_queue_size=max_queue_size,
+            max_workers=max_workers,
+        )
+        if self._on_arrow_table is not None:
+            self._on_arrow_table(arrow_table)
+        return arrow_table
+
+    def _to_arrow(
+        self,
+        progress_bar_type=None,
+        bqstorage_client=None,
+        create_bqstorage_client=False,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
+    ):
+        """Download all the rows as a :class:`pyarrow.Table`, see :meth:`to_arrow`."""
         if pyarrow is None:
             raise ValueError(_NO_PYARROW_ERROR)
 
@@ -1529,7 +1816,9 @@ class RowIterator(HTTPIterator):
 
             record_batches = []
             for record_batch in self._to_arrow_iterable(
-                bqstorage_client=bqstorage_client
+                bqstorage_client=bqstorage_client,
+                max_queue_size=max_queue_size,
+                max_workers=max_workers,
             ):
                 record_batches.append(record_batch)
 
@@ -1554,7 +1843,13 @@ class RowIterator(HTTPIterator):
             arrow_schema = _pandas_helpers.bq_to_arrow_schema(self._schema)
             return pyarrow.Table.from_batches(record_batches, schema=arrow_schema)
 
-    def to_dataframe_iterable(self, bqstorage_client=None, dtypes=None):
+    def to_dataframe_iterable(
+        self,
+        bqstorage_client=None,
+        dtypes=None,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
+    ):
         """Create an iterable of pandas DataFrames, to process the table as a stream.
 
         Args:
@@ -1566,8 +1861,12 @@ class RowIterator(HTTPIterator):
                 This method requires the ``pyarrow`` and
                 ``google-cloud-bigquery-storage`` libraries.
 
-                Reading from a specific partition or snapshot is not
-                currently supported by this method.
+                A partition decorator, such as ``my_table$20181225``, is
+                read as a row restriction, and a snapshot decorator, such as
+                ``my_table@1234567890000``, as the read session snapshot time.
+                Only daily and integer range partitions are supported,
+                and the ``__UNPARTITIONED__`` partition is not supported for
+                tables partitioned by a time column.
 
                 **Caution**: There is a known issue reading small anonymous
                 query result tables with the BQ Storage API. When a problem
@@ -1578,6 +1877,20 @@ class RowIterator(HTTPIterator):
                 provided ``dtype`` is used when constructing the series for
                 the column specified. Otherwise, the default pandas behavior
                 is used.
+            max_queue_size (Optional[int]):
+                The maximum number of result pages to hold in memory, waiting
+                to be processed, when reading with the BigQuery Storage API.
+                The threads reading the streams block while the limit is
+                reached. Ignored if the BigQuery Storage API is not used.
+
+                By default, as many pages as there are streams. If ``None``,
+                the number of pages is not limited, which can use as much
+                memory as the whole table if the pages are processed slower
+                than they are downloaded.
+            max_workers (Optional[int]):
+                The maximum number of threads reading the streams of the
+                BigQuery Storage API read session. Ignored if the BigQuery
+                Storage API is not used. By default, one thread per stream.
 
         Returns:
             pandas.DataFrame:
@@ -1602,10 +1915,12 @@ class RowIterator(HTTPIterator):
             dtypes,
             preserve_order=self._preserve_order,
             selected_fields=self._selected_fields,
+            max_queue_size=max_queue_size,
+            max_workers=max_workers,
         )
         tabledata_list_download = functools.partial(
             _pandas_helpers.download_dataframe_tabledata_list,
-            iter(self.pages),
+            self._tabledata_list_pages(),
             self.schema,
             dtypes,
         )
@@ -1623,6 +1938,8 @@ class RowIterator(HTTPIterator):
         dtypes=None,
         progress_bar_type=None,
         create_bqstorage_client=False,
+        max_queue_size=_pandas_helpers._MAX_QUEUE_SIZE_DEFAULT,
+        max_workers=None,
     ):
         """Create a pandas DataFrame by loading all pages of a query.
 
@@ -1635,8 +1952,12 @@ class RowIterator(HTTPIterator):
                 This method requires the ``pyarrow`` and
                 ``google-cloud-bigquery-storage`` libraries.
 
-                Reading from a specific partition or snapshot is not
-                currently supported by this method.
+                A partition decorator, such as ``my_table$20181225``, is
+                read as a row restriction, and a snapshot decorator, such as
+                ``my_table@1234567890000``, as the read session snapshot time.
+                Only daily and integer range partitions are supported,
+                and the ``__UNPARTITIONED__`` partition is not supported for
+                tables partitioned by a time column.
 
                 **Caution**: There is a known issue reading small anonymous
                 query result tables with the BQ Storage API. When a problem
@@ -1677,6 +1998,20 @@ class RowIterator(HTTPIterator):
                 This argument does nothing if ``bqstorage_client`` is supplied.
 
                 ..versionadded:: 1.24.0
+            max_queue_size (Optional[int]):
+                The maximum number of result pages to hold in memory, waiting
+                to be processed, when reading with the BigQuery Storage API.
+                The threads reading the streams block while the limit is
+                reached. Ignored if the BigQuery Storage API is not used.
+
+                By default, as many pages as there are streams. If ``None``,
+                the number of pages is not limited, which can use as much
+                memory as the whole table if the pages are processed slower
+                than they are downloaded.
+            max_workers (Optional[int]):
+                The maximum number of threads reading the streams of the
+                BigQuery Storage API read session. Ignored if the BigQuery
+                Storage API is not used. By default, one thread per stream.
 
         Returns:
             pandas.DataFrame:
@@ -1707,26 +2042,86 @@ class RowIterator(HTTPIterator):
             create_bqstorage_client = False
             bqstorage_client = None
 
+        column_names = [field.name for field in self._schema]
+        if self._on_arrow_table is not None:
+            # Download the rows as an Arrow table, which can be cached.
+            arrow_table = self._to_arrow(
+                progress_bar_type=progress_bar_type,
+                bqstorage_client=bqstorage_client,
+                create_bqstorage_client=create_bqstorage_client,
+                max_queue_size=max_queue_size,
+                max_workers=max_workers,
+            )
+            if self._on_arrow_table(arrow_table):
+                # Don't release the Arrow buffers, the table is kept.
+                dataframe = arrow_table.to_pandas()
+                for column in dtypes:
+                    dataframe[column] = pandas.Series(
+                        dataframe[column], dtype=dtypes[column]
+                    )
+                return dataframe
+
+            record_batches = arrow_table.to_batches()
+            del arrow_table
+            return _pandas_helpers.record_batches_to_dataframe(
+                record_batches, column_names, dtypes
+            )
+
         owns_bqstorage_client = False
         if not bqstorage_client and create_bqstorage_client:
             owns_bqstorage_client = True
             bqstorage_client = self.client._create_bqstorage_client()
 
+        if bqstorage_client is not None:
+            # Keep the BQ Storage API pages as Arrow record batches, which are
+            # converted to a DataFrame at once, rather than page by page.
+            bqstorage_download = functools.partial(
+                _pandas_helpers.download_arrow_bqstorage,
+                self._project,
+                self._table,
+                bqstorage_client,
+                preserve_order=self._preserve_order,
+                selected_fields=self._selected_fields,
+                max_queue_size=max_queue_size,
+                max_workers=max_workers,
+            )
+            tabledata_list_download = functools.partial(
+                _pandas_helpers.download_dataframe_tabledata_list,
+                self._tabledata_list_pages(),
+                self.schema,
+                dtypes,
+            )
+            pages = self._to_page_iterable(
+                bqstorage_download,
+                tabledata_list_download,
+                bqstorage_client=bqstorage_client,
+            )
+        else:
+            pages = self.to_dataframe_iterable(dtypes=dtypes)
+
         try:
             progress_bar = self._get_progress_bar(progress_bar_type)
 
+            record_batches = []
             frames = []
-            for frame in self.to_dataframe_iterable(
-                bqstorage_client=bqstorage_client, dtypes=dtypes
-            ):
-                frames.append(frame)
+            for page in pages:
+                if isinstance(page, pandas.DataFrame):
+                    frames.append(page)
+                    num_rows = len(page)
+                else:
+                    record_batches.append(page)
+                    num_rows = page.num_rows
 
                 if progress_bar is not None:
                     # In some cases, the number of total rows is not populated
                     # until the first page of rows is fetched. Update the
                     # progress bar's total to keep an accurate count.
                     progress_bar.total = progress_bar.total or self.total_rows
-                    progress_bar.update(len(frame))
+                    progress_bar.update(num_rows)
+
+            # Drop the reference to the last page, so that the conversion
+            # below can release its buffers.
+            page = None
 
             if progress_bar is not None:
                 # Indicate that the download has finished.
@@ -1735,10 +2130,22 @@ class RowIterator(HTTPIterator):
             if owns_bqstorage_client:
                 bqstorage_client.transport.channel.close()
 
+        if record_batches:
+            # The BQ Storage API pages come before any tabledata.list page
+            # read after falling back to tabledata.list.
+            frames.insert(
+                0,
+                _pandas_helpers.record_batches_to_dataframe(
+                    record_batches, column_names, dtypes
+                ),
+            )
+
         # Avoid concatting an empty list.
         if not frames:
-            column_names = [field.name for field in self._schema]
             return pandas.DataFrame(columns=column_names)
+        # Avoid copying the only DataFrame.
+        if len(frames) == 1:
+            return frames[0]
         return pandas.concat(frames, ignore_index=True)
 
 
@@ -1759,6 +2166,8 @@ class _EmptyRowIterator(object):
         progress_bar_type=None,
         bqstorage_client=None,
         create_bqstorage_client=False,
+        max_queue_size=None,
+        max_workers=None,
     ):
         """[Beta] Create an empty class:`pyarrow.Table`.
 
@@ -1766,6 +2175,8 @@ class _EmptyRowIterator(object):
             progress_bar_type (Optional[str]): Ignored. Added for compatibility with RowIterator.
             bqstorage_client (Any): Ignored. Added for compatibility with RowIterator.
             create_bqstorage_client (bool): Ignored. Added for compatibility with RowIterator.
+            max_queue_size (Any): Ignored. Added for compatibility with RowIterator.
+            max_workers (Any): Ignored. Added for compatibility with RowIterator.
 
         Returns:
             pyarrow.Table: An empty :class:`pyarrow.Table`.
@@ -1780,6 +2191,8 @@ class _EmptyRowIterator(object):
         dtypes=None,
         progress_bar_type=None,
         create_bqstorage_client=False,
+        max_queue_size=None,
+        max_workers=None,
     ):
         """Create an empty dataframe.
 
@@ -1788,6 +2201,8 @@ class _EmptyRowIterator(object):
             dtypes (Any): Ignored. Added for compatibility with RowIterator.
             progress_bar_type (Any): Ignored. Added for compatibility with RowIterator.
             create_bqstorage_client (bool): Ignored. Added for compatibility with RowIterator.
+            max_queue_size (Any): Ignored. Added for compatibility with RowIterator.
+            max_workers (Any): Ignored. Added for compatibility with RowIterator.
 
         Returns:
             pandas.DataFrame: An empty :class:`~pandas.DataFrame`.
@@ -1800,6 +2215,89 @@ class _EmptyRowIterator(object):
         return iter(())
 
 
+class _ArrowRowIterator(object):
+    """A row iterator over rows already downloaded to a :class:`pyarrow.Table`.
+
+    This class prevents API requests for query results read from a
+    :class:`~google.cloud.bigquery.query_cache.QueryCache`.
+
+    Args:
+        arrow_table (pyarrow.Table): The rows.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+    """
+
+    def __init__(self, arrow_table, schema):
+        self._arrow_table = arrow_table
+        self.schema = list(schema)
+        self.total_rows = arrow_table.num_rows
+        self._field_to_index = _helpers._field_to_index_mapping(self.schema)
+
+    def to_arrow(
+        self,
+        progress_bar_type=None,
+        bqstorage_client=None,
+        create_bqstorage_client=False,
+        max_queue_size=None,
+        max_workers=None,
+    ):
+        """[Beta] Return the rows as a class:`pyarrow.Table`.
+
+        Args:
+            progress_bar_type (Optional[str]): Ignored. Added for compatibility with RowIterator.
+            bqstorage_client (Any): Ignored. Added for compatibility with RowIterator.
+            create_bqstorage_client (bool): Ignored. Added for compatibility with RowIterator.
+            max_queue_size (Any): Ignored. Added for compatibility with RowIterator.
+            max_workers (Any): Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            pyarrow.Table: The rows.
+        """
+        return self._arrow_table
+
+    def to_dataframe(
+        self,
+        bqstorage_client=None,
+        dtypes=None,
+        progress_bar_type=None,
+        create_bqstorage_client=False,
+        max_queue_size=None,
+        max_workers=None,
+    ):
+        """Create a dataframe of the rows.
+
+        Args:
+            bqstorage_client (Any): Ignored. Added for compatibility with RowIterator.
+            dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+                Optional. A dictionary of column names pandas ``dtype``s. The
+                provided ``dtype`` is used when constructing the series for
+                the column specified. Otherwise, the default pandas behavior
+                is used.
+            progress_bar_type (Any): Ignored. Added for compatibility with RowIterator.
+            create_bqstorage_client (bool): Ignored. Added for compatibility with RowIterator.
+            max_queue_size (Any): Ignored. Added for compatibility with RowIterator.
+            max_workers (Any): Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            pandas.DataFrame: A :class:`~pandas.DataFrame` of the rows.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+        if dtypes is None:
+            dtypes = {}
+
+        # Don't release the Arrow buffers, the table may be read again.
+        dataframe = self._arrow_table.to_pandas()
+        for column in dtypes:
+            dataframe[column] = pandas.Series(dataframe[column], dtype=dtypes[column])
+        return dataframe
+
+    def __iter__(self):
+        columns = [column.to_pylist() for column in self._arrow_table.columns]
+        for values in six.moves.zip(*columns):
+            yield Row(values, self._field_to_index)
+
+
 class PartitionRange(object):
     """Definition of the ranges for range partitioning.
 
@@ -2165,6 +2663,8 @@ def _rows_page_start(iterator, page, response):
     # Make a (lazy) copy of the page in column-oriented format for use in data
     # science packages.
     page._columns = _tabledata_list_page_columns(iterator._schema, response)
+    # Keep the raw rows too, to convert the columns of some types at once.
+    page._rows_json = response.get("rows", [])
 
     total_rows = response.get("totalRows")
     if total_rows is not None:
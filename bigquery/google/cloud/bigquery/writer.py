@@ -0,0 +1,307 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch rows inserted with the streaming API in the background."""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import json
+import numbers
+import threading
+import time
+import uuid
+
+from google.cloud.bigquery.client import _INSERT_ROW_OVERHEAD_BYTES
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+
+class InsertRowError(Exception):
+    """A row was not inserted by a ``tabledata.insertAll`` request.
+
+    Args:
+        errors (Sequence[Mapping[str, Any]]):
+            The mappings describing one or more problems with the row.
+    """
+
+    def __init__(self, errors):
+        super(InsertRowError, self).__init__(
+            "Row not inserted: {}".format(
+                "; ".join(error.get("message", "") for error in errors)
+            )
+        )
+        self.errors = errors
+
+
+class StreamingInsertWriter(object):
+    """Insert JSON rows into a table in batches, in the background.
+
+    The rows added from any thread are grouped into ``tabledata.insertAll``
+    requests of at most ``max_rows`` rows and about ``max_bytes`` bytes. A
+    request is also sent ``max_latency`` seconds after the first row of the
+    batch was added. The requests are sent concurrently by a pool of
+    ``max_workers`` threads.
+
+    Each row has an insert ID, so that BigQuery can deduplicate it if it is
+    sent again. The rows which failed with a transient error are sent again,
+    up to ``max_row_retries`` times, without the other rows of their batch.
+
+    Use the writer as a context manager, or call :meth:`close` when done, to
+    send the remaining rows.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to send the requests.
+        table (Union[ \
+            google.cloud.bigquery.table.Table, \
+            google.cloud.bigquery.table.TableReference, \
+            str, \
+        ]):
+            The destination table for the row data, or a reference to it.
+        max_rows (int):
+            The maximum number of rows in a request, at least 1. Defaults to
+            500, the recommended number of rows per request.
+        max_bytes (int):
+            The approximate maximum size of the JSON rows of a request, in
+            bytes, at least 1. A row larger than the limit is sent in a
+            request of its own. Defaults to 5 MiB, half of the request size
+            limit.
+        max_latency (float):
+            The maximum time, in seconds, a row waits for its batch to be
+            sent, at least 0. Defaults to 0.1 second.
+        max_workers (int):
+            The maximum number of requests sent concurrently. Defaults to 4.
+        max_row_retries (int):
+            The number of times the rows which failed with a transient error
+            are sent again, at least 0. Defaults to 3.
+        skip_invalid_rows (Optional[bool]):
+            Insert all valid rows of a request, even if invalid rows exist.
+        ignore_unknown_values (Optional[bool]):
+            Accept rows that contain values that do not match the schema.
+        template_suffix (Optional[str]):
+            Treat the table as a template table and provide a suffix.
+        retry (Optional[google.api_core.retry.Retry]):
+            How to retry the RPCs.
+        timeout (Optional[float]):
+            The number of seconds to wait for the underlying HTTP transport
+            before using ``retry``.
+
+    Raises:
+        ValueError: If a limit is not a number in its allowed range.
+    """
+
+    def __init__(
+        self,
+        client,
+        table,
+        max_rows=500,
+        max_bytes=5 * 1024 * 1024,
+        max_latency=0.1,
+        max_workers=4,
+        max_row_retries=3,
+        skip_invalid_rows=None,
+        ignore_unknown_values=None,
+        template_suffix=None,
+        retry=DEFAULT_RETRY,
+        timeout=None,
+    ):
+        for name, value, minimum in (
+            ("max_rows", max_rows, 1),
+            ("max_bytes", max_bytes, 1),
+            ("max_latency", max_latency, 0),
+            ("max_row_retries", max_row_retries, 0),
+        ):
+            if not isinstance(value, numbers.Real) or value < minimum:
+                raise ValueError(
+                    "{} must be a number of at least {}, got {!r}.".format(
+                        name, minimum, value
+                    )
+                )
+
+        self._client = client
+        self._table = table
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._max_row_retries = max_row_retries
+        self._insert_kwargs = {
+            "skip_invalid_rows": skip_invalid_rows,
+            "ignore_unknown_values": ignore_unknown_values,
+            "template_suffix": template_suffix,
+            "retry": retry,
+            "timeout": timeout,
+        }
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._condition = threading.Condition()
+        self._batch = []
+        self._batch_bytes = 0
+        self._batch_deadline = None
+        self._pending = set()
+        self._closed = False
+
+        self._latency_thread = threading.Thread(
+            name="Thread-StreamingInsertWriterLatency", target=self._send_on_deadline
+        )
+        self._latency_thread.daemon = True
+        self._latency_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def insert_row(self, row, row_id=None):
+        """Add a row to the current batch.
+
+        Args:
+            row (Mapping[str, Any]):
+                A JSON-compatible row, as in
+                :meth:`~google.cloud.bigquery.client.Client.insert_rows_json`.
+            row_id (Optional[str]):
+                The insert ID of the row. By default, a unique ID is created.
+
+        Returns:
+            concurrent.futures.Future:
+                A future resolving to ``None`` once the row is inserted. It
+                raises :exc:`InsertRowError` if the row was rejected, or the
+                exception raised by the request. Cancelling the future before
+                the batch is sent removes the row from the batch.
+
+        Raises:
+            ValueError: If the writer is closed.
+        """
+        if row_id is None:
+            row_id = str(uuid.uuid4())
+        row_bytes = len(json.dumps(row)) + _INSERT_ROW_OVERHEAD_BYTES
+        future = concurrent.futures.Future()
+
+        with self._condition:
+            if self._closed:
+                raise ValueError("Cannot insert rows into a closed writer.")
+
+            if self._batch and self._batch_bytes + row_bytes > self._max_bytes:
+                self._send_batch()
+
+            self._batch.append((row, row_id, future))
+            self._batch_bytes += row_bytes
+
+            if len(self._batch) >= self._max_rows:
+                self._send_batch()
+            elif len(self._batch) == 1:
+                self._batch_deadline = time.time() + self._max_latency
+                self._condition.notify()
+
+        return future
+
+    def insert_rows(self, rows, row_ids=None):
+        """Add rows to the current batch.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): JSON-compatible rows.
+            row_ids (Optional[Sequence[Optional[str]]]):
+                The insert IDs of the rows. By default, unique IDs are
+                created.
+
+        Returns:
+            List[concurrent.futures.Future]: One future per row.
+        """
+        if row_ids is None:
+            row_ids = [None] * len(rows)
+        return [self.insert_row(row, row_id) for row, row_id in zip(rows, row_ids)]
+
+    def flush(self):
+        """Send the current batch, and wait for all the requests to finish."""
+        with self._condition:
+            self._send_batch()
+            pending = list(self._pending)
+        concurrent.futures.wait(pending)
+
+    def close(self):
+        """Send the remaining rows and stop the background threads.
+
+        Rows cannot be inserted once the writer is closed.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self.flush()
+        self._latency_thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _send_batch(self):
+        """Submit the current batch. Must be called with the lock held."""
+        if not self._batch:
+            return
+        batch = self._batch
+        self._batch = []
+        self._batch_bytes = 0
+        self._batch_deadline = None
+
+        request = self._executor.submit(self._insert_batch, batch)
+        self._pending.add(request)
+        request.add_done_callback(self._on_request_done)
+
+    def _on_request_done(self, request):
+        with self._condition:
+            self._pending.discard(request)
+
+    def _send_on_deadline(self):
+        """Send each batch at the latest ``max_latency`` after its first row."""
+        with self._condition:
+            while not self._closed:
+                if self._batch_deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = self._batch_deadline - time.time()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._send_batch()
+
+    def _insert_batch(self, batch):
+        # Don't send the rows whose future was cancelled.
+        batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        json_rows = [row for row, _, _ in batch]
+        row_ids = [row_id for _, row_id, _ in batch]
+        futures = [future for _, _, future in batch]
+
+        def resolve(inserted, errors):
+            """Resolve the futures of the rows done after a request."""
+            for index in inserted:
+                futures[index].set_result(None)
+            for error in errors:
+                futures[error["index"]].set_exception(InsertRowError(error["errors"]))
+
+        try:
+            self._client._insert_json_rows_chunk(
+                self._table,
+                json_rows,
+                row_ids,
+                self._max_row_retries,
+                self._insert_kwargs,
+                (0, len(batch)),
+                on_attempt_done=resolve,
+            )
+        except Exception as exc:
+            # Only the rows not inserted by an earlier request failed.
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
@@ -51,6 +51,7 @@ extras = {
         # https://issues.apache.org/jira/browse/ARROW-5868
         "pyarrow>=0.4.1, != 0.14.0"
     ],
+    "asyncio": ['aiohttp >= 3.3.0, < 4.0.0dev; python_version >= "3.5"'],
     "tqdm": ["tqdm >= 4.0.0, <5.0.0dev"],
     "fastparquet": ["fastparquet", "python-snappy"],
 }
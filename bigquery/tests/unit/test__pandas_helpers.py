@@ -16,7 +16,9 @@ import collections
 import datetime
 import decimal
 import functools
+import io
 import operator
+import os
 import warnings
 
 import mock
@@ -37,6 +39,11 @@ except ImportError:  # pragma: NO COVER
 import pytest
 import pytz
 
+try:
+    from google.cloud import bigquery_storage_v1beta1
+except ImportError:  # pragma: NO COVER
+    bigquery_storage_v1beta1 = None
+
 from google import api_core
 from google.cloud.bigquery import schema
 
@@ -987,6 +994,88 @@ def test_dataframe_to_parquet_compression_method(module_under_test):
     assert call_args.kwargs.get("compression") == "ZSTD"
 
 
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream(module_under_test):
+    bq_schema = (
+        schema.SchemaField("field00", "STRING"),
+        schema.SchemaField("field01", "INTEGER"),
+    )
+    dataframe = pandas.DataFrame(
+        {"field00": [u"row{}".format(n) for n in range(10)], "field01": range(10)}
+    )
+
+    stream = module_under_test.ParquetStream(dataframe, bq_schema, row_group_size=3)
+    chunks = []
+    chunk = stream.read(64)
+    while chunk:
+        chunks.append(chunk)
+        chunk = stream.read(64)
+
+    assert all(len(chunk) == 64 for chunk in chunks[:-1])
+    data = b"".join(chunks)
+    assert stream.tell() == len(data)
+    parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(data))
+    assert parquet_file.num_row_groups == 4
+    assert parquet_file.read().to_pandas().equals(dataframe)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_empty_dataframe(module_under_test):
+    bq_schema = (schema.SchemaField("field00", "STRING"),)
+    dataframe = pandas.DataFrame({"field00": []}, dtype="object")
+
+    stream = module_under_test.ParquetStream(dataframe, bq_schema)
+
+    table = pyarrow.parquet.read_table(io.BytesIO(stream.read()))
+    assert table.num_rows == 0
+    assert table.column_names == ["field00"]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_seek_within_last_read(module_under_test):
+    bq_schema = (schema.SchemaField("field00", "INTEGER"),)
+    dataframe = pandas.DataFrame({"field00": range(100)})
+    stream = module_under_test.ParquetStream(dataframe, bq_schema, row_group_size=10)
+
+    stream.read(100)
+    chunk = stream.read(100)
+    assert stream.seek(150) == 150
+    assert stream.read(50) == chunk[50:]
+    assert stream.seek(-50, os.SEEK_CUR) == 150
+    assert stream.read(50) == chunk[50:]
+
+    with pytest.raises(ValueError):
+        stream.seek(50)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_parquet_stream_row_group_size_w_object_column(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "_PARQUET_ROW_GROUP_BYTES", 64 * 1024)
+    bq_schema = (schema.SchemaField("field00", "STRING"),)
+    dataframe = pandas.DataFrame(
+        {"field00": [u"{:04d}".format(n) * 512 for n in range(2000)]}, dtype="object"
+    )
+
+    stream = module_under_test.ParquetStream(dataframe, bq_schema)
+
+    # Each 2 KB string counts fully, not as an 8-byte object pointer.
+    assert 16 <= stream._row_group_size <= 32
+    parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(stream.read()))
+    assert parquet_file.num_row_groups == -(-2000 // stream._row_group_size)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_parquet_stream_without_pyarrow(module_under_test, monkeypatch):
+    monkeypatch.setattr(module_under_test, "pyarrow", None)
+    with pytest.raises(ValueError) as exc_context:
+        module_under_test.ParquetStream(pandas.DataFrame(), ())
+    assert "pyarrow is required" in str(exc_context.value)
+
+
 @pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
 def test_dataframe_to_bq_schema_fallback_needed_wo_pyarrow(module_under_test):
     dataframe = pandas.DataFrame(
@@ -1324,3 +1413,368 @@ def test_download_dataframe_tabledata_list_dict_sequence_schema(module_under_tes
         )
     )
     assert result.equals(expected_result)
+
+
+def _make_tabledata_list_page(rows_json, columns=()):
+    page = api_core.page_iterator.Page(
+        parent=mock.Mock(),
+        items=[{"page_data": "foo"}],
+        item_to_value=api_core.page_iterator._item_to_value_identity,
+    )
+    page._rows_json = [{"f": [{"v": value} for value in row]} for row in rows_json]
+    # Only the columns which cannot be parsed at once are read cell by cell.
+    page._columns = list(columns)
+    return page
+
+
+_VECTORIZED_SCHEMA = [
+    schema.SchemaField("int_col", "INTEGER"),
+    schema.SchemaField("float_col", "FLOAT64"),
+    schema.SchemaField("bool_col", "BOOLEAN"),
+    schema.SchemaField("ts_col", "TIMESTAMP"),
+]
+
+_VECTORIZED_ROWS = [
+    ["1", "1.5", "true", "1.4338368E9"],
+    ["-10", "-Infinity", "false", "-1.5E-6"],
+    [None, None, None, None],
+]
+
+
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_download_arrow_tabledata_list_parses_columns_at_once(module_under_test):
+    pages = [_make_tabledata_list_page(_VECTORIZED_ROWS)]
+
+    results_gen = module_under_test.download_arrow_tabledata_list(
+        pages, _VECTORIZED_SCHEMA
+    )
+    result = next(results_gen)
+
+    assert result.schema.types == [
+        pyarrow.int64(),
+        pyarrow.float64(),
+        pyarrow.bool_(),
+        pyarrow.timestamp("us", tz="UTC"),
+    ]
+    columns = result.to_pydict()
+    assert columns["int_col"] == [1, -10, None]
+    assert columns["float_col"] == [1.5, float("-inf"), None]
+    assert columns["bool_col"] == [True, False, None]
+    # Timestamps are rounded to microseconds like when converting the rows.
+    assert columns["ts_col"] == [
+        datetime.datetime(2015, 6, 9, 8, 0, tzinfo=pytz.utc),
+        datetime.datetime(1969, 12, 31, 23, 59, 59, 999998, tzinfo=pytz.utc),
+        None,
+    ]
+
+
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_download_arrow_tabledata_list_falls_back_to_cells(module_under_test):
+    # "t" is parsed as True by the per-cell converter, but not by pyarrow.
+    page = _make_tabledata_list_page(
+        [["42", "t"], ["7", "false"]], columns=[[], [True, False]]
+    )
+    bq_schema = [
+        schema.SchemaField("int_col", "INTEGER"),
+        schema.SchemaField("bool_col", "BOOLEAN"),
+    ]
+
+    result = next(module_under_test.download_arrow_tabledata_list([page], bq_schema))
+
+    assert result.to_pydict() == {"int_col": [42, 7], "bool_col": [True, False]}
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_download_dataframe_tabledata_list_parses_columns_at_once(module_under_test):
+    pages = [_make_tabledata_list_page(_VECTORIZED_ROWS)]
+
+    results_gen = module_under_test.download_dataframe_tabledata_list(
+        pages, _VECTORIZED_SCHEMA, dtypes={"float_col": "float32"}
+    )
+    result = next(results_gen)
+
+    assert list(result.columns) == ["int_col", "float_col", "bool_col", "ts_col"]
+    assert result.dtypes["int_col"].name == "float64"
+    assert result.dtypes["float_col"].name == "float32"
+    assert result.dtypes["bool_col"].name == "object"
+    assert result.dtypes["ts_col"].name == "datetime64[ns, UTC]"
+    assert list(result["int_col"][:2]) == [1, -10]
+    assert list(result["bool_col"]) == [True, False, None]
+    assert result["ts_col"][1] == pandas.Timestamp(
+        "1969-12-31 23:59:59.999998", tz="UTC"
+    )
+    assert result.iloc[2].isnull().all()
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_download_dataframe_tabledata_list_timestamp_out_of_bounds(module_under_test):
+    year_one = datetime.datetime(1, 1, 1, tzinfo=pytz.utc)
+    page = _make_tabledata_list_page([["-6.21355968E10"]], columns=[[year_one]])
+    bq_schema = [schema.SchemaField("ts_col", "TIMESTAMP")]
+
+    results_gen = module_under_test.download_dataframe_tabledata_list(
+        [page], bq_schema, dtypes={}
+    )
+    result = next(results_gen)
+
+    assert result.dtypes["ts_col"].name == "object"
+    assert list(result["ts_col"]) == [year_one]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_record_batches_to_dataframe(module_under_test):
+    record_batches = [
+        pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array([1, 2]), pyarrow.array(["a", "b"])],
+            names=["int_col", "str_col"],
+        ),
+        pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array([3]), pyarrow.array(["c"])], names=["int_col", "str_col"]
+        ),
+    ]
+
+    result = module_under_test.record_batches_to_dataframe(
+        record_batches, ["str_col", "int_col"], dtypes={"int_col": "float32"}
+    )
+
+    # The list is emptied so that only the table references the batches.
+    assert record_batches == []
+    assert list(result.columns) == ["str_col", "int_col"]
+    assert result.dtypes["int_col"].name == "float32"
+    assert list(result["int_col"]) == [1.0, 2.0, 3.0]
+    assert list(result["str_col"]) == ["a", "b", "c"]
+    assert list(result.index) == [0, 1, 2]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_record_batches_to_dataframe_w_single_batch_is_writeable(module_under_test):
+    record_batches = [
+        pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array([1, 2]), pyarrow.array([1.5, 2.5])],
+            names=["int_col", "float_col"],
+        )
+    ]
+
+    result = module_under_test.record_batches_to_dataframe(
+        record_batches, ["int_col", "float_col"], dtypes={}
+    )
+    result.loc[0, "int_col"] = 42
+    result.loc[0, "float_col"] = 4.5
+
+    assert list(result["int_col"]) == [42, 2]
+    assert list(result["float_col"]) == [4.5, 2.5]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+@pytest.mark.skipif(isinstance(pyarrow, mock.Mock), reason="Requires `pyarrow`")
+def test_record_batches_to_dataframe_w_missing_column(module_under_test):
+    record_batches = [
+        pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array([1, 2]), pyarrow.array(["a", "b"])],
+            names=["int_col", "str_col"],
+        )
+    ]
+
+    with pytest.raises(ValueError, match="float_col"):
+        module_under_test.record_batches_to_dataframe(
+            record_batches, ["str_col", "float_col"], dtypes={}
+        )
+
+
+@pytest.mark.parametrize(
+    "table_id,time_partitioning,range_partitioning,expected",
+    [
+        ("tbl$20181225", None, None, '_PARTITIONTIME = TIMESTAMP "2018-12-25"'),
+        ("tbl$__UNPARTITIONED__", None, None, "_PARTITIONTIME IS NULL"),
+        ("tbl$20181225", "date_col", None, '`date_col` = DATE "2018-12-25"'),
+        (
+            "tbl$20181225",
+            "ts_col",
+            None,
+            '`ts_col` >= TIMESTAMP "2018-12-25" AND `ts_col` < TIMESTAMP "2018-12-26"',
+        ),
+        ("tbl$__NULL__", "ts_col", None, "`ts_col` IS NULL"),
+        ("tbl$20", None, "int_col", "`int_col` >= 20 AND `int_col` < 30"),
+        ("tbl$__NULL__", None, "int_col", "`int_col` IS NULL"),
+        (
+            "tbl$__UNPARTITIONED__",
+            None,
+            "int_col",
+            "`int_col` < 0 OR `int_col` >= 100",
+        ),
+    ],
+)
+def test_bqstorage_partition_row_restriction(
+    module_under_test, table_id, time_partitioning, range_partitioning, expected
+):
+    from google.cloud.bigquery import table as mut
+
+    table = mut.Table(
+        "proj.dset." + table_id,
+        schema=[
+            schema.SchemaField("date_col", "DATE"),
+            schema.SchemaField("ts_col", "TIMESTAMP"),
+            schema.SchemaField("int_col", "INTEGER"),
+        ],
+    )
+    if time_partitioning is not None:
+        table.time_partitioning = mut.TimePartitioning(field=time_partitioning)
+    if range_partitioning is not None:
+        table.range_partitioning = mut.RangePartitioning(
+            field=range_partitioning,
+            range_=mut.PartitionRange(start=0, end=100, interval=10),
+        )
+    partition_id = table_id.split("$")[1]
+
+    got = module_under_test._bqstorage_partition_row_restriction(table, partition_id)
+
+    assert got == expected
+
+
+def test_bqstorage_partition_row_restriction_w_table_reference(module_under_test):
+    from google.cloud.bigquery import table as mut
+
+    table = mut.TableReference.from_string("proj.dset.tbl$20181225")
+
+    got = module_under_test._bqstorage_partition_row_restriction(table, "20181225")
+
+    assert got == '_PARTITIONTIME = TIMESTAMP "2018-12-25"'
+
+
+def test_bqstorage_partition_row_restriction_w_last_range_partition(module_under_test,):
+    from google.cloud.bigquery import table as mut
+
+    table = mut.Table("proj.dset.tbl$90")
+    table.range_partitioning = mut.RangePartitioning(
+        field="int_col", range_=mut.PartitionRange(start=0, end=95, interval=10)
+    )
+
+    got = module_under_test._bqstorage_partition_row_restriction(table, "90")
+
+    assert got == "`int_col` >= 90 AND `int_col` < 95"
+
+
+def test_bqstorage_partition_row_restriction_unpartitioned_w_time_column(
+    module_under_test,
+):
+    from google.cloud.bigquery import table as mut
+
+    table = mut.Table("proj.dset.tbl$__UNPARTITIONED__")
+    table.time_partitioning = mut.TimePartitioning(field="ts_col")
+
+    with pytest.raises(ValueError, match="__UNPARTITIONED__"):
+        module_under_test._bqstorage_partition_row_restriction(
+            table, "__UNPARTITIONED__"
+        )
+
+
+@pytest.mark.parametrize("partition_id", ["2018122500", "__NULL__", "not-a-day"])
+def test_bqstorage_partition_row_restriction_unsupported(
+    module_under_test, partition_id
+):
+    from google.cloud.bigquery import table as mut
+
+    table = mut.TableReference.from_string("proj.dset.tbl")
+
+    with pytest.raises(ValueError):
+        module_under_test._bqstorage_partition_row_restriction(table, partition_id)
+
+
+@pytest.mark.skipif(
+    bigquery_storage_v1beta1 is None, reason="Requires `google-cloud-bigquery-storage`"
+)
+def test_bqstorage_snapshot_modifiers_relative(module_under_test):
+    with mock.patch("time.time", return_value=1234567890.0):
+        got = module_under_test._bqstorage_snapshot_modifiers("-3600000")
+
+    assert got.snapshot_time.ToMilliseconds() == 1234567890000 - 3600000
+
+
+@pytest.mark.parametrize("snapshot_id", ["0", "1234567890000-1234567899999"])
+def test_bqstorage_snapshot_modifiers_unsupported(module_under_test, snapshot_id):
+    with pytest.raises(ValueError):
+        module_under_test._bqstorage_snapshot_modifiers(snapshot_id)
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_dataframe_to_json_rows(module_under_test):
+    from google.cloud.bigquery import _helpers
+
+    bq_schema = [
+        schema.SchemaField("int_col", "INTEGER"),
+        schema.SchemaField("int_w_nulls_col", "INTEGER"),
+        schema.SchemaField("float_col", "FLOAT"),
+        schema.SchemaField("bool_col", "BOOLEAN"),
+        schema.SchemaField("str_col", "STRING"),
+        schema.SchemaField("ts_col", "TIMESTAMP"),
+        schema.SchemaField("dt_col", "DATETIME"),
+        schema.SchemaField("date_col", "DATE"),
+        schema.SchemaField("num_col", "NUMERIC"),
+        schema.SchemaField("repeated_col", "INTEGER", mode="REPEATED"),
+        schema.SchemaField("missing_col", "STRING"),
+    ]
+    dataframe = pandas.DataFrame(
+        {
+            "int_col": [1, -2],
+            "int_w_nulls_col": [3, None],
+            "float_col": [1.5, float("nan")],
+            "bool_col": [True, False],
+            "str_col": ["abc", None],
+            "ts_col": pandas.to_datetime(
+                ["2019-01-02 03:04:05.678901", "1969-12-31 23:59:59.000000"]
+            ).tz_localize("UTC"),
+            "dt_col": pandas.to_datetime(["2019-01-02 03:04:05.678901", None]),
+            "date_col": pandas.to_datetime(["2019-01-02", "1999-12-31"]),
+            "num_col": [decimal.Decimal("1.25"), None],
+            "repeated_col": [[1, 2], []],
+            "ignored_col": ["x", "y"],
+        }
+    )
+
+    rows = module_under_test.dataframe_to_json_rows(dataframe, bq_schema)
+
+    assert rows == [
+        {
+            "int_col": "1",
+            "int_w_nulls_col": "3",
+            "float_col": 1.5,
+            "bool_col": "true",
+            "str_col": "abc",
+            "ts_col": _helpers._timestamp_to_json_row(
+                datetime.datetime(2019, 1, 2, 3, 4, 5, 678901, tzinfo=pytz.utc)
+            ),
+            "dt_col": "2019-01-02T03:04:05.678901",
+            "date_col": "2019-01-02",
+            "num_col": "1.25",
+            "repeated_col": ["1", "2"],
+            "missing_col": None,
+        },
+        {
+            "int_col": "-2",
+            "int_w_nulls_col": None,
+            "float_col": None,
+            "bool_col": "false",
+            "str_col": None,
+            "ts_col": -1.0,
+            "dt_col": None,
+            "date_col": "1999-12-31",
+            "num_col": None,
+            "repeated_col": [],
+            "missing_col": None,
+        },
+    ]
+
+
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_dataframe_to_json_rows_w_non_integral_floats(module_under_test):
+    bq_schema = [schema.SchemaField("int_col", "INTEGER")]
+    dataframe = pandas.DataFrame({"int_col": [1.0, 2.5]})
+
+    rows = module_under_test.dataframe_to_json_rows(dataframe, bq_schema)
+
+    # Left for the API to reject, like when inserting the values one by one.
+    assert rows == [{"int_col": 1.0}, {"int_col": 2.5}]
@@ -0,0 +1,435 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import unittest
+
+import mock
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+class _Response(object):
+    def __init__(self, loop, status, payload):
+        self._loop = loop
+        self.status = status
+        self._payload = payload
+
+    def read(self):
+        future = self._loop.create_future()
+        future.set_result(json.dumps(self._payload).encode("utf-8"))
+        return future
+
+
+class _Session(object):
+    """Answer the requests with the given (status, payload) pairs."""
+
+    def __init__(self, loop, *responses):
+        self._loop = loop
+        self._responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, data=None):
+        self.requests.append(
+            {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "data": json.loads(data) if data else None,
+            }
+        )
+        future = self._loop.create_future()
+        if self._responses:
+            status, payload = self._responses.pop(0)
+            future.set_result(_Response(self._loop, status, payload))
+        return future
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "Requires `asyncio`")
+class TestAsyncClient(unittest.TestCase):
+    PROJECT = "my-project"
+    JOB_ID = "my-job"
+    TABLE_PATH = "/projects/my-project/datasets/my_dataset/tables/my_table"
+    TABLE_RESOURCE = {
+        "tableReference": {
+            "projectId": "my-project",
+            "datasetId": "my_dataset",
+            "tableId": "my_table",
+        },
+        "schema": {
+            "fields": [
+                {"name": "name", "type": "STRING"},
+                {"name": "age", "type": "INTEGER"},
+            ]
+        },
+    }
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.async_client import AsyncClient
+
+        return AsyncClient
+
+    def _make_one(self, *responses, **kwargs):
+        from google.cloud.bigquery.client import Client
+
+        client = Client(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            _http=object(),
+            **kwargs
+        )
+        session = _Session(self.loop, *responses)
+        return self._get_target_class()(client, session=session, loop=self.loop)
+
+    def _run(self, future):
+        return self.loop.run_until_complete(future)
+
+    def _job_resource(self, state, **kwargs):
+        resource = {
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "configuration": {
+                "query": {
+                    "query": "SELECT name, age FROM t",
+                    "destinationTable": {
+                        "projectId": self.PROJECT,
+                        "datasetId": "_anonymous",
+                        "tableId": "anon_table",
+                    },
+                }
+            },
+            "status": {"state": state},
+        }
+        resource.update(kwargs)
+        return resource
+
+    def test_ctor_wo_aiohttp(self):
+        with mock.patch("google.cloud.bigquery.async_client.aiohttp", None):
+            with self.assertRaises(ValueError):
+                self._get_target_class()(mock.sentinel.client)
+
+    def test_get_table(self):
+        from google.cloud.bigquery.table import Table
+
+        async_client = self._make_one((200, self.TABLE_RESOURCE))
+
+        table = self._run(async_client.get_table("my-project.my_dataset.my_table"))
+
+        self.assertIsInstance(table, Table)
+        self.assertEqual([field.name for field in table.schema], ["name", "age"])
+        request = async_client._session.requests[0]
+        self.assertEqual(request["method"], "GET")
+        self.assertTrue(
+            request["url"].startswith(
+                "https://bigquery.googleapis.com/bigquery/v2" + self.TABLE_PATH
+            )
+        )
+        user_agent = async_client.client._connection.user_agent
+        self.assertEqual(request["headers"]["User-Agent"], user_agent)
+        async_client.client._credentials.apply.assert_called_once_with(
+            request["headers"]
+        )
+
+    def test_get_table_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        error = {"error": {"message": "Not found: Table", "errors": []}}
+        async_client = self._make_one((404, error))
+
+        with self.assertRaises(NotFound) as exc_info:
+            self._run(async_client.get_table("my-project.my_dataset.my_table"))
+
+        self.assertIn("Not found: Table", exc_info.exception.message)
+
+    def test_retries_transient_errors(self):
+        from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+        error = {"error": {"message": "Boom", "errors": [{"reason": "backendError"}]}}
+        async_client = self._make_one((500, error), (200, self.TABLE_RESOURCE))
+        retry = DEFAULT_RETRY.with_delay(initial=0.001)
+
+        table = self._run(
+            async_client.get_table("my-project.my_dataset.my_table", retry=retry)
+        )
+
+        self.assertEqual(table.table_id, "my_table")
+        self.assertEqual(len(async_client._session.requests), 2)
+
+    def test_refreshes_credentials_once(self):
+        async_client = self._make_one(
+            (200, self.TABLE_RESOURCE), (200, self.TABLE_RESOURCE)
+        )
+        credentials = async_client.client._credentials
+        credentials.valid = False
+
+        self._run(
+            asyncio.gather(
+                async_client.get_table("my-project.my_dataset.my_table"),
+                async_client.get_table("my-project.my_dataset.my_table"),
+            )
+        )
+
+        credentials.refresh.assert_called_once()
+        self.assertEqual(credentials.apply.call_count, 2)
+
+    def test_many_concurrent_requests(self):
+        count = 200
+        async_client = self._make_one(*[(200, self.TABLE_RESOURCE)] * count)
+        futures = [
+            async_client.get_table("my-project.my_dataset.my_table")
+            for _ in range(count)
+        ]
+
+        tables = [self._run(future) for future in futures]
+
+        self.assertEqual(len(tables), count)
+        self.assertEqual(len(async_client._session.requests), count)
+
+    def test_cancel_request(self):
+        async_client = self._make_one()  # The request never completes.
+        future = async_client.get_table("my-project.my_dataset.my_table")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self._run(asyncio.wait_for(future, 0.01))
+
+        self.assertTrue(future.cancelled())
+
+    def test_query(self):
+        from google.cloud.bigquery.job import QueryJob
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        async_client = self._make_one(
+            (200, self._job_resource("RUNNING")),
+            default_query_job_config=QueryJobConfig(maximum_bytes_billed=1000),
+        )
+
+        query_job = self._run(
+            async_client.query("SELECT name, age FROM t", job_id=self.JOB_ID)
+        )
+
+        self.assertIsInstance(query_job, QueryJob)
+        self.assertIs(query_job._client, async_client.client)
+        self.assertEqual(query_job.state, "RUNNING")
+        request = async_client._session.requests[0]
+        self.assertEqual(request["method"], "POST")
+        self.assertIn("/projects/my-project/jobs", request["url"])
+        query_config = request["data"]["configuration"]["query"]
+        self.assertEqual(query_config["query"], "SELECT name, age FROM t")
+        self.assertEqual(query_config["maximumBytesBilled"], "1000")
+
+    def test_query_result(self):
+        query_results = {
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "schema": self.TABLE_RESOURCE["schema"],
+            "totalRows": "3",
+        }
+        async_client = self._make_one(
+            (200, self._job_resource("RUNNING")),
+            (200, dict(query_results, jobComplete=False)),
+            (200, dict(query_results, jobComplete=True)),
+            (200, self._job_resource("DONE")),
+            (
+                200,
+                {
+                    "rows": [
+                        {"f": [{"v": "Phred"}, {"v": "32"}]},
+                        {"f": [{"v": "Bharney"}, {"v": "33"}]},
+                    ],
+                    "pageToken": "next",
+                },
+            ),
+            (200, {"rows": [{"f": [{"v": "Wylma"}, {"v": "29"}]}]}),
+        )
+        query_job = self._run(async_client.query("SELECT name, age FROM t"))
+
+        with mock.patch(
+            "google.cloud.bigquery.job._poll_delay", return_value=0.0
+        ) as poll_delay:
+            rows = self._run(async_client.query_result(query_job, page_size=2))
+
+        poll_delay.assert_called()
+        self.assertEqual(query_job.state, "DONE")
+        self.assertEqual(rows.total_rows, 3)
+        first_page = self._run(rows.next_page())
+        self.assertEqual([row.name for row in first_page], ["Phred", "Bharney"])
+        second_page = self._run(rows.next_page())
+        self.assertEqual([row["age"] for row in second_page], [29])
+        self.assertIsNone(self._run(rows.next_page()))
+
+        requests = async_client._session.requests
+        self.assertIn("/queries/", requests[1]["url"])
+        self.assertIn("maxResults=0", requests[1]["url"])
+        self.assertIn("/jobs/", requests[3]["url"])
+        self.assertIn("/datasets/_anonymous/tables/anon_table/data", requests[4]["url"])
+        self.assertIn("maxResults=2", requests[4]["url"])
+        self.assertIn("pageToken=next", requests[5]["url"])
+
+    def test_query_result_job_failed(self):
+        from google.cloud.exceptions import BadRequest
+
+        failed = self._job_resource(
+            "DONE",
+            status={
+                "state": "DONE",
+                "errorResult": {"reason": "invalidQuery", "message": "Bad query."},
+            },
+        )
+        async_client = self._make_one((200, failed))
+        query_job = self._run(async_client.query("SELECT name, age FROM t"))
+
+        with self.assertRaises(BadRequest) as exc_info:
+            self._run(async_client.query_result(query_job))
+
+        self.assertIn("Bad query.", exc_info.exception.message)
+        self.assertIn("SELECT name, age FROM t", exc_info.exception.message)
+        self.assertIs(exc_info.exception.query_job, query_job)
+
+    def test_query_result_wo_rows(self):
+        async_client = self._make_one(
+            (200, self._job_resource("DONE")),
+            (
+                200,
+                {
+                    "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+                    "jobComplete": True,
+                },
+            ),
+        )
+        query_job = self._run(async_client.query("DROP TABLE t"))
+
+        rows = self._run(async_client.query_result(query_job))
+
+        self.assertIsNone(self._run(rows.next_page()))
+        self.assertEqual(len(async_client._session.requests), 2)
+
+    def test_list_rows_fetches_schema(self):
+        async_client = self._make_one(
+            (200, self.TABLE_RESOURCE),
+            (
+                200,
+                {
+                    "totalRows": "3",
+                    "rows": [
+                        {"f": [{"v": "Phred"}, {"v": "32"}]},
+                        {"f": [{"v": "Bharney"}, {"v": "33"}]},
+                    ],
+                    "pageToken": "next",
+                },
+            ),
+        )
+
+        rows = self._run(
+            async_client.list_rows("my-project.my_dataset.my_table", max_results=2)
+        )
+
+        def collect(iterator):
+            result = []
+
+            def next_row(future):
+                if future.exception() is not None:
+                    collected.set_result(result)
+                    return
+                result.append(future.result())
+                iterator.__anext__().add_done_callback(next_row)
+
+            collected = self.loop.create_future()
+            iterator.__aiter__().__anext__().add_done_callback(next_row)
+            return collected
+
+        collected = self._run(collect(rows))
+
+        self.assertEqual(
+            [(row.name, row.age) for row in collected], [("Phred", 32), ("Bharney", 33)]
+        )
+        self.assertEqual(rows.total_rows, 3)
+        # The page token is not followed, max_results was reached.
+        self.assertEqual(len(async_client._session.requests), 2)
+        self.assertIn("maxResults=2", async_client._session.requests[1]["url"])
+
+    def test_list_rows_w_selected_fields(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import TableReference
+
+        async_client = self._make_one((200, {"rows": [{"f": [{"v": "Phred"}]}]}))
+        table_ref = TableReference.from_string("my-project.my_dataset.my_table")
+
+        rows = self._run(
+            async_client.list_rows(
+                table_ref,
+                selected_fields=[SchemaField("name", "STRING")],
+                start_index=1,
+            )
+        )
+        page = self._run(rows.next_page())
+
+        self.assertEqual(page[0].name, "Phred")
+        url = async_client._session.requests[0]["url"]
+        self.assertIn("selectedFields=name", url)
+        self.assertIn("startIndex=1", url)
+
+    def test_list_rows_wo_table(self):
+        async_client = self._make_one()
+
+        with self.assertRaises(TypeError):
+            async_client.list_rows(object())
+
+    def test_insert_rows_json(self):
+        async_client = self._make_one(
+            (200, {"insertErrors": [{"index": "1", "errors": [{"reason": "invalid"}]}]})
+        )
+
+        errors = self._run(
+            async_client.insert_rows_json(
+                "my-project.my_dataset.my_table",
+                [{"name": "Phred"}, {"name": 1}],
+                row_ids=["a", "b"],
+                skip_invalid_rows=True,
+            )
+        )
+
+        self.assertEqual(errors, [{"index": 1, "errors": [{"reason": "invalid"}]}])
+        request = async_client._session.requests[0]
+        self.assertIn(self.TABLE_PATH + "/insertAll", request["url"])
+        self.assertEqual(
+            request["data"],
+            {
+                "rows": [
+                    {"json": {"name": "Phred"}, "insertId": "a"},
+                    {"json": {"name": 1}, "insertId": "b"},
+                ],
+                "skipInvalidRows": True,
+            },
+        )
+
+    def test_close_w_session(self):
+        async_client = self._make_one()
+        session = async_client._session
+
+        self._run(async_client.close())
+
+        self.assertIs(async_client._session, session)
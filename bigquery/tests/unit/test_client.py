@@ -3211,6 +3211,127 @@ class TestClient(unittest.TestCase):
             )
             conn.api_request.reset_mock()
 
+    def _make_query_job_resource(self, job_id, state="RUNNING", **statistics):
+        statistics.setdefault("creationTime", "1437767599006")
+        return {
+            "jobReference": {"projectId": self.PROJECT, "jobId": job_id},
+            "configuration": {"query": {"query": "SELECT 1"}},
+            "status": {"state": state},
+            "statistics": statistics,
+        }
+
+    def test_wait_for_jobs(self):
+        from google.cloud.bigquery.job import QueryJob
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        first = QueryJob.from_api_repr(self._make_query_job_resource("first"), client)
+        second = QueryJob.from_api_repr(
+            self._make_query_job_resource("second", creationTime="1437767600000"),
+            client,
+        )
+        other_job = self._make_query_job_resource("other", state="DONE")
+        conn = client._connection = make_connection(
+            {
+                "jobs": [
+                    other_job,
+                    self._make_query_job_resource(
+                        "second", creationTime="1437767600000"
+                    ),
+                    self._make_query_job_resource("first", state="DONE"),
+                ]
+            },
+            {"jobs": [self._make_query_job_resource("second", state="DONE")]},
+        )
+
+        with mock.patch("time.sleep") as sleep:
+            done, not_done = client.wait_for_jobs([first, second])
+
+        self.assertEqual(done, {first, second})
+        self.assertEqual(not_done, set())
+        self.assertEqual(first.state, "DONE")
+        self.assertEqual(second.state, "DONE")
+        sleep.assert_called_once_with(0.1)
+        # One jobs.list request per poll, from the oldest unfinished job.
+        self.assertEqual(conn.api_request.call_count, 2)
+        first_request, second_request = conn.api_request.call_args_list
+        self.assertEqual(first_request[1]["path"], "/projects/%s/jobs" % self.PROJECT)
+        self.assertEqual(
+            first_request[1]["query_params"]["minCreationTime"], "1437767599006"
+        )
+        self.assertEqual(
+            second_request[1]["query_params"]["minCreationTime"], "1437767600000"
+        )
+
+    def test_wait_for_jobs_reloads_unlisted_jobs(self):
+        from google.cloud.bigquery.job import QueryJob
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        query_job = QueryJob.from_api_repr(
+            self._make_query_job_resource("other-user"), client
+        )
+        conn = client._connection = make_connection(
+            {"jobs": []}, self._make_query_job_resource("other-user", state="DONE")
+        )
+
+        done, not_done = client.wait_for_jobs([query_job])
+
+        self.assertEqual((done, not_done), ({query_job}, set()))
+        self.assertEqual(
+            conn.api_request.call_args[1]["path"],
+            "/projects/%s/jobs/other-user" % self.PROJECT,
+        )
+
+    def test_wait_for_jobs_first_completed(self):
+        import concurrent.futures
+        from google.cloud.bigquery.job import QueryJob
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        first = QueryJob.from_api_repr(self._make_query_job_resource("first"), client)
+        second = QueryJob.from_api_repr(self._make_query_job_resource("second"), client)
+        client._connection = make_connection(
+            {
+                "jobs": [
+                    self._make_query_job_resource("second"),
+                    self._make_query_job_resource("first", state="DONE"),
+                ]
+            }
+        )
+
+        done, not_done = client.wait_for_jobs(
+            [first, second], return_when=concurrent.futures.FIRST_COMPLETED
+        )
+
+        self.assertEqual((done, not_done), ({first}, {second}))
+
+    def test_wait_for_jobs_timeout_w_statistics(self):
+        from google.cloud.bigquery.job import QueryJob
+
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        query_job = QueryJob.from_api_repr(
+            self._make_query_job_resource("running"), client
+        )
+        running = self._make_query_job_resource(
+            "running",
+            query={
+                "timeline": [
+                    {"elapsedMs": "3000", "pendingUnits": "1", "completedUnits": "1"}
+                ]
+            },
+        )
+        client._connection = make_connection({"jobs": [running]}, {"jobs": [running]})
+        clock = mock.patch("time.time", side_effect=[100.0, 100.5, 110.0])
+
+        with mock.patch("time.sleep") as sleep, clock:
+            done, not_done = client.wait_for_jobs([query_job], timeout=10.0)
+
+        self.assertEqual((done, not_done), (set(), {query_job}))
+        # Wait for half the estimated remaining time of 3 seconds.
+        sleep.assert_called_once_with(1.5)
+
     def test_load_table_from_uri(self):
         from google.cloud.bigquery.job import LoadJob, LoadJobConfig
 
@@ -5292,6 +5413,135 @@ class TestClient(unittest.TestCase):
             method="POST", path=API_PATH, data=EXPECTED_SENT_DATA, timeout=None
         )
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_w_max_chunk_bytes(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataframe = pandas.DataFrame({"name": ["a" * 100, "b" * 100, "c", "d"]})
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        conn = client._connection = make_connection({}, {}, {})
+        table = Table(self.TABLE_REF, schema=[SchemaField("name", "STRING")])
+
+        error_info = client.insert_rows_from_dataframe(
+            table, dataframe, chunk_size=None, max_chunk_bytes=200
+        )
+
+        self.assertEqual(error_info, [[], [], []])
+        sent_names = [
+            [row["json"]["name"] for row in call[1]["data"]["rows"]]
+            for call in conn.api_request.call_args_list
+        ]
+        self.assertEqual(sent_names, [["a" * 100], ["b" * 100], ["c", "d"]])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_retries_failed_rows(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataframe = pandas.DataFrame({"age": [10, 20, 30, 40]})
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        backend_error = [{"reason": "backendError", "message": "Try again."}]
+        invalid = [{"reason": "invalid", "message": "Bad row."}]
+        conn = client._connection = make_connection(
+            {
+                "insertErrors": [
+                    {"index": 0, "errors": invalid},
+                    {"index": 2, "errors": backend_error},
+                ]
+            },
+            {},
+            {},
+        )
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        with mock.patch("uuid.uuid4", side_effect=map(str, range(len(dataframe)))):
+            error_info = client.insert_rows_from_dataframe(
+                table, dataframe, chunk_size=3
+            )
+
+        self.assertEqual(error_info, [[{"index": 0, "errors": invalid}], []])
+        sent_rows = [
+            call[1]["data"]["rows"] for call in conn.api_request.call_args_list
+        ]
+        self.assertEqual(
+            sent_rows,
+            [
+                [
+                    {"insertId": "0", "json": {"age": "10"}},
+                    {"insertId": "1", "json": {"age": "20"}},
+                    {"insertId": "2", "json": {"age": "30"}},
+                ],
+                # Only the failed row is sent again, with the same insert ID.
+                [{"insertId": "2", "json": {"age": "30"}}],
+                [{"insertId": "3", "json": {"age": "40"}}],
+            ],
+        )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_rows_from_dataframe_w_max_row_retries(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        dataframe = pandas.DataFrame({"age": [10]})
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        backend_error = [{"reason": "backendError", "message": "Try again."}]
+        response = {"insertErrors": [{"index": 0, "errors": backend_error}]}
+        conn = client._connection = make_connection(response, response)
+        table = Table(self.TABLE_REF, schema=[SchemaField("age", "INTEGER")])
+
+        error_info = client.insert_rows_from_dataframe(
+            table, dataframe, max_row_retries=1
+        )
+
+        self.assertEqual(error_info, [[{"index": 0, "errors": backend_error}]])
+        self.assertEqual(conn.api_request.call_count, 2)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_insert_rows_from_dataframe_w_arrow_table_and_max_workers(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        arrow_table = pyarrow.Table.from_arrays(
+            [pyarrow.array([10, 20, 30]), pyarrow.array([True, False, None])],
+            names=["age", "adult"],
+        )
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        conn = client._connection = make_connection({}, {}, {})
+        schema = [SchemaField("age", "INTEGER"), SchemaField("adult", "BOOLEAN")]
+        table = Table(self.TABLE_REF, schema=schema)
+
+        error_info = client.insert_rows_from_dataframe(
+            table, arrow_table, chunk_size=1, max_workers=3
+        )
+
+        self.assertEqual(error_info, [[], [], []])
+        sent_rows = sorted(
+            (
+                row["json"]
+                for call in conn.api_request.call_args_list
+                for row in call[1]["data"]["rows"]
+            ),
+            key=lambda row: row["age"],
+        )
+        self.assertEqual(
+            sent_rows,
+            [
+                {"age": "10", "adult": "true"},
+                {"age": "20", "adult": "false"},
+                {"age": "30", "adult": None},
+            ],
+        )
+
     def test_insert_rows_json(self):
         from google.cloud.bigquery.dataset import DatasetReference
         from google.cloud.bigquery.schema import SchemaField
@@ -5589,6 +5839,43 @@ class TestClient(unittest.TestCase):
             req = conn.api_request.call_args_list[i]
             self.assertEqual(req[1]["query_params"], test[1], "for kwargs %s" % test[0])
 
+    def test_list_rows_w_prefetch_pages(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        table = Table(
+            self.TABLE_REF, schema=[SchemaField("age", "INTEGER", mode="NULLABLE")]
+        )
+        client._connection = make_connection(
+            {"rows": [{"f": [{"v": "1"}]}], "pageToken": "next"},
+            {"rows": [{"f": [{"v": "2"}]}]},
+        )
+
+        iterator = client.list_rows(table, prefetch_pages=1)
+
+        self.assertEqual(iterator._prefetch_pages, 1)
+        self.assertEqual([row.age for row in iterator], [1, 2])
+
+    def test_list_rows_w_download_workers(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        table = Table(
+            self.TABLE_REF, schema=[SchemaField("age", "INTEGER", mode="NULLABLE")]
+        )
+        table._properties["numRows"] = "100000"
+
+        iterator = client.list_rows(table, download_workers=4)
+
+        self.assertEqual(iterator._download_workers, 4)
+        self.assertEqual(len(iterator._download_shards()), 4)
+
     def test_list_rows_repeated_fields(self):
         from google.cloud.bigquery.schema import SchemaField
 
@@ -6942,6 +7229,63 @@ class TestClientUpload(object):
         err_msg = str(exc.value)
         assert "Expected an instance of LoadJobConfig" in err_msg
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_streaming(self):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"id": range(1000), "name": ["x"] * 1000})
+        schema = (SchemaField("id", "INTEGER"), SchemaField("name", "STRING"))
+        job_config = job.LoadJobConfig(schema=schema)
+        uploaded = []
+
+        def do_resumable_upload(stream, metadata, num_retries):
+            chunk = stream.read(100)
+            while chunk:
+                uploaded.append(chunk)
+                chunk = stream.read(100)
+            response = mock.Mock()
+            response.json.return_value = metadata
+            return response
+
+        upload_patch = mock.patch.object(
+            client, "_do_resumable_upload", side_effect=do_resumable_upload
+        )
+        tempfile_patch = mock.patch("tempfile.mkstemp")
+        with upload_patch as upload, tempfile_patch as mkstemp:
+            load_job = client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_config=job_config, streaming=True
+            )
+
+        mkstemp.assert_not_called()
+        upload.assert_called_once()
+        assert load_job.source_format == job.SourceFormat.PARQUET
+        uploaded_table = pyarrow.parquet.read_table(io.BytesIO(b"".join(uploaded)))
+        assert uploaded_table.to_pandas().equals(dataframe)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_load_table_from_dataframe_w_streaming_wo_pyarrow(self):
+        from google.cloud.bigquery import job
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"id": [1, 2]})
+        job_config = job.LoadJobConfig(schema=[SchemaField("id", "INTEGER")])
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file", autospec=True
+        )
+        pyarrow_patch = mock.patch("google.cloud.bigquery.client.pyarrow", None)
+
+        with load_patch as load_table_from_file, pyarrow_patch:
+            with pytest.raises(ValueError, match="requires pyarrow"):
+                client.load_table_from_dataframe(
+                    dataframe, self.TABLE_REF, job_config=job_config, streaming=True
+                )
+
+        load_table_from_file.assert_not_called()
+
     def test_load_table_from_json_basic_use(self):
         from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
         from google.cloud.bigquery import job
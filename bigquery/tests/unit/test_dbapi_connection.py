@@ -59,6 +59,16 @@ class TestConnection(unittest.TestCase):
         self.assertIsInstance(connection, Connection)
         self.assertIs(connection._client, mock_client)
 
+    def test_connect_w_bqstorage_client(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        mock_client = self._mock_client()
+        connection = connect(
+            client=mock_client, bqstorage_client=mock.sentinel.bqstorage_client
+        )
+        self.assertIs(connection._client, mock_client)
+        self.assertIs(connection._bqstorage_client, mock.sentinel.bqstorage_client)
+
     def test_close(self):
         connection = self._make_one(client=self._mock_client())
         # close() is a no-op, there is nothing to test.
@@ -16,6 +16,11 @@ import unittest
 
 import mock
 
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
 
 class TestCursor(unittest.TestCase):
     @staticmethod
@@ -180,6 +185,202 @@ class TestCursor(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0], (1,))
 
+    def _bqstorage_connection(self, record_batches):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._mock_client(
+            rows=[], schema=[SchemaField("a", "INTEGER"), SchemaField("b", "STRING")],
+        )
+        client.project = "my-project"
+        client.query.return_value.query = "SELECT a, b FROM t"
+        bqstorage_client = mock.Mock()
+        patcher = mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_bqstorage",
+            return_value=iter(record_batches),
+        )
+        download = patcher.start()
+        self.addCleanup(patcher.stop)
+        return dbapi.connect(client, bqstorage_client=bqstorage_client), download
+
+    def _record_batches(self):
+        return [
+            pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(["x", "y", "z"]), pyarrow.array([1, 2, 3])], ["b", "a"],
+            ),
+            pyarrow.RecordBatch.from_arrays(
+                [
+                    pyarrow.array([], type=pyarrow.string()),
+                    pyarrow.array([], type=pyarrow.int64()),
+                ],
+                ["b", "a"],
+            ),
+            pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(["w"]), pyarrow.array([4])], ["b", "a"]
+            ),
+        ]
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_w_bqstorage_client(self):
+        connection, download = self._bqstorage_connection(self._record_batches())
+        cursor = connection.cursor()
+        cursor.execute("SELECT a, b FROM t")
+
+        self.assertEqual(_values(cursor.fetchmany(2)), [(1, "x"), (2, "y")])
+        self.assertEqual(_values(cursor.fetchmany(2)), [(3, "z"), (4, "w")])
+        self.assertEqual(cursor.fetchone(), None)
+        self.assertEqual(cursor.fetchall(), [])
+
+        args, kwargs = download.call_args
+        self.assertIs(args[2], connection._bqstorage_client)
+        self.assertFalse(kwargs["preserve_order"])
+        self.assertEqual(
+            [field.name for field in kwargs["selected_fields"]], ["a", "b"]
+        )
+        # The rows are not listed with tabledata.list.
+        connection._client.list_rows.assert_not_called()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_w_bqstorage_client_falls_back_to_tabledata_list(self):
+        import google.api_core.exceptions
+
+        def fail_to_read():
+            raise google.api_core.exceptions.InternalServerError("can't read")
+            yield  # pragma: NO COVER
+
+        connection, bqstorage_download = self._bqstorage_connection([])
+        bqstorage_download.return_value = fail_to_read()
+        rows_iter = mock.Mock(pages=mock.sentinel.pages, schema=mock.sentinel.schema)
+        connection._client.list_rows.return_value = rows_iter
+        cursor = connection.cursor()
+        cursor.execute("SELECT a, b FROM t")
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_tabledata_list",
+            return_value=iter(self._record_batches()),
+        ) as download:
+            rows = cursor.fetchall()
+
+        self.assertEqual(_values(rows), [(1, "x"), (2, "y"), (3, "z"), (4, "w")])
+        download.assert_called_once_with(mock.sentinel.pages, mock.sentinel.schema)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_w_bqstorage_client_forbidden(self):
+        import google.api_core.exceptions
+        from google.cloud.bigquery import dbapi
+
+        def fail_to_read():
+            raise google.api_core.exceptions.Forbidden("API not enabled")
+            yield  # pragma: NO COVER
+
+        connection, download = self._bqstorage_connection([])
+        download.return_value = fail_to_read()
+        cursor = connection.cursor()
+        cursor.execute("SELECT a, b FROM t")
+
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.fetchone()
+        connection._client.list_rows.assert_not_called()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_w_bqstorage_client_error_while_reading(self):
+        import google.api_core.exceptions
+        from google.cloud.bigquery import dbapi
+
+        first_batch = self._record_batches()[0]
+
+        def fail_after_first_batch():
+            yield first_batch
+            raise google.api_core.exceptions.ServiceUnavailable("try again")
+
+        connection, download = self._bqstorage_connection([])
+        download.return_value = fail_after_first_batch()
+        cursor = connection.cursor()
+        cursor.execute("SELECT a, b FROM t")
+
+        self.assertEqual(cursor.fetchone().values(), (1, "x"))
+        with self.assertRaises(dbapi.DatabaseError):
+            cursor.fetchall()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetchone_and_fetchall_w_bqstorage_client(self):
+        connection, _ = self._bqstorage_connection(self._record_batches())
+        cursor = connection.cursor()
+        cursor.execute("SELECT a, b FROM t")
+
+        row = cursor.fetchone()
+        self.assertEqual(row.values(), (1, "x"))
+        self.assertEqual(row.b, "x")
+        self.assertEqual(_values(cursor.fetchall()), [(2, "y"), (3, "z"), (4, "w")])
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_batches_w_bqstorage_client(self):
+        connection, _ = self._bqstorage_connection(self._record_batches())
+        cursor = connection.cursor()
+        cursor.execute("SELECT a, b FROM t")
+        cursor.fetchone()
+
+        batches = list(cursor.fetch_arrow_batches())
+
+        # The rest of the partially fetched batch comes first.
+        self.assertEqual(batches[0].to_pydict(), {"b": ["y", "z"], "a": [2, 3]})
+        self.assertEqual([batch.num_rows for batch in batches], [2, 0, 1])
+        self.assertIsNone(cursor.fetchone())
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_batches_wo_bqstorage_client(self):
+        from google.cloud.bigquery import dbapi
+
+        rows_iter = mock.Mock(pages=mock.sentinel.pages, schema=mock.sentinel.schema)
+        client = self._mock_client(rows=[])
+        client.list_rows.return_value = rows_iter
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+
+        with mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_tabledata_list",
+            return_value=iter([mock.sentinel.batch]),
+        ) as download:
+            batches = list(cursor.fetch_arrow_batches())
+
+        self.assertEqual(batches, [mock.sentinel.batch])
+        download.assert_called_once_with(mock.sentinel.pages, mock.sentinel.schema)
+        self.assertIsNone(cursor.fetchone())
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_batches_after_fetch_wo_bqstorage_client(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(rows=[(1,), (2,)]))
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+        cursor.fetchone()
+
+        with self.assertRaises(dbapi.InterfaceError):
+            cursor.fetch_arrow_batches()
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_fetch_arrow_batches_w_dml(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(rows=[], num_dml_affected_rows=12))
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM t WHERE TRUE;")
+
+        self.assertEqual(list(cursor.fetch_arrow_batches()), [])
+
+    def test_fetch_arrow_batches_wo_pyarrow(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client(rows=[]))
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1;")
+
+        with mock.patch("google.cloud.bigquery.dbapi.cursor.pyarrow", None):
+            with self.assertRaises(ValueError):
+                cursor.fetch_arrow_batches()
+
     def test_execute_custom_job_id(self):
         from google.cloud.bigquery.dbapi import connect
 
@@ -330,3 +531,7 @@ class TestCursor(unittest.TestCase):
             "SELECT %s, %s;",
             ("hello",),
         )
+
+
+def _values(rows):
+    return [row.values() for row in rows]
@@ -956,6 +956,78 @@ class Test_AsyncJob(unittest.TestCase):
 
         self.assertTrue(job.done())
 
+    def test__blocking_poll_backs_off(self):
+        from google.cloud.bigquery import job as job_module
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        done = mock.patch.object(
+            job, "done", autospec=True, side_effect=[False] * 4 + [True]
+        )
+
+        with done, mock.patch("time.sleep") as sleep:
+            job._blocking_poll()
+
+        delays = [call[0][0] for call in sleep.call_args_list]
+        self.assertEqual(delays[0], job_module._POLL_INITIAL_DELAY_SECS)
+        self.assertEqual(
+            delays[1:],
+            [delay * job_module._POLL_DELAY_MULTIPLIER for delay in delays[:-1]],
+        )
+
+    def test__blocking_poll_retries_transient_errors(self):
+        from google.api_core import exceptions
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        side_effect = [exceptions.InternalServerError("retry"), True]
+
+        with mock.patch.object(job, "done", side_effect=side_effect) as done:
+            with mock.patch("time.sleep"):
+                job._blocking_poll()
+
+        self.assertEqual(done.call_count, 2)
+
+    def test__blocking_poll_raises_other_errors(self):
+        from google.api_core import exceptions
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        error = exceptions.BadRequest("invalid")
+
+        with mock.patch.object(job, "done", side_effect=error):
+            with self.assertRaises(exceptions.BadRequest):
+                job._blocking_poll()
+
+    def test__blocking_poll_timeout(self):
+        import concurrent.futures
+
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, client)
+        clock = mock.patch("time.time", side_effect=[100.0, 100.05, 103.0])
+
+        with mock.patch.object(job, "done", return_value=False), clock:
+            with mock.patch("time.sleep") as sleep:
+                with self.assertRaises(concurrent.futures.TimeoutError):
+                    job._blocking_poll(timeout=2.0)
+
+        self.assertEqual(len(sleep.call_args_list), 1)
+
+    def test__poll_delay(self):
+        from google.cloud.bigquery import job as job_module
+
+        self.assertEqual(
+            job_module._poll_delay(None), job_module._POLL_INITIAL_DELAY_SECS
+        )
+        self.assertEqual(job_module._poll_delay(1.0), 2.0)
+        self.assertEqual(job_module._poll_delay(50.0), job_module._POLL_MAX_DELAY_SECS)
+        self.assertEqual(job_module._poll_delay(None, remaining_secs=10.0), 5.0)
+        self.assertEqual(job_module._poll_delay(30.0, remaining_secs=1.0), 0.5)
+        self.assertEqual(
+            job_module._poll_delay(1.0, remaining_secs=0.0),
+            job_module._POLL_INITIAL_DELAY_SECS,
+        )
+
     @mock.patch("google.api_core.future.polling.PollingFuture.result")
     def test_result_default_wo_state(self, result):
         from google.cloud.bigquery.retry import DEFAULT_RETRY
@@ -3988,6 +4060,55 @@ class TestQueryJob(unittest.TestCase, _Base):
 
         self.assertTrue(job.cancelled())
 
+    def test__estimate_remaining_secs(self):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+        self.assertIsNone(job._estimate_remaining_secs())
+
+        job._properties["statistics"] = {
+            "query": {
+                "timeline": [
+                    {"elapsedMs": "1000", "pendingUnits": "10", "completedUnits": "0"},
+                    {"elapsedMs": "4000", "pendingUnits": "30", "completedUnits": "10"},
+                ]
+            }
+        }
+        self.assertEqual(job._estimate_remaining_secs(), 12.0)
+
+        del job._properties["statistics"]["query"]["timeline"][-1]
+        self.assertIsNone(job._estimate_remaining_secs())
+
+    def test__next_poll_delay_w_statistics(self):
+        from google.cloud.bigquery import job as job_module
+
+        running_resource = self._make_resource()
+        running_resource["statistics"]["query"] = {
+            "timeline": [
+                {"elapsedMs": "60000", "pendingUnits": "90", "completedUnits": "10"}
+            ]
+        }
+        connection = _make_connection(running_resource)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        # Fast polls don't refresh the statistics.
+        self.assertEqual(job._next_poll_delay(None), 0.1)
+        self.assertEqual(job._next_poll_delay(1.0), 2.0)
+        connection.api_request.assert_not_called()
+
+        # Slower polls wait for a fraction of the estimated remaining time.
+        self.assertEqual(job._next_poll_delay(2.0), job_module._POLL_MAX_DELAY_SECS)
+        connection.api_request.assert_called_once()
+
+    def test__blocking_poll_sets_done_timeout(self):
+        client = _make_client(project=self.PROJECT)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        with mock.patch.object(job, "done", return_value=True):
+            job._blocking_poll(timeout=5.0)
+
+        self.assertEqual(job._done_timeout, 5.0)
+
     def test_done(self):
         client = _make_client(project=self.PROJECT)
         resource = self._make_resource(ended=True)
@@ -5455,6 +5576,32 @@ class TestQueryJob(unittest.TestCase, _Base):
 
         self.assertEqual(len(df), 0)
 
+    def test_to_arrow_and_to_dataframe_w_max_queue_size_and_max_workers(self):
+        client = _make_client(self.PROJECT)
+        resource = self._make_resource(ended=True)
+        job = self._get_target_class().from_api_repr(resource, client)
+        result_patch = mock.patch.object(job, "result", autospec=True)
+
+        with result_patch as result:
+            job.to_arrow(max_queue_size=3, max_workers=2)
+            job.to_dataframe(max_queue_size=None, max_workers=4)
+
+        result.return_value.to_arrow.assert_called_once_with(
+            progress_bar_type=None,
+            bqstorage_client=None,
+            create_bqstorage_client=False,
+            max_queue_size=3,
+            max_workers=2,
+        )
+        result.return_value.to_dataframe.assert_called_once_with(
+            bqstorage_client=None,
+            dtypes=None,
+            progress_bar_type=None,
+            create_bqstorage_client=False,
+            max_queue_size=None,
+            max_workers=4,
+        )
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(
         bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
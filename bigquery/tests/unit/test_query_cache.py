@@ -0,0 +1,373 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+try:
+    import pyarrow
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pyarrow = None
+
+from tests.unit.helpers import make_connection
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+class Test_normalize_query(unittest.TestCase):
+    def _call_fut(self, query):
+        from google.cloud.bigquery.query_cache import normalize_query
+
+        return normalize_query(query)
+
+    def test_collapses_whitespace(self):
+        self.assertEqual(
+            self._call_fut("\n  SELECT a,\n\tb  FROM `t`\n"), "SELECT a, b FROM `t`"
+        )
+
+    def test_keeps_strings_and_identifiers(self):
+        query = "SELECT 'a  b', \"c  d\", `d  e`, '''f\n\n g''' FROM t"
+        self.assertEqual(self._call_fut(query), query)
+
+    def test_keeps_comments(self):
+        self.assertEqual(
+            self._call_fut("SELECT 1 -- don't\n,  2 /* a  b */"),
+            "SELECT 1 -- don't\n, 2 /* a  b */",
+        )
+        self.assertNotEqual(
+            self._call_fut("SELECT 1 -- x\n, 2"), self._call_fut("SELECT 1 -- x , 2")
+        )
+
+
+@unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+class TestQueryCache(unittest.TestCase):
+    PROJECT = "my-project"
+    JOB_ID = "my-job"
+    QUERY = "SELECT name FROM `my-project.my_dataset.my_table`"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import QueryCache
+
+        return QueryCache
+
+    def _make_one(self, **kwargs):
+        return self._get_target_class()(**kwargs)
+
+    def _make_client(self, cache, *responses):
+        from google.cloud.bigquery.client import Client
+
+        client = Client(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            _http=object(),
+            query_cache=cache,
+        )
+        client._connection = make_connection(*responses)
+        return client
+
+    def _query_responses(self, modified="1000", started=None):
+        """Responses to run the query, then fetch the referenced table."""
+        job_resource = {
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "configuration": {
+                "query": {
+                    "query": self.QUERY,
+                    "destinationTable": {
+                        "projectId": self.PROJECT,
+                        "datasetId": "_anonymous",
+                        "tableId": "anon_table",
+                    },
+                }
+            },
+            "status": {"state": "DONE"},
+            "statistics": {
+                "startTime": started or modified,
+                "query": {
+                    "statementType": "SELECT",
+                    "referencedTables": [
+                        {
+                            "projectId": self.PROJECT,
+                            "datasetId": "my_dataset",
+                            "tableId": "my_table",
+                        }
+                    ],
+                },
+            },
+        }
+        query_results = {
+            "jobComplete": True,
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "schema": {"fields": [{"name": "name", "type": "STRING"}]},
+            "totalRows": "2",
+        }
+        tabledata = {
+            "totalRows": "2",
+            "rows": [{"f": [{"v": "a"}]}, {"f": [{"v": "b"}]}],
+        }
+        return [
+            job_resource,
+            query_results,
+            tabledata,
+            self._table_resource(modified),
+        ]
+
+    def _table_resource(self, modified):
+        return {
+            "tableReference": {
+                "projectId": self.PROJECT,
+                "datasetId": "my_dataset",
+                "tableId": "my_table",
+            },
+            "lastModifiedTime": modified,
+        }
+
+    def test_ctor_wo_pyarrow(self):
+        with mock.patch("google.cloud.bigquery.query_cache.pyarrow", None):
+            with self.assertRaises(ValueError):
+                self._make_one()
+
+    def test_query_hit(self):
+        from google.cloud.bigquery.table import _ArrowRowIterator
+
+        cache = self._make_one()
+        client = self._make_client(
+            cache, *(self._query_responses() + [self._table_resource("1000")])
+        )
+
+        arrow_table = client.query(self.QUERY).result().to_arrow()
+        self.assertEqual(arrow_table.column(0).to_pylist(), ["a", "b"])
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+        requests_sent = client._connection.api_request.call_count
+
+        query_job = client.query("  SELECT name\nFROM `my-project.my_dataset.my_table`")
+        rows = query_job.result()
+
+        self.assertEqual(query_job.job_id, self.JOB_ID)
+        self.assertIsInstance(rows, _ArrowRowIterator)
+        self.assertEqual([row.name for row in rows], ["a", "b"])
+        self.assertEqual(rows.total_rows, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # Only the referenced table was fetched, to check it is unmodified.
+        self.assertEqual(client._connection.api_request.call_count, requests_sent + 1)
+        self.assertEqual(
+            client._connection.api_request.call_args[1]["path"],
+            "/projects/my-project/datasets/my_dataset/tables/my_table",
+        )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_query_hit_to_dataframe(self):
+        cache = self._make_one(check_modified=False)
+        client = self._make_client(cache, *self._query_responses()[:-1])
+        dataframe = client.query(self.QUERY).to_dataframe()
+        self.assertEqual(list(dataframe["name"]), ["a", "b"])
+        self.assertEqual((cache.hits, len(cache)), (0, 1))
+
+        dataframe = client.query(self.QUERY).to_dataframe()
+
+        self.assertEqual(list(dataframe["name"]), ["a", "b"])
+        self.assertEqual(cache.hits, 1)
+
+    def test_query_miss_for_other_parameters(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        cache = self._make_one(check_modified=False)
+        key = cache._key(self.QUERY, None, self.PROJECT, None)
+        self.assertEqual(
+            key, cache._key(self.QUERY, QueryJobConfig(), "my-project", None)
+        )
+
+        config = QueryJobConfig(
+            query_parameters=[ScalarQueryParameter("x", "INT64", 1)]
+        )
+        other_config = QueryJobConfig(
+            query_parameters=[ScalarQueryParameter("x", "INT64", 2)]
+        )
+        self.assertNotEqual(key, cache._key(self.QUERY, config, self.PROJECT, None))
+        self.assertNotEqual(
+            cache._key(self.QUERY, config, self.PROJECT, None),
+            cache._key(self.QUERY, other_config, self.PROJECT, None),
+        )
+        self.assertNotEqual(key, cache._key(self.QUERY, None, self.PROJECT, "EU"))
+
+    def test_query_not_cacheable(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        cache = self._make_one()
+
+        for config in (
+            QueryJobConfig(dry_run=True),
+            QueryJobConfig(use_query_cache=False),
+            QueryJobConfig(destination="my-project.my_dataset.dest"),
+        ):
+            self.assertIsNone(cache._key(self.QUERY, config, self.PROJECT, None))
+
+    def test_query_invalidated_when_table_modified(self):
+        cache = self._make_one()
+        responses = self._query_responses()
+        responses.append(self._table_resource("2000"))
+        responses.extend(self._query_responses(modified="2000"))
+        client = self._make_client(cache, *responses)
+        client.query(self.QUERY).result().to_arrow()
+
+        arrow_table = client.query(self.QUERY).result().to_arrow()
+
+        self.assertEqual(arrow_table.column(0).to_pylist(), ["a", "b"])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual((cache.invalidations, len(cache)), (1, 1))
+
+    def test_query_not_cached_when_table_modified_after_start(self):
+        cache = self._make_one()
+        client = self._make_client(
+            cache, *self._query_responses(modified="2000", started="1000")
+        )
+
+        arrow_table = client.query(self.QUERY).result().to_arrow()
+
+        self.assertEqual(arrow_table.column(0).to_pylist(), ["a", "b"])
+        self.assertEqual(len(cache), 0)
+
+    def test_query_miss_result_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        cache = self._make_one(check_modified=False)
+        client = self._make_client(cache, *self._query_responses()[:-1])
+
+        rows = client.query(self.QUERY).result()
+
+        self.assertIsInstance(rows, RowIterator)
+        pages = list(rows.pages)
+        self.assertEqual([row.name for row in pages[0]], ["a", "b"])
+        self.assertEqual(rows.num_results, 2)
+        self.assertIsNone(rows.next_page_token)
+        # Only downloading the rows with to_arrow or to_dataframe caches them.
+        self.assertEqual(len(cache), 0)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_query_miss_to_dataframe_w_bqstorage_client(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        cache = self._make_one(check_modified=False)
+        client = self._make_client(cache, *self._query_responses()[:2])
+        bqstorage_client = mock.sentinel.bqstorage_client
+        record_batch = pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(["a", "b"])], names=["name"]
+        )
+
+        with mock.patch.object(
+            RowIterator, "_to_arrow_iterable", return_value=[record_batch]
+        ) as to_arrow_iterable:
+            dataframe = client.query(self.QUERY).to_dataframe(
+                bqstorage_client=bqstorage_client
+            )
+
+        self.assertEqual(
+            to_arrow_iterable.call_args[1]["bqstorage_client"], bqstorage_client
+        )
+        self.assertEqual(list(dataframe["name"]), ["a", "b"])
+        self.assertEqual(len(cache), 1)
+
+        # The cached table is not modified through the DataFrame.
+        dataframe.loc[0, "name"] = "z"
+        dataframe = client.query(self.QUERY).to_dataframe()
+        self.assertEqual(list(dataframe["name"]), ["a", "b"])
+        self.assertEqual(cache.hits, 1)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_query_miss_to_dataframe_larger_than_max_bytes(self):
+        cache = self._make_one(max_bytes=1, check_modified=False)
+        client = self._make_client(cache, *self._query_responses()[:-1])
+
+        dataframe = client.query(self.QUERY).to_dataframe()
+
+        self.assertEqual(list(dataframe["name"]), ["a", "b"])
+        self.assertEqual((len(cache), cache.num_bytes), (0, 0))
+
+    def test_ttl(self):
+        cache = self._make_one(ttl=60, check_modified=False)
+        client = self._make_client(cache, *self._query_responses()[:-1])
+        with mock.patch("time.time", return_value=1000.0):
+            client.query(self.QUERY).result().to_arrow()
+        key = cache._key(self.QUERY, None, self.PROJECT, None)
+
+        with mock.patch("time.time", return_value=1059.0):
+            self.assertIsNotNone(cache._get(client, key))
+        with mock.patch("time.time", return_value=1060.0):
+            self.assertIsNone(cache._get(client, key))
+
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 2, 1))
+        self.assertEqual((len(cache), cache.num_bytes), (0, 0))
+
+    def test_max_bytes_evicts_least_recently_used(self):
+        cache = self._make_one(check_modified=False)
+        query_job = mock.Mock(referenced_tables=[], _properties={})
+        arrow_table = pyarrow.Table.from_arrays([pyarrow.array([1, 2])], names=["n"])
+        cache._max_bytes = arrow_table.nbytes * 2
+
+        for key in ("a", "b"):
+            cache._put(None, key, query_job, arrow_table, [])
+        cache._get(None, "a")
+        cache._put(None, "c", query_job, arrow_table, [])
+
+        self.assertEqual(list(cache._entries), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.num_bytes, arrow_table.nbytes * 2)
+
+    def test_invalidate(self):
+        from google.cloud.bigquery.table import TableReference
+
+        cache = self._make_one(check_modified=False)
+        arrow_table = pyarrow.Table.from_arrays([pyarrow.array([1])], names=["n"])
+        for key, table_id in (("a", "p.d.t1"), ("b", "p.d.t2")):
+            query_job = mock.Mock(
+                referenced_tables=[TableReference.from_string(table_id)],
+                _properties={},
+            )
+            cache._put(None, key, query_job, arrow_table, [])
+
+        cache.invalidate("p.d.t1")
+        self.assertEqual(list(cache._entries), ["b"])
+
+        cache.invalidate()
+        self.assertEqual((len(cache), cache.invalidations), (0, 2))
+
+    def test_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        cache = self._make_one(directory=directory, check_modified=False)
+        client = self._make_client(cache, *self._query_responses()[:-1])
+        client.query(self.QUERY).result().to_arrow()
+
+        rows = client.query(self.QUERY).result()
+
+        self.assertEqual([row.name for row in rows], ["a", "b"])
+        self.assertEqual(len(cache), 1)
+        self.assertGreater(cache.num_bytes, 0)
+
+        cache.invalidate()
+        self.assertEqual(cache.num_bytes, 0)
+        self.assertEqual(os.listdir(directory), [])
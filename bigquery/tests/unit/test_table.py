@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import itertools
 import logging
 import time
@@ -20,6 +21,7 @@ import warnings
 
 import mock
 import pytest
+import requests
 import six
 
 import google.api_core.exceptions
@@ -1617,6 +1619,275 @@ class TestRowIterator(unittest.TestCase):
             query_params={"maxResults": row_iterator._page_size},
         )
 
+    def _make_paged_api_request(self, num_pages):
+        api_request = mock.Mock(
+            side_effect=[
+                {
+                    "rows": [{"f": [{"v": "row-{}".format(page_number)}]}],
+                    "pageToken": "token-{}".format(page_number + 1),
+                }
+                for page_number in range(num_pages - 1)
+            ]
+            + [{"rows": [{"f": [{"v": "row-{}".format(num_pages - 1)}]}]}]
+        )
+        return api_request
+
+    def test_iterate_w_prefetch_pages(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        api_request = self._make_paged_api_request(3)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+
+        names = [row.name for row in row_iterator]
+
+        self.assertEqual(names, ["row-0", "row-1", "row-2"])
+        self.assertEqual(row_iterator.num_results, 3)
+        self.assertEqual(row_iterator.page_number, 3)
+        self.assertIsNone(row_iterator.next_page_token)
+        page_tokens = [
+            call[1]["query_params"].get("pageToken")
+            for call in api_request.call_args_list
+        ]
+        self.assertEqual(page_tokens, [None, "token-1", "token-2"])
+
+    def test_pages_w_prefetch_pages_w_max_results(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        api_request = self._make_paged_api_request(3)
+        row_iterator = self._make_one(
+            _mock_client(),
+            api_request,
+            "/foo",
+            schema,
+            max_results=2,
+            prefetch_pages=4,
+        )
+
+        pages = list(row_iterator.pages)
+
+        self.assertEqual([page.num_items for page in pages], [1, 1])
+        self.assertEqual(api_request.call_count, 2)
+        self.assertEqual(
+            api_request.call_args_list[1][1]["query_params"],
+            {"pageToken": "token-1", "maxResults": 1},
+        )
+
+    def test_pages_w_prefetch_pages_bounded(self):
+        import threading
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        responses = self._make_paged_api_request(5).side_effect
+        fetched = threading.Semaphore(0)
+
+        def fake_api_request(**kwargs):
+            response = next(responses)
+            fetched.release()
+            return response
+
+        api_request = mock.Mock(side_effect=fake_api_request)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=2
+        )
+        pages = row_iterator.pages
+
+        first_page = six.next(pages)
+
+        # The first page is being processed, and the two next pages are
+        # fetched in the background, but not more.
+        for _ in range(3):
+            fetched.acquire()
+        time.sleep(0.1)
+        self.assertEqual(first_page.num_items, 1)
+        self.assertEqual(api_request.call_count, 3)
+
+        self.assertEqual(len(list(pages)), 4)
+        self.assertEqual(api_request.call_count, 5)
+
+    def test_pages_w_prefetch_pages_error(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        api_request = mock.Mock(
+            side_effect=[
+                {"rows": [{"f": [{"v": "row-0"}]}], "pageToken": "token-1"},
+                google.api_core.exceptions.InternalServerError("boom"),
+            ]
+        )
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=1
+        )
+        pages = row_iterator.pages
+
+        self.assertEqual(six.next(pages).num_items, 1)
+        with self.assertRaises(google.api_core.exceptions.InternalServerError):
+            six.next(pages)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_prefetch_pages(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        api_request = self._make_paged_api_request(4)
+        row_iterator = self._make_one(
+            _mock_client(), api_request, "/foo", schema, prefetch_pages=1
+        )
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(list(df["name"]), ["row-0", "row-1", "row-2", "row-3"])
+
+    def _make_sharded_one(self, num_rows, **kwargs):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+
+        table = Table("proj.dset.tbl")
+        table._properties["numRows"] = num_rows
+        schema = [SchemaField("index", "INTEGER", mode="REQUIRED")]
+        return self._make_one(schema=schema, table=table, **kwargs)
+
+    def test__download_shards(self):
+        tests = [
+            # Ranges of at least _MIN_SHARD_ROWS rows, up to the end.
+            ({}, [(0, 12500), (12500, None)]),
+            ({"max_results": 20000}, [(0, 10000), (10000, 10000)]),
+            ({"extra_params": {"startIndex": 5000}}, [(5000, 10000), (15000, None)]),
+            ({"download_workers": 4}, [(0, 10000), (10000, 10000), (20000, None)]),
+        ]
+        for kwargs, expected in tests:
+            kwargs.setdefault("download_workers", 2)
+            iterator = self._make_sharded_one(25000, **kwargs)
+            self.assertEqual(iterator._download_shards(), expected, kwargs)
+
+    def test__download_shards_max_shard_rows(self):
+        iterator = self._make_sharded_one(250000, download_workers=2)
+
+        shards = iterator._download_shards()
+
+        self.assertEqual(
+            shards, [(0, 100000), (100000, 100000), (200000, None)],
+        )
+
+    def test__download_shards_not_worth_it(self):
+        from google.cloud.bigquery.table import Table
+
+        tests = [
+            (self._make_sharded_one(25000), "no download_workers"),
+            (self._make_sharded_one(25000, download_workers=1), "single worker"),
+            (self._make_sharded_one(10000, download_workers=2), "small table"),
+            (self._make_one(download_workers=2), "unknown number of rows"),
+            (
+                self._make_sharded_one(25000, download_workers=2, page_token="foo"),
+                "page token",
+            ),
+            (
+                self._make_one(table=Table("proj.dset.tbl"), download_workers=2),
+                "unknown number of rows",
+            ),
+        ]
+        for iterator, reason in tests:
+            self.assertIsNone(iterator._download_shards(), reason)
+
+    def _make_sharded_api_request(self, num_rows, errors=None):
+        errors = errors if errors is not None else {}
+
+        def fake_api_request(method=None, path=None, query_params=None):
+            start_index = query_params["startIndex"]
+            error = errors.pop(start_index, None)
+            if error is not None:
+                raise error
+            max_results = query_params.get("maxResults", num_rows)
+            end_index = min(start_index + max_results, num_rows)
+            return {
+                "rows": [
+                    {"f": [{"v": str(index)}]}
+                    for index in range(start_index, end_index)
+                ],
+                "totalRows": str(num_rows),
+            }
+
+        return mock.Mock(side_effect=fake_api_request)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @mock.patch("google.cloud.bigquery.table._MIN_SHARD_ROWS", new=2)
+    def test_to_dataframe_w_download_workers(self):
+        api_request = self._make_sharded_api_request(9)
+        row_iterator = self._make_sharded_one(
+            9, api_request=api_request, download_workers=3
+        )
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(list(df["index"]), list(range(9)))
+        self.assertEqual(row_iterator.num_results, 9)
+        self.assertEqual(row_iterator.page_number, 3)
+        query_params = sorted(
+            (call[1]["query_params"] for call in api_request.call_args_list),
+            key=lambda params: params["startIndex"],
+        )
+        self.assertEqual(
+            query_params,
+            [
+                {"startIndex": 0, "maxResults": 3},
+                {"startIndex": 3, "maxResults": 3},
+                {"startIndex": 6},
+            ],
+        )
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @mock.patch("google.cloud.bigquery.table._MIN_SHARD_ROWS", new=2)
+    def test_to_arrow_w_download_workers_retries_shard(self):
+        errors = {
+            3: google.api_core.exceptions.InternalServerError("boom"),
+            6: requests.exceptions.ConnectionError("boom"),
+        }
+        api_request = self._make_sharded_api_request(9, errors=errors)
+        row_iterator = self._make_sharded_one(
+            9, api_request=api_request, download_workers=3
+        )
+
+        tbl = row_iterator.to_arrow()
+
+        self.assertEqual(tbl.to_pydict()["index"], list(range(9)))
+        self.assertEqual(api_request.call_count, 5)
+        self.assertEqual(errors, {})
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @mock.patch("google.cloud.bigquery.table._MIN_SHARD_ROWS", new=2)
+    def test_to_arrow_w_download_workers_error(self):
+        errors = {3: google.api_core.exceptions.BadRequest("invalid")}
+        api_request = self._make_sharded_api_request(9, errors=errors)
+        row_iterator = self._make_sharded_one(
+            9, api_request=api_request, download_workers=3
+        )
+
+        with self.assertRaises(google.api_core.exceptions.BadRequest):
+            row_iterator.to_arrow()
+
+        # Errors which are not transient are not retried.
+        self.assertEqual(api_request.call_count, 3)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    @mock.patch("google.cloud.bigquery.table._MAX_SHARD_ATTEMPTS", new=2)
+    @mock.patch("google.cloud.bigquery.table._MIN_SHARD_ROWS", new=2)
+    def test_to_arrow_w_download_workers_too_many_errors(self):
+        api_request = mock.Mock(
+            side_effect=google.api_core.exceptions.InternalServerError("boom")
+        )
+        row_iterator = self._make_sharded_one(
+            4, api_request=api_request, download_workers=2
+        )
+
+        with self.assertRaises(google.api_core.exceptions.InternalServerError):
+            row_iterator.to_arrow()
+
+        # Both ranges are attempted twice.
+        self.assertEqual(api_request.call_count, 4)
+
     @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
     def test_to_arrow(self):
         from google.cloud.bigquery.schema import SchemaField
@@ -2057,6 +2328,172 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df_2["name"][0], "Sven")
         self.assertEqual(df_2["age"][0], 33)
 
+    def _make_bqstorage_client(self, num_streams, num_pages, page_to_dataframe):
+        from google.cloud.bigquery_storage_v1beta1 import reader
+
+        arrow_schema = pyarrow.schema([pyarrow.field("colA", pyarrow.int64())])
+        session = bigquery_storage_v1beta1.types.ReadSession(
+            streams=[
+                {"name": "/projects/proj/dataset/dset/tables/tbl/streams/%d" % index}
+                for index in range(num_streams)
+            ],
+            arrow_schema={"serialized_schema": arrow_schema.serialize().to_pybytes()},
+        )
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+        bqstorage_client.create_read_session.return_value = session
+
+        def read_rows(position):
+            stream_index = int(position.stream.name.rsplit("/", 1)[-1])
+            pages = []
+            for page_index in range(num_pages):
+                page = mock.create_autospec(reader.ReadRowsPage)
+                page.to_dataframe.side_effect = functools.partial(
+                    page_to_dataframe, stream_index, page_index
+                )
+                page.to_arrow.side_effect = functools.partial(
+                    page_to_arrow, stream_index, page_index
+                )
+                pages.append(page)
+            rows = mock.create_autospec(reader.ReadRowsIterable)
+            type(rows).pages = mock.PropertyMock(return_value=pages)
+            rowstream = mock.create_autospec(reader.ReadRowsStream)
+            rowstream.rows.return_value = rows
+            return rowstream
+
+        def page_to_arrow(stream_index, page_index):
+            return pyarrow.RecordBatch.from_pandas(
+                page_to_dataframe(stream_index, page_index), preserve_index=False
+            )
+
+        bqstorage_client.read_rows.side_effect = read_rows
+        return bqstorage_client
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    @mock.patch("google.cloud.bigquery._pandas_helpers._PROGRESS_INTERVAL", new=0.01)
+    def test_to_dataframe_iterable_w_bqstorage_max_queue_size(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        downloaded = []
+
+        def page_to_dataframe(stream_index, page_index, **kwargs):
+            downloaded.append((stream_index, page_index))
+            return pandas.DataFrame({"colA": [stream_index]})
+
+        bqstorage_client = self._make_bqstorage_client(2, 5, page_to_dataframe)
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "INTEGER")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        frames = row_iterator.to_dataframe_iterable(
+            bqstorage_client=bqstorage_client, max_queue_size=1
+        )
+        next(frames)
+        time.sleep(0.2)
+
+        # Besides the page being processed and the page in the queue, each
+        # stream thread holds at most one page, waiting for room in the queue.
+        self.assertLessEqual(len(downloaded), 4)
+
+        self.assertEqual(len(list(frames)), 9)
+        self.assertEqual(len(downloaded), 10)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    @mock.patch("google.cloud.bigquery._pandas_helpers._PROGRESS_INTERVAL", new=0.01)
+    def test_to_dataframe_iterable_w_bqstorage_stops_blocked_threads(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        downloaded = []
+
+        def page_to_dataframe(stream_index, page_index, **kwargs):
+            downloaded.append((stream_index, page_index))
+            return pandas.DataFrame({"colA": [stream_index]})
+
+        bqstorage_client = self._make_bqstorage_client(2, 5, page_to_dataframe)
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "INTEGER")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+        frames = row_iterator.to_dataframe_iterable(
+            bqstorage_client=bqstorage_client, max_queue_size=1
+        )
+        next(frames)
+
+        # Does not wait for the threads blocked on the full queue forever.
+        frames.close()
+
+        self.assertLess(len(downloaded), 10)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    @mock.patch("google.cloud.bigquery._pandas_helpers._PROGRESS_INTERVAL", new=0.01)
+    def test_to_dataframe_w_bqstorage_max_workers(self):
+        import threading
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        threads = set()
+
+        def page_to_dataframe(stream_index, page_index, **kwargs):
+            threads.add(threading.current_thread())
+            return pandas.DataFrame({"colA": [stream_index]})
+
+        bqstorage_client = self._make_bqstorage_client(3, 2, page_to_dataframe)
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "INTEGER")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+
+        df = row_iterator.to_dataframe(
+            bqstorage_client=bqstorage_client, max_queue_size=None, max_workers=1
+        )
+
+        # The streams are read one after the other, by a single thread.
+        self.assertEqual(list(df["colA"]), [0, 0, 1, 1, 2, 2])
+        self.assertEqual(len(threads), 1)
+
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_to_arrow_w_bqstorage_max_queue_size_and_max_workers(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        row_iterator = self._make_one(
+            schema=[schema.SchemaField("colA", "INTEGER")],
+            table=mut.TableReference.from_string("proj.dset.tbl"),
+        )
+        bqstorage_client = mock.sentinel.bqstorage_client
+        download_patch = mock.patch(
+            "google.cloud.bigquery._pandas_helpers.download_arrow_bqstorage",
+            return_value=iter(()),
+        )
+
+        with download_patch as download:
+            row_iterator.to_arrow(
+                bqstorage_client=bqstorage_client, max_queue_size=3, max_workers=2
+            )
+
+        download.assert_called_once_with(
+            row_iterator._project,
+            row_iterator._table,
+            bqstorage_client,
+            preserve_order=False,
+            selected_fields=None,
+            max_queue_size=3,
+            max_workers=2,
+        )
+
     @mock.patch("google.cloud.bigquery.table.pandas", new=None)
     def test_to_dataframe_iterable_error_if_pandas_is_none(self):
         from google.cloud.bigquery.schema import SchemaField
@@ -2627,8 +3064,9 @@ class TestRowIterator(unittest.TestCase):
         ]
 
         mock_page = mock.create_autospec(reader.ReadRowsPage)
-        mock_page.to_dataframe.return_value = pandas.DataFrame(
-            page_items, columns=["colA", "colB", "colC"]
+        mock_page.to_arrow.return_value = pyarrow.RecordBatch.from_pandas(
+            pandas.DataFrame(page_items, columns=["colA", "colB", "colC"]),
+            preserve_index=False,
         )
         mock_pages = (mock_page, mock_page, mock_page)
         type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
@@ -2659,6 +3097,10 @@ class TestRowIterator(unittest.TestCase):
         total_rows = len(page_items) * total_pages
         self.assertEqual(len(got.index), total_rows)
 
+        # Are the pages converted to a DataFrame at once?
+        mock_page.to_dataframe.assert_not_called()
+        self.assertEqual(list(got["colB"][:2]), ["abc", "def"])
+
         # Don't close the client if it was passed in.
         bqstorage_client.transport.channel.close.assert_not_called()
 
@@ -2699,7 +3141,9 @@ class TestRowIterator(unittest.TestCase):
             [{"colA": 1}, {"colA": -1}], columns=["colA"]
         )
         mock_page = mock.create_autospec(reader.ReadRowsPage)
-        mock_page.to_dataframe.return_value = page_data_frame
+        mock_page.to_arrow.return_value = pyarrow.RecordBatch.from_pandas(
+            page_data_frame, preserve_index=False
+        )
         mock_pages = (mock_page, mock_page, mock_page)
         type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
 
@@ -2757,14 +3201,16 @@ class TestRowIterator(unittest.TestCase):
         page_items = [-1, 0, 1]
         type(mock_page).num_items = mock.PropertyMock(return_value=len(page_items))
 
-        def blocking_to_dataframe(*args, **kwargs):
+        def blocking_to_arrow(*args, **kwargs):
             # Sleep for longer than the waiting interval. This ensures the
             # progress_queue gets written to more than once because it gives
             # the worker->progress updater time to sum intermediate updates.
             time.sleep(2 * mut._PROGRESS_INTERVAL)
-            return pandas.DataFrame({"testcol": page_items})
+            return pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(page_items)], names=["testcol"]
+            )
 
-        mock_page.to_dataframe.side_effect = blocking_to_dataframe
+        mock_page.to_arrow.side_effect = blocking_to_arrow
         mock_pages = (mock_page, mock_page, mock_page, mock_page, mock_page)
         type(mock_rows).pages = mock.PropertyMock(return_value=mock_pages)
 
@@ -2790,7 +3236,7 @@ class TestRowIterator(unittest.TestCase):
         progress_updates = [
             args[0] for args, kwargs in tqdm_mock().update.call_args_list
         ]
-        # Should have sent >1 update due to delay in blocking_to_dataframe.
+        # Should have sent >1 update due to delay in blocking_to_arrow.
         self.assertGreater(len(progress_updates), 1)
         self.assertEqual(sum(progress_updates), expected_total_rows)
         tqdm_mock().close.assert_called_once()
@@ -2831,17 +3277,21 @@ class TestRowIterator(unittest.TestCase):
         )
         bqstorage_client.create_read_session.return_value = session
 
-        def blocking_to_dataframe(*args, **kwargs):
+        def blocking_to_arrow(*args, **kwargs):
             # Sleep for longer than the waiting interval so that we know we're
             # only reading one page per loop at most.
             time.sleep(2 * mut._PROGRESS_INTERVAL)
-            return pandas.DataFrame(
-                {"colA": [1, -1], "colB": ["abc", "def"], "colC": [2.0, 4.0]},
-                columns=["colA", "colB", "colC"],
+            return pyarrow.RecordBatch.from_arrays(
+                [
+                    pyarrow.array([1, -1]),
+                    pyarrow.array(["abc", "def"]),
+                    pyarrow.array([2.0, 4.0]),
+                ],
+                names=["colA", "colB", "colC"],
             )
 
         mock_page = mock.create_autospec(reader.ReadRowsPage)
-        mock_page.to_dataframe.side_effect = blocking_to_dataframe
+        mock_page.to_arrow.side_effect = blocking_to_arrow
         mock_rows = mock.create_autospec(reader.ReadRowsIterable)
         mock_pages = mock.PropertyMock(return_value=(mock_page, mock_page, mock_page))
         type(mock_rows).pages = mock_pages
@@ -2879,7 +3329,7 @@ class TestRowIterator(unittest.TestCase):
 
         # Should not have fetched the third page of results because exit_early
         # should have been set.
-        self.assertLessEqual(mock_page.to_dataframe.call_count, 2)
+        self.assertLessEqual(mock_page.to_arrow.call_count, 2)
 
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(
@@ -2996,6 +3446,7 @@ class TestRowIterator(unittest.TestCase):
             row_iterator.to_dataframe(bqstorage_client=bqstorage_client)
         assert mut._NO_BQSTORAGE_ERROR in str(exc_context.value)
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(
         bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
     )
@@ -3006,18 +3457,34 @@ class TestRowIterator(unittest.TestCase):
         bqstorage_client = mock.create_autospec(
             bigquery_storage_v1beta1.BigQueryStorageClient
         )
+        bqstorage_client.create_read_session.return_value = (
+            bigquery_storage_v1beta1.types.ReadSession()
+        )
+        table = mut.Table(
+            "proj.dset.tbl$20181225", schema=[schema.SchemaField("colA", "DATE")]
+        )
+        table.time_partitioning = mut.TimePartitioning(field="colA")
 
         row_iterator = mut.RowIterator(
             _mock_client(),
             None,  # api_request: ignored
             None,  # path: ignored
-            [schema.SchemaField("colA", "IGNORED")],
-            table=mut.TableReference.from_string("proj.dset.tbl$20181225"),
+            [schema.SchemaField("colA", "DATE")],
+            table=table,
         )
+        row_iterator.to_dataframe(bqstorage_client)
 
-        with pytest.raises(ValueError):
-            row_iterator.to_dataframe(bqstorage_client)
+        bqstorage_client.create_read_session.assert_called_once_with(
+            mut.TableReference.from_string("proj.dset.tbl").to_bqstorage(),
+            "projects/my-project",
+            format_=bigquery_storage_v1beta1.enums.DataFormat.ARROW,
+            read_options=bigquery_storage_v1beta1.types.TableReadOptions(
+                row_restriction='`colA` = DATE "2018-12-25"'
+            ),
+            requested_streams=0,
+        )
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
     @unittest.skipIf(
         bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
     )
@@ -3028,6 +3495,9 @@ class TestRowIterator(unittest.TestCase):
         bqstorage_client = mock.create_autospec(
             bigquery_storage_v1beta1.BigQueryStorageClient
         )
+        bqstorage_client.create_read_session.return_value = (
+            bigquery_storage_v1beta1.types.ReadSession()
+        )
 
         row_iterator = mut.RowIterator(
             _mock_client(),
@@ -3036,6 +3506,39 @@ class TestRowIterator(unittest.TestCase):
             [schema.SchemaField("colA", "IGNORED")],
             table=mut.TableReference.from_string("proj.dset.tbl@1234567890000"),
         )
+        row_iterator.to_dataframe(bqstorage_client)
+
+        table_modifiers = bigquery_storage_v1beta1.types.TableModifiers()
+        table_modifiers.snapshot_time.FromMilliseconds(1234567890000)
+        bqstorage_client.create_read_session.assert_called_once_with(
+            mut.TableReference.from_string("proj.dset.tbl").to_bqstorage(),
+            "projects/my-project",
+            format_=bigquery_storage_v1beta1.enums.DataFormat.ARROW,
+            read_options=bigquery_storage_v1beta1.types.TableReadOptions(),
+            requested_streams=0,
+            table_modifiers=table_modifiers,
+        )
+
+    @unittest.skipIf(
+        bigquery_storage_v1beta1 is None, "Requires `google-cloud-bigquery-storage`"
+    )
+    def test_to_dataframe_w_bqstorage_snapshot_range(self):
+        from google.cloud.bigquery import schema
+        from google.cloud.bigquery import table as mut
+
+        bqstorage_client = mock.create_autospec(
+            bigquery_storage_v1beta1.BigQueryStorageClient
+        )
+
+        row_iterator = mut.RowIterator(
+            _mock_client(),
+            None,  # api_request: ignored
+            None,  # path: ignored
+            [schema.SchemaField("colA", "IGNORED")],
+            table=mut.TableReference.from_string(
+                "proj.dset.tbl@1234567890000-1234567899999"
+            ),
+        )
 
         with pytest.raises(ValueError):
             row_iterator.to_dataframe(bqstorage_client)
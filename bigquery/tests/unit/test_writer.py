@@ -0,0 +1,227 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+import pytest
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+class TestStreamingInsertWriter(unittest.TestCase):
+    TABLE = "my-project.my_dataset.my_table"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.writer import StreamingInsertWriter
+
+        return StreamingInsertWriter
+
+    def _make_client(self, responses=None):
+        from google.cloud.bigquery.client import Client
+
+        client = Client(
+            project="my-project", credentials=_make_credentials(), _http=object()
+        )
+        requests = []
+        lock = threading.Lock()
+        responses = list(responses or [])
+
+        def insert_rows_json(table, json_rows, row_ids=None, **kwargs):
+            with lock:
+                requests.append((list(json_rows), list(row_ids), kwargs))
+                response = responses.pop(0) if responses else []
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        client.insert_rows_json = insert_rows_json
+        return client, requests
+
+    def _make_one(self, client, **kwargs):
+        return self._get_target_class()(client, self.TABLE, **kwargs)
+
+    def test_batches_by_max_rows(self):
+        client, requests = self._make_client()
+        writer = self._make_one(client, max_rows=2, max_latency=60)
+
+        futures = writer.insert_rows(
+            [{"n": 1}, {"n": 2}, {"n": 3}], row_ids=["a", "b", "c"]
+        )
+        futures[0].result(timeout=5)
+
+        self.assertEqual(requests[0][0], [{"n": 1}, {"n": 2}])
+        self.assertEqual(requests[0][1], ["a", "b"])
+        self.assertFalse(futures[2].done())
+
+        writer.close()
+
+        self.assertIsNone(futures[2].result(timeout=5))
+        self.assertEqual(requests[1][0], [{"n": 3}])
+        self.assertEqual(requests[1][2]["retry"], writer._insert_kwargs["retry"])
+
+    def test_batches_by_max_bytes(self):
+        client, requests = self._make_client()
+
+        with self._make_one(client, max_bytes=200, max_latency=60) as writer:
+            writer.insert_rows([{"s": "a" * 50}, {"s": "b" * 50}, {"s": "c"}])
+
+        self.assertEqual(
+            [rows for rows, _, _ in requests],
+            [[{"s": "a" * 50}], [{"s": "b" * 50}, {"s": "c"}]],
+        )
+
+    def test_sends_batch_after_max_latency(self):
+        client, requests = self._make_client()
+        writer = self._make_one(client, max_latency=0.01)
+
+        future = writer.insert_row({"n": 1})
+
+        self.assertIsNone(future.result(timeout=5))
+        self.assertEqual(requests[0][0], [{"n": 1}])
+        writer.close()
+
+    def test_creates_unique_row_ids(self):
+        client, requests = self._make_client()
+
+        with self._make_one(client, max_latency=60) as writer:
+            writer.insert_rows([{"n": 1}, {"n": 2}])
+
+        row_ids = requests[0][1]
+        self.assertEqual(len(set(row_ids)), 2)
+        self.assertNotIn(None, row_ids)
+
+    def test_retries_failed_rows(self):
+        from google.cloud.bigquery.writer import InsertRowError
+
+        backend_error = [{"reason": "backendError", "message": "Try again."}]
+        invalid = [{"reason": "invalid", "message": "Bad row."}]
+        client, requests = self._make_client(
+            [
+                [
+                    {"index": 0, "errors": invalid},
+                    {"index": 1, "errors": backend_error},
+                ],
+                [],
+            ]
+        )
+
+        with self._make_one(client, max_latency=60) as writer:
+            futures = writer.insert_rows(
+                [{"n": 1}, {"n": 2}, {"n": 3}], row_ids=["a", "b", "c"]
+            )
+
+        with pytest.raises(InsertRowError) as exc_info:
+            futures[0].result()
+        self.assertEqual(exc_info.value.errors, invalid)
+        self.assertIsNone(futures[1].result())
+        self.assertIsNone(futures[2].result())
+        # Only the failed row is sent again, with the same insert ID.
+        self.assertEqual(requests[1][:2], ([{"n": 2}], ["b"]))
+
+    def test_request_error_fails_batch(self):
+        client, _ = self._make_client()
+        error = ValueError("boom")
+
+        with mock.patch.object(client, "insert_rows_json", side_effect=error):
+            with self._make_one(client, max_latency=60) as writer:
+                futures = writer.insert_rows([{"n": 1}, {"n": 2}])
+
+        for future in futures:
+            self.assertIs(future.exception(), error)
+
+    def test_retry_error_fails_only_retried_rows(self):
+        from google.cloud.bigquery.writer import InsertRowError
+
+        backend_error = [{"reason": "backendError", "message": "Try again."}]
+        invalid = [{"reason": "invalid", "message": "Bad row."}]
+        error = ValueError("boom")
+        client, requests = self._make_client(
+            [
+                [
+                    {"index": 0, "errors": invalid},
+                    {"index": 1, "errors": backend_error},
+                ],
+                error,
+            ]
+        )
+
+        with self._make_one(client, max_latency=60) as writer:
+            futures = writer.insert_rows(
+                [{"n": 1}, {"n": 2}, {"n": 3}], row_ids=["a", "b", "c"]
+            )
+
+        self.assertIsInstance(futures[0].exception(), InsertRowError)
+        self.assertIs(futures[1].exception(), error)
+        # The row inserted by the first request is not failed by the retry.
+        self.assertIsNone(futures[2].result())
+        self.assertEqual(len(requests), 2)
+
+    def test_ctor_w_invalid_limits(self):
+        client, _ = self._make_client()
+
+        for kwargs in (
+            {"max_rows": None},
+            {"max_rows": 0},
+            {"max_bytes": None},
+            {"max_latency": None},
+            {"max_latency": -1},
+            {"max_row_retries": None},
+        ):
+            with pytest.raises(ValueError):
+                self._make_one(client, **kwargs)
+
+    def test_cancelled_rows_are_not_sent(self):
+        client, requests = self._make_client()
+
+        with self._make_one(client, max_latency=60) as writer:
+            futures = writer.insert_rows([{"n": 1}, {"n": 2}])
+            futures[0].cancel()
+
+        self.assertEqual(requests[0][0], [{"n": 2}])
+
+    def test_insert_after_close(self):
+        client, _ = self._make_client()
+        writer = self._make_one(client)
+        writer.close()
+
+        with pytest.raises(ValueError):
+            writer.insert_row({"n": 1})
+
+    def test_insert_from_many_threads(self):
+        client, requests = self._make_client()
+        writer = self._make_one(client, max_rows=7, max_latency=0.01, max_workers=3)
+        futures = []
+
+        def insert(start):
+            for n in range(start, start + 100):
+                futures.append(writer.insert_row({"n": n}))
+
+        threads = [threading.Thread(target=insert, args=(i * 100,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        self.assertTrue(all(future.done() for future in futures))
+        sent = sorted(row["n"] for rows, _, _ in requests for row in rows)
+        self.assertEqual(sent, list(range(400)))
+        self.assertTrue(all(len(rows) <= 7 for rows, _, _ in requests))
@@ -124,3 +124,100 @@ class BigQueryStorageClient(big_query_storage_client.BigQueryStorageClient):
             read_position,
             {"retry": retry, "timeout": timeout, "metadata": metadata},
         )
+
+    def read_session_parallel(
+        self,
+        read_session,
+        max_workers=None,
+        max_queue_size=None,
+        preserve_order=False,
+        output_type="arrow",
+        dtypes=None,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        metadata=None,
+    ):
+        """
+        Reads all the streams of a read session in parallel threads, as
+        Arrow record batches or pandas data frames.
+
+        Each page of each stream is converted in the thread which read it.
+        At most ``max_queue_size`` pages wait to be consumed, so that the
+        whole table does not end up in memory when the pages are consumed
+        slower than they are read.
+
+        Example:
+            >>> from google.cloud import bigquery_storage_v1beta1
+            >>>
+            >>> client = bigquery_storage_v1beta1.BigQueryStorageClient()
+            >>>
+            >>> # TODO: Initialize ``table_reference`` and ``parent``.
+            >>> session = client.create_read_session(
+            ...     table_reference,
+            ...     parent,
+            ...     format_=bigquery_storage_v1beta1.enums.DataFormat.ARROW,
+            ... )
+            >>>
+            >>> with client.read_session_parallel(session) as record_batches:
+            ...     for record_batch in record_batches:
+            ...         # process record_batch
+            ...         pass
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                Required. The read session to read all streams from. This is
+                also required to parse the row messages.
+            max_workers (Optional[int]):
+                The maximum number of streams read at the same time. Defaults
+                to the number of streams.
+            max_queue_size (Optional[int]):
+                The maximum number of pages read but not consumed yet, per
+                stream if ``preserve_order`` is set. Defaults to
+                ``max_workers``, or to ``1`` if ``preserve_order`` is set.
+            preserve_order (Optional[bool]):
+                If ``True``, return the pages of each stream in turn, in the
+                order of ``read_session.streams``. By default, pages are
+                returned as soon as they are read.
+            output_type (Optional[str]):
+                ``"arrow"`` (the default) for
+                :class:`pyarrow.RecordBatch` objects, or ``"dataframe"`` for
+                :class:`pandas.DataFrame` objects.
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names pandas ``dtype``s,
+                used when ``output_type`` is ``"dataframe"``.
+            retry (Optional[google.api_core.retry.Retry]):  A retry object used
+                to retry requests. If ``None`` is specified, requests will not
+                be retried.
+            timeout (Optional[float]): The amount of time, in seconds, to wait
+                for the request to complete. Note that if ``retry`` is
+                specified, the timeout applies to each individual attempt.
+            metadata (Optional[Sequence[Tuple[str, str]]]): Additional metadata
+                that is provided to the method.
+
+        Returns:
+            ~google.cloud.bigquery_storage_v1beta1.reader.ParallelReadRowsIterator:
+                An iterator of record batches or data frames. Call its
+                ``close()`` method to stop reading early.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a request
+                    failed for any reason, when iterating.
+            google.api_core.exceptions.RetryError: If a request failed due
+                    to a retryable error and retry attempts failed, when
+                    iterating.
+            ValueError: If the parameters are invalid.
+        """
+        return reader.ParallelReadRowsIterator(
+            super(BigQueryStorageClient, self),
+            read_session,
+            {"retry": retry, "timeout": timeout, "metadata": metadata},
+            max_workers=max_workers,
+            max_queue_size=max_queue_size,
+            preserve_order=preserve_order,
+            output_type=output_type,
+            dtypes=dtypes,
+        )
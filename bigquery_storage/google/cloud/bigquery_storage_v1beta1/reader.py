@@ -14,8 +14,10 @@
 
 from __future__ import absolute_import
 
-import collections
 import json
+import operator
+import sys
+import threading
 
 try:
     import fastavro
@@ -32,6 +34,7 @@ try:
 except ImportError:  # pragma: NO COVER
     pyarrow = None
 import six
+from six.moves import queue
 
 try:
     import pyarrow
@@ -43,6 +46,15 @@ from google.cloud.bigquery_storage_v1beta1 import types
 
 _STREAM_RESUMPTION_EXCEPTIONS = (google.api_core.exceptions.ServiceUnavailable,)
 
+# How long to wait for a queue, in seconds, before checking whether a parallel
+# read was stopped in the meantime.
+_PROGRESS_INTERVAL = 0.2
+
+# Sentinel marking the end of a stream in the queue of a parallel read.
+_STREAM_DONE = object()
+
+_OUTPUT_TYPES = ("arrow", "dataframe")
+
 _FASTAVRO_REQUIRED = (
     "fastavro is required to parse ReadRowResponse messages with Avro bytes."
 )
@@ -50,6 +62,27 @@ _PANDAS_REQUIRED = "pandas is required to create a DataFrame"
 _PYARROW_REQUIRED = (
     "pyarrow is required to parse ReadRowResponse messages with Arrow bytes."
 )
+_PYARROW_TO_ARROW_REQUIRED = "pyarrow is required to create an Arrow record batch"
+
+_AVRO_MAGIC = b"Obj\x01"
+_AVRO_SYNC_MARKER = b"\x00" * 16
+
+# Logical types decoded as plain integers, which Arrow arrays of these types
+# take as is. This avoids creating datetime objects for the values.
+_AVRO_LOGICAL_TYPES_TO_ARROW = {
+    "date": lambda: pyarrow.date32(),
+    "time-micros": lambda: pyarrow.time64("us"),
+    "timestamp-micros": lambda: pyarrow.timestamp("us", tz="UTC"),
+}
+_AVRO_PRIMITIVE_TYPES_TO_ARROW = {
+    "boolean": lambda: pyarrow.bool_(),
+    "int": lambda: pyarrow.int32(),
+    "long": lambda: pyarrow.int64(),
+    "float": lambda: pyarrow.float32(),
+    "double": lambda: pyarrow.float64(),
+    "string": lambda: pyarrow.utf8(),
+    "bytes": lambda: pyarrow.binary(),
+}
 
 
 class ReadRowsStream(object):
@@ -170,8 +203,12 @@ class ReadRowsStream(object):
     def to_arrow(self, read_session):
         """Create a :class:`pyarrow.Table` of all rows in the stream.
 
-        This method requires the pyarrow library and a stream using the Arrow
-        format.
+        This method requires the pyarrow library. Streams using the Avro
+        format also require the fastavro library.
+
+        .. warning::
+            DATETIME columns of Avro streams are not supported. They are
+            currently parsed as strings.
 
         Args:
             read_session ( \
@@ -273,8 +310,8 @@ class ReadRowsIterable(object):
     def to_arrow(self):
         """Create a :class:`pyarrow.Table` of all rows in the stream.
 
-        This method requires the pyarrow library and a stream using the Arrow
-        format.
+        This method requires the pyarrow library. Streams using the Avro
+        format also require the fastavro library.
 
         Returns:
             pyarrow.Table:
@@ -406,6 +443,221 @@ class ReadRowsPage(object):
         return self._stream_parser.to_dataframe(self._message, dtypes=dtypes)
 
 
+class ParallelReadRowsIterator(six.Iterator):
+    """An iterator of pages read from all the streams of a read session.
+
+    The streams are read by background threads, at most ``max_workers`` at
+    a time, and each page is converted to a :class:`pyarrow.RecordBatch` or
+    a :class:`pandas.DataFrame` in the thread which read it. Each stream
+    reconnects to the ReadRows stream if it is interrupted, like a
+    :class:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream`.
+
+    Call :meth:`close`, or use the iterator as a context manager, to stop
+    reading before all the pages were consumed.
+    """
+
+    def __init__(
+        self,
+        client,
+        read_session,
+        read_rows_kwargs,
+        max_workers=None,
+        max_queue_size=None,
+        preserve_order=False,
+        output_type="arrow",
+        dtypes=None,
+    ):
+        """Construct a ParallelReadRowsIterator.
+
+        Args:
+            client ( \
+                ~google.cloud.bigquery_storage_v1beta1.gapic. \
+                    big_query_storage_client.BigQueryStorageClient \
+            ):
+                A GAPIC client used to read the streams.
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session to read all streams from.
+            read_rows_kwargs (dict):
+                Keyword arguments to use when connecting to a ReadRows stream.
+            max_workers (Optional[int]):
+                The maximum number of streams read at the same time. Defaults
+                to the number of streams.
+            max_queue_size (Optional[int]):
+                The maximum number of pages read but not consumed yet, per
+                stream if ``preserve_order`` is set. Defaults to
+                ``max_workers``, or to ``1`` if ``preserve_order`` is set.
+            preserve_order (Optional[bool]):
+                If ``True``, return the pages of each stream in turn, in the
+                order of ``read_session.streams``. By default, pages are
+                returned as soon as they are read.
+            output_type (Optional[str]):
+                ``"arrow"`` (the default) for record batches, or
+                ``"dataframe"`` for data frames.
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                Optional. A dictionary of column names pandas ``dtype``s,
+                used when ``output_type`` is ``"dataframe"``.
+
+        Raises:
+            ValueError: If ``output_type`` or ``max_workers`` is invalid.
+        """
+        if output_type not in _OUTPUT_TYPES:
+            raise ValueError(
+                "output_type must be one of {}, got {!r}".format(
+                    _OUTPUT_TYPES, output_type
+                )
+            )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        streams = list(read_session.streams)
+        if max_workers is None:
+            max_workers = len(streams)
+        max_workers = min(max_workers, len(streams))
+        if max_queue_size is None:
+            max_queue_size = 1 if preserve_order else max_workers
+
+        self._client = client
+        self._read_session = read_session
+        self._read_rows_kwargs = read_rows_kwargs
+        self._streams = streams
+        self._max_workers = max_workers
+        self._output_type = output_type
+        self._dtypes = dtypes
+
+        num_queues = len(streams) if preserve_order else 1
+        self._queues = [queue.Queue(maxsize=max_queue_size) for _ in range(num_queues)]
+        self._pending_streams = queue.Queue()
+        for index in range(len(streams)):
+            self._pending_streams.put(index)
+        self._streams_remaining = len(streams)
+        self._current_queue = 0
+        self._workers = None
+        self._error = None
+        self._done = False
+
+        # The streams being read by the workers, to cancel their ReadRows
+        # calls when the read is stopped.
+        self._lock = threading.Lock()
+        self._rowstreams = set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        """Get the next record batch or data frame."""
+        self._start()
+        while self._streams_remaining and not self._done:
+            if self._error is not None:
+                error = self._error
+                self.close()
+                six.reraise(*error)
+
+            try:
+                item = self._queues[self._current_queue].get(timeout=_PROGRESS_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if item is not _STREAM_DONE:
+                return item
+            self._streams_remaining -= 1
+            if len(self._queues) > 1:
+                self._current_queue += 1
+
+        self.close()
+        raise StopIteration()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stop reading the streams, and wait for the worker threads to exit.
+
+        Pages already read are discarded. Streams which were not started yet
+        are not read, and the ReadRows calls in progress are cancelled.
+        Iterating after closing stops at once.
+        """
+        self._done = True
+        with self._lock:
+            rowstreams = list(self._rowstreams)
+        for rowstream in rowstreams:
+            _cancel_read_rows(rowstream)
+        for worker in self._workers or ():
+            worker.join()
+
+    def _start(self):
+        """Start the worker threads, on the first call."""
+        if self._workers is not None:
+            return
+
+        self._workers = []
+        for _ in range(self._max_workers):
+            worker = threading.Thread(target=self._read_streams)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def _read_streams(self):
+        """Read streams in a worker thread, until none are left."""
+        while not self._done:
+            try:
+                index = self._pending_streams.get_nowait()
+            except queue.Empty:
+                return
+
+            worker_queue = self._queues[index % len(self._queues)]
+            try:
+                self._read_stream(self._streams[index], worker_queue)
+            except Exception:
+                # Errors caused by cancelling the ReadRows call are expected.
+                if not self._done:
+                    self._error = sys.exc_info()
+                return
+            self._put(worker_queue, _STREAM_DONE)
+
+    def _read_stream(self, stream, worker_queue):
+        """Put the pages of a stream in a queue, converted to output items."""
+        position = types.StreamPosition(stream=stream)
+        wrapped = self._client.read_rows(position, **self._read_rows_kwargs)
+        rowstream = ReadRowsStream(
+            wrapped, self._client, position, self._read_rows_kwargs
+        )
+        with self._lock:
+            self._rowstreams.add(rowstream)
+        if self._done:  # Closed before the stream could be cancelled.
+            _cancel_read_rows(rowstream)
+
+        try:
+            for page in rowstream.rows(self._read_session).pages:
+                if self._done:
+                    return
+                if self._output_type == "dataframe":
+                    item = page.to_dataframe(dtypes=self._dtypes)
+                else:
+                    item = page.to_arrow()
+                self._put(worker_queue, item)
+        finally:
+            with self._lock:
+                self._rowstreams.discard(rowstream)
+
+    def _put(self, worker_queue, item):
+        """Put an item in a queue, unless the read is stopped meanwhile."""
+        while not self._done:
+            try:
+                # Block while the queue is full, but check regularly whether
+                # the read has been stopped in the meantime.
+                worker_queue.put(item, timeout=_PROGRESS_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+
 class _StreamParser(object):
     def to_arrow(self, message):
         raise NotImplementedError("Not implemented.")
@@ -430,7 +682,14 @@ class _StreamParser(object):
 
 
 class _AvroStreamParser(_StreamParser):
-    """Helper to parse Avro messages into useful representations."""
+    """Helper to parse Avro messages into useful representations.
+
+    The rows of a message are decoded with a single :func:`fastavro.reader`
+    call, by framing them as a block of an Avro object container file, rather
+    than with one :func:`fastavro.schemaless_reader` call per row. Each row is
+    still decoded into a dictionary of Python objects, thus this is only
+    slightly faster than decoding the rows one at a time.
+    """
 
     def __init__(self, read_session):
         """Construct an _AvroStreamParser.
@@ -445,12 +704,25 @@ class _AvroStreamParser(_StreamParser):
 
         self._read_session = read_session
         self._avro_schema_json = None
-        self._fastavro_schema = None
         self._column_names = None
+        self._column_getters = None
+        self._container_header = None
+        self._arrow_avro_schema_json = None
+        self._arrow_container_header = None
+        self._arrow_types = None
 
     def to_arrow(self, message):
         """Create an :class:`pyarrow.RecordBatch` of rows in the page.
 
+        The rows are decoded into Python objects, which are then converted
+        to Arrow arrays, column by column. Date, time and timestamp values
+        are decoded as integers rather than :mod:`datetime` objects, and
+        stored as is in the Arrow arrays.
+
+        .. warning::
+            DATETIME columns are not supported. They are currently parsed as
+            strings.
+
         Args:
             message (google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse):
                 Protocol buffer from the read rows stream, to convert into an
@@ -460,7 +732,28 @@ class _AvroStreamParser(_StreamParser):
             pyarrow.RecordBatch:
                 Rows from the message, as an Arrow record batch.
         """
-        raise NotImplementedError("to_arrow not implemented for Avro streams.")
+        if pyarrow is None:
+            raise ImportError(_PYARROW_TO_ARROW_REQUIRED)
+
+        self._parse_avro_schema()
+        if self._arrow_container_header is None:
+            fields = self._avro_schema_json["fields"]
+            self._arrow_types = [_avro_to_arrow_type(field["type"]) for field in fields]
+            self._arrow_avro_schema_json = _avro_plain_logical_types(
+                self._avro_schema_json
+            )
+            self._arrow_container_header = _avro_container_header(
+                self._arrow_avro_schema_json
+            )
+
+        rows = self._read_block(
+            message, self._arrow_avro_schema_json, self._arrow_container_header
+        )
+        arrays = [
+            pyarrow.array(list(map(getter, rows)), type=arrow_type)
+            for getter, arrow_type in zip(self._column_getters, self._arrow_types)
+        ]
+        return pyarrow.RecordBatch.from_arrays(arrays, list(self._column_names))
 
     def to_dataframe(self, message, dtypes=None):
         """Create a :class:`pandas.DataFrame` of rows in the page.
@@ -490,10 +783,10 @@ class _AvroStreamParser(_StreamParser):
         if dtypes is None:
             dtypes = {}
 
-        columns = collections.defaultdict(list)
-        for row in self.to_rows(message):
-            for column in row:
-                columns[column].append(row[column])
+        rows = self.to_rows(message)
+        columns = {}
+        for name, getter in zip(self._column_names, self._column_getters):
+            columns[name] = list(map(getter, rows))
         for column in dtypes:
             columns[column] = pandas.Series(columns[column], dtype=dtypes[column])
         return pandas.DataFrame(columns, columns=self._column_names)
@@ -507,11 +800,36 @@ class _AvroStreamParser(_StreamParser):
         self._column_names = tuple(
             (field["name"] for field in self._avro_schema_json["fields"])
         )
+        self._column_getters = [
+            operator.itemgetter(name) for name in self._column_names
+        ]
+        self._container_header = _avro_container_header(self._avro_schema_json)
 
-    def _parse_fastavro(self):
-        """Convert parsed Avro schema to fastavro format."""
-        self._parse_avro_schema()
-        self._fastavro_schema = fastavro.parse_schema(self._avro_schema_json)
+    def _read_block(self, message, avro_schema_json, container_header):
+        """Decode all rows of a message as one Avro block.
+
+        A block needs the number of rows it contains. If the message sets
+        neither its own row count nor the one of its Avro rows, the rows are
+        decoded one at a time instead.
+        """
+        rows_bytes = message.avro_rows.serialized_binary_rows
+        if not rows_bytes:
+            return []
+
+        row_count = message.row_count or message.avro_rows.row_count
+        if not row_count:
+            return _read_schemaless_rows(rows_bytes, avro_schema_json)
+
+        block = b"".join(
+            (
+                container_header,
+                _avro_long(row_count),
+                _avro_long(len(rows_bytes)),
+                rows_bytes,
+                _AVRO_SYNC_MARKER,
+            )
+        )
+        return list(fastavro.reader(six.BytesIO(block)))
 
     def to_rows(self, message):
         """Parse all rows in a stream message.
@@ -523,20 +841,13 @@ class _AvroStreamParser(_StreamParser):
                 A message containing Avro bytes to parse into rows.
 
         Returns:
-            Iterable[Mapping]:
+            Sequence[Mapping]:
                 A sequence of rows, represented as dictionaries.
         """
-        self._parse_fastavro()
-        messageio = six.BytesIO(message.avro_rows.serialized_binary_rows)
-        while True:
-            # Loop in a while loop because schemaless_reader can only read
-            # a single record.
-            try:
-                # TODO: Parse DATETIME into datetime.datetime (no timezone),
-                #       instead of as a string.
-                yield fastavro.schemaless_reader(messageio, self._fastavro_schema)
-            except StopIteration:
-                break  # Finished with message
+        self._parse_avro_schema()
+        # TODO: Parse DATETIME into datetime.datetime (no timezone),
+        #       instead of as a string.
+        return self._read_block(message, self._avro_schema_json, self._container_header)
 
 
 class _ArrowStreamParser(_StreamParser):
@@ -589,6 +900,120 @@ class _ArrowStreamParser(_StreamParser):
         self._column_names = [field.name for field in self._schema]
 
 
+def _avro_long(value):
+    """Encode a non-negative integer as an Avro long (a zig-zag varint)."""
+    value <<= 1
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_schemaless_rows(rows_bytes, avro_schema_json):
+    """Decode Avro rows one at a time, until the bytes are exhausted.
+
+    Args:
+        rows_bytes (bytes): The serialized rows, without any framing.
+        avro_schema_json (Mapping): The schema of the rows.
+
+    Returns:
+        List[Mapping]: The decoded rows.
+    """
+    avro_schema = fastavro.parse_schema(avro_schema_json)
+    rows_io = six.BytesIO(rows_bytes)
+    rows = []
+    while rows_io.tell() < len(rows_bytes):
+        rows.append(fastavro.schemaless_reader(rows_io, avro_schema))
+    return rows
+
+
+def _avro_container_header(avro_schema_json):
+    """Make the header of an Avro object container file, without compression.
+
+    Args:
+        avro_schema_json (Mapping): The schema of the rows in the file.
+
+    Returns:
+        bytes: The header, ending with :data:`_AVRO_SYNC_MARKER`.
+    """
+    metadata = (
+        (b"avro.schema", json.dumps(avro_schema_json).encode("utf-8")),
+        (b"avro.codec", b"null"),
+    )
+    header = [_AVRO_MAGIC, _avro_long(len(metadata))]
+    for key, value in metadata:
+        header.extend((_avro_long(len(key)), key, _avro_long(len(value)), value))
+    header.extend((_avro_long(0), _AVRO_SYNC_MARKER))
+    return b"".join(header)
+
+
+def _avro_plain_logical_types(avro_type):
+    """Remove the logical types which :func:`_avro_to_arrow_type` maps to
+    Arrow types of the same integers."""
+    if isinstance(avro_type, list):
+        return [_avro_plain_logical_types(member) for member in avro_type]
+    if not isinstance(avro_type, dict):
+        return avro_type
+    if avro_type.get("logicalType") in _AVRO_LOGICAL_TYPES_TO_ARROW:
+        return avro_type["type"]
+
+    avro_type = dict(avro_type)
+    if avro_type.get("type") == "record":
+        avro_type["fields"] = [
+            dict(field, type=_avro_plain_logical_types(field["type"]))
+            for field in avro_type["fields"]
+        ]
+    elif avro_type.get("type") == "array":
+        avro_type["items"] = _avro_plain_logical_types(avro_type["items"])
+    return avro_type
+
+
+def _avro_to_arrow_type(avro_type):
+    """Map an Avro type of a BigQuery schema to an Arrow type.
+
+    Returns:
+        Optional[pyarrow.DataType]:
+            The Arrow type, or ``None`` to let :func:`pyarrow.array` infer
+            it from the values.
+    """
+    if isinstance(avro_type, list):
+        members = [member for member in avro_type if member != "null"]
+        if len(members) != 1:
+            return None
+        return _avro_to_arrow_type(members[0])
+    if not isinstance(avro_type, dict):
+        to_arrow = _AVRO_PRIMITIVE_TYPES_TO_ARROW.get(avro_type)
+        return to_arrow() if to_arrow is not None else None
+
+    logical_type = avro_type.get("logicalType")
+    if logical_type in _AVRO_LOGICAL_TYPES_TO_ARROW:
+        return _AVRO_LOGICAL_TYPES_TO_ARROW[logical_type]()
+    if logical_type == "decimal":
+        return pyarrow.decimal128(avro_type["precision"], avro_type.get("scale", 0))
+
+    if avro_type["type"] == "record":
+        fields = []
+        for field in avro_type["fields"]:
+            field_type = _avro_to_arrow_type(field["type"])
+            if field_type is None:
+                return None
+            fields.append(pyarrow.field(field["name"], field_type))
+        return pyarrow.struct(fields)
+    if avro_type["type"] == "array":
+        item_type = _avro_to_arrow_type(avro_type["items"])
+        return pyarrow.list_(item_type) if item_type is not None else None
+    return _avro_to_arrow_type(avro_type["type"])
+
+
+def _cancel_read_rows(rowstream):
+    """Cancel the ReadRows call a stream is currently reading, if any."""
+    cancel = getattr(rowstream._wrapped, "cancel", None)
+    if cancel is not None:
+        cancel()
+
+
 def _copy_stream_position(position):
     """Copy a StreamPosition.
 
@@ -88,3 +88,17 @@ def test_read_rows(mock_transport, client_under_test):
     mock_transport.create_read_session.read_rows(
         expected_request, metadata=mock.ANY, timeout=mock.ANY
     )
+
+
+def test_read_session_parallel(mock_transport, client_under_test):
+    from google.cloud.bigquery_storage_v1beta1 import reader
+
+    read_session = types.ReadSession()
+
+    got = client_under_test.read_session_parallel(
+        read_session, preserve_order=True, timeout=10
+    )
+
+    assert isinstance(got, reader.ParallelReadRowsIterator)
+    assert got._read_rows_kwargs["timeout"] == 10
+    assert list(got) == []
@@ -18,6 +18,7 @@ import datetime
 import decimal
 import itertools
 import json
+import threading
 
 import fastavro
 import pyarrow
@@ -315,6 +316,39 @@ def test_rows_w_scalars(class_under_test, mock_client):
     assert got == expected
 
 
+def test_rows_w_avro_rows_row_count(class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_avro_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(SCALAR_BLOCKS, avro_schema)
+    for block in avro_blocks:
+        block.avro_rows.row_count = block.row_count
+        block.ClearField("row_count")
+
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    got = tuple(reader.rows(read_session))
+
+    expected = tuple(itertools.chain.from_iterable(SCALAR_BLOCKS))
+    assert got == expected
+
+
+def test_rows_wo_row_count(class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_avro_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(SCALAR_BLOCKS, avro_schema)
+    for block in avro_blocks:
+        block.ClearField("row_count")
+
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    got = tuple(reader.rows(read_session))
+
+    expected = tuple(itertools.chain.from_iterable(SCALAR_BLOCKS))
+    assert got == expected
+
+
 def test_rows_w_scalars_arrow(class_under_test, mock_client):
     arrow_schema = _bq_to_arrow_schema(SCALAR_COLUMNS)
     read_session = _generate_arrow_read_session(arrow_schema)
@@ -506,6 +540,112 @@ def test_to_arrow_w_scalars_arrow(class_under_test):
     assert actual_table == expected_table
 
 
+def test_to_arrow_avro_no_pyarrow_raises_import_error(
+    mut, class_under_test, mock_client, monkeypatch
+):
+    monkeypatch.setattr(mut, "pyarrow", None)
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_avro_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(SCALAR_BLOCKS, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    with pytest.raises(ImportError):
+        next(reader.rows(read_session).pages).to_arrow()
+
+
+def test_to_arrow_w_scalars(class_under_test):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_avro_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(SCALAR_BLOCKS, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    actual_table = reader.to_arrow(read_session)
+
+    arrow_schema = pyarrow.schema(
+        [
+            pyarrow.field(column["name"], BQ_TO_ARROW_TYPES[column["type"]])
+            for column in SCALAR_COLUMNS
+        ]
+    )
+    expected_table = pyarrow.Table.from_batches(
+        _bq_to_arrow_batch_objects(SCALAR_BLOCKS, arrow_schema)
+    )
+    assert actual_table == expected_table
+
+
+def test_to_arrow_w_nested_and_nulls(class_under_test):
+    avro_schema = {
+        "type": "record",
+        "name": "__root__",
+        "fields": [
+            {"name": "int_col", "type": ["null", "long"]},
+            {
+                "name": "date_list",
+                "type": {
+                    "type": "array",
+                    "items": {"type": "int", "logicalType": "date"},
+                },
+            },
+            {
+                "name": "struct_col",
+                "type": [
+                    "null",
+                    {
+                        "type": "record",
+                        "name": "struct_col",
+                        "fields": [
+                            {
+                                "name": "ts",
+                                "type": [
+                                    "null",
+                                    {"type": "long", "logicalType": "timestamp-micros"},
+                                ],
+                            }
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    bq_blocks = [
+        [
+            {
+                "int_col": 1,
+                "date_list": [datetime.date(1970, 1, 2)],
+                "struct_col": {
+                    "ts": datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)
+                },
+            },
+            {"int_col": None, "date_list": [], "struct_col": None},
+        ]
+    ]
+    read_session = _generate_avro_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(bq_blocks, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    actual_table = reader.to_arrow(read_session)
+
+    timestamp_type = pyarrow.timestamp("us", tz="UTC")
+    assert actual_table.schema.types == [
+        pyarrow.int64(),
+        pyarrow.list_(pyarrow.date32()),
+        pyarrow.struct([pyarrow.field("ts", timestamp_type)]),
+    ]
+    assert actual_table.to_pydict() == {
+        "int_col": [1, None],
+        "date_list": [[datetime.date(1970, 1, 2)], []],
+        "struct_col": [
+            {"ts": datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=pytz.utc)},
+            None,
+        ],
+    }
+
+
 def test_to_dataframe_no_pandas_raises_import_error(
     mut, class_under_test, mock_client, monkeypatch
 ):
@@ -721,6 +861,200 @@ def test_to_dataframe_by_page(class_under_test, mock_client):
     )
 
 
+def _generate_parallel_read_session(avro_schema_json, num_streams):
+    read_session = _generate_avro_read_session(avro_schema_json)
+    for index in range(num_streams):
+        read_session.streams.add(name="stream-{}".format(index))
+    return read_session
+
+
+def _parallel_read_rows(stream_blocks):
+    """Make a ``read_rows`` mock side effect, returning the blocks of each
+    stream, keyed by the stream name and the offset to read from."""
+
+    def read_rows(read_position, **kwargs):
+        return stream_blocks[(read_position.stream.name, read_position.offset)]
+
+    return read_rows
+
+
+def _parallel_read_stream_blocks(avro_schema):
+    bq_blocks = {
+        "stream-0": [[{"int_col": 1}, {"int_col": 2}], [{"int_col": 3}]],
+        "stream-1": [[{"int_col": 4}], [{"int_col": 5}, {"int_col": 6}]],
+        "stream-2": [[{"int_col": 7}]],
+    }
+    stream_blocks = {
+        (name, 0): _bq_to_avro_blocks(blocks, avro_schema)
+        for name, blocks in bq_blocks.items()
+    }
+    return stream_blocks
+
+
+def test_parallel_iterator_w_invalid_args(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 2)
+
+    with pytest.raises(ValueError):
+        mut.ParallelReadRowsIterator(mock_client, read_session, {}, output_type="rows")
+    with pytest.raises(ValueError):
+        mut.ParallelReadRowsIterator(mock_client, read_session, {}, max_workers=0)
+
+
+def test_parallel_iterator_w_empty_session(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 0)
+
+    got = mut.ParallelReadRowsIterator(mock_client, read_session, {})
+
+    assert list(got) == []
+    mock_client.read_rows.assert_not_called()
+
+
+def test_parallel_iterator_to_arrow(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 3)
+    stream_blocks = _parallel_read_stream_blocks(avro_schema)
+    mock_client.read_rows.side_effect = _parallel_read_rows(stream_blocks)
+    read_rows_kwargs = {"metadata": {"test-key": "test-value"}}
+
+    got = mut.ParallelReadRowsIterator(
+        mock_client, read_session, read_rows_kwargs, max_workers=2
+    )
+    record_batches = list(got)
+
+    assert len(record_batches) == 5
+    assert all(isinstance(batch, pyarrow.RecordBatch) for batch in record_batches)
+    table = pyarrow.Table.from_batches(record_batches)
+    assert sorted(table.column("int_col").to_pylist()) == [1, 2, 3, 4, 5, 6, 7]
+    assert mock_client.read_rows.call_count == 3
+    for call in mock_client.read_rows.call_args_list:
+        assert call[1] == read_rows_kwargs
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_parallel_iterator_preserve_order_to_dataframe(mut, mock_client, max_workers):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 3)
+    stream_blocks = _parallel_read_stream_blocks(avro_schema)
+    mock_client.read_rows.side_effect = _parallel_read_rows(stream_blocks)
+
+    got = mut.ParallelReadRowsIterator(
+        mock_client,
+        read_session,
+        {},
+        max_workers=max_workers,
+        preserve_order=True,
+        output_type="dataframe",
+        dtypes={"int_col": "int32"},
+    )
+    frames = list(got)
+
+    assert len(frames) == 5
+    dataframe = pandas.concat(frames, ignore_index=True)
+    assert list(dataframe["int_col"]) == [1, 2, 3, 4, 5, 6, 7]
+    assert str(dataframe["int_col"].dtype) == "int32"
+
+
+def test_parallel_iterator_w_reconnect(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 1)
+    avro_blocks_1 = _bq_to_avro_blocks([[{"int_col": 1}, {"int_col": 2}]], avro_schema)
+    avro_blocks_2 = _bq_to_avro_blocks([[{"int_col": 3}]], avro_schema)
+    mock_client.read_rows.side_effect = _parallel_read_rows(
+        {
+            ("stream-0", 0): _avro_blocks_w_unavailable(avro_blocks_1),
+            ("stream-0", 2): avro_blocks_2,
+        }
+    )
+
+    got = mut.ParallelReadRowsIterator(mock_client, read_session, {})
+    table = pyarrow.Table.from_batches(list(got))
+
+    assert table.column("int_col").to_pylist() == [1, 2, 3]
+
+
+def test_parallel_iterator_w_error(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 3)
+    stream_blocks = _parallel_read_stream_blocks(avro_schema)
+    stream_blocks[("stream-1", 0)] = _avro_blocks_w_deadline(
+        stream_blocks[("stream-1", 0)]
+    )
+    mock_client.read_rows.side_effect = _parallel_read_rows(stream_blocks)
+
+    got = mut.ParallelReadRowsIterator(mock_client, read_session, {})
+
+    with pytest.raises(google.api_core.exceptions.DeadlineExceeded):
+        list(got)
+    assert not any(worker.is_alive() for worker in got._workers)
+
+
+def test_parallel_iterator_close(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 3)
+    stream_blocks = _parallel_read_stream_blocks(avro_schema)
+    mock_client.read_rows.side_effect = _parallel_read_rows(stream_blocks)
+
+    with mut.ParallelReadRowsIterator(
+        mock_client, read_session, {}, max_workers=1, max_queue_size=1
+    ) as got:
+        next(got)
+
+    assert not any(worker.is_alive() for worker in got._workers)
+    # The last streams are not started, once the read is stopped.
+    assert mock_client.read_rows.call_count < 3
+
+
+def test_parallel_iterator_next_after_close(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 3)
+    stream_blocks = _parallel_read_stream_blocks(avro_schema)
+    mock_client.read_rows.side_effect = _parallel_read_rows(stream_blocks)
+    got = mut.ParallelReadRowsIterator(mock_client, read_session, {})
+    next(got)
+
+    got.close()
+
+    with pytest.raises(StopIteration):
+        next(got)
+
+
+class _BlockingReadRows(object):
+    """A ReadRows call which blocks after its first message, until it is
+    cancelled."""
+
+    def __init__(self, first_message):
+        self._first_message = first_message
+        self.cancelled = threading.Event()
+
+    def __iter__(self):
+        yield self._first_message
+        self.cancelled.wait()
+        raise google.api_core.exceptions.Cancelled("test: cancelled")
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def test_parallel_iterator_close_cancels_read_rows(mut, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_parallel_read_session(avro_schema, 1)
+    blocks = _bq_to_avro_blocks([[{"int_col": 1}]], avro_schema)
+    read_rows = _BlockingReadRows(blocks[0])
+    mock_client.read_rows.return_value = read_rows
+    got = mut.ParallelReadRowsIterator(mock_client, read_session, {})
+    assert next(got).num_rows == 1
+
+    got.close()
+
+    assert read_rows.cancelled.is_set()
+    assert not any(worker.is_alive() for worker in got._workers)
+    # The error caused by cancelling the call is not raised.
+    with pytest.raises(StopIteration):
+        next(got)
+
+
 def test_copy_stream_position(mut):
     read_position = bigquery_storage_v1beta1.types.StreamPosition(
         stream={"name": "test"}, offset=41
@@ -0,0 +1,138 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the subscriber's ack time histograms.
+
+The benchmark feeds a simulated stream of ack times to each histogram, with
+the ack times shifting from slow to fast halfway through, and reads the 99th
+percentile after every ack, as the subscriber does when leasing the received
+messages. It reports the time spent adding the values and computing the
+percentiles, and the error of the reported 99th percentile compared to the
+exact 99th percentile of the ack times within the last ``--window`` seconds.
+
+Usage:
+
+  $ python benchmark/ack_histogram.py --acks 200000
+"""
+
+import argparse
+import bisect
+import collections
+import random
+import time
+
+from google.cloud.pubsub_v1.subscriber._protocol import histogram
+
+
+def parse_options():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--acks", type=int, default=200000, help="The number of acks to simulate."
+    )
+    parser.add_argument(
+        "--ack-rate", type=float, default=100.0, help="The simulated acks per second."
+    )
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=600.0,
+        help="The window of the windowed histogram, in seconds.",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def simulate_acks(count, ack_rate, seed):
+    """Return a list of (timestamp, ack time) tuples."""
+    rng = random.Random(seed)
+    acks = []
+    for i in range(count):
+        # Slow acks in the first half, fast acks in the second half.
+        mean = 120 if i < count // 2 else 15
+        acks.append((i / ack_rate, rng.expovariate(1.0 / mean)))
+    return acks
+
+
+class ExactWindow(object):
+    """The exact percentiles of the values within the window (the reference)."""
+
+    def __init__(self, window):
+        self._window = window
+        self._entries = collections.deque()
+        self._sorted = []
+
+    def add(self, now, value):
+        value = min(max(int(value), 10), 600)
+        self._entries.append((now, value))
+        bisect.insort(self._sorted, value)
+        while self._entries[0][0] <= now - self._window:
+            _, old = self._entries.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, old)]
+
+    def percentile(self, percent):
+        index = min(len(self._sorted) - 1, int(len(self._sorted) * percent / 100))
+        return self._sorted[index]
+
+
+def run(name, histo, clock, acks, reference):
+    add_time = 0.0
+    percentile_time = 0.0
+    errors = []
+
+    for timestamp, ack_time in acks:
+        clock[0] = timestamp
+
+        start = time.perf_counter()
+        histo.add(ack_time)
+        add_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        p99 = histo.percentile(99)
+        percentile_time += time.perf_counter() - start
+
+        errors.append(abs(p99 - reference[len(errors)]))
+
+    print(
+        "{:<20} add {:>6.2f} us, percentile {:>6.2f} us, "
+        "p99 error mean {:>6.1f} s, max {:>4} s".format(
+            name,
+            add_time / len(acks) * 1e6,
+            percentile_time / len(acks) * 1e6,
+            sum(errors) / len(errors),
+            max(errors),
+        )
+    )
+
+
+def main():
+    options = parse_options()
+    acks = simulate_acks(options.acks, options.ack_rate, options.seed)
+
+    exact = ExactWindow(options.window)
+    reference = []
+    for timestamp, ack_time in acks:
+        exact.add(timestamp, ack_time)
+        reference.append(exact.percentile(99))
+
+    clock = [0.0]
+    run("Histogram", histogram.Histogram(), clock, acks, reference)
+
+    windowed = histogram.WindowedHistogram(
+        window=options.window, clock=lambda: clock[0]
+    )
+    run("WindowedHistogram", windowed, clock, acks, reference)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the publish requests sent with batch packing and compression.
+
+The benchmark does not talk to the backend, the publish RPC is replaced with a
+fake one that records the size of each request. It publishes messages of
+random sizes with JSON-like, compressible data, and reports the number of
+publish requests, the bytes sent, and how full the requests were on average.
+
+Usage:
+
+  $ python benchmark/publisher_packing.py --messages 500
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+
+import mock
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+
+
+TOPIC = "projects/benchmark/topics/benchmark"
+
+
+def parse_options():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--min-size", type=int, default=10 * 1000)
+    parser.add_argument("--max-size", type=int, default=2 * 1000 * 1000)
+    parser.add_argument("--max-bytes", type=int, default=9 * 1000 * 1000)
+    parser.add_argument("--max-open-batches", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def make_payloads(count, min_size, max_size, seed):
+    rng = random.Random(seed)
+    records = [
+        json.dumps(
+            {
+                "id": rng.randint(0, 2 ** 32),
+                "sensor": "sensor-{}".format(rng.randint(0, 1000)),
+                "values": [round(rng.gauss(20, 5), 3) for _ in range(10)],
+            }
+        ).encode("utf-8")
+        for _ in range(1000)
+    ]
+    payloads = []
+    for _ in range(count):
+        size = rng.randint(min_size, max_size)
+        chunks = []
+        while size > 0:
+            chunks.append(rng.choice(records))
+            size -= len(chunks[-1])
+        payloads.append(b"\n".join(chunks))
+    return payloads
+
+
+def make_client(batch_settings, compression):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        credentials=creds, batch_settings=batch_settings, compression=compression
+    )
+    request_sizes = []
+    lock = threading.Lock()
+
+    def fake_publish(topic, messages):
+        request = types.PublishRequest(topic=topic, messages=messages)
+        with lock:
+            request_sizes.append(request.ByteSize())
+        return types.PublishResponse(message_ids=[str(i) for i in range(len(messages))])
+
+    client.api.publish = fake_publish
+    return client, request_sizes
+
+
+def run(name, payloads, batch_settings, compression):
+    client, request_sizes = make_client(batch_settings, compression)
+
+    start = time.time()
+    futures = [client.publish(TOPIC, payload) for payload in payloads]
+    client.stop()
+    for future in futures:
+        future.result()
+    elapsed = time.time() - start
+
+    limit = batch_settings.max_bytes
+    print(
+        "{:<16} {:>6} requests, {:>9.1f} MB sent, {:>5.1f} % average fill, "
+        "{:.2f} s".format(
+            name,
+            len(request_sizes),
+            sum(request_sizes) / 1e6,
+            100.0 * sum(request_sizes) / (len(request_sizes) * limit),
+            elapsed,
+        )
+    )
+
+
+def main():
+    options = parse_options()
+    payloads = make_payloads(
+        options.messages, options.min_size, options.max_size, options.seed
+    )
+    print("Publishing {:.1f} MB of data.".format(sum(map(len, payloads)) / 1e6))
+
+    # A long max latency makes the batches fill up by size only.
+    single = types.BatchSettings(max_bytes=options.max_bytes, max_latency=10.0)
+    packed = single._replace(max_open_batches=options.max_open_batches)
+    gzip = types.CompressionSettings(codec=types.Compression.GZIP)
+
+    run("default", payloads, single, types.CompressionSettings())
+    run("packed", payloads, packed, types.CompressionSettings())
+    run("gzip", payloads, single, gzip)
+    run("gzip + packed", payloads, packed, gzip)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the publisher's thread-per-batch commits with a commit scheduler.
+
+The benchmark does not talk to the backend, the publish RPC is replaced with a
+fake one that sleeps for the given latency. It publishes messages at the given
+target rates and reports the achieved throughput, the peak number of threads,
+and the time it took for all the publish futures to resolve.
+
+Usage:
+
+  $ python benchmark/publisher_throughput.py --rates 10000 50000 100000
+"""
+
+import argparse
+import threading
+import time
+
+import mock
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import scheduler
+
+
+TOPIC = "projects/benchmark/topics/benchmark"
+
+
+def parse_options():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rates",
+        type=int,
+        nargs="+",
+        default=[10000, 50000, 100000],
+        help="The target publish rates in messages per second.",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=3.0, help="Seconds to publish for."
+    )
+    parser.add_argument(
+        "--rpc-latency",
+        type=float,
+        default=0.05,
+        help="The simulated latency of a publish RPC in seconds.",
+    )
+    parser.add_argument("--message-size", type=int, default=100)
+    parser.add_argument("--max-workers", type=int, default=10)
+    parser.add_argument("--max-in-flight-per-topic", type=int, default=None)
+    return parser.parse_args()
+
+
+def make_client(rpc_latency, commit_scheduler=None):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds, commit_scheduler=commit_scheduler)
+
+    def fake_publish(topic, messages):
+        time.sleep(rpc_latency)
+        return types.PublishResponse(message_ids=[str(i) for i in range(len(messages))])
+
+    client.api.publish = fake_publish
+    return client
+
+
+def run(client, rate, duration, message_size):
+    data = b"x" * message_size
+    total = int(rate * duration)
+    interval = 1.0 / rate
+    peak_threads = threading.active_count()
+
+    futures = []
+    start = time.time()
+    for i in range(total):
+        futures.append(client.publish(TOPIC, data))
+
+        # Pace the publishing, checking the clock only every 100 messages.
+        if i % 100 == 0:
+            ahead = start + i * interval - time.time()
+            if ahead > 0:
+                time.sleep(ahead)
+            peak_threads = max(peak_threads, threading.active_count())
+    publish_time = time.time() - start
+
+    for future in futures:
+        future.result()
+    total_time = time.time() - start
+
+    return {
+        "messages": total,
+        "publish_rate": total / publish_time,
+        "throughput": total / total_time,
+        "peak_threads": peak_threads,
+        "total_time": total_time,
+    }
+
+
+def report(name, rate, result):
+    print(
+        "{:<16} target {:>7} msg/s: published {:>9.0f} msg/s, "
+        "acknowledged {:>9.0f} msg/s, peak threads {:>5}, total {:.2f} s".format(
+            name,
+            rate,
+            result["publish_rate"],
+            result["throughput"],
+            result["peak_threads"],
+            result["total_time"],
+        )
+    )
+
+
+def main():
+    options = parse_options()
+
+    for rate in options.rates:
+        client = make_client(options.rpc_latency)
+        result = run(client, rate, options.duration, options.message_size)
+        report("thread-per-batch", rate, result)
+
+        commit_scheduler = scheduler.ThreadCommitScheduler(
+            max_workers=options.max_workers,
+            max_in_flight_per_topic=options.max_in_flight_per_topic,
+        )
+        client = make_client(options.rpc_latency, commit_scheduler=commit_scheduler)
+        result = run(client, rate, options.duration, options.message_size)
+        commit_scheduler.shutdown()
+        report("commit-scheduler", rate, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the subscriber's schedulers on messages with ordering keys.
+
+The benchmark schedules the callbacks directly, without a streaming pull. The
+callback sleeps for the given processing time, simulating I/O bound message
+processing. It reports the throughput, and how many messages were processed
+out of order relative to the other messages with the same key.
+
+Usage:
+
+  $ python benchmark/subscriber_scheduler.py --keys 1 10 100 1000
+"""
+
+import argparse
+import collections
+import threading
+import time
+
+from google.cloud.pubsub_v1.subscriber import scheduler
+
+
+class FakeMessage(object):
+    __slots__ = ("attributes", "sequence")
+
+    def __init__(self, key, sequence):
+        self.attributes = {"key": key}
+        self.sequence = sequence
+
+
+def parse_options():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--keys",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1000],
+        help="The numbers of distinct ordering keys to run with.",
+    )
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument(
+        "--processing-time",
+        type=float,
+        default=0.001,
+        help="The simulated processing time of a message in seconds.",
+    )
+    parser.add_argument("--num-lanes", type=int, default=1024)
+    return parser.parse_args()
+
+
+def run(scheduler_, num_keys, num_messages, processing_time):
+    last_sequence = collections.defaultdict(lambda: -1)
+    out_of_order = [0]
+    processed = [0]
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def callback(message):
+        time.sleep(processing_time)
+        key = message.attributes["key"]
+        with lock:
+            if message.sequence < last_sequence[key]:
+                out_of_order[0] += 1
+            last_sequence[key] = max(last_sequence[key], message.sequence)
+            processed[0] += 1
+            if processed[0] == num_messages:
+                done.set()
+
+    start = time.time()
+    for sequence in range(num_messages):
+        message = FakeMessage("key-{}".format(sequence % num_keys), sequence)
+        scheduler_.schedule(callback, message)
+    done.wait()
+    elapsed = time.time() - start
+    scheduler_.shutdown()
+
+    return num_messages / elapsed, out_of_order[0]
+
+
+def main():
+    options = parse_options()
+
+    for num_keys in options.keys:
+        for name, scheduler_ in (
+            ("ThreadScheduler", scheduler.ThreadScheduler()),
+            (
+                "OrderedKeyScheduler",
+                scheduler.OrderedKeyScheduler(
+                    key_attribute="key", num_lanes=options.num_lanes
+                ),
+            ),
+        ):
+            throughput, out_of_order = run(
+                scheduler_, num_keys, options.messages, options.processing_time
+            )
+            print(
+                "{:<20} {:>5} keys: {:>8.0f} msg/s, {:>6} out of order".format(
+                    name, num_keys, throughput, out_of_order
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
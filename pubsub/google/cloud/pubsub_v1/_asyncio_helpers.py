@@ -0,0 +1,241 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for handing work over from the client threads to an asyncio loop.
+
+.. note::
+
+    This module is only functional on Python 3. It does not use the
+    ``async`` / ``await`` syntax, so that the package can still be installed
+    on Python 2.7.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import inspect
+import logging
+import sys
+import threading
+import weakref
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_loop_bridges = weakref.WeakKeyDictionary()
+_loop_bridges_lock = threading.Lock()
+
+
+def _check_asyncio():
+    """Raise an error if asyncio is not available."""
+    if asyncio is None:  # pragma: NO COVER
+        raise RuntimeError("The asyncio support requires Python 3.5 or newer.")
+
+
+def get_event_loop(loop=None):
+    """Return the given event loop, or the current one if not given.
+
+    Args:
+        loop (Optional[asyncio.AbstractEventLoop]): The event loop.
+
+    Returns:
+        asyncio.AbstractEventLoop: The event loop.
+    """
+    _check_asyncio()
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    return loop
+
+
+def _get_running_loop():
+    """Return the event loop running in the current thread, if any.
+
+    Returns:
+        Optional[asyncio.AbstractEventLoop]: The running event loop, or
+        :data:`None` if no event loop is running in the current thread.
+    """
+    if sys.version_info >= (3, 7):
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    # Before Python 3.7, the event loop of the thread is returned, running
+    # or not, and an error is raised if the thread has none.
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        return None
+    return loop if loop.is_running() else None
+
+
+def is_awaitable(obj):
+    """Return :data:`True` if the object can be awaited in an event loop.
+
+    Args:
+        obj (Any): The object to check.
+
+    Returns:
+        bool: Whether the object is awaitable.
+    """
+    return asyncio is not None and inspect.isawaitable(obj)
+
+
+def run_awaitable(awaitable):
+    """Run the awaitable as a task in the event loop of the current thread.
+
+    Args:
+        awaitable (Awaitable): The awaitable (e.g. a coroutine) to run.
+
+    Returns:
+        asyncio.Future: The future of the task running the awaitable.
+
+    Raises:
+        RuntimeError: If there is no event loop running in the current thread.
+    """
+    _check_asyncio()
+    loop = _get_running_loop()
+    if loop is None:
+        # Avoid a warning about a coroutine that was never awaited.
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError(
+            "Awaitable callbacks must be run in an event loop, use an "
+            "AsyncioScheduler to schedule them."
+        )
+    return asyncio.ensure_future(awaitable, loop=loop)
+
+
+class LoopBridge(object):
+    """Call functions in an event loop from other threads.
+
+    Each call to :meth:`asyncio.AbstractEventLoop.call_soon_threadsafe` wakes
+    up the loop. The bridge coalesces these wake-ups - the functions queued by
+    other threads are called in batches, with a single wake-up per batch.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop to call the functions
+            in.
+    """
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._operational_lock = threading.Lock()
+        self._pending = collections.deque()
+        self._wakeup_scheduled = False
+
+    @property
+    def loop(self):
+        """asyncio.AbstractEventLoop: The event loop of the bridge."""
+        return self._loop
+
+    def call_soon(self, callback, *args):
+        """Call the callback in the event loop, as soon as possible.
+
+        This method is thread-safe.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+        """
+        with self._operational_lock:
+            self._pending.append((callback, args))
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # The event loop has been closed, nobody is waiting for the
+            # results anymore.
+            _LOGGER.debug("Event loop closed, dropping the pending callbacks.")
+            self.clear()
+
+    def clear(self):
+        """Drop all callbacks that have not been called yet."""
+        with self._operational_lock:
+            self._pending.clear()
+            self._wakeup_scheduled = False
+
+    def _drain(self):
+        """Call all the pending callbacks. Runs in the event loop."""
+        with self._operational_lock:
+            pending = self._pending
+            self._pending = collections.deque()
+            self._wakeup_scheduled = False
+
+        for callback, args in pending:
+            try:
+                callback(*args)
+            except Exception:
+                _LOGGER.exception("Unexpected error in a callback in the event loop.")
+
+
+def get_loop_bridge(loop):
+    """Return the bridge shared by all the callers using the event loop.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop.
+
+    Returns:
+        LoopBridge: The bridge to the event loop.
+    """
+    with _loop_bridges_lock:
+        bridge = _loop_bridges.get(loop)
+        if bridge is None:
+            bridge = _loop_bridges[loop] = LoopBridge(loop)
+        return bridge
+
+
+def _copy_future_state(source, destination):
+    """Copy the outcome of a done client future to an asyncio future."""
+    if destination.cancelled():
+        return
+
+    exception = source.exception()
+    if exception is not None:
+        destination.set_exception(exception)
+    else:
+        destination.set_result(source.result())
+
+
+def wrap_future(future, loop=None):
+    """Wrap a client future into an asyncio future.
+
+    No thread is blocked waiting on the client future, the asyncio future is
+    resolved in the event loop by a callback attached to the client future.
+
+    Args:
+        future (~google.cloud.pubsub_v1.futures.Future): The client future.
+        loop (Optional[asyncio.AbstractEventLoop]): The event loop the asyncio
+            future belongs to. Defaults to the current event loop.
+
+    Returns:
+        asyncio.Future: The future resolved with the outcome of ``future``.
+    """
+    loop = get_event_loop(loop)
+    aio_future = loop.create_future()
+    bridge = get_loop_bridge(loop)
+
+    def on_done(source):
+        bridge.call_soon(_copy_future_state, source, aio_future)
+
+    future.add_done_callback(on_done)
+    return aio_future
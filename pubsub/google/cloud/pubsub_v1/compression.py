@@ -0,0 +1,179 @@
+# Copyright 2020, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compression of the Pub/Sub message data.
+
+The publisher compresses the data of each message separately, and marks the
+compressed messages with the :data:`ENCODING_ATTRIBUTE` attribute naming the
+codec used. Messages that are too small, or that would not get any smaller,
+are published uncompressed and without the attribute.
+
+The subscriber can decompress the received messages with
+:func:`decompress_message`, or by subscribing with ``decompress=True``.
+"""
+
+from __future__ import absolute_import
+
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # pragma: NO COVER
+    zstandard = None
+
+from google.cloud.pubsub_v1 import types
+
+
+ENCODING_ATTRIBUTE = "pubsub-content-encoding"
+"""The message attribute naming the codec the message data is compressed
+with."""
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+"""Makes ``zlib`` produce and consume the gzip format (also on Python 2,
+which lacks ``gzip.compress()``)."""
+
+
+def _gzip_compress(data, level):
+    if level is None:
+        level = zlib.Z_DEFAULT_COMPRESSION
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_decompress(data):
+    return zlib.decompress(data, _GZIP_WBITS)
+
+
+def _zstd_compress(data, level):
+    if level is None:
+        compressor = zstandard.ZstdCompressor()
+    else:
+        compressor = zstandard.ZstdCompressor(level=level)
+    return compressor.compress(data)
+
+
+def _zstd_decompress(data):
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+_CODECS = {
+    types.Compression.GZIP.value: (_gzip_compress, _gzip_decompress),
+    types.Compression.ZSTD.value: (_zstd_compress, _zstd_decompress),
+}
+
+
+def _get_codec(name):
+    """Return the compress and decompress functions of a codec.
+
+    Args:
+        name (Union[str, ~google.cloud.pubsub_v1.types.Compression]): The
+            codec name.
+
+    Returns:
+        Tuple[Callable[[bytes, Optional[int]], bytes], Callable[[bytes], bytes]]:
+        The compress and decompress functions.
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ImportError: If the codec requires a package that is not installed.
+    """
+    name = getattr(name, "value", name)
+    try:
+        codec = _CODECS[name]
+    except KeyError:
+        raise ValueError("Unknown compression codec: {!r}.".format(name))
+
+    if name == types.Compression.ZSTD.value and zstandard is None:
+        raise ImportError(
+            "The zstandard package is required for the zstd compression. "
+            "Install it with 'pip install google-cloud-pubsub[zstd]'."
+        )
+    return codec
+
+
+def validate_settings(settings):
+    """Check that the codec of the compression settings can be used.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.CompressionSettings): The
+            compression settings.
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ImportError: If the codec requires a package that is not installed.
+    """
+    if settings.codec is not None:
+        _get_codec(settings.codec)
+
+
+def compress(data, attributes, settings):
+    """Compress the data of a message to publish.
+
+    Args:
+        data (bytes): The message data.
+        attributes (Mapping[str, str]): The message attributes.
+        settings (~google.cloud.pubsub_v1.types.CompressionSettings): The
+            compression settings.
+
+    Returns:
+        Tuple[bytes, Mapping[str, str]]: The data to publish, and the
+        attributes to publish it with. If the data is compressed, the
+        returned attributes are a copy of ``attributes`` with the
+        :data:`ENCODING_ATTRIBUTE` added, otherwise the arguments are returned
+        unchanged.
+    """
+    if settings.codec is None or len(data) < settings.min_bytes:
+        return data, attributes
+
+    codec_name = getattr(settings.codec, "value", settings.codec)
+    compress_func, _ = _get_codec(codec_name)
+    compressed = compress_func(data, settings.level)
+
+    # Do not make the receivers decompress the data for nothing.
+    if len(compressed) >= len(data):
+        return data, attributes
+
+    attributes = dict(attributes)
+    attributes[ENCODING_ATTRIBUTE] = codec_name
+    return compressed, attributes
+
+
+def decompress_message(message):
+    """Decompress the data of a received message in place.
+
+    The message is left untouched unless it is marked with the
+    :data:`ENCODING_ATTRIBUTE`, which is removed from its attributes once
+    the data is decompressed.
+
+    Args:
+        message (~google.cloud.pubsub_v1.types.PubsubMessage): The message,
+            e.g. the ``message`` of a
+            :class:`~google.cloud.pubsub_v1.types.ReceivedMessage` returned by
+            a synchronous pull.
+
+    Returns:
+        ~google.cloud.pubsub_v1.types.PubsubMessage: The same message.
+
+    Raises:
+        ValueError: If the message is compressed with an unknown codec.
+        ImportError: If the codec requires a package that is not installed.
+    """
+    codec_name = message.attributes.get(ENCODING_ATTRIBUTE)
+    if not codec_name:
+        return message
+
+    _, decompress_func = _get_codec(codec_name)
+    message.data = decompress_func(message.data)
+    del message.attributes[ENCODING_ATTRIBUTE]
+    return message
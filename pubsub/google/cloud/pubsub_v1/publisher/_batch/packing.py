@@ -0,0 +1,236 @@
+# Copyright 2020, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import itertools
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher._batch import base
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+_FULL_RATIO = 0.95
+"""The fraction of the size limit above which a batch is considered full and
+is committed right away."""
+
+
+class PackingBatch(base.Batch):
+    """A group of batches that the messages are packed into by their size.
+
+    Each message is added to the oldest open batch it fits into (first fit).
+    Only if it does not fit into any of them, a new batch is opened, and if
+    there are already ``settings.max_open_batches`` open batches, the fullest
+    one is committed to make room for it. The requests are thus filled closer
+    to ``settings.max_bytes`` than with a single batch, which is committed as
+    soon as the next message does not fit into it.
+
+    Every batch is still committed at the latest ``settings.max_latency``
+    seconds after it was opened, but the messages are not necessarily
+    published in the order they were published with the client.
+
+    Args:
+        client (~.pubsub_v1.PublisherClient): The publisher client used to
+            create this batch.
+        topic (str): The topic. The format for this is
+            ``projects/{project}/topics/{topic}``.
+        settings (~.pubsub_v1.types.BatchSettings): The settings for batch
+            publishing.
+        autocommit (bool): Whether to autocommit the batches when the time
+            has elapsed.
+    """
+
+    def __init__(self, client, topic, settings, autocommit=True):
+        self._client = client
+        self._topic = topic
+        self._settings = settings
+        self._autocommit = autocommit
+
+        self._size_limit = min(settings.max_bytes, thread._SERVER_PUBLISH_MAX_BYTES)
+
+        # The lock protects the open batches and the status.
+        self._state_lock = threading.Lock()
+        self._open_batches = []
+        self._status = base.BatchStatus.ACCEPTING_MESSAGES
+
+    @staticmethod
+    def make_lock():
+        """Return a threading lock.
+
+        Returns:
+            _thread.Lock: A newly created lock.
+        """
+        return threading.Lock()
+
+    @property
+    def client(self):
+        """~.pubsub_v1.client.PublisherClient: A publisher client."""
+        return self._client
+
+    @property
+    def open_batches(self):
+        """Sequence[~.pubsub_v1.publisher._batch.base.Batch]: The batches
+        accepting messages, the oldest first."""
+        with self._state_lock:
+            return list(self._open_batches)
+
+    @property
+    def messages(self):
+        """Sequence: The messages in the open batches."""
+        return list(
+            itertools.chain.from_iterable(batch.messages for batch in self.open_batches)
+        )
+
+    @property
+    def settings(self):
+        """Return the batch settings.
+
+        Returns:
+            ~.pubsub_v1.types.BatchSettings: The batch settings.
+        """
+        return self._settings
+
+    @property
+    def size(self):
+        """Return the total size of the messages in the open batches.
+
+        Returns:
+            int: The total size of the open batches, including the overhead
+                of their requests, in bytes.
+        """
+        with self._state_lock:
+            return sum(batch.size for batch in self._open_batches)
+
+    @property
+    def status(self):
+        """Return the status of this group of batches.
+
+        Returns:
+            str: ``accepting messages`` until :meth:`commit` is called,
+                ``starting`` afterwards.
+        """
+        return self._status
+
+    def will_accept(self, message):
+        """Return True if the batch is able to accept the message.
+
+        Any message is accepted until :meth:`commit` is called, as a new
+        batch is opened for the messages that do not fit into the open ones.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            bool: Whether this batch can accept the message.
+        """
+        return self._status == base.BatchStatus.ACCEPTING_MESSAGES
+
+    def commit(self):
+        """Commit all the open batches, and stop accepting messages.
+
+        .. note::
+
+            This method is non-blocking, the batches are committed in the
+            background.
+        """
+        with self._state_lock:
+            if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+                return
+            self._status = base.BatchStatus.STARTING
+            batches, self._open_batches = self._open_batches, []
+
+        for batch in batches:
+            batch.commit()
+
+    def _open_batch(self):
+        """Open a new batch. The caller must hold the state lock."""
+        if len(self._open_batches) >= self._settings.max_open_batches:
+            fullest = max(self._open_batches, key=lambda batch: batch.size)
+            self._open_batches.remove(fullest)
+            fullest.commit()
+
+        batch = self._client._batch_class(
+            autocommit=self._autocommit,
+            client=self._client,
+            settings=self._settings,
+            topic=self._topic,
+        )
+        self._open_batches.append(batch)
+        return batch
+
+    def publish(self, message):
+        """Publish a single message.
+
+        Add the given message to the oldest open batch that it fits into,
+        opening a new batch if needed.
+
+        Args:
+            message (~.pubsub_v1.types.PubsubMessage): The Pub/Sub message.
+
+        Returns:
+            Optional[~google.api_core.future.Future]: An object conforming to
+            the :class:`~concurrent.futures.Future` interface, or :data:`None`
+            if this group of batches has been committed.
+
+        Raises:
+            pubsub_v1.publisher.exceptions.MessageTooLargeError: If publishing
+                the ``message`` would exceed the max size limit on the backend.
+        """
+        # Coerce the type, just in case.
+        if not isinstance(message, types.PubsubMessage):
+            message = types.PubsubMessage(**message)
+
+        size_increase = types.PublishRequest(messages=[message]).ByteSize()
+
+        with self._state_lock:
+            if self._status != base.BatchStatus.ACCEPTING_MESSAGES:
+                return None
+
+            # Forget the batches committed in the meantime, e.g. after their
+            # max latency has elapsed.
+            self._open_batches = [
+                batch
+                for batch in self._open_batches
+                if batch.status == base.BatchStatus.ACCEPTING_MESSAGES
+            ]
+
+            candidates = [
+                batch
+                for batch in self._open_batches
+                if batch.size + size_increase <= self._size_limit
+            ]
+
+            future = None
+            for batch in candidates:
+                future = batch.publish(message)
+                if future is not None:
+                    break
+
+            while future is None:
+                # The message does not fit into any open batch, or the batches
+                # it fits into have just been committed. A new batch accepts
+                # any message, unless it is too large, in which case the error
+                # is raised.
+                batch = self._open_batch()
+                future = batch.publish(message)
+
+            # Do not wait for the max latency to commit a batch that (almost)
+            # no other message fits into.
+            is_full = batch.size >= _FULL_RATIO * self._size_limit
+            if is_full and batch.status == base.BatchStatus.ACCEPTING_MESSAGES:
+                self._open_batches.remove(batch)
+                batch.commit()
+
+        return future
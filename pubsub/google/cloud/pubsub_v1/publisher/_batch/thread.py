@@ -87,14 +87,23 @@ class Batch(base.Batch):
         self._base_request_size = types.PublishRequest(topic=topic).ByteSize()
         self._size = self._base_request_size
 
+        # If the client has a commit scheduler, the commits are run by the
+        # scheduler instead of the threads spawned by the batch itself.
+        self._commit_scheduler = client._commit_scheduler
+
         # If max latency is specified, start a thread to monitor the batch and
         # commit when the max latency is reached.
         self._thread = None
         if autocommit and self.settings.max_latency < float("inf"):
-            self._thread = threading.Thread(
-                name="Thread-MonitorBatchPublisher", target=self.monitor
-            )
-            self._thread.start()
+            if self._commit_scheduler is not None:
+                self._commit_scheduler.schedule_after(
+                    self.settings.max_latency, self.commit
+                )
+            else:
+                self._thread = threading.Thread(
+                    name="Thread-MonitorBatchPublisher", target=self.monitor
+                )
+                self._thread.start()
 
     @staticmethod
     def make_lock():
@@ -153,7 +162,8 @@ class Batch(base.Batch):
 
         .. note::
 
-            This method is non-blocking. It opens a new thread, which calls
+            This method is non-blocking. It opens a new thread (or schedules
+            the work on the client's commit scheduler, if any), which calls
             :meth:`_commit`, which does block.
 
         This synchronously sets the batch status to "starting", and then opens
@@ -170,6 +180,10 @@ class Batch(base.Batch):
             else:
                 return
 
+        if self._commit_scheduler is not None:
+            self._commit_scheduler.schedule(self._topic, self._commit)
+            return
+
         # Start a new thread to actually handle the commit.
         commit_thread = threading.Thread(
             name="Thread-CommitBatchPublisher", target=self._commit
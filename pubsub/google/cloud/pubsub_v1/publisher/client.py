@@ -24,10 +24,14 @@ import six
 from google.api_core import grpc_helpers
 from google.oauth2 import service_account
 
+from google.cloud.pubsub_v1 import _asyncio_helpers
 from google.cloud.pubsub_v1 import _gapic
+from google.cloud.pubsub_v1 import compression as compression_codecs
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import publisher_client
 from google.cloud.pubsub_v1.gapic.transports import publisher_grpc_transport
+from google.cloud.pubsub_v1.publisher import flow_controller
+from google.cloud.pubsub_v1.publisher._batch import packing
 from google.cloud.pubsub_v1.publisher._batch import thread
 
 
@@ -50,7 +54,26 @@ class Client(object):
 
     Args:
         batch_settings (~google.cloud.pubsub_v1.types.BatchSettings): The
-            settings for batch publishing.
+            settings for batch publishing. If ``max_open_batches`` is greater
+            than one, the messages are packed into multiple batches per topic
+            by their size, and are not necessarily published in order.
+        flow_control (~google.cloud.pubsub_v1.types.PublishFlowControl): The
+            settings for bounding the number and the total size of messages
+            that have been published, but not yet sent to the backend. By
+            default, the limits are not enforced.
+        commit_scheduler (~google.cloud.pubsub_v1.publisher.scheduler.CommitScheduler):
+            An optional scheduler shared by all batches to run their publish
+            requests, e.g. a
+            :class:`~google.cloud.pubsub_v1.publisher.scheduler.ThreadCommitScheduler`
+            that bounds the number of threads and the number of publish
+            requests in flight per topic. If not given, each batch spawns its
+            own threads. The scheduler is not shut down by :meth:`stop`.
+        compression (~google.cloud.pubsub_v1.types.CompressionSettings): The
+            settings for compressing the data of the published messages. By
+            default, the data is not compressed. The compressed messages are
+            marked with the
+            :data:`~google.cloud.pubsub_v1.compression.ENCODING_ATTRIBUTE`
+            attribute, and must be decompressed by the subscribers.
         kwargs (dict): Any additional arguments provided are sent as keyword
             arguments to the underlying
             :class:`~google.cloud.pubsub_v1.gapic.publisher_client.PublisherClient`.
@@ -74,6 +97,20 @@ class Client(object):
                 max_latency=1,   # One second
             ),
 
+            # Optional
+            flow_control = pubsub_v1.types.PublishFlowControl(
+                max_messages=500,
+                max_bytes=10 * 1024 * 1024,  # Ten megabytes
+                limit_exceeded_behavior=(
+                    pubsub_v1.types.LimitExceededBehavior.BLOCK
+                ),
+            ),
+
+            # Optional
+            compression = pubsub_v1.types.CompressionSettings(
+                codec=pubsub_v1.types.Compression.GZIP,
+            ),
+
             # Optional
             client_config = {
                 "interfaces": {
@@ -96,7 +133,14 @@ class Client(object):
 
     _batch_class = thread.Batch
 
-    def __init__(self, batch_settings=(), **kwargs):
+    def __init__(
+        self,
+        batch_settings=(),
+        flow_control=(),
+        commit_scheduler=None,
+        compression=(),
+        **kwargs
+    ):
         # Sanity check: Is our goal to use the emulator?
         # If so, create a grpc insecure channel with the emulator host
         # as the target.
@@ -129,12 +173,20 @@ class Client(object):
         # client.
         self.api = publisher_client.PublisherClient(**kwargs)
         self.batch_settings = types.BatchSettings(*batch_settings)
+        self.flow_control = types.PublishFlowControl(*flow_control)
+        self.compression_settings = types.CompressionSettings(*compression)
+        compression_codecs.validate_settings(self.compression_settings)
 
         # The batches on the publisher client are responsible for holding
         # messages. One batch exists for each topic.
         self._batch_lock = self._batch_class.make_lock()
         self._batches = {}
         self._is_stopped = False
+        self._commit_scheduler = commit_scheduler
+
+        # The flow controller bounds the messages that are waiting to be
+        # published across all batches.
+        self._flow_controller = flow_controller.FlowController(self.flow_control)
 
     @classmethod
     def from_service_account_file(cls, filename, batch_settings=(), **kwargs):
@@ -194,7 +246,10 @@ class Client(object):
                 create = True
 
         if create:
-            batch = self._batch_class(
+            batch_class = self._batch_class
+            if self.batch_settings.max_open_batches > 1:
+                batch_class = packing.PackingBatch
+            batch = batch_class(
                 autocommit=autocommit,
                 client=self,
                 settings=self.batch_settings,
@@ -247,6 +302,10 @@ class Client(object):
             RuntimeError:
                 If called after publisher has been stopped
                 by a `stop()` method call.
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                If publishing the message would exceed the publish flow
+                control limits, and the client is configured to raise an
+                error in that case.
         """
         # Sanity check: Is the data being sent as a bytestring?
         # If it is literally anything else, complain loudly about it.
@@ -267,23 +326,82 @@ class Client(object):
                 "be sent as text strings."
             )
 
+        # Compress the data, if configured and worth it.
+        data, attrs = compression_codecs.compress(
+            data, attrs, self.compression_settings
+        )
+
         # Create the Pub/Sub message object.
         message = types.PubsubMessage(data=data, attributes=attrs)
 
-        # Delegate the publishing to the batch.
-        with self._batch_lock:
-            if self._is_stopped:
-                raise RuntimeError("Cannot publish on a stopped publisher.")
+        # Messages should go through flow control to prevent excessive
+        # queuing on the client side (depending on the settings).
+        self._flow_controller.add(message)
 
-            batch = self._batch(topic)
-            future = None
-            while future is None:
-                future = batch.publish(message)
-                if future is None:
-                    batch = self._batch(topic, create=True)
+        def on_publish_done(future):
+            self._flow_controller.release(message)
 
+        # Delegate the publishing to the batch.
+        try:
+            with self._batch_lock:
+                if self._is_stopped:
+                    raise RuntimeError("Cannot publish on a stopped publisher.")
+
+                batch = self._batch(topic)
+                future = None
+                while future is None:
+                    future = batch.publish(message)
+                    if future is None:
+                        batch = self._batch(topic, create=True)
+        except Exception:
+            # The message never made it into a batch, thus it will never be
+            # published and must not keep occupying the flow control capacity.
+            self._flow_controller.release(message)
+            raise
+
+        future.add_done_callback(on_publish_done)
         return future
 
+    def publish_async(self, topic, data, **attrs):
+        """Publish a single message from an :mod:`asyncio` event loop.
+
+        This is the same as :meth:`publish`, except that it returns an
+        :class:`asyncio.Future` that can be awaited in the event loop. The
+        message is batched with the messages published by other coroutines and
+        threads, and no thread is blocked waiting for the publish result.
+
+        .. note::
+            This method requires Python 3. If the publish flow control is set
+            to block when its limits are exceeded, this method blocks the
+            event loop as well; consider using the ``ERROR`` behavior instead.
+
+        Example:
+            >>> from google.cloud import pubsub_v1
+            >>> client = pubsub_v1.PublisherClient()
+            >>> topic = client.topic_path('[PROJECT]', '[TOPIC]')
+            >>> data = b'The rain in Wales falls mainly on the snails.'
+            >>> message_id = await client.publish_async(topic, data)
+
+        Args:
+            topic (str): The topic to publish messages to.
+            data (bytes): A bytestring representing the message body. This
+                must be a bytestring.
+            attrs (Mapping[str, str]): A dictionary of attributes to be
+                sent as metadata. (These may be text strings or byte strings.)
+
+        Returns:
+            asyncio.Future: A future belonging to the current event loop
+            that resolves to the message ID.
+
+        Raises:
+            RuntimeError:
+                If called after publisher has been stopped
+                by a `stop()` method call.
+        """
+        loop = _asyncio_helpers.get_event_loop()
+        future = self.publish(topic, data, **attrs)
+        return _asyncio_helpers.wrap_future(future, loop=loop)
+
     def stop(self):
         """Immediately publish all outstanding messages.
 
@@ -26,4 +26,13 @@ class MessageTooLargeError(ValueError):
     """Attempt to publish a message that would exceed the server max size limit."""
 
 
-__all__ = ("MessageTooLargeError", "PublishError", "TimeoutError")
+class FlowControlLimitError(Exception):
+    """An action resulted in exceeding the flow control limits."""
+
+
+__all__ = (
+    "FlowControlLimitError",
+    "MessageTooLargeError",
+    "PublishError",
+    "TimeoutError",
+)
@@ -0,0 +1,189 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FlowController(object):
+    """A class used to control the flow of messages passing through it.
+
+    The controller keeps track of the number and the total size of the
+    messages that have been added, but not yet released. When adding a new
+    message would exceed the configured limits, the controller either blocks
+    the caller until enough capacity is released, raises an error, or simply
+    lets the message through, depending on the settings.
+
+    Blocked callers are granted capacity in the order they arrived.
+
+    Args:
+        settings (~google.cloud.pubsub_v1.types.PublishFlowControl):
+            The desired flow control configuration.
+    """
+
+    def __init__(self, settings):
+        self._settings = settings
+
+        self._message_count = 0
+        self._total_bytes = 0
+
+        # A FIFO queue of tickets of the threads currently waiting for the
+        # capacity to become available.
+        self._waiting = collections.deque()
+
+        # The lock is used to protect the internal state (message and byte
+        # count, waiting threads) from being modified by multiple threads at
+        # the same time.
+        self._operational_lock = threading.Lock()
+        self._has_capacity = threading.Condition(self._operational_lock)
+
+    @property
+    def message_count(self):
+        """int: The number of messages added, but not yet released."""
+        return self._message_count
+
+    @property
+    def total_bytes(self):
+        """int: The total size of messages added, but not yet released."""
+        return self._total_bytes
+
+    def add(self, message):
+        """Add a message to flow control.
+
+        Adding a message updates the internal load statistics, and an action
+        is taken if these limits are exceeded (depending on the flow control
+        settings).
+
+        Args:
+            message (~google.cloud.pubsub_v1.types.PubsubMessage):
+                The message entering the flow control.
+
+        Raises:
+            ~google.cloud.pubsub_v1.publisher.exceptions.FlowControlLimitError:
+                Raised when the desired action is
+                :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.ERROR`
+                and the message would exceed flow control limits, or when
+                the desired action is
+                :attr:`~google.cloud.pubsub_v1.types.LimitExceededBehavior.BLOCK`
+                and the message would block forever against the flow control
+                limits.
+        """
+        behavior = self._settings.limit_exceeded_behavior
+        if behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        message_size = message.ByteSize()
+
+        with self._operational_lock:
+            if not self._waiting and not self._would_overflow(message_size):
+                self._message_count += 1
+                self._total_bytes += message_size
+                return
+
+            # Adding a message would overflow, react.
+            if behavior == types.LimitExceededBehavior.ERROR:
+                msg = (
+                    "Flow control limits would be exceeded - "
+                    "max_messages: {}, max_bytes: {}.".format(
+                        self._settings.max_messages, self._settings.max_bytes
+                    )
+                )
+                raise exceptions.FlowControlLimitError(msg)
+
+            assert behavior == types.LimitExceededBehavior.BLOCK
+
+            # Sanity check - if a message exceeds the total flow control limits
+            # on its own, it would block forever, thus raise an error.
+            if (
+                message_size > self._settings.max_bytes
+                or self._settings.max_messages < 1
+            ):
+                msg = (
+                    "Flow control limits too low for the message - "
+                    "max_messages: {}, max_bytes: {}, message size: {}.".format(
+                        self._settings.max_messages,
+                        self._settings.max_bytes,
+                        message_size,
+                    )
+                )
+                raise exceptions.FlowControlLimitError(msg)
+
+            ticket = object()
+            self._waiting.append(ticket)
+            _LOGGER.debug(
+                "Blocking until there is enough free capacity in the flow - "
+                "%s message(s) and %s byte(s) outstanding.",
+                self._message_count,
+                self._total_bytes,
+            )
+
+            while self._waiting[0] is not ticket or self._would_overflow(message_size):
+                self._has_capacity.wait()
+
+            self._waiting.popleft()
+            self._message_count += 1
+            self._total_bytes += message_size
+
+            # The next thread in line might also fit in the remaining capacity.
+            self._has_capacity.notify_all()
+
+    def release(self, message):
+        """Release a message from flow control.
+
+        Args:
+            message (~google.cloud.pubsub_v1.types.PubsubMessage):
+                The message leaving the flow control.
+        """
+        if self._settings.limit_exceeded_behavior == types.LimitExceededBehavior.IGNORE:
+            return
+
+        message_size = message.ByteSize()
+
+        with self._operational_lock:
+            # Releasing a message decreases the load.
+            self._message_count -= 1
+            self._total_bytes -= message_size
+
+            if self._message_count < 0 or self._total_bytes < 0:
+                _LOGGER.warning(
+                    "Releasing a message that was never added or already released."
+                )
+                self._message_count = max(0, self._message_count)
+                self._total_bytes = max(0, self._total_bytes)
+
+            self._has_capacity.notify_all()
+
+    def _would_overflow(self, message_size):
+        """Determine if accepting a message would exceed flow control limits.
+
+        The method assumes that the caller has obtained ``_operational_lock``.
+
+        Args:
+            message_size (int): The size of the message entering the flow.
+
+        Returns:
+            bool: Whether the message would exceed the limits.
+        """
+        messages_overflow = self._message_count + 1 > self._settings.max_messages
+        size_overflow = self._total_bytes + message_size > self._settings.max_bytes
+        return messages_overflow or size_overflow
@@ -0,0 +1,276 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Commit schedulers run the publish requests of message batches.
+
+By default, every batch spawns its own threads to wait for ``max_latency`` and
+to send the publish request to the backend. A commit scheduler can instead be
+shared by all batches of a publisher client, bounding the number of threads
+and the number of publish requests in flight.
+"""
+
+from __future__ import absolute_import
+
+import abc
+import collections
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+import six
+
+
+_LOGGER = logging.getLogger(__name__)
+_TIMER_NAME = "Thread-CommitSchedulerTimer"
+
+
+@six.add_metaclass(abc.ABCMeta)
+class CommitScheduler(object):
+    """Abstract base class for publisher commit schedulers."""
+
+    @abc.abstractmethod
+    def schedule(self, topic, callback):
+        """Schedule the blocking commit of a batch to run asynchronously.
+
+        Commits scheduled for the same topic are started in the order they
+        were scheduled.
+
+        Args:
+            topic (str): The topic the batch publishes the messages to.
+            callback (Callable[[], None]): The blocking commit to run.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def schedule_after(self, delay, callback):
+        """Schedule the callback to be called once the delay has elapsed.
+
+        The callback is expected to return quickly, e.g. by calling
+        :meth:`schedule` to run the actual commit.
+
+        Args:
+            delay (float): The number of seconds to wait.
+            callback (Callable[[], None]): The function to call.
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def shutdown(self, wait=True):
+        """Shut down the scheduler.
+
+        Args:
+            wait (bool): Whether to block until all scheduled commits
+                have completed.
+        """
+        raise NotImplementedError
+
+
+def _make_default_thread_pool_executor(max_workers):
+    # Python 2.7 and 3.6+ have the thread_name_prefix argument, which is useful
+    # for debugging.
+    executor_kwargs = {}
+    if sys.version_info[:2] == (2, 7) or sys.version_info >= (3, 6):
+        executor_kwargs["thread_name_prefix"] = "ThreadPoolExecutor-CommitScheduler"
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, **executor_kwargs
+    )
+
+
+class ThreadCommitScheduler(CommitScheduler):
+    """A thread pool-based commit scheduler.
+
+    All commits are run on a single, size-limited thread pool, and all delayed
+    commits are triggered by a single timer thread, thus the number of threads
+    does not grow with the number of batches.
+
+    Args:
+        max_workers (int): The maximum number of worker threads running the
+            publish requests, across all topics. Ignored if ``executor`` is
+            given.
+        max_in_flight_per_topic (Optional[int]): The maximum number of
+            publish requests in flight for any single topic. Commits above the
+            limit are queued until a previous commit for the same topic
+            completes. If not given, the commits are only bounded by the
+            number of worker threads.
+        executor (concurrent.futures.ThreadPoolExecutor): An optional executor
+            to run the commits on. If not specified, a default one will be
+            created.
+    """
+
+    def __init__(self, max_workers=10, max_in_flight_per_topic=None, executor=None):
+        if max_in_flight_per_topic is not None and max_in_flight_per_topic < 1:
+            raise ValueError("max_in_flight_per_topic must be a positive integer.")
+
+        if executor is None:
+            executor = _make_default_thread_pool_executor(max_workers)
+        self._executor = executor
+        self._max_in_flight_per_topic = max_in_flight_per_topic
+
+        # The number of commits in flight, and the commits waiting to be
+        # started, per topic. Both are guarded by the operational lock.
+        self._operational_lock = threading.Lock()
+        self._in_flight = collections.defaultdict(int)
+        self._pending = collections.defaultdict(collections.deque)
+
+        # The timer state. The heap contains (deadline, sequence, callback)
+        # entries, where the sequence number breaks the ties among callbacks
+        # with the same deadline.
+        self._timer_lock = threading.Condition()
+        self._timer_heap = []
+        self._timer_sequence = itertools.count()
+        self._timer_thread = None
+        self._is_shutdown = False
+
+    def in_flight(self, topic):
+        """Return the number of commits currently in flight for the topic.
+
+        Args:
+            topic (str): The topic name.
+
+        Returns:
+            int: The number of commits in flight.
+        """
+        with self._operational_lock:
+            return self._in_flight.get(topic, 0)
+
+    def schedule(self, topic, callback):
+        """Schedule the blocking commit of a batch on the thread pool.
+
+        Args:
+            topic (str): The topic the batch publishes the messages to.
+            callback (Callable[[], None]): The blocking commit to run.
+
+        Returns:
+            None
+        """
+        with self._operational_lock:
+            limit = self._max_in_flight_per_topic
+            if limit is not None and self._in_flight[topic] >= limit:
+                self._pending[topic].append(callback)
+                return
+            self._in_flight[topic] += 1
+
+        self._executor.submit(self._run_commit, topic, callback)
+
+    def _run_commit(self, topic, callback):
+        """Run the commit, followed by the commits pending for the topic.
+
+        The pending commits are run on the same worker thread, which keeps
+        the in-flight slot of the topic occupied until its queue is drained.
+        """
+        while callback is not None:
+            try:
+                callback()
+            except Exception:
+                _LOGGER.exception("Unexpected error while committing a batch.")
+
+            with self._operational_lock:
+                pending = self._pending.get(topic)
+                if pending:
+                    callback = pending.popleft()
+                else:
+                    callback = None
+                    self._pending.pop(topic, None)
+                    self._in_flight[topic] -= 1
+                    if not self._in_flight[topic]:
+                        del self._in_flight[topic]
+
+    def schedule_after(self, delay, callback):
+        """Schedule the callback to be called by the timer thread.
+
+        Args:
+            delay (float): The number of seconds to wait.
+            callback (Callable[[], None]): The function to call.
+
+        Returns:
+            None
+        """
+        deadline = time.time() + delay
+        with self._timer_lock:
+            if self._is_shutdown:
+                raise RuntimeError("Cannot schedule on a shut down scheduler.")
+
+            entry = (deadline, next(self._timer_sequence), callback)
+            heapq.heappush(self._timer_heap, entry)
+
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(
+                    name=_TIMER_NAME, target=self._run_timer
+                )
+                self._timer_thread.daemon = True
+                self._timer_thread.start()
+
+            # Wake up the timer if the new deadline is the earliest one.
+            if self._timer_heap[0] is entry:
+                self._timer_lock.notify()
+
+    def _run_timer(self):
+        """Call the delayed callbacks as their deadlines pass."""
+        while True:
+            with self._timer_lock:
+                while not self._is_shutdown:
+                    if not self._timer_heap:
+                        self._timer_lock.wait()
+                        continue
+
+                    timeout = self._timer_heap[0][0] - time.time()
+                    if timeout <= 0:
+                        break
+                    self._timer_lock.wait(timeout)
+
+                if self._is_shutdown:
+                    due = [entry[2] for entry in sorted(self._timer_heap)]
+                    del self._timer_heap[:]
+                else:
+                    due = [heapq.heappop(self._timer_heap)[2]]
+
+            for callback in due:
+                try:
+                    callback()
+                except Exception:
+                    _LOGGER.exception("Unexpected error in a delayed callback.")
+
+            if self._is_shutdown:
+                _LOGGER.debug("Exiting the %s thread.", _TIMER_NAME)
+                return
+
+    def shutdown(self, wait=True):
+        """Shut down the scheduler.
+
+        The delayed callbacks that have not been called yet are called
+        immediately, so that no batch is left uncommitted.
+
+        Args:
+            wait (bool): Whether to block until all scheduled commits
+                have completed.
+        """
+        with self._timer_lock:
+            self._is_shutdown = True
+            timer_thread = self._timer_thread
+            self._timer_lock.notify()
+
+        if timer_thread is not None:
+            timer_thread.join()
+
+        self._executor.shutdown(wait=wait)
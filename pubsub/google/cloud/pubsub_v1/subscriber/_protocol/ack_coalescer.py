@@ -0,0 +1,250 @@
+# Copyright 2020, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+from __future__ import division
+
+import collections
+import logging
+import threading
+import time
+
+from google.cloud.pubsub_v1 import types
+
+
+_LOGGER = logging.getLogger(__name__)
+_COALESCER_WORKER_NAME = "Thread-AckCoalescer"
+
+
+class AckCoalescer(object):
+    """Coalesces the ACK and modify ACK deadline requests of a subscriber.
+
+    The ACK IDs to acknowledge and the ACK deadlines to modify are collected
+    and sent together, either when ``max_messages`` ACK IDs have been
+    collected, or when ``max_latency`` seconds have elapsed since the first of
+    them was collected, whichever comes first.
+
+    While collected, the requests are deduplicated - an ACK ID is acknowledged
+    only once, its ACK deadline is only modified to the last requested value,
+    and it is not modified at all if the ACK ID is also acknowledged.
+
+    Callbacks given with the ACK IDs are called after the requests
+    containing them have been sent, from the coalescer's helper thread.
+
+    Args:
+        manager (~.subscriber._protocol.streaming_pull_manager.StreamingPullManager):
+            The manager to send the requests with.
+        settings (~google.cloud.pubsub_v1.types.AckBatchSettings): The
+            batching settings.
+        max_request_ack_ids (int): The maximum number of ACK IDs to send in a
+            single request.
+    """
+
+    def __init__(self, manager, settings, max_request_ack_ids):
+        self._manager = manager
+        self._settings = settings
+        self._max_request_ack_ids = max_request_ack_ids
+
+        self._thread = None
+        # a lock used for start/stop operations, protecting the _thread attribute
+        self._operational_lock = threading.Lock()
+
+        # The condition protects the collected requests and the stop flag, and
+        # is used to wake up the worker thread.
+        self._condition = threading.Condition()
+        self._ack_ids = collections.OrderedDict()
+        self._modacks = collections.OrderedDict()
+        self._on_sent = []
+        self._first_added = None
+        self._stopping = False
+
+        self._batch_sizes = collections.Counter()
+
+    @property
+    def batch_sizes(self):
+        """collections.Counter: The number of flushes per flushed batch size.
+
+        The batch size is the number of unique ACK IDs sent in a flush.
+        """
+        with self._condition:
+            return collections.Counter(self._batch_sizes)
+
+    @property
+    def pending_count(self):
+        """int: The number of ACK IDs collected, but not sent yet."""
+        with self._condition:
+            return len(self._ack_ids) + len(self._modacks)
+
+    def ack(self, ack_ids, on_sent=None):
+        """Collect ACK IDs to acknowledge.
+
+        Args:
+            ack_ids (Iterable[str]): The ACK IDs.
+            on_sent (Optional[Callable[[], None]]): Called once the ACK IDs
+                have been sent, or failed to be sent.
+        """
+        with self._condition:
+            for ack_id in ack_ids:
+                self._modacks.pop(ack_id, None)
+                self._ack_ids[ack_id] = None
+            if on_sent is not None:
+                self._on_sent.append(on_sent)
+            self._on_added()
+
+    def modify_ack_deadline(self, items):
+        """Collect ACK deadlines to modify.
+
+        Args:
+            items(Sequence[ModAckRequest]): The ACK IDs and their new
+                deadlines.
+        """
+        with self._condition:
+            for item in items:
+                if item.ack_id in self._ack_ids:
+                    continue
+                # Re-insert the ACK ID, keeping the items ordered by the time
+                # of their latest modification.
+                self._modacks.pop(item.ack_id, None)
+                self._modacks[item.ack_id] = item.seconds
+            self._on_added()
+
+    def _on_added(self):
+        """Wake up the worker if needed. The caller must hold the condition."""
+        if self._first_added is None:
+            self._first_added = time.time()
+            self._condition.notify()
+        elif len(self._ack_ids) + len(self._modacks) >= self._settings.max_messages:
+            self._condition.notify()
+
+    def _should_flush(self):
+        """Return the time to wait before the next flush.
+
+        The caller must hold the condition.
+
+        Returns:
+            Optional[float]: ``0`` if the collected requests should be flushed
+            now, the number of seconds until they should be flushed, or
+            :data:`None` if there is nothing to flush.
+        """
+        if self._first_added is None:
+            return None
+        if self._stopping:
+            return 0
+        if len(self._ack_ids) + len(self._modacks) >= self._settings.max_messages:
+            return 0
+        return max(0, self._first_added + self._settings.max_latency - time.time())
+
+    def _take_pending(self):
+        """Take the collected requests. The caller must hold the condition."""
+        ack_ids = list(self._ack_ids)
+        modacks = list(self._modacks.items())
+        on_sent = self._on_sent
+        self._ack_ids.clear()
+        self._modacks.clear()
+        self._on_sent = []
+        self._first_added = None
+        self._batch_sizes[len(ack_ids) + len(modacks)] += 1
+        return ack_ids, modacks, on_sent
+
+    def _send(self, ack_ids, modacks):
+        """Send the requests, splitting them to respect the request size limit.
+
+        Args:
+            ack_ids (Sequence[str]): The ACK IDs to acknowledge.
+            modacks (Sequence[Tuple[str, int]]): The ACK IDs and their new
+                deadlines.
+        """
+        chunk_size = self._max_request_ack_ids
+        total_requests = 0
+
+        while ack_ids or modacks:
+            # Fill each request with the ACK IDs to acknowledge first, and use
+            # any remaining room for the ACK deadline modifications.
+            acks_chunk, ack_ids = ack_ids[:chunk_size], ack_ids[chunk_size:]
+            room = chunk_size - len(acks_chunk)
+            modacks_chunk, modacks = modacks[:room], modacks[room:]
+
+            request = types.StreamingPullRequest(
+                ack_ids=acks_chunk,
+                modify_deadline_ack_ids=[ack_id for ack_id, _ in modacks_chunk],
+                modify_deadline_seconds=[seconds for _, seconds in modacks_chunk],
+            )
+            self._manager.send(request)
+            total_requests += 1
+
+        return total_requests
+
+    def _flush(self, ack_ids, modacks):
+        total_requests = self._send(ack_ids, modacks)
+        _LOGGER.debug(
+            "Flushed %d ACK(s) and %d modify ACK deadline(s) in %d request(s).",
+            len(ack_ids),
+            len(modacks),
+            total_requests,
+        )
+
+    def coalesce(self):
+        """Flush the collected requests as they become due, until stopped."""
+        while True:
+            with self._condition:
+                timeout = self._should_flush()
+                while timeout != 0:
+                    if self._stopping:
+                        break
+                    self._condition.wait(timeout=timeout)
+                    timeout = self._should_flush()
+
+                if timeout is None:
+                    # Stopping with nothing left to flush.
+                    break
+                ack_ids, modacks, on_sent = self._take_pending()
+
+            try:
+                self._flush(ack_ids, modacks)
+            except Exception:
+                _LOGGER.exception("Error while sending coalesced ACK requests.")
+
+            for callback in on_sent:
+                try:
+                    callback()
+                except Exception:
+                    _LOGGER.exception("Error in a coalesced ACK callback.")
+
+        _LOGGER.info("%s exiting.", _COALESCER_WORKER_NAME)
+
+    def start(self):
+        with self._operational_lock:
+            if self._thread is not None:
+                raise ValueError("Ack coalescer is already running.")
+
+            # Create and start the helper thread.
+            with self._condition:
+                self._stopping = False
+            thread = threading.Thread(name=_COALESCER_WORKER_NAME, target=self.coalesce)
+            thread.daemon = True
+            thread.start()
+            _LOGGER.debug("Started helper thread %s", thread.name)
+            self._thread = thread
+
+    def stop(self):
+        """Flush the collected requests and stop the helper thread."""
+        with self._operational_lock:
+            with self._condition:
+                self._stopping = True
+                self._condition.notify()
+
+            if self._thread is not None:
+                self._thread.join()
+
+            self._thread = None
@@ -22,6 +22,7 @@ import math
 import threading
 
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
 from google.cloud.pubsub_v1.subscriber._protocol import helper_threads
 from google.cloud.pubsub_v1.subscriber._protocol import requests
 
@@ -51,12 +52,26 @@ IDs at a time.
 
 
 class Dispatcher(object):
-    def __init__(self, manager, queue):
+    def __init__(self, manager, queue, ack_batch_settings=None):
         self._manager = manager
         self._queue = queue
         self._thread = None
         self._operational_lock = threading.Lock()
 
+        # ACK and modify ACK deadline requests are only coalesced if the
+        # settings allow them to be delayed.
+        self._ack_coalescer = None
+        if ack_batch_settings is not None and ack_batch_settings.max_latency > 0:
+            self._ack_coalescer = ack_coalescer.AckCoalescer(
+                manager, ack_batch_settings, _ACK_IDS_BATCH_SIZE
+            )
+
+    @property
+    def ack_coalescer(self):
+        """Optional[~.subscriber._protocol.ack_coalescer.AckCoalescer]: The
+        coalescer of the ACK requests, if enabled."""
+        return self._ack_coalescer
+
     def start(self):
         """Start a thread to dispatch requests queued up by callbacks.
         Spawns a thread to run :meth:`dispatch_callback`.
@@ -78,6 +93,9 @@ class Dispatcher(object):
             _LOGGER.debug("Started helper thread %s", thread.name)
             self._thread = thread
 
+            if self._ack_coalescer is not None:
+                self._ack_coalescer.start()
+
     def stop(self):
         with self._operational_lock:
             if self._thread is not None:
@@ -87,6 +105,11 @@ class Dispatcher(object):
 
             self._thread = None
 
+            # Stop the coalescer last, so that it flushes the requests the
+            # worker has collected before stopping.
+            if self._ack_coalescer is not None:
+                self._ack_coalescer.stop()
+
     def dispatch_callback(self, items):
         """Map the callback request to the appropriate gRPC request.
 
@@ -125,6 +148,11 @@ class Dispatcher(object):
     def ack(self, items):
         """Acknowledge the given messages.
 
+        If the ACK requests are coalesced, the messages are removed from the
+        lease management only once their ACK IDs are sent, so that their
+        flow control budget is not used by new messages while they can
+        still be redelivered.
+
         Args:
             items(Sequence[AckRequest]): The items to acknowledge.
         """
@@ -134,6 +162,12 @@ class Dispatcher(object):
             if time_to_ack is not None:
                 self._manager.ack_histogram.add(time_to_ack)
 
+        if self._ack_coalescer is not None:
+            self._ack_coalescer.ack(
+                (item.ack_id for item in items), on_sent=lambda: self.drop(items)
+            )
+            return
+
         # We must potentially split the request into multiple smaller requests
         # to avoid the server-side max request size limit.
         ack_ids = (item.ack_id for item in items)
@@ -172,6 +206,10 @@ class Dispatcher(object):
         Args:
             items(Sequence[ModAckRequest]): The items to modify.
         """
+        if self._ack_coalescer is not None:
+            self._ack_coalescer.modify_ack_deadline(items)
+            return
+
         # We must potentially split the request into multiple smaller requests
         # to avoid the server-side max request size limit.
         ack_ids = (item.ack_id for item in items)
@@ -14,6 +14,9 @@
 
 from __future__ import absolute_import, division
 
+import threading
+import time
+
 
 class Histogram(object):
     """Representation of a single histogram.
@@ -152,3 +155,221 @@ class Histogram(object):
         # The only way to get here is if there was no data.
         # In this case, just return 10 seconds.
         return 10
+
+
+class WindowedHistogram(object):
+    """A histogram of the values added within a sliding time window.
+
+    Unlike :class:`Histogram`, old values age out of this histogram, thus a
+    past spike in the ack times does not keep the lease deadlines high
+    forever. The window is divided into ``num_slices`` slices, and the values
+    are discarded one slice at a time, thus the values are retained for at
+    least ``window - window / num_slices`` seconds. The expired slices are
+    discarded whenever a value is added or the histogram is read.
+
+    The values are counted in fixed-size arrays of per-second buckets, thus
+    the memory use is constant, regardless of the number of values added, and
+    adding a value takes constant time. The percentiles are computed from
+    aggregate counts that are kept up to date when adding the values - per
+    bucket, and per block of ``_BLOCK_SIZE`` buckets, so that the empty ranges
+    can be skipped quickly. The last computed percentile is cached until the
+    histogram changes.
+
+    Updates, i.e. adding values and discarding expired slices, are serialized
+    with a lock. Computing a percentile does not take the lock, thus it does
+    not block the subscriber's dispatcher adding values.
+
+    The precision of data stored is to the nearest integer. Values outside the
+    range of ``10 <= x <= 600`` are stored as ``10`` or ``600``, same as with
+    :class:`Histogram`.
+
+    Args:
+        window (float): The number of seconds to retain the values for.
+        num_slices (int): The number of slices to divide the window into.
+        clock (Callable[[], float]): The function returning the current time
+            in seconds. Defaults to :func:`time.time`.
+    """
+
+    _MIN_VALUE = 10
+    _MAX_VALUE = 600
+    _BLOCK_SIZE = 16
+
+    def __init__(self, window=600, num_slices=10, clock=time.time):
+        if window <= 0:
+            raise ValueError("The window must be positive.")
+        if num_slices < 1:
+            raise ValueError("The number of slices must be a positive integer.")
+
+        self._slice_duration = window / num_slices
+        self._num_slices = num_slices
+        self._clock = clock
+
+        num_buckets = self._MAX_VALUE - self._MIN_VALUE + 1
+        self._totals = [0] * num_buckets
+        self._block_totals = [0] * -(-num_buckets // self._BLOCK_SIZE)
+        self._len = 0
+        self._slices = [[0] * num_buckets for _ in range(num_slices)]
+        self._slice_lens = [0] * num_slices
+        self._slice_epochs = [None] * num_slices
+        self._epoch = None
+        self._lock = threading.Lock()
+
+        # The last computed percentile, as a (percent, version, result) tuple.
+        # The version is incremented whenever the values change.
+        self._version = 0
+        self._cached = None
+
+    def __len__(self):
+        """Return the number of data points within the window.
+
+        Returns:
+            int: The number of data points.
+        """
+        self._expire()
+        return self._len
+
+    def __contains__(self, needle):
+        """Return True if needle is present in the histogram, False otherwise.
+
+        Returns:
+            bool: True or False
+        """
+        index = needle - self._MIN_VALUE
+        if not 0 <= index < len(self._totals):
+            return False
+        self._expire()
+        return self._totals[index] > 0
+
+    def __repr__(self):
+        return "<WindowedHistogram: {len} values between {min} and {max}>".format(
+            len=len(self), max=self.max, min=self.min
+        )
+
+    @property
+    def max(self):
+        """Return the maximum value in this histogram.
+
+        If there are no values in the histogram at all, return 600.
+
+        Returns:
+            int: The maximum value in the histogram.
+        """
+        if len(self) == 0:
+            return self._MAX_VALUE
+        for index in range(len(self._totals) - 1, -1, -1):
+            if self._totals[index] > 0:
+                return index + self._MIN_VALUE
+        return self._MAX_VALUE  # pragma: NO COVER
+
+    @property
+    def min(self):
+        """Return the minimum value in this histogram.
+
+        If there are no values in the histogram at all, return 10.
+
+        Returns:
+            int: The minimum value in the histogram.
+        """
+        if len(self) == 0:
+            return self._MIN_VALUE
+        for index, count in enumerate(self._totals):
+            if count > 0:
+                return index + self._MIN_VALUE
+        return self._MIN_VALUE  # pragma: NO COVER
+
+    def _expire(self):
+        """Discard the slices that have fallen out of the window by now."""
+        epoch = int(self._clock() // self._slice_duration)
+        if epoch != self._epoch:
+            with self._lock:
+                if epoch != self._epoch:
+                    self._rotate(epoch)
+
+    def _rotate(self, epoch):
+        """Discard the slices that have fallen out of the window.
+
+        The caller must hold the lock.
+        """
+        for slot, slot_epoch in enumerate(self._slice_epochs):
+            if slot_epoch is None or epoch - slot_epoch < self._num_slices:
+                continue
+
+            counts = self._slices[slot]
+            for index, count in enumerate(counts):
+                if count:
+                    self._totals[index] -= count
+                    self._block_totals[index // self._BLOCK_SIZE] -= count
+                    counts[index] = 0
+            self._len -= self._slice_lens[slot]
+            self._slice_lens[slot] = 0
+            self._slice_epochs[slot] = None
+            self._version += 1
+
+        self._epoch = epoch
+
+    def add(self, value):
+        """Add the value to this histogram.
+
+        Args:
+            value (int): The value. Values outside of ``10 <= x <= 600``
+                will be raised to ``10`` or reduced to ``600``.
+        """
+        value = min(max(int(value), self._MIN_VALUE), self._MAX_VALUE)
+        index = value - self._MIN_VALUE
+
+        with self._lock:
+            epoch = int(self._clock() // self._slice_duration)
+            if epoch != self._epoch:
+                self._rotate(epoch)
+
+            slot = epoch % self._num_slices
+            self._slice_epochs[slot] = epoch
+            self._slices[slot][index] += 1
+            self._slice_lens[slot] += 1
+            self._totals[index] += 1
+            self._block_totals[index // self._BLOCK_SIZE] += 1
+            self._len += 1
+            self._version += 1
+
+    def percentile(self, percent):
+        """Return the value that is the Nth precentile in the histogram.
+
+        Args:
+            percent (Union[int, float]): The precentile being sought. The
+                default consumer implementations use consistently use ``99``.
+
+        Returns:
+            int: The value corresponding to the requested percentile.
+        """
+        if percent >= 100:
+            percent = 100
+
+        self._expire()
+
+        # The version is read before the data, so that a concurrently added
+        # value at worst causes the result to be needlessly recomputed.
+        version = self._version
+        cached = self._cached
+        if cached is not None and cached[:2] == (percent, version):
+            return cached[2]
+
+        result = self._MIN_VALUE
+        target = self._len - self._len * (percent / 100)
+        for block in range(len(self._block_totals) - 1, -1, -1):
+            block_total = self._block_totals[block]
+            if target - block_total >= 0:
+                target -= block_total
+                continue
+
+            # The percentile is within this block.
+            start = block * self._BLOCK_SIZE
+            stop = min(start + self._BLOCK_SIZE, len(self._totals))
+            for index in range(stop - 1, start - 1, -1):
+                target -= self._totals[index]
+                if target < 0:
+                    result = index + self._MIN_VALUE
+                    break
+            break
+
+        self._cached = (percent, version, result)
+        return result
@@ -15,7 +15,7 @@
 from __future__ import absolute_import
 
 import collections
-import copy
+import heapq
 import logging
 import random
 import threading
@@ -29,8 +29,19 @@ from google.cloud.pubsub_v1.subscriber._protocol import requests
 _LOGGER = logging.getLogger(__name__)
 _LEASE_WORKER_NAME = "Thread-LeaseMaintainer"
 
+_RENEWAL_HORIZON = 0.75
+"""Leases expiring within this fraction of the p99 ack time are renewed."""
 
-_LeasedMessage = collections.namedtuple("_LeasedMessage", ["added_time", "size"])
+_RENEWAL_MARGIN = 0.5
+"""The fraction of the p99 ack time before a lease expires to wake up at.
+
+The difference to :data:`_RENEWAL_HORIZON` is the time window in which the
+expiring leases are renewed together, in a single batch."""
+
+
+_LeasedMessage = collections.namedtuple(
+    "_LeasedMessage", ["added_time", "size", "deadline"]
+)
 
 
 class Leaser(object):
@@ -42,12 +53,25 @@ class Leaser(object):
         self._operational_lock = threading.Lock()
 
         # A lock ensuring that add/remove operations are atomic and cannot be
-        # intertwined. Protects the _leased_messages and _bytes attributes.
+        # intertwined. Protects the _leased_messages, _deadlines, _bytes and
+        # _next_wakeup attributes.
         self._add_remove_lock = threading.Lock()
 
-        self._leased_messages = {}
-        """dict[str, float]: A mapping of ack IDs to the local time when the
-            ack ID was initially leased in seconds since the epoch."""
+        # A condition used to wake up the lease maintenance early, when a
+        # message is added with a lease expiring before the next planned
+        # renewal.
+        self._wakeup = threading.Condition(self._add_remove_lock)
+        self._next_wakeup = None
+
+        self._leased_messages = collections.OrderedDict()
+        """OrderedDict[str, _LeasedMessage]: A mapping of ack IDs to the
+            local time when the ack ID was initially leased in seconds since
+            the epoch, the message size, and the local time the current lease
+            expires at. Ordered by the time the ack IDs were leased."""
+        self._deadlines = []
+        """List[Tuple[float, str]]: A heap of the lease expiration times and
+            their ack IDs. The entries of the removed and renewed leases are
+            discarded lazily, when they reach the top of the heap."""
         self._bytes = 0
         """int: The total number of bytes consumed by leased messages."""
 
@@ -70,39 +94,96 @@ class Leaser(object):
 
     def add(self, items):
         """Add messages to be managed by the leaser."""
+        # The messages have just been leased by the manager, for the current
+        # p99 ack time.
+        now = time.time()
+        deadline = now + self._manager.ack_histogram.percentile(99)
+
         with self._add_remove_lock:
             for item in items:
                 # Add the ack ID to the set of managed ack IDs, and increment
                 # the size counter.
                 if item.ack_id not in self._leased_messages:
                     self._leased_messages[item.ack_id] = _LeasedMessage(
-                        added_time=time.time(), size=item.byte_size
+                        added_time=now, size=item.byte_size, deadline=deadline
                     )
+                    heapq.heappush(self._deadlines, (deadline, item.ack_id))
                     self._bytes += item.byte_size
                 else:
                     _LOGGER.debug("Message %s is already lease managed", item.ack_id)
 
+            # Wake up the lease maintenance if it would renew the new leases
+            # too late, e.g. because the p99 ack time has decreased.
+            renew_at = deadline - (deadline - now) * _RENEWAL_MARGIN
+            if self._next_wakeup is not None and renew_at < self._next_wakeup:
+                self._wakeup.notify()
+
     def remove(self, items):
         """Remove messages from lease management."""
         with self._add_remove_lock:
             # Remove the ack ID from lease management, and decrement the
             # byte counter.
             for item in items:
-                if self._leased_messages.pop(item.ack_id, None) is not None:
-                    self._bytes -= item.byte_size
+                leased_message = self._leased_messages.pop(item.ack_id, None)
+                if leased_message is not None:
+                    # Subtract the size the message was added with, in case
+                    # its size changed since, e.g. once decompressed.
+                    self._bytes -= leased_message.size
                 else:
                     _LOGGER.debug("Item %s was not managed.", item.ack_id)
 
-            if self._bytes < 0:
-                _LOGGER.debug("Bytes was unexpectedly negative: %d", self._bytes)
-                self._bytes = 0
+            # The heap entries of the removed messages are only discarded when
+            # they expire, compact the heap if most of its entries are stale.
+            if len(self._deadlines) > 2 * len(self._leased_messages) + 100:
+                self._deadlines = [
+                    (item.deadline, ack_id)
+                    for ack_id, item in six.iteritems(self._leased_messages)
+                ]
+                heapq.heapify(self._deadlines)
+
+    def _expired_leases(self, cutoff):
+        """Return the messages that were leased before the cutoff time.
+
+        Only the oldest messages are visited, since the leased messages are
+        ordered by the time they were added.
+        """
+        to_drop = []
+        with self._add_remove_lock:
+            for ack_id, item in six.iteritems(self._leased_messages):
+                if item.added_time >= cutoff:
+                    break
+                to_drop.append(requests.DropRequest(ack_id, item.size))
+        return to_drop
+
+    def _renew_expiring_leases(self, now, p99, dropped_ack_ids):
+        """Extend the leases expiring soon, and return their ack IDs."""
+        renew_before = now + p99 * _RENEWAL_HORIZON
+        deadline = now + p99
+        ack_ids = []
+
+        with self._add_remove_lock:
+            while self._deadlines and self._deadlines[0][0] <= renew_before:
+                old_deadline, ack_id = heapq.heappop(self._deadlines)
+                item = self._leased_messages.get(ack_id)
+                if (
+                    item is None
+                    or item.deadline != old_deadline
+                    or ack_id in dropped_ack_ids
+                ):
+                    continue  # A stale entry.
+
+                self._leased_messages[ack_id] = item._replace(deadline=deadline)
+                heapq.heappush(self._deadlines, (deadline, ack_id))
+                ack_ids.append(ack_id)
+
+        return ack_ids
 
     def maintain_leases(self):
         """Maintain all of the leases being managed.
 
-        This method modifies the ack deadline for all of the managed
-        ack IDs, then waits for most of that time (but with jitter), and
-        repeats.
+        This method modifies the ack deadline of the managed ack IDs whose
+        leases are about to expire, then waits until the next leases are about
+        to expire (but with jitter), and repeats.
         """
         while self._manager.is_active and not self._stop_event.is_set():
             # Determine the appropriate duration for the lease. This is
@@ -111,20 +192,11 @@ class Leaser(object):
             p99 = self._manager.ack_histogram.percentile(99)
             _LOGGER.debug("The current p99 value is %d seconds.", p99)
 
-            # Make a copy of the leased messages. This is needed because it's
-            # possible for another thread to modify the dictionary while
-            # we're iterating over it.
-            leased_messages = copy.copy(self._leased_messages)
-
             # Drop any leases that are well beyond max lease time. This
             # ensures that in the event of a badly behaving actor, we can
             # drop messages and allow Pub/Sub to resend them.
             cutoff = time.time() - self._manager.flow_control.max_lease_duration
-            to_drop = [
-                requests.DropRequest(ack_id, item.size)
-                for ack_id, item in six.iteritems(leased_messages)
-                if item.added_time < cutoff
-            ]
+            to_drop = self._expired_leases(cutoff)
 
             if to_drop:
                 _LOGGER.warning(
@@ -132,16 +204,13 @@ class Leaser(object):
                 )
                 self._manager.dispatcher.drop(to_drop)
 
-            # Remove dropped items from our copy of the leased messages (they
-            # have already been removed from the real one by
-            # self._manager.drop(), which calls self.remove()).
-            for item in to_drop:
-                leased_messages.pop(item.ack_id)
-
-            # Create a streaming pull request.
-            # We do not actually call `modify_ack_deadline` over and over
-            # because it is more efficient to make a single request.
-            ack_ids = leased_messages.keys()
+            # Renew the leases that are about to expire. The dropped items
+            # have already been removed by self._manager.drop(), which calls
+            # self.remove(), but skip them in case they have not.
+            now = time.time()
+            ack_ids = self._renew_expiring_leases(
+                now, p99, set(item.ack_id for item in to_drop)
+            )
             if ack_ids:
                 _LOGGER.debug("Renewing lease for %d ack IDs.", len(ack_ids))
 
@@ -150,19 +219,32 @@ class Leaser(object):
                 #       without any sort of race condition would require a
                 #       way for ``send_request`` to fail when the consumer
                 #       is inactive.
+                # The dispatcher splits the ack IDs into requests that fit the
+                # request size limit.
                 self._manager.dispatcher.modify_ack_deadline(
                     [requests.ModAckRequest(ack_id, p99) for ack_id in ack_ids]
                 )
 
-            # Now wait an appropriate period of time and do this again.
+            # Now wait until the next leases are about to expire, and do this
+            # again. All the remaining leases expire later than the renewal
+            # horizon, thus the wait is at least a fraction of the p99.
             #
-            # We determine the appropriate period of time based on a random
-            # period between 0 seconds and 90% of the lease. This use of
-            # jitter (http://bit.ly/2s2ekL7) helps decrease contention in cases
-            # where there are many clients.
-            snooze = random.uniform(0.0, p99 * 0.9)
-            _LOGGER.debug("Snoozing lease management for %f seconds.", snooze)
-            self._stop_event.wait(timeout=snooze)
+            # The wait is also bounded by 90% of the p99, so that the
+            # expired leases are dropped in a timely manner. Some jitter
+            # (http://bit.ly/2s2ekL7) helps decrease contention in cases where
+            # there are many clients.
+            with self._wakeup:
+                snooze = p99 * 0.9
+                if self._deadlines:
+                    next_deadline = self._deadlines[0][0]
+                    snooze = min(snooze, next_deadline - now - p99 * _RENEWAL_MARGIN)
+                snooze = max(snooze, 0.0) * random.uniform(0.9, 1.0)
+                self._next_wakeup = now + snooze
+
+                if not self._stop_event.is_set():
+                    _LOGGER.debug("Snoozing lease management for %f seconds.", snooze)
+                    self._wakeup.wait(timeout=snooze)
+                self._next_wakeup = None
 
         _LOGGER.info("%s exiting.", _LEASE_WORKER_NAME)
 
@@ -184,6 +266,8 @@ class Leaser(object):
     def stop(self):
         with self._operational_lock:
             self._stop_event.set()
+            with self._wakeup:
+                self._wakeup.notify()
 
             if self._thread is not None:
                 # The thread should automatically exit when the consumer is
@@ -15,6 +15,7 @@
 from __future__ import division
 
 import collections
+import concurrent.futures
 import functools
 import logging
 import threading
@@ -25,6 +26,8 @@ from six.moves import queue
 
 from google.api_core import bidi
 from google.api_core import exceptions
+from google.cloud.pubsub_v1 import _asyncio_helpers
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import heartbeater
@@ -51,6 +54,8 @@ _MAX_LOAD = 1.0
 _RESUME_THRESHOLD = 0.8
 """The load threshold below which to resume the incoming message stream."""
 
+_Stream = collections.namedtuple("_Stream", ["rpc", "consumer"])
+
 
 def _maybe_wrap_exception(exception):
     """Wraps a gRPC exception class, if needed."""
@@ -63,12 +68,27 @@ def _wrap_callback_errors(callback, on_callback_error, message):
     """Wraps a user callback so that if an exception occurs the message is
     nacked.
 
+    If the callback returns an awaitable (e.g. it is a coroutine function),
+    the awaitable is run as a task in the current thread's event loop, and
+    the errors it raises are handled in the same way. If the callback returns
+    a :class:`concurrent.futures.Future` (e.g. it has submitted the work to
+    an executor), the errors are handled once the future completes.
+
     Args:
         callback (Callable[None, Message]): The user callback.
         message (~Message): The Pub/Sub message.
     """
     try:
-        callback(message)
+        result = callback(message)
+        if _asyncio_helpers.is_awaitable(result):
+            task = _asyncio_helpers.run_awaitable(result)
+            task.add_done_callback(
+                functools.partial(_on_callback_task_done, on_callback_error, message)
+            )
+        elif isinstance(result, concurrent.futures.Future):
+            result.add_done_callback(
+                functools.partial(_on_callback_task_done, on_callback_error, message)
+            )
     except Exception as exc:
         # Note: the likelihood of this failing is extremely low. This just adds
         # a message to a queue, so if this doesn't work the world is in an
@@ -80,6 +100,44 @@ def _wrap_callback_errors(callback, on_callback_error, message):
         on_callback_error(exc)
 
 
+def _decompress_then_call(callback, message):
+    """Decompresses the message data, if compressed, and calls the callback.
+
+    Args:
+        callback (Callable[None, Message]): The user callback.
+        message (~Message): The Pub/Sub message.
+
+    Returns:
+        Any: The result of the callback.
+    """
+    compression.decompress_message(message._message)
+    return callback(message)
+
+
+def _on_callback_task_done(on_callback_error, message, task):
+    """Nacks the message if the asynchronous part of a user callback failed.
+
+    Args:
+        on_callback_error (Callable[Exception]): Called with the error raised
+            by the callback, if any.
+        message (~Message): The Pub/Sub message.
+        task (Union[asyncio.Future, concurrent.futures.Future]): The done
+            task, or the done future returned by the callback.
+    """
+    if task.cancelled():
+        message.nack()
+        return
+
+    exc = task.exception()
+    if exc is not None:
+        _LOGGER.error(
+            "Top-level exception occurred in callback while processing a message",
+            exc_info=(type(exc), exc, getattr(exc, "__traceback__", None)),
+        )
+        message.nack()
+        on_callback_error(exc)
+
+
 class StreamingPullManager(object):
     """The streaming pull manager coordinates pulling messages from Pub/Sub,
     leasing them, and scheduling them to be processed.
@@ -95,6 +153,19 @@ class StreamingPullManager(object):
         scheduler (~google.cloud.pubsub_v1.scheduler.Scheduler): The scheduler
             to use to process messages. If not provided, a thread pool-based
             scheduler will be used.
+        ack_batch_settings (~google.cloud.pubsub_v1.types.AckBatchSettings):
+            The settings for coalescing the ACK and modify ACK deadline
+            requests.
+        ack_histogram (Optional[~.subscriber._protocol.histogram.Histogram]):
+            The histogram to track the time-to-acknowledge in, e.g. a
+            :class:`~.subscriber._protocol.histogram.WindowedHistogram`. If
+            not provided, a :class:`~.subscriber._protocol.histogram.Histogram`
+            will be used.
+        num_streams (int): The number of streaming pull RPCs to receive the
+            messages over. All streams share the flow control limits, the
+            lease management and the scheduler.
+        decompress (bool): Whether to decompress the data of the messages
+            compressed by the publisher before passing them to the callback.
     """
 
     _UNARY_REQUESTS = True
@@ -102,15 +173,31 @@ class StreamingPullManager(object):
     RPC instead of over the streaming RPC."""
 
     def __init__(
-        self, client, subscription, flow_control=types.FlowControl(), scheduler=None
+        self,
+        client,
+        subscription,
+        flow_control=types.FlowControl(),
+        scheduler=None,
+        ack_batch_settings=types.AckBatchSettings(),
+        ack_histogram=None,
+        num_streams=1,
+        decompress=False,
     ):
+        if num_streams < 1:
+            raise ValueError("num_streams must be a positive integer.")
+
         self._client = client
         self._subscription = subscription
         self._flow_control = flow_control
-        self._ack_histogram = histogram.Histogram()
+        self._ack_batch_settings = ack_batch_settings
+        if ack_histogram is None:
+            ack_histogram = histogram.Histogram()
+        self._ack_histogram = ack_histogram
         self._last_histogram_size = 0
         self._ack_deadline = 10
         self._rpc = None
+        self._num_streams = num_streams
+        self._decompress = decompress
         self._callback = None
         self._closing = threading.Lock()
         self._closed = False
@@ -145,6 +232,10 @@ class StreamingPullManager(object):
         self._consumer = None
         self._heartbeater = None
 
+        # The streams in addition to the primary one (``_rpc`` and
+        # ``_consumer``), if more than one stream is used.
+        self._extra_streams = []
+
     @property
     def is_active(self):
         """bool: True if this manager is actively streaming.
@@ -154,6 +245,11 @@ class StreamingPullManager(object):
         """
         return self._consumer is not None and self._consumer.is_active
 
+    @property
+    def num_streams(self):
+        """int: The number of streaming pull RPCs used."""
+        return self._num_streams
+
     @property
     def flow_control(self):
         """google.cloud.pubsub_v1.types.FlowControl: The active flow control
@@ -240,15 +336,29 @@ class StreamingPullManager(object):
         """
         self._close_callbacks.append(callback)
 
+    def _consumers(self):
+        """Return the background consumers of all the streams."""
+        if self._consumer is None:
+            return []
+        return [self._consumer] + [stream.consumer for stream in self._extra_streams]
+
     def maybe_pause_consumer(self):
-        """Check the current load and pause the consumer if needed."""
+        """Check the current load and pause the consumers if needed.
+
+        The flow control limits are shared by all streams, thus all of them
+        are paused together.
+        """
         with self._pause_resume_lock:
             if self.load >= _MAX_LOAD:
-                if self._consumer is not None and not self._consumer.is_paused:
+                to_pause = [
+                    consumer for consumer in self._consumers() if not consumer.is_paused
+                ]
+                if to_pause:
                     _LOGGER.debug(
                         "Message backlog over load at %.2f, pausing.", self.load
                     )
-                    self._consumer.pause()
+                for consumer in to_pause:
+                    consumer.pause()
 
     def maybe_resume_consumer(self):
         """Check the load and held messages and resume the consumer if needed.
@@ -263,7 +373,8 @@ class StreamingPullManager(object):
             # In order to not thrash too much, require us to have passed below
             # the resume threshold (80% by default) of each flow control setting
             # before restarting.
-            if self._consumer is None or not self._consumer.is_paused:
+            paused = [consumer for consumer in self._consumers() if consumer.is_paused]
+            if not paused:
                 return
 
             _LOGGER.debug("Current load: %.2f", self.load)
@@ -274,7 +385,8 @@ class StreamingPullManager(object):
 
             if self.load < _RESUME_THRESHOLD:
                 _LOGGER.debug("Current load is %.2f, resuming consumer.", self.load)
-                self._consumer.resume()
+                for consumer in paused:
+                    consumer.resume()
             else:
                 _LOGGER.debug("Did not resume, current load is %.2f.", self.load)
 
@@ -375,13 +487,15 @@ class StreamingPullManager(object):
             self._rpc.send(request)
 
     def heartbeat(self):
-        """Sends an empty request over the streaming pull RPC.
+        """Sends an empty request over the streaming pull RPCs.
 
-        This always sends over the stream, regardless of if
+        This always sends over the streams, regardless of if
         ``self._UNARY_REQUESTS`` is set or not.
         """
-        if self._rpc is not None and self._rpc.is_active:
-            self._rpc.send(types.StreamingPullRequest())
+        rpcs = [self._rpc] + [stream.rpc for stream in self._extra_streams]
+        for rpc in rpcs:
+            if rpc is not None and rpc.is_active:
+                rpc.send(types.StreamingPullRequest())
 
     def open(self, callback, on_callback_error):
         """Begin consuming messages.
@@ -400,6 +514,10 @@ class StreamingPullManager(object):
         if self._closed:
             raise ValueError("This manager has been closed and can not be re-used.")
 
+        # The messages are decompressed in the scheduler's threads, and any
+        # decompression errors are handled as the errors of the callback.
+        if self._decompress:
+            callback = functools.partial(_decompress_then_call, callback)
         self._callback = functools.partial(
             _wrap_callback_errors, callback, on_callback_error
         )
@@ -410,24 +528,24 @@ class StreamingPullManager(object):
         get_initial_request = functools.partial(
             self._get_initial_request, stream_ack_deadline_seconds
         )
-        self._rpc = bidi.ResumableBidiRpc(
-            start_rpc=self._client.api.streaming_pull,
-            initial_request=get_initial_request,
-            should_recover=self._should_recover,
-            should_terminate=self._should_terminate,
-            throttle_reopen=True,
-        )
-        self._rpc.add_done_callback(self._on_rpc_done)
+        self._rpc = self._create_rpc(get_initial_request)
 
         _LOGGER.debug(
-            "Creating a stream, default ACK deadline set to {} seconds.".format(
-                stream_ack_deadline_seconds
+            "Creating {} stream(s), default ACK deadline set to {} seconds.".format(
+                self._num_streams, stream_ack_deadline_seconds
             )
         )
 
         # Create references to threads
-        self._dispatcher = dispatcher.Dispatcher(self, self._scheduler.queue)
+        self._dispatcher = dispatcher.Dispatcher(
+            self, self._scheduler.queue, ack_batch_settings=self._ack_batch_settings
+        )
         self._consumer = bidi.BackgroundConsumer(self._rpc, self._on_response)
+        for _ in range(self._num_streams - 1):
+            rpc = self._create_rpc(get_initial_request)
+            self._extra_streams.append(
+                _Stream(rpc, bidi.BackgroundConsumer(rpc, self._on_response))
+            )
         self._leaser = leaser.Leaser(self)
         self._heartbeater = heartbeater.Heartbeater(self)
 
@@ -436,6 +554,8 @@ class StreamingPullManager(object):
 
         # Start consuming messages.
         self._consumer.start()
+        for stream in self._extra_streams:
+            stream.consumer.start()
 
         # Start the lease maintainer thread.
         self._leaser.start()
@@ -462,6 +582,10 @@ class StreamingPullManager(object):
                 _LOGGER.debug("Stopping consumer.")
                 self._consumer.stop()
             self._consumer = None
+            for stream in self._extra_streams:
+                if stream.consumer.is_active:
+                    stream.consumer.stop()
+            self._extra_streams = []
 
             # Shutdown all helper threads
             _LOGGER.debug("Stopping scheduler.")
@@ -495,6 +619,30 @@ class StreamingPullManager(object):
             for callback in self._close_callbacks:
                 callback(self, reason)
 
+    def _create_rpc(self, get_initial_request):
+        """Create a streaming pull RPC, terminating the manager when done.
+
+        Each RPC recovers from the retryable errors on its own, while the
+        other streams keep delivering the messages. Any non-recoverable error
+        shuts down all the streams.
+
+        Args:
+            get_initial_request (Callable[[], types.StreamingPullRequest]):
+                Returns the initial request of the stream.
+
+        Returns:
+            google.api_core.bidi.ResumableBidiRpc: The RPC.
+        """
+        rpc = bidi.ResumableBidiRpc(
+            start_rpc=self._client.api.streaming_pull,
+            initial_request=get_initial_request,
+            should_recover=self._should_recover,
+            should_terminate=self._should_terminate,
+            throttle_reopen=True,
+        )
+        rpc.add_done_callback(self._on_rpc_done)
+        return rpc
+
     def _get_initial_request(self, stream_ack_deadline_seconds):
         """Return the initial request for the RPC.
 
@@ -0,0 +1,140 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import collections
+
+from google.cloud.pubsub_v1 import _asyncio_helpers
+from google.cloud.pubsub_v1.subscriber import scheduler
+
+
+class AsyncMessageIterator(object):
+    """An asynchronous iterator over the messages received on a subscription.
+
+    The messages are received by a streaming pull in the background, and
+    handed over to the event loop in batches by an
+    :class:`~google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler`.
+    The received messages are subject to the flow control until they are
+    acknowledged (or nacked), thus the streaming pull is paused if the
+    messages are not consumed fast enough.
+
+    The iteration stops when the streaming pull is cancelled, and raises an
+    error if the streaming pull terminates with a non-recoverable error.
+
+    .. note::
+        This class requires Python 3. It should not be instantiated directly,
+        use :meth:`~.pubsub_v1.subscriber.client.Client.subscribe_iter`.
+
+    Args:
+        client (~.pubsub_v1.subscriber.client.Client): The subscriber client.
+        subscription (str): The name of the subscription.
+        flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow
+            control settings.
+        loop (Optional[asyncio.AbstractEventLoop]): The event loop to deliver
+            the messages in. Defaults to the current event loop.
+    """
+
+    def __init__(self, client, subscription, flow_control=(), loop=None):
+        self._loop = _asyncio_helpers.get_event_loop(loop)
+        self._bridge = _asyncio_helpers.get_loop_bridge(self._loop)
+
+        # Both the received messages and the futures waiting for them are
+        # only accessed in the event loop, thus they need no locking.
+        self._messages = collections.deque()
+        self._waiters = collections.deque()
+        self._exception = None
+        self._finished = False
+
+        self._future = client.subscribe(
+            subscription,
+            self._on_message,
+            flow_control=flow_control,
+            scheduler=scheduler.AsyncioScheduler(loop=self._loop),
+        )
+        self._future.add_done_callback(self._on_streaming_pull_done)
+
+    @property
+    def future(self):
+        """~google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture:
+        The future representing the background streaming pull."""
+        return self._future
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        """Return an awaitable resolving to the next received message.
+
+        Returns:
+            asyncio.Future: The future resolving to the next
+            :class:`~google.cloud.pubsub_v1.subscriber.message.Message`.
+        """
+        waiter = self._loop.create_future()
+
+        if self._messages:
+            waiter.set_result(self._messages.popleft())
+        elif self._finished:
+            waiter.set_exception(self._stop_exception())
+        else:
+            self._waiters.append(waiter)
+
+        return waiter
+
+    def cancel(self):
+        """Stop pulling messages.
+
+        The messages that have been received, but not returned by the iterator
+        yet, are dropped. They will be redelivered by the backend once their
+        ack deadline expires.
+
+        .. note::
+            This blocks until the background threads of the streaming pull
+            have been shut down.
+        """
+        self._future.cancel()
+
+    def _stop_exception(self):
+        """Return the exception to end the iteration with."""
+        if self._exception is not None:
+            return self._exception
+        return StopAsyncIteration()
+
+    def _on_message(self, message):
+        """Hand over a received message to a waiter. Runs in the event loop."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(message)
+                return
+
+        self._messages.append(message)
+
+    def _on_streaming_pull_done(self, future):
+        """Called in a background thread when the streaming pull terminates."""
+        exception = None
+        if not future.cancelled():
+            exception = future.exception()
+        self._bridge.call_soon(self._finish, exception)
+
+    def _finish(self, exception):
+        """End the iteration. Runs in the event loop."""
+        self._finished = True
+        self._exception = exception
+        self._messages.clear()
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(self._stop_exception())
@@ -26,6 +26,7 @@ from google.cloud.pubsub_v1 import _gapic
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import subscriber_client
 from google.cloud.pubsub_v1.gapic.transports import subscriber_grpc_transport
+from google.cloud.pubsub_v1.subscriber import async_iterator
 from google.cloud.pubsub_v1.subscriber import futures
 from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
 
@@ -140,7 +141,17 @@ class Client(object):
         """The underlying gapic API client."""
         return self._api
 
-    def subscribe(self, subscription, callback, flow_control=(), scheduler=None):
+    def subscribe(
+        self,
+        subscription,
+        callback,
+        flow_control=(),
+        scheduler=None,
+        ack_batch_settings=(),
+        ack_histogram=None,
+        num_streams=1,
+        decompress=False,
+    ):
         """Asynchronously start receiving messages on a given subscription.
 
         This method starts a background thread to begin pulling messages from
@@ -162,6 +173,22 @@ class Client(object):
         settings may lead to faster throughput for messages that do not take
         a long time to process.
 
+        The ``ack_batch_settings`` argument can be used to coalesce the ACK
+        and modify ACK deadline requests of the received messages into fewer,
+        larger requests, at the cost of delaying them by up to
+        ``max_latency`` seconds. By default, the requests are not delayed.
+
+        A single streaming pull has a limited throughput. Subscribers
+        receiving messages at very high rates can set ``num_streams`` to
+        receive the messages over multiple streams in parallel. The streams
+        share the flow control limits, the lease management and the
+        ``scheduler``, and if a stream has to reconnect, the others keep
+        receiving the messages in the meantime.
+
+        If the publishers compress the message data, set ``decompress`` to
+        have the messages decompressed before they are passed to the
+        ``callback``.
+
         This method starts the receiver in the background and returns a
         *Future* representing its execution. Waiting on the future (calling
         ``result()``) will block forever or until a non-recoverable error
@@ -205,22 +232,48 @@ class Client(object):
             callback (Callable[~google.cloud.pubsub_v1.subscriber.message.Message]):
                 The callback function. This function receives the message as
                 its only argument and will be called from a different thread/
-                process depending on the scheduling strategy.
+                process depending on the scheduling strategy. If the
+                ``scheduler`` is an
+                :class:`~google.cloud.pubsub_v1.subscriber.scheduler.AsyncioScheduler`,
+                the callback can also be a coroutine function.
             flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow control
                 settings. Use this to prevent situations where you are
                 inundated with too many messages at once.
             scheduler (~google.cloud.pubsub_v1.subscriber.scheduler.Scheduler): An optional
                 *scheduler* to use when executing the callback. This controls
                 how callbacks are executed concurrently.
+            ack_batch_settings (~google.cloud.pubsub_v1.types.AckBatchSettings):
+                The settings for coalescing the ACK and modify ACK deadline
+                requests of the received messages.
+            ack_histogram (Optional[~.subscriber._protocol.histogram.Histogram]):
+                An optional histogram to track the time-to-acknowledge of the
+                messages in, which determines how far the ACK deadlines of the
+                received messages are extended. Pass a
+                :class:`~.subscriber._protocol.histogram.WindowedHistogram`
+                to only take the recent acknowledgements into account.
+            num_streams (int): The number of streaming pulls to receive the
+                messages over. Defaults to one.
+            decompress (bool): Whether to decompress the data of the messages
+                compressed by the publisher (see
+                :class:`~google.cloud.pubsub_v1.types.CompressionSettings`).
+                Defaults to :data:`False`.
 
         Returns:
             A :class:`~google.cloud.pubsub_v1.subscriber.futures.StreamingPullFuture`
             instance that can be used to manage the background stream.
         """
         flow_control = types.FlowControl(*flow_control)
+        ack_batch_settings = types.AckBatchSettings(*ack_batch_settings)
 
         manager = streaming_pull_manager.StreamingPullManager(
-            self, subscription, flow_control=flow_control, scheduler=scheduler
+            self,
+            subscription,
+            flow_control=flow_control,
+            scheduler=scheduler,
+            ack_batch_settings=ack_batch_settings,
+            ack_histogram=ack_histogram,
+            num_streams=num_streams,
+            decompress=decompress,
         )
 
         future = futures.StreamingPullFuture(manager)
@@ -228,3 +281,53 @@ class Client(object):
         manager.open(callback=callback, on_callback_error=future.set_exception)
 
         return future
+
+    def subscribe_iter(self, subscription, flow_control=(), loop=None):
+        """Start receiving messages on a subscription in an :mod:`asyncio` loop.
+
+        This is the same as :meth:`subscribe`, except that the received
+        messages are returned by an asynchronous iterator instead of being
+        passed to a callback. The messages are handed over to the event loop
+        in batches, without a thread per message.
+
+        As with :meth:`subscribe`, it is the responsibility of the caller to
+        either call ``ack()`` or ``nack()`` on each message when it finished
+        processing it.
+
+        .. note::
+            This method requires Python 3.
+
+        Example:
+            .. code-block:: python
+
+                from google.cloud import pubsub_v1
+
+                subscriber_client = pubsub_v1.SubscriberClient()
+
+                # existing subscription
+                subscription = subscriber_client.subscription_path(
+                    'my-project-id', 'my-subscription')
+
+                async def consume():
+                    messages = subscriber_client.subscribe_iter(subscription)
+                    async for message in messages:
+                        print(message)
+                        message.ack()
+
+        Args:
+            subscription (str): The name of the subscription. The
+                subscription should have already been created (for example,
+                by using :meth:`create_subscription`).
+            flow_control (~google.cloud.pubsub_v1.types.FlowControl): The flow
+                control settings. The received messages count against the
+                limits until they are acknowledged or nacked.
+            loop (Optional[asyncio.AbstractEventLoop]): The event loop to
+                deliver the messages in. Defaults to the current event loop.
+
+        Returns:
+            A :class:`~google.cloud.pubsub_v1.subscriber.async_iterator.AsyncMessageIterator`
+            instance. Call its ``cancel()`` method to stop receiving messages.
+        """
+        return async_iterator.AsyncMessageIterator(
+            self, subscription, flow_control=flow_control, loop=loop
+        )
@@ -91,6 +91,11 @@ class Message(object):
         self._request_queue = request_queue
         self.message_id = message.message_id
 
+        # The size of the message as received, before its data is possibly
+        # decompressed in place. Flow control and lease management account
+        # for this size when the message is leased and released.
+        self._size = message.ByteSize()
+
         # The instantiation time is the time that this message
         # was received. Tracking this provides us a way to be smart about
         # the default lease deadline.
@@ -154,8 +159,9 @@ class Message(object):
 
     @property
     def size(self):
-        """Return the size of the underlying message, in bytes."""
-        return self._message.ByteSize()
+        """Return the size of the underlying message, in bytes, as received
+        from Pub/Sub."""
+        return self._size
 
     @property
     def ack_id(self):
@@ -0,0 +1,122 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process the received messages in a pool of worker processes.
+
+The messages are received, leased and acknowledged by the subscriber in the
+parent process. Only the message payloads are sent to the worker processes,
+thus CPU-bound message processing is not limited by the global interpreter
+lock of the parent process.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import functools
+import logging
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+MessagePayload = collections.namedtuple(
+    "MessagePayload", ["message_id", "data", "attributes", "publish_time"]
+)
+MessagePayload.__doc__ = """The payload of a message, sent to a worker process.
+
+Attributes:
+    message_id (str): The ID of the message.
+    data (bytes): The message data.
+    attributes (Dict[str, str]): The message attributes.
+    publish_time (datetime.datetime): The time the message was published.
+"""
+
+
+class ProcessPoolCallback(object):
+    """A subscriber callback processing the messages in worker processes.
+
+    Pass an instance as the ``callback`` to
+    :meth:`~.pubsub_v1.subscriber.client.Client.subscribe`. For each
+    received message, the ``target`` function is called in a worker process
+    with the :class:`MessagePayload` of the message. Once the ``target``
+    returns, the message is acknowledged in the parent process. If the
+    ``target`` raises an exception, the message is nacked, and the exception
+    terminates the streaming pull, same as the exceptions raised by a regular
+    callback.
+
+    Submitting a message to the worker processes does not block the
+    scheduler's threads. The messages count against the subscriber's flow
+    control limits until they are acknowledged, thus the number of messages
+    waiting for or being processed by the worker processes is bounded by the
+    ``max_messages`` and ``max_bytes`` flow control settings. The leases of
+    the messages are extended by the parent process while they are being
+    processed.
+
+    Args:
+        target (Callable[[MessagePayload], None]): The function to process
+            the messages with. It must be picklable, e.g. a module-level
+            function.
+        max_workers (Optional[int]): The number of worker processes. Defaults
+            to the number of processors. Ignored if ``executor`` is given.
+        executor (Optional[concurrent.futures.ProcessPoolExecutor]): The
+            executor to run the ``target`` in. If not given, a new one is
+            created.
+    """
+
+    def __init__(self, target, max_workers=None, executor=None):
+        if executor is None:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        self._target = target
+        self._executor = executor
+
+    def __call__(self, message):
+        """Submit the message for processing in a worker process.
+
+        Args:
+            message (~.pubsub_v1.subscriber.message.Message): The message.
+
+        Returns:
+            concurrent.futures.Future: The future of the ``target`` call.
+        """
+        payload = MessagePayload(
+            message_id=message.message_id,
+            data=message.data,
+            attributes=dict(message.attributes),
+            publish_time=message.publish_time,
+        )
+        future = self._executor.submit(self._target, payload)
+        future.add_done_callback(functools.partial(_ack_if_succeeded, message))
+        return future
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes.
+
+        Call this after the streaming pull has been cancelled.
+
+        Args:
+            wait (bool): Whether to block until the messages being processed
+                have been processed.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+def _ack_if_succeeded(message, future):
+    """Acknowledge the message if it has been processed successfully.
+
+    The failures are handled by the streaming pull manager.
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    message.ack()
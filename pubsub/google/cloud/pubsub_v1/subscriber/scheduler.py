@@ -19,12 +19,21 @@ each message.
 """
 
 import abc
+import collections
 import concurrent.futures
+import functools
+import logging
 import sys
+import threading
 
 import six
 from six.moves import queue
 
+from google.cloud.pubsub_v1 import _asyncio_helpers
+
+
+_LOGGER = logging.getLogger(__name__)
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Scheduler(object):
@@ -121,3 +130,231 @@ class ThreadScheduler(Scheduler):
         except queue.Empty:
             pass
         self._executor.shutdown()
+
+
+class AsyncioScheduler(Scheduler):
+    """An :mod:`asyncio` event loop-based scheduler.
+
+    This scheduler calls the callbacks in the event loop, so that the
+    messages can be processed by coroutines without a thread per message.
+    If the user-provided callback is a coroutine function, the returned
+    coroutine is run as a task in the event loop. Callbacks must not block
+    the event loop.
+
+    The messages are handed over to the event loop in batches, thus the loop
+    is not woken up separately for each message.
+
+    .. note::
+        This scheduler requires Python 3.
+
+    Args:
+        loop (Optional[asyncio.AbstractEventLoop]): The event loop to call the
+            callbacks in. Defaults to the current event loop.
+    """
+
+    def __init__(self, loop=None):
+        self._queue = queue.Queue()
+        self._bridge = _asyncio_helpers.LoopBridge(
+            _asyncio_helpers.get_event_loop(loop)
+        )
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    @property
+    def loop(self):
+        """asyncio.AbstractEventLoop: The event loop the callbacks are
+        called in."""
+        return self._bridge.loop
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called in the event loop.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        self._bridge.call_soon(functools.partial(callback, *args, **kwargs))
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+        """
+        # Callbacks that are already running as tasks are not cancelled, but
+        # the callbacks not handed over to the event loop yet are dropped.
+        self._bridge.clear()
+
+
+class _Lane(object):
+    """The callbacks waiting to be called in order, and whether one is running."""
+
+    __slots__ = ("pending", "running")
+
+    def __init__(self):
+        self.pending = collections.deque()
+        self.running = False
+
+
+class OrderedKeyScheduler(Scheduler):
+    """A thread pool-based scheduler preserving the order of related messages.
+
+    The messages are assigned to lanes by hashing an ordering key - by
+    default, the value of the ``key_attribute`` attribute of each message.
+    The callbacks of the messages in the same lane are called one at a time,
+    in the order the messages were received, while the callbacks of messages
+    in different lanes are called in parallel. Messages without an ordering
+    key are not ordered, their callbacks are called in parallel, same as with
+    :class:`ThreadScheduler`.
+
+    The lanes do not occupy the worker threads while idle, and scheduling a
+    callback never blocks, thus a slow lane does not hold up the others,
+    as long as there are worker threads available.
+
+    .. note::
+        The order is only preserved among the messages received by the same
+        streaming pull. The messages redelivered by the backend (e.g. after a
+        ``nack()``) are delivered again after the other messages in the lane.
+
+    Args:
+        key_attribute (Optional[str]): The name of the message attribute to
+            use as the ordering key.
+        key (Optional[Callable[[~.pubsub_v1.subscriber.message.Message], Hashable]]):
+            A function returning the ordering key of a message, or
+            :data:`None` if the message is not ordered. Takes precedence
+            over ``key_attribute``. If the function raises an exception, or
+            returns an unhashable key, the error is logged and the message
+            is not ordered.
+        num_lanes (int): The number of lanes to hash the ordering keys to.
+            Messages with different keys may end up in the same lane, thus
+            more lanes mean less contention among unrelated messages.
+        executor (concurrent.futures.ThreadPoolExecutor): An optional executor
+            to use. If not specified, a default one will be created.
+    """
+
+    def __init__(self, key_attribute=None, key=None, num_lanes=1024, executor=None):
+        if key is None and key_attribute is None:
+            raise ValueError("Either key_attribute or key must be given.")
+        if num_lanes < 1:
+            raise ValueError("num_lanes must be a positive integer.")
+
+        if key is None:
+
+            def key(message):
+                return message.attributes.get(key_attribute)
+
+        self._key = key
+        self._queue = queue.Queue()
+        if executor is None:
+            self._executor = _make_default_thread_pool_executor()
+        else:
+            self._executor = executor
+
+        # The lanes are created lazily. All lane state is guarded by the lock.
+        self._lanes_lock = threading.Lock()
+        self._lanes = {}
+        self._num_lanes = num_lanes
+
+    @property
+    def queue(self):
+        """Queue: A thread-safe queue used for communication between callbacks
+        and the scheduling thread."""
+        return self._queue
+
+    def _lane_index(self, message):
+        """Return the lane of the message, or None if it is not ordered."""
+        try:
+            key = self._key(message)
+            if key is None:
+                return None
+            return hash(key) % self._num_lanes
+        except Exception:
+            # The error must not reach the thread dispatching the messages.
+            _LOGGER.exception(
+                "Error getting the ordering key of a message, "
+                "scheduling it without ordering."
+            )
+            return None
+
+    def schedule(self, callback, *args, **kwargs):
+        """Schedule the callback to be called asynchronously in a thread pool.
+
+        The first positional argument must be the message, it determines the
+        lane the callback is called in.
+
+        Args:
+            callback (Callable): The function to call.
+            args: Positional arguments passed to the function.
+            kwargs: Key-word arguments passed to the function.
+
+        Returns:
+            None
+        """
+        index = self._lane_index(args[0])
+        if index is None:
+            self._executor.submit(callback, *args, **kwargs)
+            return
+
+        with self._lanes_lock:
+            lane = self._lanes.get(index)
+            if lane is None:
+                lane = self._lanes[index] = _Lane()
+
+            lane.pending.append(functools.partial(callback, *args, **kwargs))
+            if lane.running:
+                return
+            lane.running = True
+
+        self._executor.submit(self._run_lane, index)
+
+    def _run_lane(self, index):
+        """Call the next callback in the lane.
+
+        If more callbacks are waiting in the lane afterwards, the lane is
+        re-submitted to the executor rather than drained on the same worker,
+        so that the busy lanes do not starve the others.
+        """
+        with self._lanes_lock:
+            lane = self._lanes.get(index)
+            if lane is None:  # The scheduler has been shut down.
+                return
+            callback = lane.pending.popleft()
+
+        try:
+            callback()
+        finally:
+            with self._lanes_lock:
+                if lane.pending:
+                    resubmit = True
+                else:
+                    resubmit = False
+                    lane.running = False
+                    if self._lanes.get(index) is lane:
+                        del self._lanes[index]
+
+            if resubmit:
+                try:
+                    self._executor.submit(self._run_lane, index)
+                except RuntimeError:  # The executor has been shut down.
+                    pass
+
+    def shutdown(self):
+        """Shuts down the scheduler and immediately end all pending callbacks.
+        """
+        with self._lanes_lock:
+            self._lanes.clear()
+
+        # Drop all pending item from the executor. Without this, the executor
+        # will block until all pending items are complete, which is
+        # undesirable.
+        try:
+            while True:
+                self._executor._work_queue.get(block=False)
+        except queue.Empty:
+            pass
+        self._executor.shutdown()
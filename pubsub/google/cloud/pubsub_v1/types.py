@@ -14,6 +14,7 @@
 
 from __future__ import absolute_import
 import collections
+import enum
 import sys
 
 from google.api import http_pb2
@@ -36,12 +37,13 @@ from google.cloud.pubsub_v1.proto import pubsub_pb2
 # these settings can be altered to tweak Pub/Sub behavior.
 # The defaults should be fine for most use cases.
 BatchSettings = collections.namedtuple(
-    "BatchSettings", ["max_bytes", "max_latency", "max_messages"]
+    "BatchSettings", ["max_bytes", "max_latency", "max_messages", "max_open_batches"]
 )
 BatchSettings.__new__.__defaults__ = (
     1 * 1000 * 1000,  # max_bytes: 1 MB
     0.01,  # max_latency: 10 ms
     100,  # max_messages: 100
+    1,  # max_open_batches: 1 (do not pack)
 )
 
 if sys.version_info >= (3, 5):
@@ -60,6 +62,90 @@ if sys.version_info >= (3, 5):
         "The maximum number of messages to collect before automatically "
         "publishing the batch."
     )
+    BatchSettings.max_open_batches.__doc__ = (
+        "The maximum number of batches per topic to collect the messages in at "
+        "the same time. If greater than one, a message that does not fit into "
+        "a batch is added to another open batch it fits into, thus the batches "
+        "are filled closer to ``max_bytes``, but the messages are no longer "
+        "published in order."
+    )
+
+
+class LimitExceededBehavior(str, enum.Enum):
+    """The possible actions when exceeding the publish flow control limits."""
+
+    IGNORE = "ignore"
+    BLOCK = "block"
+    ERROR = "error"
+
+
+# Define the type class and default values for publisher flow control settings.
+#
+# This class is used when creating a publisher client, and these settings can
+# be altered to bound the amount of memory used by messages that have been
+# published, but not yet acknowledged by the backend.
+# The defaults should be fine for most use cases.
+PublishFlowControl = collections.namedtuple(
+    "PublishFlowControl", ["max_messages", "max_bytes", "limit_exceeded_behavior"]
+)
+PublishFlowControl.__new__.__defaults__ = (
+    10 * BatchSettings.__new__.__defaults__[2],  # max_messages: 1000
+    10 * BatchSettings.__new__.__defaults__[0],  # max_bytes: 10 MB
+    LimitExceededBehavior.IGNORE,  # limit_exceeded_behavior: IGNORE
+)
+
+if sys.version_info >= (3, 5):
+    PublishFlowControl.__doc__ = (
+        "The client flow control settings for message publishing."
+    )
+    PublishFlowControl.max_messages.__doc__ = (
+        "The maximum number of messages awaiting to be published."
+    )
+    PublishFlowControl.max_bytes.__doc__ = (
+        "The maximum total size of messages awaiting to be published."
+    )
+    PublishFlowControl.limit_exceeded_behavior.__doc__ = (
+        "The action to take when publish flow control limits are exceeded."
+    )
+
+
+class Compression(str, enum.Enum):
+    """The codecs to compress the published message data with."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+# Define the type class and default values for the publisher compression
+# settings.
+#
+# This class is used when creating a publisher client, and these settings can
+# be altered to compress the data of the published messages.
+CompressionSettings = collections.namedtuple(
+    "CompressionSettings", ["codec", "min_bytes", "level"]
+)
+CompressionSettings.__new__.__defaults__ = (
+    None,  # codec: None (do not compress)
+    1024,  # min_bytes: 1 KiB
+    None,  # level: None (the codec's default)
+)
+
+if sys.version_info >= (3, 5):
+    CompressionSettings.__doc__ = (
+        "The settings for compressing the data of the published messages."
+    )
+    CompressionSettings.codec.__doc__ = (
+        "The codec to compress the message data with, a ``Compression`` value. "
+        "If ``None``, the messages are not compressed."
+    )
+    CompressionSettings.min_bytes.__doc__ = (
+        "The minimum size of the message data to compress, in bytes. Smaller "
+        "messages are published uncompressed."
+    )
+    CompressionSettings.level.__doc__ = (
+        "The compression level, the meaning of which depends on the codec. If "
+        "``None``, the codec's default level is used."
+    )
 
 
 # Define the type class and default values for flow control settings.
@@ -95,6 +181,35 @@ if sys.version_info >= (3, 5):
     )
 
 
+# Define the type class and default values for the acknowledgement batching
+# settings.
+#
+# This class is used when subscribing to a subscription, and these settings can
+# be altered to coalesce the ACK and modify ACK deadline requests.
+# The defaults should be fine for most use cases.
+AckBatchSettings = collections.namedtuple(
+    "AckBatchSettings", ["max_messages", "max_latency"]
+)
+AckBatchSettings.__new__.__defaults__ = (
+    2500,  # max_messages: 2500
+    0,  # max_latency: 0 (do not coalesce)
+)
+
+if sys.version_info >= (3, 5):
+    AckBatchSettings.__doc__ = (
+        "The settings for coalescing the acknowledgement requests of a subscriber."
+    )
+    AckBatchSettings.max_messages.__doc__ = (
+        "The maximum number of ACK IDs to collect before automatically sending "
+        "the ACK and modify ACK deadline requests."
+    )
+    AckBatchSettings.max_latency.__doc__ = (
+        "The maximum number of seconds to wait for additional ACK IDs before "
+        "automatically sending the requests. If zero, the requests are sent "
+        "immediately and not coalesced."
+    )
+
+
 _shared_modules = [
     http_pb2,
     iam_policy_pb2,
@@ -110,7 +225,15 @@ _shared_modules = [
 _local_modules = [pubsub_pb2]
 
 
-names = ["BatchSettings", "FlowControl"]
+names = [
+    "AckBatchSettings",
+    "BatchSettings",
+    "Compression",
+    "CompressionSettings",
+    "FlowControl",
+    "LimitExceededBehavior",
+    "PublishFlowControl",
+]
 
 
 for module in _shared_modules:
@@ -33,7 +33,7 @@ dependencies = [
     "grpc-google-iam-v1 >= 0.12.3, < 0.13dev",
     'enum34; python_version < "3.4"',
 ]
-extras = {}
+extras = {"zstd": "zstandard >= 0.13.0"}
 
 
 # Setup boilerplate below this line.
@@ -0,0 +1,186 @@
+# Copyright 2020, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+import pytest
+
+from google.auth import credentials
+from google.cloud.pubsub_v1 import publisher
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
+from google.cloud.pubsub_v1.publisher._batch import packing
+from google.cloud.pubsub_v1.publisher._batch import thread
+
+
+def create_packing_batch(**batch_settings):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+    settings = types.BatchSettings(**batch_settings)
+    return packing.PackingBatch(client, "topic_name", settings, autocommit=False)
+
+
+def message_of_size(size):
+    """Return a message adding ``size`` bytes to a publish request."""
+    message = types.PubsubMessage(data=b"x" * size)
+    overhead = types.PublishRequest(messages=[message]).ByteSize() - size
+    return types.PubsubMessage(data=b"x" * (size - overhead))
+
+
+def test_init():
+    batch = create_packing_batch(max_open_batches=3)
+
+    assert batch.status == BatchStatus.ACCEPTING_MESSAGES
+    assert batch.open_batches == []
+    assert batch.messages == []
+    assert batch.size == 0
+    assert batch.will_accept(types.PubsubMessage(data=b"foo"))
+
+
+def test_publish_first_fit():
+    batch = create_packing_batch(max_bytes=1000, max_open_batches=3)
+
+    big = message_of_size(700)
+    small = message_of_size(100)
+
+    batch.publish(big)
+    batch.publish(big)
+    # The small message fits into the first batch, the big one did not.
+    batch.publish(small)
+
+    first, second = batch.open_batches
+    assert first.messages == [big, small]
+    assert second.messages == [big]
+    assert batch.messages == [big, small, big]
+    assert batch.size == first.size + second.size
+
+
+def test_publish_returns_batch_futures():
+    batch = create_packing_batch(max_bytes=1000, max_open_batches=2)
+
+    future1 = batch.publish(message_of_size(700))
+    future2 = batch.publish(message_of_size(700))
+
+    first, second = batch.open_batches
+    assert first._futures == [future1]
+    assert second._futures == [future2]
+
+
+def test_publish_commits_fullest_batch_when_too_many_open():
+    batch = create_packing_batch(max_bytes=1000, max_open_batches=2)
+
+    batch.publish(message_of_size(700))
+    batch.publish(message_of_size(800))
+    fullest = batch.open_batches[1]
+
+    with mock.patch.object(fullest, "commit", autospec=True) as commit:
+        batch.publish(message_of_size(600))
+
+    commit.assert_called_once_with()
+    assert len(batch.open_batches) == 2
+    assert fullest not in batch.open_batches
+
+
+def test_publish_commits_full_batch():
+    batch = create_packing_batch(max_bytes=1000, max_open_batches=2)
+
+    batch.publish(message_of_size(700))
+    first = batch.open_batches[0]
+
+    with mock.patch.object(first, "commit", autospec=True) as commit:
+        batch.publish(message_of_size(260))
+
+    commit.assert_called_once_with()
+    assert batch.open_batches == []
+
+
+def test_publish_skips_committed_batches():
+    batch = create_packing_batch(max_bytes=1000, max_open_batches=2)
+
+    batch.publish(message_of_size(100))
+    first = batch.open_batches[0]
+    # The batch is committed concurrently, e.g. after its max latency.
+    first._status = BatchStatus.IN_PROGRESS
+
+    batch.publish(message_of_size(100))
+
+    assert len(batch.open_batches) == 1
+    assert batch.open_batches[0] is not first
+
+
+def test_publish_message_count_limit():
+    batch = create_packing_batch(max_messages=3, max_open_batches=2)
+    message = types.PubsubMessage(data=b"foo")
+
+    def fake_commit(self):
+        self._status = BatchStatus.STARTING
+
+    with mock.patch.object(
+        thread.Batch, "commit", autospec=True, side_effect=fake_commit
+    ) as commit:
+        futures = [batch.publish(message) for _ in range(4)]
+
+    assert all(future is not None for future in futures)
+    # A batch that reached the message count limit commits itself.
+    commit.assert_called_once()
+    (committed,) = commit.call_args[0]
+    assert len(committed.messages) == 2
+    assert committed not in batch.open_batches
+    assert [len(open_batch.messages) for open_batch in batch.open_batches] == [2]
+
+
+def test_publish_too_large():
+    batch = create_packing_batch(max_open_batches=2)
+    message = types.PubsubMessage(data=b"x" * 10 * 1000 * 1000)
+
+    with pytest.raises(exceptions.MessageTooLargeError):
+        batch.publish(message)
+
+
+def test_publish_dict():
+    batch = create_packing_batch(max_open_batches=2)
+
+    future = batch.publish({"data": b"foo", "attributes": {"bar": "baz"}})
+
+    assert future is not None
+    assert batch.messages == [
+        types.PubsubMessage(data=b"foo", attributes={"bar": "baz"})
+    ]
+
+
+def test_commit():
+    batch = create_packing_batch(max_bytes=1000, max_open_batches=3)
+    batch.publish(message_of_size(700))
+    batch.publish(message_of_size(700))
+    open_batches = batch.open_batches
+
+    patches = [
+        mock.patch.object(open_batch, "commit", autospec=True)
+        for open_batch in open_batches
+    ]
+    commits = [patch.start() for patch in patches]
+    try:
+        batch.commit()
+        # Committing again is a no-op.
+        batch.commit()
+    finally:
+        for patch in patches:
+            patch.stop()
+
+    for commit in commits:
+        commit.assert_called_once_with()
+    assert batch.status == BatchStatus.STARTING
+    assert batch.open_batches == []
+    assert not batch.will_accept(types.PubsubMessage(data=b"foo"))
+    assert batch.publish(types.PubsubMessage(data=b"foo")) is None
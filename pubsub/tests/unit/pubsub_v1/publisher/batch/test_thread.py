@@ -24,14 +24,15 @@ from google.auth import credentials
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import scheduler
 from google.cloud.pubsub_v1.publisher._batch.base import BatchStatus
 from google.cloud.pubsub_v1.publisher._batch import thread
 from google.cloud.pubsub_v1.publisher._batch.thread import Batch
 
 
-def create_client():
+def create_client(**kwargs):
     creds = mock.Mock(spec=credentials.Credentials)
-    return publisher.Client(credentials=creds)
+    return publisher.Client(credentials=creds, **kwargs)
 
 
 def create_batch(autocommit=False, topic="topic_name", **batch_settings):
@@ -71,6 +72,20 @@ def test_init():
     assert batch.status == BatchStatus.ACCEPTING_MESSAGES
 
 
+def test_init_w_commit_scheduler():
+    commit_scheduler = mock.create_autospec(scheduler.CommitScheduler, instance=True)
+    client = create_client(commit_scheduler=commit_scheduler)
+
+    # The batch should not create a monitor thread, the delayed commit is
+    # scheduled on the commit scheduler instead.
+    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+        batch = Batch(client, "topic_name", types.BatchSettings(max_latency=2.0))
+        Thread.assert_not_called()
+
+    assert batch._thread is None
+    commit_scheduler.schedule_after.assert_called_once_with(2.0, batch.commit)
+
+
 def test_init_infinite_latency():
     batch = create_batch(max_latency=float("inf"))
     assert batch._thread is None
@@ -107,6 +122,37 @@ def test_commit():
     assert batch.status == BatchStatus.STARTING
 
 
+def test_commit_w_commit_scheduler():
+    commit_scheduler = mock.create_autospec(scheduler.CommitScheduler, instance=True)
+    client = create_client(commit_scheduler=commit_scheduler)
+    batch = Batch(client, "topic_name", types.BatchSettings(), autocommit=False)
+
+    with mock.patch.object(threading, "Thread", autospec=True) as Thread:
+        batch.commit()
+        Thread.assert_not_called()
+
+    # The blocking commit should have been scheduled for the batch's topic.
+    commit_scheduler.schedule.assert_called_once_with("topic_name", batch._commit)
+    assert batch.status == BatchStatus.STARTING
+
+
+def test_commit_w_thread_commit_scheduler():
+    commit_scheduler = scheduler.ThreadCommitScheduler(max_in_flight_per_topic=1)
+    client = create_client(commit_scheduler=commit_scheduler)
+    batch = Batch(client, "topic_name", types.BatchSettings(max_latency=0.01))
+
+    publish_response = types.PublishResponse(message_ids=["a"])
+    patch = mock.patch.object(
+        type(batch.client.api), "publish", return_value=publish_response
+    )
+    with patch:
+        future = batch.publish({"data": b"This is my message."})
+        assert future.result(timeout=1.0) == "a"
+        commit_scheduler.shutdown()
+
+    assert batch.status == BatchStatus.SUCCESS
+
+
 def test_commit_no_op():
     batch = create_batch()
     batch._status = BatchStatus.IN_PROGRESS
@@ -0,0 +1,231 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+import pytest
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher.flow_controller import FlowController
+
+
+def _run_in_daemon(action, name=None):
+    """Run the action in a daemon thread and return the started thread."""
+    thread = threading.Thread(target=action, name=name)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def test_no_overflow_no_error():
+    settings = types.PublishFlowControl(
+        max_messages=100,
+        max_bytes=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    # there should be no errors
+    for data in (b"foo", b"bar", b"baz"):
+        msg = types.PubsubMessage(data=data)
+        flow_controller.add(msg)
+
+    msg_size = types.PubsubMessage(data=b"foo").ByteSize()
+    assert flow_controller.message_count == 3
+    assert flow_controller.total_bytes == 3 * msg_size
+
+
+def test_overflow_no_error_on_ignore():
+    settings = types.PublishFlowControl(
+        max_messages=1,
+        max_bytes=2,
+        limit_exceeded_behavior=types.LimitExceededBehavior.IGNORE,
+    )
+    flow_controller = FlowController(settings)
+
+    # there should be no overflow errors
+    flow_controller.add(types.PubsubMessage(data=b"foo"))
+    flow_controller.add(types.PubsubMessage(data=b"bar"))
+
+    # the load is not even tracked
+    assert flow_controller.message_count == 0
+    assert flow_controller.total_bytes == 0
+
+
+def test_message_count_overflow_error():
+    settings = types.PublishFlowControl(
+        max_messages=1,
+        max_bytes=10000,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    flow_controller.add(types.PubsubMessage(data=b"foo"))
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        flow_controller.add(types.PubsubMessage(data=b"bar"))
+
+    assert "max_messages: 1" in str(error.value)
+    assert flow_controller.message_count == 1
+
+
+def test_byte_size_overflow_error():
+    settings = types.PublishFlowControl(
+        max_messages=10000,
+        max_bytes=199,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    # Since the message data itself occupies 100 bytes, it means that both
+    # messages combined will exceed the imposed byte limit of 199, but a single
+    # message will not (the message size overhead is way lower than data size).
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+
+    flow_controller.add(msg1)
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        flow_controller.add(msg2)
+
+    assert "max_bytes: 199" in str(error.value)
+
+
+def test_no_error_on_moderate_message_flow():
+    settings = types.PublishFlowControl(
+        max_messages=2,
+        max_bytes=250,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+    msg3 = types.PubsubMessage(data=b"z" * 100)
+
+    # The flow control settings will accept two in-flight messages, but not three.
+    # If releasing messages works correctly, the sequence below will not raise
+    # errors.
+    flow_controller.add(msg1)
+    flow_controller.add(msg2)
+    flow_controller.release(msg1)
+    flow_controller.add(msg3)
+    flow_controller.release(msg2)
+    flow_controller.release(msg3)
+
+    assert flow_controller.message_count == 0
+    assert flow_controller.total_bytes == 0
+
+
+def test_release_more_than_added_is_clamped():
+    settings = types.PublishFlowControl(
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR
+    )
+    flow_controller = FlowController(settings)
+
+    msg = types.PubsubMessage(data=b"foo")
+    flow_controller.add(msg)
+    flow_controller.release(msg)
+    flow_controller.release(msg)
+
+    assert flow_controller.message_count == 0
+    assert flow_controller.total_bytes == 0
+
+
+def test_blocking_on_overflow_until_free_capacity():
+    settings = types.PublishFlowControl(
+        max_messages=1,
+        max_bytes=150,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+
+    msg1 = types.PubsubMessage(data=b"x" * 100)
+    msg2 = types.PubsubMessage(data=b"y" * 100)
+
+    flow_controller.add(msg1)
+
+    added = threading.Event()
+
+    def add_second():
+        flow_controller.add(msg2)
+        added.set()
+
+    adder = _run_in_daemon(add_second)
+
+    # The second message cannot be added until the first one is released.
+    assert not added.wait(timeout=0.1)
+
+    flow_controller.release(msg1)
+    assert added.wait(timeout=1.0)
+    adder.join(timeout=1.0)
+
+    assert flow_controller.message_count == 1
+    assert flow_controller.total_bytes == msg2.ByteSize()
+
+
+def test_blocking_threads_are_unblocked_in_order():
+    settings = types.PublishFlowControl(
+        max_messages=1, limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK
+    )
+    flow_controller = FlowController(settings)
+
+    first = types.PubsubMessage(data=b"first")
+    flow_controller.add(first)
+
+    order = []
+    order_lock = threading.Lock()
+
+    def make_adder(data):
+        def add():
+            flow_controller.add(types.PubsubMessage(data=data))
+            with order_lock:
+                order.append(data)
+
+        return add
+
+    threads = []
+    for data in (b"a", b"b", b"c"):
+        threads.append(_run_in_daemon(make_adder(data)))
+        # Give each thread the time to start waiting before the next one.
+        time.sleep(0.05)
+
+    flow_controller.release(first)
+    for data in (b"a", b"b"):
+        time.sleep(0.05)
+        flow_controller.release(types.PubsubMessage(data=data))
+
+    for thread in threads:
+        thread.join(timeout=1.0)
+
+    assert order == [b"a", b"b", b"c"]
+
+
+def test_error_if_message_would_block_forever():
+    settings = types.PublishFlowControl(
+        max_messages=10,
+        max_bytes=10,
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK,
+    )
+    flow_controller = FlowController(settings)
+
+    msg = types.PubsubMessage(data=b"x" * 100)
+
+    with pytest.raises(exceptions.FlowControlLimitError) as error:
+        flow_controller.add(msg)
+
+    assert "too low for the message" in str(error.value)
+    assert flow_controller.message_count == 0
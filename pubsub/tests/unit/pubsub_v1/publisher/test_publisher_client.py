@@ -14,14 +14,25 @@
 
 from __future__ import absolute_import
 
+import sys
+
 from google.auth import credentials
 
 import mock
 import pytest
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
 from google.cloud.pubsub_v1.gapic import publisher_client
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import publisher
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.publisher import exceptions
+from google.cloud.pubsub_v1.publisher import futures
+from google.cloud.pubsub_v1.publisher._batch import packing
 
 
 def test_init():
@@ -35,6 +46,41 @@ def test_init():
     assert client.batch_settings.max_latency == 0.01
     assert client.batch_settings.max_messages == 100
 
+    # Publish flow control should not be enforced by default.
+    assert client.flow_control.max_messages == 1000
+    assert client.flow_control.max_bytes == 10 * 1000 * 1000
+    assert (
+        client.flow_control.limit_exceeded_behavior
+        == types.LimitExceededBehavior.IGNORE
+    )
+
+
+def test_init_w_flow_control():
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(
+        max_messages=5,
+        max_bytes=500,
+        limit_exceeded_behavior=types.LimitExceededBehavior.ERROR,
+    )
+    client = publisher.Client(credentials=creds, flow_control=flow_control)
+
+    assert client.flow_control == flow_control
+
+
+def test_init_w_compression():
+    creds = mock.Mock(spec=credentials.Credentials)
+    settings = types.CompressionSettings(codec=types.Compression.GZIP)
+    client = publisher.Client(credentials=creds, compression=settings)
+
+    assert client.compression_settings == settings
+
+
+def test_init_w_unknown_compression_codec():
+    creds = mock.Mock(spec=credentials.Credentials)
+
+    with pytest.raises(ValueError):
+        publisher.Client(credentials=creds, compression=("brotli",))
+
 
 def test_init_w_custom_transport():
     transport = object()
@@ -99,6 +145,20 @@ def test_batch_create_and_exists():
     assert client._batches == {topic: batch}
 
 
+def test_batch_create_packing():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        credentials=creds, batch_settings=types.BatchSettings(max_open_batches=4)
+    )
+
+    topic = "topic/path"
+    batch = client._batch(topic, autocommit=False)
+
+    assert isinstance(batch, packing.PackingBatch)
+    assert batch.settings.max_open_batches == 4
+    assert client._batches == {topic: batch}
+
+
 def test_publish():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
@@ -107,17 +167,16 @@ def test_publish():
     batch = mock.Mock(spec=client._batch_class)
     # Set the mock up to claim indiscriminately that it accepts all messages.
     batch.will_accept.return_value = True
-    batch.publish.side_effect = (mock.sentinel.future1, mock.sentinel.future2)
+    future1 = mock.Mock(spec=futures.Future)
+    future2 = mock.Mock(spec=futures.Future)
+    batch.publish.side_effect = (future1, future2)
 
     topic = "topic/path"
     client._batches[topic] = batch
 
     # Begin publishing.
-    future1 = client.publish(topic, b"spam")
-    future2 = client.publish(topic, b"foo", bar="baz")
-
-    assert future1 is mock.sentinel.future1
-    assert future2 is mock.sentinel.future2
+    assert client.publish(topic, b"spam") is future1
+    assert client.publish(topic, b"foo", bar="baz") is future2
 
     # Check mock.
     batch.publish.assert_has_calls(
@@ -128,6 +187,63 @@ def test_publish():
     )
 
 
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test_publish_async():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(credentials=creds)
+
+    batch = mock.Mock(spec=client._batch_class)
+    future = futures.Future()
+    batch.publish.return_value = future
+
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    loop = asyncio.new_event_loop()
+    with mock.patch.object(asyncio, "get_event_loop", return_value=loop):
+        aio_future = client.publish_async(topic, b"foo", bar="baz")
+
+    assert isinstance(aio_future, asyncio.Future)
+    assert not aio_future.done()
+
+    future.set_result("message_id")
+    assert loop.run_until_complete(aio_future) == "message_id"
+    loop.close()
+
+    batch.publish.assert_called_once_with(
+        types.PubsubMessage(data=b"foo", attributes={"bar": "baz"})
+    )
+
+
+def test_publish_w_compression():
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = publisher.Client(
+        credentials=creds,
+        compression=types.CompressionSettings(
+            codec=types.Compression.GZIP, min_bytes=100
+        ),
+    )
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.return_value = mock.Mock(spec=futures.Future)
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    data = b"spam" * 100
+    client.publish(topic, data, bar="baz")
+    client.publish(topic, b"eggs", bar="baz")
+
+    compressed, small = [call[0][0] for call in batch.publish.call_args_list]
+    assert len(compressed.data) < len(data)
+    assert dict(compressed.attributes) == {
+        "bar": "baz",
+        compression.ENCODING_ATTRIBUTE: "gzip",
+    }
+    assert compression.decompress_message(compressed).data == data
+    # Messages below the size threshold are published uncompressed.
+    assert small == types.PubsubMessage(data=b"eggs", attributes={"bar": "baz"})
+
+
 def test_publish_data_not_bytestring_error():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
@@ -170,8 +286,9 @@ def test_publish_new_batch_needed():
     batch2 = mock.Mock(spec=client._batch_class)
     # Set the first mock up to claim indiscriminately that it rejects all
     # messages and the second accepts all.
+    future = mock.Mock(spec=futures.Future)
     batch1.publish.return_value = None
-    batch2.publish.return_value = mock.sentinel.future
+    batch2.publish.return_value = future
 
     topic = "topic/path"
     client._batches[topic] = batch1
@@ -181,8 +298,7 @@ def test_publish_new_batch_needed():
     client._batch_class = batch_class
 
     # Publish a message.
-    future = client.publish(topic, b"foo", bar=b"baz")
-    assert future is mock.sentinel.future
+    assert client.publish(topic, b"foo", bar=b"baz") is future
 
     # Check the mocks.
     batch_class.assert_called_once_with(
@@ -193,6 +309,71 @@ def test_publish_new_batch_needed():
     batch2.publish.assert_called_once_with(message_pb)
 
 
+def _make_flow_controlled_client(**kwargs):
+    creds = mock.Mock(spec=credentials.Credentials)
+    flow_control = types.PublishFlowControl(**kwargs)
+    return publisher.Client(credentials=creds, flow_control=flow_control)
+
+
+def test_publish_flow_control_released_when_future_done():
+    client = _make_flow_controlled_client(
+        max_messages=1, limit_exceeded_behavior=types.LimitExceededBehavior.ERROR
+    )
+
+    batch = mock.Mock(spec=client._batch_class)
+    future = futures.Future()
+    batch.publish.return_value = future
+
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    assert client.publish(topic, b"foo") is future
+    assert client._flow_controller.message_count == 1
+
+    # The flow control capacity is exhausted until the message is published.
+    with pytest.raises(exceptions.FlowControlLimitError):
+        client.publish(topic, b"bar")
+    assert batch.publish.call_count == 1
+
+    future.set_result("message_id")
+    assert client._flow_controller.message_count == 0
+    assert client._flow_controller.total_bytes == 0
+
+    client.publish(topic, b"bar")
+    assert batch.publish.call_count == 2
+
+
+def test_publish_flow_control_released_on_publish_error():
+    client = _make_flow_controlled_client(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK
+    )
+
+    batch = mock.Mock(spec=client._batch_class)
+    batch.publish.side_effect = exceptions.MessageTooLargeError("too big")
+
+    topic = "topic/path"
+    client._batches[topic] = batch
+
+    with pytest.raises(exceptions.MessageTooLargeError):
+        client.publish(topic, b"foo")
+
+    assert client._flow_controller.message_count == 0
+    assert client._flow_controller.total_bytes == 0
+
+
+def test_publish_flow_control_released_on_stopped_publisher():
+    client = _make_flow_controlled_client(
+        limit_exceeded_behavior=types.LimitExceededBehavior.BLOCK
+    )
+    client.stop()
+
+    with pytest.raises(RuntimeError):
+        client.publish("topic/path", b"foo")
+
+    assert client._flow_controller.message_count == 0
+    assert client._flow_controller.total_bytes == 0
+
+
 def test_publish_attrs_type_error():
     creds = mock.Mock(spec=credentials.Credentials)
     client = publisher.Client(credentials=creds)
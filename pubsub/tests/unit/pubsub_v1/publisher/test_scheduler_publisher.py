@@ -0,0 +1,174 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+import time
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1.publisher import scheduler
+
+
+def test_subclasses_base_abc():
+    assert issubclass(scheduler.ThreadCommitScheduler, scheduler.CommitScheduler)
+
+
+def test_constructor_defaults():
+    scheduler_ = scheduler.ThreadCommitScheduler()
+
+    assert isinstance(scheduler_._executor, concurrent.futures.Executor)
+    assert scheduler_._max_in_flight_per_topic is None
+
+
+def test_constructor_options():
+    scheduler_ = scheduler.ThreadCommitScheduler(
+        max_in_flight_per_topic=2, executor=mock.sentinel.executor
+    )
+
+    assert scheduler_._executor == mock.sentinel.executor
+    assert scheduler_._max_in_flight_per_topic == 2
+
+
+def test_constructor_invalid_in_flight_limit():
+    with pytest.raises(ValueError):
+        scheduler.ThreadCommitScheduler(max_in_flight_per_topic=0)
+
+
+def test_schedule():
+    called = threading.Event()
+
+    scheduler_ = scheduler.ThreadCommitScheduler()
+    scheduler_.schedule("topic", called.set)
+
+    assert called.wait(timeout=1.0)
+    scheduler_.shutdown()
+
+    assert scheduler_.in_flight("topic") == 0
+
+
+def test_schedule_respects_in_flight_limit_per_topic():
+    release = threading.Event()
+    started = []
+    started_lock = threading.Lock()
+
+    def make_commit(name):
+        def commit():
+            with started_lock:
+                started.append(name)
+            release.wait()
+
+        return commit
+
+    scheduler_ = scheduler.ThreadCommitScheduler(
+        max_workers=10, max_in_flight_per_topic=1
+    )
+    for name in ("foo1", "foo2", "foo3"):
+        scheduler_.schedule("foo", make_commit(name))
+    scheduler_.schedule("bar", make_commit("bar1"))
+
+    time.sleep(0.1)
+
+    # Only one commit per topic is started, the rest is waiting in line.
+    assert sorted(started) == ["bar1", "foo1"]
+    assert scheduler_.in_flight("foo") == 1
+    assert scheduler_.in_flight("bar") == 1
+
+    release.set()
+    scheduler_.shutdown()
+
+    # The pending commits are run in order.
+    assert [name for name in started if name.startswith("foo")] == [
+        "foo1",
+        "foo2",
+        "foo3",
+    ]
+    assert scheduler_.in_flight("foo") == 0
+    assert scheduler_.in_flight("bar") == 0
+
+
+def test_schedule_commit_error_does_not_stop_pending_commits():
+    called = threading.Event()
+
+    def failing_commit():
+        raise ValueError("Simulated failure.")
+
+    scheduler_ = scheduler.ThreadCommitScheduler(max_in_flight_per_topic=1)
+
+    with mock.patch.object(scheduler, "_LOGGER") as logger:
+        scheduler_.schedule("topic", failing_commit)
+        scheduler_.schedule("topic", called.set)
+
+        assert called.wait(timeout=1.0)
+        scheduler_.shutdown()
+
+    logger.exception.assert_called_once()
+
+
+def test_schedule_after():
+    calls = []
+    all_called = threading.Event()
+
+    def make_callback(name):
+        def callback():
+            calls.append(name)
+            if len(calls) == 3:
+                all_called.set()
+
+        return callback
+
+    scheduler_ = scheduler.ThreadCommitScheduler()
+    scheduler_.schedule_after(0.2, make_callback("late"))
+    scheduler_.schedule_after(0.1, make_callback("middle"))
+    scheduler_.schedule_after(0.0, make_callback("early"))
+
+    assert all_called.wait(timeout=1.0)
+    scheduler_.shutdown()
+
+    assert calls == ["early", "middle", "late"]
+
+
+def test_schedule_after_single_timer_thread():
+    scheduler_ = scheduler.ThreadCommitScheduler()
+    for _ in range(5):
+        scheduler_.schedule_after(60.0, mock.Mock())
+
+    timer_threads = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name == scheduler._TIMER_NAME and thread is scheduler_._timer_thread
+    ]
+    assert len(timer_threads) == 1
+
+    scheduler_.shutdown()
+
+
+def test_shutdown_runs_delayed_callbacks():
+    callback = mock.Mock()
+
+    scheduler_ = scheduler.ThreadCommitScheduler()
+    scheduler_.schedule_after(60.0, callback)
+    scheduler_.shutdown()
+
+    callback.assert_called_once_with()
+    assert not scheduler_._timer_thread.is_alive()
+
+
+def test_schedule_after_shutdown_error():
+    scheduler_ = scheduler.ThreadCommitScheduler()
+    scheduler_.shutdown()
+
+    with pytest.raises(RuntimeError):
+        scheduler_.schedule_after(1.0, mock.Mock())
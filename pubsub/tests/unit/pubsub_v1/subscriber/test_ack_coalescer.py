@@ -0,0 +1,210 @@
+# Copyright 2020, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber._protocol import ack_coalescer
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+import mock
+import pytest
+
+
+def create_coalescer(max_messages=2500, max_latency=10, max_request_ack_ids=2500):
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    settings = types.AckBatchSettings(
+        max_messages=max_messages, max_latency=max_latency
+    )
+    return ack_coalescer.AckCoalescer(manager, settings, max_request_ack_ids), manager
+
+
+def sent_requests(manager):
+    return [call[0][0] for call in manager.send.call_args_list]
+
+
+def test_stop_flushes_pending():
+    coalescer, manager = create_coalescer()
+    coalescer.start()
+
+    coalescer.ack(["ack_id_1", "ack_id_2"])
+    coalescer.modify_ack_deadline([requests.ModAckRequest("ack_id_3", 30)])
+    coalescer.stop()
+
+    assert sent_requests(manager) == [
+        types.StreamingPullRequest(
+            ack_ids=["ack_id_1", "ack_id_2"],
+            modify_deadline_ack_ids=["ack_id_3"],
+            modify_deadline_seconds=[30],
+        )
+    ]
+    assert coalescer.pending_count == 0
+    assert coalescer.batch_sizes == {3: 1}
+
+
+def test_stop_nothing_pending():
+    coalescer, manager = create_coalescer()
+    coalescer.start()
+    coalescer.stop()
+
+    manager.send.assert_not_called()
+    assert coalescer.batch_sizes == {}
+
+
+def test_deduplicates():
+    coalescer, manager = create_coalescer()
+    coalescer.start()
+
+    coalescer.modify_ack_deadline(
+        [
+            requests.ModAckRequest("ack_id_1", 10),
+            requests.ModAckRequest("ack_id_2", 10),
+            requests.ModAckRequest("ack_id_2", 20),
+        ]
+    )
+    coalescer.ack(["ack_id_1", "ack_id_3", "ack_id_3"])
+    # Modifying the deadline of an acknowledged message is pointless.
+    coalescer.modify_ack_deadline([requests.ModAckRequest("ack_id_3", 0)])
+    coalescer.stop()
+
+    assert sent_requests(manager) == [
+        types.StreamingPullRequest(
+            ack_ids=["ack_id_1", "ack_id_3"],
+            modify_deadline_ack_ids=["ack_id_2"],
+            modify_deadline_seconds=[20],
+        )
+    ]
+
+
+def test_flush_splits_large_requests():
+    coalescer, manager = create_coalescer(max_request_ack_ids=2)
+    coalescer.start()
+
+    coalescer.ack(["ack_id_1", "ack_id_2", "ack_id_3"])
+    coalescer.modify_ack_deadline(
+        [requests.ModAckRequest("ack_id_4", 5), requests.ModAckRequest("ack_id_5", 6)]
+    )
+    coalescer.stop()
+
+    assert sent_requests(manager) == [
+        types.StreamingPullRequest(ack_ids=["ack_id_1", "ack_id_2"]),
+        types.StreamingPullRequest(
+            ack_ids=["ack_id_3"],
+            modify_deadline_ack_ids=["ack_id_4"],
+            modify_deadline_seconds=[5],
+        ),
+        types.StreamingPullRequest(
+            modify_deadline_ack_ids=["ack_id_5"], modify_deadline_seconds=[6]
+        ),
+    ]
+    assert coalescer.batch_sizes == {5: 1}
+
+
+def test_flush_when_max_messages_reached():
+    coalescer, manager = create_coalescer(max_messages=2, max_latency=60)
+    sent = threading.Event()
+    manager.send.side_effect = lambda request: sent.set()
+    coalescer.start()
+
+    coalescer.ack(["ack_id_1"])
+    assert not sent.wait(0.05)
+
+    coalescer.ack(["ack_id_2"])
+    assert sent.wait(5)
+    coalescer.stop()
+
+    assert sent_requests(manager) == [
+        types.StreamingPullRequest(ack_ids=["ack_id_1", "ack_id_2"])
+    ]
+
+
+def test_flush_when_max_latency_elapsed():
+    coalescer, manager = create_coalescer(max_latency=0.05)
+    sent = threading.Event()
+    manager.send.side_effect = lambda request: sent.set()
+    coalescer.start()
+
+    start = time.time()
+    coalescer.ack(["ack_id_1"])
+    assert sent.wait(5)
+    assert time.time() - start >= 0.05
+    assert coalescer.pending_count == 0
+
+    coalescer.stop()
+    manager.send.assert_called_once()
+
+
+def test_send_error_does_not_stop_the_worker():
+    coalescer, manager = create_coalescer(max_messages=1)
+    sent = threading.Event()
+
+    def send(request):
+        if not sent.is_set():
+            sent.set()
+            raise ValueError("boom")
+
+    manager.send.side_effect = send
+    coalescer.start()
+
+    with mock.patch.object(ack_coalescer._LOGGER, "exception") as log_exception:
+        coalescer.ack(["ack_id_1"])
+        assert sent.wait(5)
+        coalescer.ack(["ack_id_2"])
+        coalescer.stop()
+
+    log_exception.assert_called_once()
+    assert manager.send.call_count == 2
+
+
+def test_on_sent_called_after_flush():
+    coalescer, manager = create_coalescer()
+    on_sent = mock.Mock(side_effect=lambda: manager.send.assert_called_once())
+    failing_on_sent = mock.Mock(side_effect=ValueError("boom"))
+
+    coalescer.ack(["ack_id_1"], on_sent=failing_on_sent)
+    coalescer.ack(["ack_id_2"], on_sent=on_sent)
+    on_sent.assert_not_called()
+
+    coalescer.start()
+    with mock.patch.object(ack_coalescer._LOGGER, "exception") as log_exception:
+        coalescer.stop()
+
+    failing_on_sent.assert_called_once_with()
+    on_sent.assert_called_once_with()
+    log_exception.assert_called_once()
+
+
+@mock.patch("threading.Thread", autospec=True)
+def test_start(thread):
+    coalescer, _ = create_coalescer()
+
+    coalescer.start()
+
+    thread.assert_called_once_with(
+        name=ack_coalescer._COALESCER_WORKER_NAME, target=coalescer.coalesce
+    )
+    thread.return_value.start.assert_called_once()
+    assert coalescer._thread is not None
+
+
+def test_start_already_started():
+    coalescer, _ = create_coalescer()
+    coalescer._thread = mock.sentinel.thread
+
+    with pytest.raises(ValueError):
+        coalescer.start()
@@ -0,0 +1,154 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import futures
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import async_iterator
+from google.cloud.pubsub_v1.subscriber import client
+from google.cloud.pubsub_v1.subscriber import scheduler
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def make_iterator(loop, flow_control=()):
+    client_ = mock.create_autospec(client.Client, instance=True)
+    client_.subscribe.return_value = futures.Future()
+    iterator = async_iterator.AsyncMessageIterator(
+        client_, "sub_name_a", flow_control=flow_control, loop=loop
+    )
+    return client_, iterator
+
+
+def deliver(client_, *messages):
+    """Deliver the messages the way the streaming pull does."""
+    _, kwargs = client_.subscribe.call_args
+    callback = client_.subscribe.call_args[0][1]
+    scheduler_ = kwargs["scheduler"]
+
+    thread = threading.Thread(
+        target=lambda: [scheduler_.schedule(callback, msg) for msg in messages]
+    )
+    thread.start()
+    thread.join()
+
+
+def test_constructor(loop):
+    flow_control = types.FlowControl(max_messages=42)
+    client_, iterator = make_iterator(loop, flow_control=flow_control)
+
+    client_.subscribe.assert_called_once_with(
+        "sub_name_a",
+        iterator._on_message,
+        flow_control=flow_control,
+        scheduler=mock.ANY,
+    )
+    _, kwargs = client_.subscribe.call_args
+    assert isinstance(kwargs["scheduler"], scheduler.AsyncioScheduler)
+    assert kwargs["scheduler"].loop is loop
+    assert iterator.future is client_.subscribe.return_value
+    assert iterator.__aiter__() is iterator
+
+
+def test_messages_received_before_anext(loop):
+    client_, iterator = make_iterator(loop)
+    deliver(client_, mock.sentinel.message1, mock.sentinel.message2)
+    loop.run_until_complete(asyncio.sleep(0))
+
+    assert loop.run_until_complete(iterator.__anext__()) is mock.sentinel.message1
+    assert loop.run_until_complete(iterator.__anext__()) is mock.sentinel.message2
+
+
+def test_messages_received_after_anext(loop):
+    client_, iterator = make_iterator(loop)
+    waiter1 = iterator.__anext__()
+    waiter2 = iterator.__anext__()
+    assert not waiter1.done()
+
+    deliver(client_, mock.sentinel.message1, mock.sentinel.message2)
+
+    assert loop.run_until_complete(waiter1) is mock.sentinel.message1
+    assert loop.run_until_complete(waiter2) is mock.sentinel.message2
+
+
+def test_cancelled_waiter_skipped(loop):
+    client_, iterator = make_iterator(loop)
+    waiter1 = iterator.__anext__()
+    waiter1.cancel()
+    waiter2 = iterator.__anext__()
+
+    deliver(client_, mock.sentinel.message1)
+
+    assert loop.run_until_complete(waiter2) is mock.sentinel.message1
+
+
+def test_streaming_pull_done(loop):
+    client_, iterator = make_iterator(loop)
+    waiter = iterator.__anext__()
+
+    deliver(client_, mock.sentinel.message1)
+    iterator.future.set_result(True)
+
+    assert loop.run_until_complete(waiter) is mock.sentinel.message1
+    with pytest.raises(StopAsyncIteration):
+        loop.run_until_complete(iterator.__anext__())
+
+
+def test_streaming_pull_done_with_waiters(loop):
+    client_, iterator = make_iterator(loop)
+    waiter = iterator.__anext__()
+
+    iterator.future.set_result(True)
+
+    with pytest.raises(StopAsyncIteration):
+        loop.run_until_complete(waiter)
+
+
+def test_streaming_pull_error(loop):
+    error = ValueError("meep")
+    client_, iterator = make_iterator(loop)
+
+    iterator.future.set_exception(error)
+    loop.run_until_complete(asyncio.sleep(0))
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(iterator.__anext__())
+
+
+def test_cancel(loop):
+    client_, iterator = make_iterator(loop)
+    future = mock.create_autospec(futures.Future, instance=True)
+    iterator._future = future
+
+    iterator.cancel()
+
+    future.cancel.assert_called_once_with()
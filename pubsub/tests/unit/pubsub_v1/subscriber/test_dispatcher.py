@@ -259,3 +259,73 @@ def test_stop_no_join():
     dispatcher_ = dispatcher.Dispatcher(mock.sentinel.manager, mock.sentinel.queue)
 
     dispatcher_.stop()
+
+
+def test_ack_coalescer_disabled_by_default():
+    dispatcher_ = dispatcher.Dispatcher(mock.sentinel.manager, mock.sentinel.queue)
+    assert dispatcher_.ack_coalescer is None
+
+    settings = types.AckBatchSettings(max_latency=0)
+    dispatcher_ = dispatcher.Dispatcher(
+        mock.sentinel.manager, mock.sentinel.queue, ack_batch_settings=settings
+    )
+    assert dispatcher_.ack_coalescer is None
+
+
+def make_coalescing_dispatcher():
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    settings = types.AckBatchSettings(max_latency=10)
+    dispatcher_ = dispatcher.Dispatcher(
+        manager, queue.Queue(), ack_batch_settings=settings
+    )
+    return dispatcher_, manager
+
+
+def test_ack_coalesced():
+    dispatcher_, manager = make_coalescing_dispatcher()
+
+    items = [requests.AckRequest(ack_id="ack_id_string", byte_size=0, time_to_ack=20)]
+    dispatcher_.ack(items)
+
+    manager.send.assert_not_called()
+    assert dispatcher_.ack_coalescer.pending_count == 1
+
+    manager.ack_histogram.add.assert_called_once_with(20)
+
+    # The message is only removed from the lease management once sent.
+    manager.leaser.remove.assert_not_called()
+    dispatcher_.ack_coalescer.start()
+    dispatcher_.ack_coalescer.stop()
+
+    manager.send.assert_called_once_with(
+        types.StreamingPullRequest(ack_ids=["ack_id_string"])
+    )
+    manager.leaser.remove.assert_called_once_with(items)
+    manager.maybe_resume_consumer.assert_called_once()
+
+
+def test_modify_ack_deadline_coalesced():
+    dispatcher_, manager = make_coalescing_dispatcher()
+
+    dispatcher_.modify_ack_deadline(
+        [requests.ModAckRequest(ack_id="ack_id", seconds=60)]
+    )
+
+    manager.send.assert_not_called()
+    assert dispatcher_.ack_coalescer.pending_count == 1
+
+
+def test_start_stop_ack_coalescer():
+    dispatcher_, manager = make_coalescing_dispatcher()
+
+    dispatcher_.start()
+    dispatcher_.ack(
+        [requests.AckRequest(ack_id="ack_id", byte_size=0, time_to_ack=None)]
+    )
+    dispatcher_.stop()
+
+    # Stopping the dispatcher flushes the collected requests.
+    manager.send.assert_called_once_with(types.StreamingPullRequest(ack_ids=["ack_id"]))
+    assert dispatcher_.ack_coalescer._thread is None
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+import pytest
+
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
 
 
@@ -82,3 +85,127 @@ def test_percentile():
     assert histo.percentile(101) == 200
     assert histo.percentile(99) == 199
     assert histo.percentile(1) == 101
+
+
+def make_windowed(window=60, num_slices=6, now=1000.0):
+    clock = mock.Mock(return_value=now)
+    histo = histogram.WindowedHistogram(
+        window=window, num_slices=num_slices, clock=clock
+    )
+    return histo, clock
+
+
+@pytest.mark.parametrize("window,num_slices", [(0, 1), (60, 0)])
+def test_windowed_invalid_arguments(window, num_slices):
+    with pytest.raises(ValueError):
+        histogram.WindowedHistogram(window=window, num_slices=num_slices)
+
+
+def test_windowed_empty():
+    histo, _ = make_windowed()
+    assert len(histo) == 0
+    assert histo.max == 600
+    assert histo.min == 10
+    assert histo.percentile(99) == 10
+    assert 10 not in histo
+
+
+def test_windowed_add_and_limits():
+    histo, _ = make_windowed()
+    histo.add(60)
+    histo.add(60.7)
+    histo.add(5)
+    histo.add(12000)
+
+    assert len(histo) == 4
+    assert 60 in histo
+    assert 10 in histo
+    assert 600 in histo
+    assert 5 not in histo
+    assert 12000 not in histo
+    assert histo.min == 10
+    assert histo.max == 600
+
+
+def test_windowed_repr():
+    histo, _ = make_windowed()
+    histo.add(20)
+    histo.add(30)
+    assert repr(histo) == "<WindowedHistogram: 2 values between 20 and 30>"
+
+
+def test_windowed_percentile():
+    histo, _ = make_windowed()
+    [histo.add(i) for i in range(101, 201)]
+    assert histo.percentile(100) == 200
+    assert histo.percentile(101) == 200
+    assert histo.percentile(99) == 199
+    assert histo.percentile(1) == 101
+
+
+def test_windowed_percentile_matches_histogram():
+    histo, _ = make_windowed()
+    reference = histogram.Histogram()
+    for i in range(1000):
+        value = (i * 37) % 700
+        histo.add(value)
+        reference.add(value)
+
+    for percent in (1, 50, 90, 99, 99.9, 100):
+        assert histo.percentile(percent) == reference.percentile(percent)
+
+
+def test_windowed_percentile_cache_invalidated():
+    histo, _ = make_windowed()
+    histo.add(20)
+    assert histo.percentile(99) == 20
+    histo.add(300)
+    assert histo.percentile(99) == 300
+    assert histo.percentile(1) == 20
+
+
+def test_windowed_old_values_age_out():
+    histo, clock = make_windowed(window=60, num_slices=6)
+    histo.add(500)
+
+    clock.return_value += 30
+    [histo.add(20) for _ in range(10)]
+    assert histo.percentile(99) == 500
+
+    # The slice with the old value falls out of the window, even if no new
+    # value is added.
+    clock.return_value += 35
+    assert len(histo) == 10
+    assert 500 not in histo
+    assert histo.percentile(99) == 20
+
+    histo.add(20)
+    assert len(histo) == 11
+    assert 500 not in histo
+    assert histo.percentile(99) == 20
+    assert histo.max == 20
+
+
+def test_windowed_stale():
+    histo, clock = make_windowed(window=60, num_slices=6)
+    histo.add(500)
+
+    clock.return_value += 60
+    assert len(histo) == 0
+    assert 500 not in histo
+    assert histo.percentile(99) == 10
+
+    histo.add(30)
+    assert len(histo) == 1
+    assert histo.percentile(99) == 30
+
+
+def test_windowed_percentile_cache_invalidated_by_expiry():
+    histo, clock = make_windowed(window=60, num_slices=6)
+    histo.add(500)
+    clock.return_value += 30
+    histo.add(20)
+    assert histo.percentile(99) == 500
+
+    clock.return_value += 35
+    assert histo.percentile(99) == 20
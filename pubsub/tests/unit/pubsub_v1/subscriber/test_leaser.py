@@ -14,8 +14,13 @@
 
 import logging
 import threading
+import time
 
+from six.moves import queue
+
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import message
 from google.cloud.pubsub_v1.subscriber._protocol import dispatcher
 from google.cloud.pubsub_v1.subscriber._protocol import histogram
 from google.cloud.pubsub_v1.subscriber._protocol import leaser
@@ -26,8 +31,19 @@ import mock
 import pytest
 
 
+def create_manager(flow_control=types.FlowControl()):
+    manager = mock.create_autospec(
+        streaming_pull_manager.StreamingPullManager, instance=True
+    )
+    manager.dispatcher = mock.create_autospec(dispatcher.Dispatcher, instance=True)
+    manager.is_active = True
+    manager.flow_control = flow_control
+    manager.ack_histogram = histogram.Histogram()
+    return manager
+
+
 def test_add_and_remove():
-    leaser_ = leaser.Leaser(mock.sentinel.manager)
+    leaser_ = leaser.Leaser(create_manager())
 
     leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
     leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=25)])
@@ -46,7 +62,7 @@ def test_add_and_remove():
 def test_add_already_managed(caplog):
     caplog.set_level(logging.DEBUG)
 
-    leaser_ = leaser.Leaser(mock.sentinel.manager)
+    leaser_ = leaser.Leaser(create_manager())
 
     leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
     leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
@@ -64,27 +80,38 @@ def test_remove_not_managed(caplog):
     assert "not managed" in caplog.text
 
 
-def test_remove_negative_bytes(caplog):
-    caplog.set_level(logging.DEBUG)
-
-    leaser_ = leaser.Leaser(mock.sentinel.manager)
+def test_remove_subtracts_leased_size():
+    leaser_ = leaser.Leaser(create_manager())
 
     leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=25)])
     leaser_.remove([requests.DropRequest(ack_id="ack1", byte_size=75)])
 
-    assert leaser_.bytes == 0
-    assert "unexpectedly negative" in caplog.text
+    assert leaser_.bytes == 25
 
 
-def create_manager(flow_control=types.FlowControl()):
-    manager = mock.create_autospec(
-        streaming_pull_manager.StreamingPullManager, instance=True
-    )
-    manager.dispatcher = mock.create_autospec(dispatcher.Dispatcher, instance=True)
-    manager.is_active = True
-    manager.flow_control = flow_control
-    manager.ack_histogram = histogram.Histogram()
-    return manager
+def test_remove_decompressed_message():
+    leaser_ = leaser.Leaser(create_manager())
+    request_queue = queue.Queue()
+    messages = []
+    for index in range(3):
+        compressed, attributes = compression.compress(
+            b"spam" * 1000, {}, types.CompressionSettings(codec="gzip", min_bytes=0)
+        )
+        msg = message.Message(
+            types.PubsubMessage(data=compressed, attributes=attributes),
+            "ack{}".format(index),
+            request_queue,
+        )
+        leaser_.add([requests.LeaseRequest(ack_id=msg.ack_id, byte_size=msg.size)])
+        messages.append(msg)
+
+    streaming_pull_manager._decompress_then_call(lambda msg: msg.ack(), messages[0])
+    leaser_.remove([request_queue.get_nowait()])
+
+    assert messages[0].data == b"spam" * 1000
+    assert leaser_.message_count == 2
+    assert leaser_.bytes == messages[1].size + messages[2].size
 
 
 def test_maintain_leases_inactive(caplog):
@@ -118,15 +145,19 @@ def make_sleep_mark_manager_as_inactive(leaser):
         assert 0 < timeout < 10
         leaser._manager.is_active = False
 
-    leaser._stop_event.wait = trigger_inactive
+    leaser._wakeup.wait = trigger_inactive
 
 
-def test_maintain_leases_ack_ids():
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_ack_ids(time):
     manager = create_manager()
     leaser_ = leaser.Leaser(manager)
     make_sleep_mark_manager_as_inactive(leaser_)
+    time.return_value = 100
     leaser_.add([requests.LeaseRequest(ack_id="my ack id", byte_size=50)])
 
+    # The lease is renewed once it is about to expire.
+    time.return_value = 105
     leaser_.maintain_leases()
 
     manager.dispatcher.modify_ack_deadline.assert_called_once_with(
@@ -154,8 +185,9 @@ def test_maintain_leases_outdated_items(time):
     time.return_value = 0
     leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
 
-    # Add another item at towards end of the timeline
-    time.return_value = manager.flow_control.max_lease_duration - 1
+    # Add another item at towards end of the timeline, so that its lease is
+    # about to expire
+    time.return_value = manager.flow_control.max_lease_duration - 5
     leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
 
     # Now make sure time reports that we are at the end of our timeline.
@@ -172,6 +204,125 @@ def test_maintain_leases_outdated_items(time):
     )
 
 
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_renews_expiring_leases_only(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+
+    time.return_value = 100
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    time.return_value = 104
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+
+    # The lease of ack1 expires in 5 seconds, the lease of ack2 in 9 seconds.
+    time.return_value = 105
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack1", seconds=10)]
+    )
+    assert leaser_._leased_messages["ack1"].deadline == 115
+    assert leaser_._leased_messages["ack2"].deadline == 114
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_skips_removed_leases(time):
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    make_sleep_mark_manager_as_inactive(leaser_)
+
+    time.return_value = 100
+    leaser_.add(
+        [
+            requests.LeaseRequest(ack_id="ack1", byte_size=50),
+            requests.LeaseRequest(ack_id="ack2", byte_size=50),
+        ]
+    )
+    leaser_.remove([requests.DropRequest(ack_id="ack1", byte_size=50)])
+
+    time.return_value = 105
+    leaser_.maintain_leases()
+
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack2", seconds=10)]
+    )
+    assert leaser_._deadlines == [(115, "ack2")]
+
+
+@mock.patch("time.time", autospec=True)
+def test_maintain_leases_snooze_until_next_expiration(time):
+    manager = create_manager()
+    manager.ack_histogram.add(100)
+    leaser_ = leaser.Leaser(manager)
+
+    time.return_value = 0
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    time.return_value = 30
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+
+    snoozes = []
+
+    def wait(timeout):
+        snoozes.append(timeout)
+        manager.is_active = False
+
+    leaser_._wakeup.wait = wait
+    time.return_value = 40
+    leaser_.maintain_leases()
+
+    # ack1 (expiring at 100) is renewed, and ack2 (expiring at 130) should be
+    # renewed once it expires within 50 seconds.
+    manager.dispatcher.modify_ack_deadline.assert_called_once_with(
+        [requests.ModAckRequest(ack_id="ack1", seconds=100)]
+    )
+    assert len(snoozes) == 1
+    assert 40 * 0.9 <= snoozes[0] <= 40
+
+
+def test_add_wakes_up_lease_maintenance():
+    manager = create_manager()
+    leaser_ = leaser.Leaser(manager)
+    leaser_._wakeup = mock.create_autospec(threading.Condition, instance=True)
+
+    leaser_._next_wakeup = time.time() + 60
+    leaser_.add([requests.LeaseRequest(ack_id="ack1", byte_size=50)])
+    leaser_._wakeup.notify.assert_called_once()
+
+    leaser_._wakeup.notify.reset_mock()
+    leaser_._next_wakeup = time.time() + 1
+    leaser_.add([requests.LeaseRequest(ack_id="ack2", byte_size=50)])
+    leaser_._wakeup.notify.assert_not_called()
+
+
+def test_remove_compacts_deadlines():
+    leaser_ = leaser.Leaser(create_manager())
+
+    leaser_.add(
+        [requests.LeaseRequest(ack_id=str(i), byte_size=1) for i in range(1000)]
+    )
+    leaser_.remove(
+        [requests.DropRequest(ack_id=str(i), byte_size=1) for i in range(900)]
+    )
+
+    assert leaser_.message_count == 100
+    assert len(leaser_._deadlines) <= 2 * 100 + 100
+    assert set(ack_id for _, ack_id in leaser_._deadlines) == set(leaser_.ack_ids)
+
+
+def test_stop_wakes_up_lease_maintenance():
+    manager = create_manager()
+    manager.ack_histogram.add(600)
+    leaser_ = leaser.Leaser(manager)
+    leaser_.start()
+
+    started = time.time()
+    leaser_.stop()
+
+    assert time.time() - started < 5
+    assert leaser_._thread is None
+
+
 @mock.patch("threading.Thread", autospec=True)
 def test_start(thread):
     manager = mock.create_autospec(
@@ -0,0 +1,151 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import datetime
+
+import mock
+from six.moves import queue
+from google.protobuf import timestamp_pb2
+
+from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import message
+from google.cloud.pubsub_v1.subscriber import process_pool
+from google.cloud.pubsub_v1.subscriber._protocol import requests
+from google.cloud.pubsub_v1.subscriber._protocol import streaming_pull_manager
+
+
+def create_message(data, ack_id="ACKID", **attrs):
+    return message.Message(
+        types.PubsubMessage(
+            attributes=attrs,
+            data=data,
+            message_id="message_id",
+            publish_time=timestamp_pb2.Timestamp(seconds=1000, nanos=0),
+        ),
+        ack_id,
+        queue.Queue(),
+    )
+
+
+def create_executor():
+    executor = mock.create_autospec(
+        concurrent.futures.ProcessPoolExecutor, instance=True
+    )
+    executor.submit.return_value = concurrent.futures.Future()
+    return executor
+
+
+def test_constructor_defaults():
+    callback = process_pool.ProcessPoolCallback(len, max_workers=2)
+
+    assert isinstance(callback._executor, concurrent.futures.ProcessPoolExecutor)
+    callback.shutdown()
+
+
+def test_call_submits_payload():
+    executor = create_executor()
+    callback = process_pool.ProcessPoolCallback(mock.sentinel.target, executor=executor)
+    msg = create_message(b"foo", spam="eggs")
+
+    future = callback(msg)
+
+    assert future is executor.submit.return_value
+    executor.submit.assert_called_once_with(
+        mock.sentinel.target,
+        process_pool.MessagePayload(
+            message_id="message_id",
+            data=b"foo",
+            attributes={"spam": "eggs"},
+            publish_time=msg.publish_time,
+        ),
+    )
+    assert isinstance(executor.submit.call_args[0][1].attributes, dict)
+    assert isinstance(msg.publish_time, datetime.datetime)
+
+
+def test_ack_on_success():
+    executor = create_executor()
+    callback = process_pool.ProcessPoolCallback(mock.sentinel.target, executor=executor)
+    msg = create_message(b"foo")
+
+    future = callback(msg)
+    assert msg._request_queue.empty()
+    future.set_result(None)
+
+    request = msg._request_queue.get(block=False)
+    assert isinstance(request, requests.AckRequest)
+    assert request.ack_id == "ACKID"
+
+
+def test_no_ack_on_failure():
+    executor = create_executor()
+    callback = process_pool.ProcessPoolCallback(mock.sentinel.target, executor=executor)
+    msg = create_message(b"foo")
+
+    future = callback(msg)
+    future.set_exception(ValueError("meep"))
+
+    # The failures are handled by the streaming pull manager.
+    assert msg._request_queue.empty()
+
+
+def test_no_ack_on_cancel():
+    executor = create_executor()
+    callback = process_pool.ProcessPoolCallback(mock.sentinel.target, executor=executor)
+    msg = create_message(b"foo")
+
+    future = callback(msg)
+    future.cancel()
+
+    assert msg._request_queue.empty()
+
+
+def test_shutdown():
+    executor = create_executor()
+    callback = process_pool.ProcessPoolCallback(mock.sentinel.target, executor=executor)
+
+    callback.shutdown(wait=False)
+
+    executor.shutdown.assert_called_once_with(wait=False)
+
+
+def test_failure_nacks_and_reports_error():
+    executor = create_executor()
+    callback = process_pool.ProcessPoolCallback(mock.sentinel.target, executor=executor)
+    msg = create_message(b"foo")
+    on_callback_error = mock.Mock()
+    error = ValueError("meep")
+
+    streaming_pull_manager._wrap_callback_errors(callback, on_callback_error, msg)
+    executor.submit.return_value.set_exception(error)
+
+    request = msg._request_queue.get(block=False)
+    assert isinstance(request, requests.NackRequest)
+    on_callback_error.assert_called_once_with(error)
+
+
+def test_worker_processes():
+    # Builtins can be pickled and sent to the worker processes.
+    callback = process_pool.ProcessPoolCallback(len, max_workers=1)
+    msg = create_message(b"foo")
+
+    try:
+        result = callback(msg).result(timeout=30)
+    finally:
+        callback.shutdown()
+
+    assert result == 4  # the number of the payload fields
+    request = msg._request_queue.get(timeout=5)
+    assert isinstance(request, requests.AckRequest)
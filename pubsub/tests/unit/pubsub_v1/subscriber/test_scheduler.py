@@ -13,11 +13,19 @@
 # limitations under the License.
 
 import concurrent.futures
+import sys
 import threading
+import time
 
 import mock
+import pytest
 from six.moves import queue
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
 from google.cloud.pubsub_v1.subscriber import scheduler
 
 
@@ -54,3 +62,239 @@ def test_schedule():
     scheduler_.shutdown()
 
     assert called_with == [(("arg1",), {"kwarg1": "meep"})]
+
+
+requires_asyncio = pytest.mark.skipif(
+    sys.version_info < (3, 5), reason="requires asyncio"
+)
+
+
+@requires_asyncio
+def test_asyncio_scheduler_subclasses_base_abc():
+    assert issubclass(scheduler.AsyncioScheduler, scheduler.Scheduler)
+
+
+@requires_asyncio
+def test_asyncio_scheduler_constructor():
+    loop = asyncio.new_event_loop()
+    scheduler_ = scheduler.AsyncioScheduler(loop=loop)
+
+    assert isinstance(scheduler_.queue, queue.Queue)
+    assert scheduler_.loop is loop
+    loop.close()
+
+
+@requires_asyncio
+def test_asyncio_scheduler_schedule():
+    loop = asyncio.new_event_loop()
+    scheduler_ = scheduler.AsyncioScheduler(loop=loop)
+    called_with = []
+
+    def callback(*args, **kwargs):
+        called_with.append((threading.current_thread(), args, kwargs))
+
+    # Schedule the callbacks from a different thread, as the streaming pull
+    # does.
+    thread = threading.Thread(
+        target=lambda: [
+            scheduler_.schedule(callback, "arg{}".format(i), kwarg1="meep")
+            for i in range(3)
+        ]
+    )
+    thread.start()
+    thread.join()
+
+    with mock.patch.object(
+        loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+    ) as call_soon_threadsafe:
+        scheduler_.schedule(callback, "arg3", kwarg1="meep")
+
+    loop.run_until_complete(asyncio.sleep(0.01))
+    scheduler_.shutdown()
+    loop.close()
+
+    # All the callbacks were run in the event loop thread.
+    assert called_with == [
+        (threading.current_thread(), ("arg{}".format(i),), {"kwarg1": "meep"})
+        for i in range(4)
+    ]
+    # The loop was already going to be woken up for the last callback.
+    call_soon_threadsafe.assert_not_called()
+
+
+@requires_asyncio
+def test_asyncio_scheduler_shutdown_drops_pending_callbacks():
+    loop = asyncio.new_event_loop()
+    scheduler_ = scheduler.AsyncioScheduler(loop=loop)
+    callback = mock.Mock()
+
+    scheduler_.schedule(callback, "arg1")
+    scheduler_.shutdown()
+    loop.run_until_complete(asyncio.sleep(0.01))
+    loop.close()
+
+    callback.assert_not_called()
+
+
+def make_message(ordering_key=None):
+    attributes = {}
+    if ordering_key is not None:
+        attributes["key"] = ordering_key
+    return mock.Mock(attributes=attributes, spec=["attributes"])
+
+
+def test_ordered_key_scheduler_subclasses_base_abc():
+    assert issubclass(scheduler.OrderedKeyScheduler, scheduler.Scheduler)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"key_attribute": "key", "num_lanes": 0}],
+)
+def test_ordered_key_scheduler_constructor_invalid(kwargs):
+    with pytest.raises(ValueError):
+        scheduler.OrderedKeyScheduler(**kwargs)
+
+
+def test_ordered_key_scheduler_constructor():
+    scheduler_ = scheduler.OrderedKeyScheduler(
+        key_attribute="key", executor=mock.sentinel.executor
+    )
+
+    assert isinstance(scheduler_.queue, queue.Queue)
+    assert scheduler_._executor == mock.sentinel.executor
+
+
+def test_ordered_key_scheduler_preserves_order_per_key():
+    calls = []
+    calls_lock = threading.Lock()
+    done = threading.Event()
+
+    def callback(message, index):
+        # Give the other callbacks a chance to overtake this one.
+        time.sleep(0.001 * (index % 3))
+        with calls_lock:
+            calls.append((message.attributes["key"], index))
+            if len(calls) == 60:
+                done.set()
+
+    scheduler_ = scheduler.OrderedKeyScheduler(key_attribute="key", num_lanes=4)
+    for index in range(60):
+        scheduler_.schedule(callback, make_message("key-{}".format(index % 6)), index)
+
+    assert done.wait(timeout=5)
+    scheduler_.shutdown()
+
+    for key_index in range(6):
+        key = "key-{}".format(key_index)
+        indexes = [index for call_key, index in calls if call_key == key]
+        assert indexes == list(range(key_index, 60, 6))
+
+
+def test_ordered_key_scheduler_runs_lanes_in_parallel():
+    started = {"a": threading.Event(), "b": threading.Event()}
+    results = []
+
+    def callback(message):
+        # Both callbacks must be running at the same time to see each other.
+        key = message.attributes["key"]
+        started[key].set()
+        other = "b" if key == "a" else "a"
+        assert started[other].wait(timeout=5)
+        results.append(key)
+
+    scheduler_ = scheduler.OrderedKeyScheduler(
+        key=lambda message: message.attributes["key"]
+    )
+    with mock.patch.object(scheduler_, "_lane_index", side_effect=[0, 1]):
+        scheduler_.schedule(callback, make_message("a"))
+        scheduler_.schedule(callback, make_message("b"))
+    scheduler_.shutdown()
+
+    assert sorted(results) == ["a", "b"]
+
+
+def test_ordered_key_scheduler_releases_drained_lanes():
+    executor = mock.create_autospec(
+        concurrent.futures.ThreadPoolExecutor, instance=True
+    )
+    # Run the submitted functions inline.
+    executor.submit.side_effect = lambda fn, *args, **kwargs: fn(*args, **kwargs)
+    scheduler_ = scheduler.OrderedKeyScheduler(key_attribute="key", executor=executor)
+    callback = mock.Mock()
+    message = make_message("a")
+
+    scheduler_.schedule(callback, message)
+
+    callback.assert_called_once_with(message)
+    assert scheduler_._lanes == {}
+
+
+def test_ordered_key_scheduler_unordered_messages():
+    executor = mock.create_autospec(
+        concurrent.futures.ThreadPoolExecutor, instance=True
+    )
+    scheduler_ = scheduler.OrderedKeyScheduler(key_attribute="key", executor=executor)
+    message = make_message()
+
+    scheduler_.schedule(mock.sentinel.callback, message, kwarg1="meep")
+
+    executor.submit.assert_called_once_with(
+        mock.sentinel.callback, message, kwarg1="meep"
+    )
+    assert scheduler_._lanes == {}
+
+
+@pytest.mark.parametrize(
+    "key", [mock.Mock(side_effect=ValueError("boom")), lambda message: []]
+)
+def test_ordered_key_scheduler_key_error(key):
+    executor = mock.create_autospec(
+        concurrent.futures.ThreadPoolExecutor, instance=True
+    )
+    scheduler_ = scheduler.OrderedKeyScheduler(key=key, executor=executor)
+    message = make_message()
+
+    with mock.patch.object(scheduler._LOGGER, "exception") as log_exception:
+        scheduler_.schedule(mock.sentinel.callback, message)
+
+    # The message is scheduled without ordering.
+    log_exception.assert_called_once()
+    executor.submit.assert_called_once_with(mock.sentinel.callback, message)
+    assert scheduler_._lanes == {}
+
+
+def test_ordered_key_scheduler_does_not_block_on_busy_lane():
+    executor = mock.create_autospec(
+        concurrent.futures.ThreadPoolExecutor, instance=True
+    )
+    scheduler_ = scheduler.OrderedKeyScheduler(key_attribute="key", executor=executor)
+
+    callback = mock.Mock()
+
+    scheduler_.schedule(callback, make_message("a"))
+    scheduler_.schedule(callback, make_message("a"))
+
+    # The lane is only submitted once, the second callback waits in the lane.
+    executor.submit.assert_called_once_with(scheduler_._run_lane, mock.ANY)
+    (lane,) = scheduler_._lanes.values()
+    assert lane.running
+    assert len(lane.pending) == 2
+
+
+def test_ordered_key_scheduler_shutdown_drops_pending_callbacks():
+    executor = mock.create_autospec(
+        concurrent.futures.ThreadPoolExecutor, instance=True
+    )
+    executor._work_queue = queue.Queue()
+    executor._work_queue.put(mock.sentinel.work_item)
+    scheduler_ = scheduler.OrderedKeyScheduler(key_attribute="key", executor=executor)
+    callback = mock.Mock()
+
+    scheduler_.schedule(callback, make_message("a"))
+    scheduler_.shutdown()
+    (index,) = [call[0][1] for call in executor.submit.call_args_list]
+    scheduler_._run_lane(index)
+
+    callback.assert_not_called()
+    assert executor._work_queue.empty()
+    executor.shutdown.assert_called_once()
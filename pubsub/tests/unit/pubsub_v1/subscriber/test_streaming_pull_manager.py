@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+import sys
 import threading
 import time
 import types as stdlib_types
@@ -21,8 +22,14 @@ import mock
 import pytest
 from six.moves import queue
 
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
 from google.api_core import bidi
 from google.api_core import exceptions
+from google.cloud.pubsub_v1 import compression
 from google.cloud.pubsub_v1 import types
 from google.cloud.pubsub_v1.gapic import subscriber_client_config
 from google.cloud.pubsub_v1.subscriber import client
@@ -77,6 +84,83 @@ def test__wrap_callback_errors_error():
     on_callback_error.assert_called_once_with(callback_error)
 
 
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__wrap_callback_errors_awaitable_no_error():
+    loop = asyncio.new_event_loop()
+    msg = mock.create_autospec(message.Message, instance=True)
+    awaitable = loop.create_future()
+    awaitable.set_result(None)
+    callback = mock.Mock(return_value=awaitable)
+    on_callback_error = mock.Mock()
+
+    loop.call_soon(
+        streaming_pull_manager._wrap_callback_errors, callback, on_callback_error, msg
+    )
+    loop.run_until_complete(asyncio.sleep(0.01))
+    loop.close()
+
+    callback.assert_called_once_with(msg)
+    msg.nack.assert_not_called()
+    on_callback_error.assert_not_called()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__wrap_callback_errors_awaitable_error():
+    callback_error = ValueError("meep")
+
+    loop = asyncio.new_event_loop()
+    msg = mock.create_autospec(message.Message, instance=True)
+    awaitable = loop.create_future()
+    awaitable.set_exception(callback_error)
+    callback = mock.Mock(return_value=awaitable)
+    on_callback_error = mock.Mock()
+
+    loop.call_soon(
+        streaming_pull_manager._wrap_callback_errors, callback, on_callback_error, msg
+    )
+    loop.run_until_complete(asyncio.sleep(0.01))
+    loop.close()
+
+    msg.nack.assert_called_once()
+    on_callback_error.assert_called_once_with(callback_error)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test__wrap_callback_errors_awaitable_outside_event_loop():
+    msg = mock.create_autospec(message.Message, instance=True)
+    callback = mock.Mock(return_value=asyncio.sleep(0))
+    on_callback_error = mock.Mock()
+
+    streaming_pull_manager._wrap_callback_errors(callback, on_callback_error, msg)
+
+    msg.nack.assert_called_once()
+    on_callback_error.assert_called_once()
+    assert isinstance(on_callback_error.call_args[0][0], RuntimeError)
+
+
+def make_compressed_message(data):
+    compressed, attributes = compression.compress(
+        data, {"foo": "bar"}, types.CompressionSettings(codec="gzip", min_bytes=0)
+    )
+    return message.Message(
+        types.PubsubMessage(data=compressed, attributes=attributes),
+        "ack_id",
+        mock.sentinel.queue,
+    )
+
+
+def test__decompress_then_call():
+    msg = make_compressed_message(b"spam" * 100)
+    callback = mock.Mock(return_value=mock.sentinel.result)
+
+    result = streaming_pull_manager._decompress_then_call(callback, msg)
+
+    assert result is mock.sentinel.result
+    callback.assert_called_once_with(msg)
+    assert msg.data == b"spam" * 100
+    assert dict(msg.attributes) == {"foo": "bar"}
+
+
 def test_constructor_and_default_state():
     manager = streaming_pull_manager.StreamingPullManager(
         mock.sentinel.client, mock.sentinel.subscription
@@ -90,6 +174,8 @@ def test_constructor_and_default_state():
     assert manager.ack_histogram is not None
     assert manager.ack_deadline == 10
     assert manager.load == 0
+    assert manager.num_streams == 1
+    assert not manager._decompress
 
     # Private state
     assert manager._client == mock.sentinel.client
@@ -103,10 +189,19 @@ def test_constructor_with_options():
         mock.sentinel.subscription,
         flow_control=mock.sentinel.flow_control,
         scheduler=mock.sentinel.scheduler,
+        ack_histogram=mock.sentinel.ack_histogram,
     )
 
     assert manager.flow_control == mock.sentinel.flow_control
     assert manager._scheduler == mock.sentinel.scheduler
+    assert manager.ack_histogram == mock.sentinel.ack_histogram
+
+
+def test_constructor_invalid_num_streams():
+    with pytest.raises(ValueError):
+        streaming_pull_manager.StreamingPullManager(
+            mock.sentinel.client, mock.sentinel.subscription, num_streams=0
+        )
 
 
 def make_manager(**kwargs):
@@ -212,6 +307,46 @@ def test_drop_and_resume():
     manager._consumer.resume.assert_called_once()
 
 
+def add_extra_streams(manager, count, is_paused=False):
+    streams = []
+    for _ in range(count):
+        consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+        consumer.is_paused = is_paused
+        consumer.is_active = True
+        rpc = mock.create_autospec(bidi.ResumableBidiRpc, instance=True)
+        rpc.is_active = True
+        streams.append(streaming_pull_manager._Stream(rpc, consumer))
+    manager._extra_streams = streams
+    return streams
+
+
+def test_pause_and_resume_all_streams():
+    manager = make_manager(
+        flow_control=types.FlowControl(max_messages=10, max_bytes=1000)
+    )
+    manager._leaser = leaser.Leaser(manager)
+    manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
+    manager._consumer.is_paused = False
+    streams = add_extra_streams(manager, 2)
+
+    manager.leaser.add([requests.LeaseRequest(ack_id="one", byte_size=1000)])
+    manager.maybe_pause_consumer()
+
+    manager._consumer.pause.assert_called_once()
+    for stream in streams:
+        stream.consumer.pause.assert_called_once()
+
+    manager._consumer.is_paused = True
+    for stream in streams:
+        stream.consumer.is_paused = True
+    manager.leaser.remove([requests.DropRequest(ack_id="one", byte_size=1000)])
+    manager.maybe_resume_consumer()
+
+    manager._consumer.resume.assert_called_once()
+    for stream in streams:
+        stream.consumer.resume.assert_called_once()
+
+
 def test_resume_not_paused():
     manager = make_manager()
     manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
@@ -409,6 +544,20 @@ def test_heartbeat():
     manager._rpc.send.assert_called_once_with(types.StreamingPullRequest())
 
 
+def test_heartbeat_all_streams():
+    manager = make_manager()
+    manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
+    manager._rpc.is_active = True
+    streams = add_extra_streams(manager, 2)
+    streams[1].rpc.is_active = False
+
+    manager.heartbeat()
+
+    manager._rpc.send.assert_called_once_with(types.StreamingPullRequest())
+    streams[0].rpc.send.assert_called_once_with(types.StreamingPullRequest())
+    streams[1].rpc.send.assert_not_called()
+
+
 def test_heartbeat_inactive():
     manager = make_manager()
     manager._rpc = mock.create_autospec(bidi.BidiRpc, instance=True)
@@ -437,7 +586,11 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     heartbeater.return_value.start.assert_called_once()
     assert manager._heartbeater == heartbeater.return_value
 
-    dispatcher.assert_called_once_with(manager, manager._scheduler.queue)
+    dispatcher.assert_called_once_with(
+        manager,
+        manager._scheduler.queue,
+        ack_batch_settings=manager._ack_batch_settings,
+    )
     dispatcher.return_value.start.assert_called_once()
     assert manager._dispatcher == dispatcher.return_value
 
@@ -470,6 +623,84 @@ def test_open(heartbeater, dispatcher, leaser, background_consumer, resumable_bi
     assert manager.is_active is True
 
 
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_w_decompress(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc
+):
+    manager = make_manager(decompress=True)
+    callback = mock.Mock()
+    on_callback_error = mock.Mock()
+
+    manager.open(callback, on_callback_error)
+
+    msg = make_compressed_message(b"spam" * 100)
+    manager._callback(msg)
+    callback.assert_called_once_with(msg)
+    assert msg.data == b"spam" * 100
+
+    # Decompression errors are handled like the errors of the callback.
+    msg = message.Message(
+        types.PubsubMessage(
+            data=b"spam", attributes={compression.ENCODING_ATTRIBUTE: "brotli"}
+        ),
+        "ack_id",
+        mock.sentinel.queue,
+    )
+    with mock.patch.object(msg, "nack", autospec=True) as nack:
+        manager._callback(msg)
+
+    assert callback.call_count == 1
+    nack.assert_called_once_with()
+    on_callback_error.assert_called_once()
+    assert isinstance(on_callback_error.call_args[0][0], ValueError)
+
+
+@mock.patch("google.api_core.bidi.ResumableBidiRpc", autospec=True)
+@mock.patch("google.api_core.bidi.BackgroundConsumer", autospec=True)
+@mock.patch("google.cloud.pubsub_v1.subscriber._protocol.leaser.Leaser", autospec=True)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.dispatcher.Dispatcher", autospec=True
+)
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.heartbeater.Heartbeater", autospec=True
+)
+def test_open_multiple_streams(
+    heartbeater, dispatcher, leaser, background_consumer, resumable_bidi_rpc
+):
+    manager = make_manager(num_streams=3)
+
+    manager.open(mock.sentinel.callback, mock.sentinel.on_callback_error)
+
+    # The streams share a single leaser, dispatcher and heartbeater.
+    leaser.assert_called_once_with(manager)
+    dispatcher.assert_called_once()
+    heartbeater.assert_called_once_with(manager)
+
+    assert resumable_bidi_rpc.call_count == 3
+    initial_requests = [
+        call.kwargs["initial_request"] for call in resumable_bidi_rpc.call_args_list
+    ]
+    assert all(
+        request.func == manager._get_initial_request for request in initial_requests
+    )
+    assert resumable_bidi_rpc.return_value.add_done_callback.call_count == 3
+
+    assert background_consumer.call_count == 3
+    background_consumer.assert_called_with(
+        resumable_bidi_rpc.return_value, manager._on_response
+    )
+    assert background_consumer.return_value.start.call_count == 3
+    assert len(manager._extra_streams) == 2
+
+
 def test_open_already_active():
     manager = make_manager()
     manager._consumer = mock.create_autospec(bidi.BackgroundConsumer, instance=True)
@@ -536,6 +767,19 @@ def test_close_inactive_consumer():
     scheduler.shutdown.assert_called_once()
 
 
+def test_close_multiple_streams():
+    manager, consumer, _, _, _, _ = make_running_manager()
+    streams = add_extra_streams(manager, 2)
+    streams[1].consumer.is_active = False
+
+    manager.close()
+
+    consumer.stop.assert_called_once()
+    streams[0].consumer.stop.assert_called_once()
+    streams[1].consumer.stop.assert_not_called()
+    assert manager._extra_streams == []
+
+
 def test_close_idempotent():
     manager, _, _, _, _, scheduler = make_running_manager()
 
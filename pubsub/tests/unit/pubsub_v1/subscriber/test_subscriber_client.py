@@ -12,13 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 from google.auth import credentials
 import mock
+import pytest
 
 from google.cloud.pubsub_v1 import subscriber
 from google.cloud.pubsub_v1.gapic import subscriber_client
 from google.cloud.pubsub_v1 import types
+from google.cloud.pubsub_v1.subscriber import async_iterator
 from google.cloud.pubsub_v1.subscriber import futures
+from google.cloud.pubsub_v1.subscriber import scheduler
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
 
 
 def test_init():
@@ -89,20 +99,58 @@ def test_subscribe_options(manager_open):
     client = subscriber.Client(credentials=creds)
     flow_control = types.FlowControl(max_bytes=42)
     scheduler = mock.sentinel.scheduler
+    ack_batch_settings = types.AckBatchSettings(max_latency=0.1)
 
     future = client.subscribe(
         "sub_name_a",
         callback=mock.sentinel.callback,
         flow_control=flow_control,
         scheduler=scheduler,
+        ack_batch_settings=ack_batch_settings,
+        ack_histogram=mock.sentinel.ack_histogram,
+        num_streams=3,
+        decompress=True,
     )
     assert isinstance(future, futures.StreamingPullFuture)
 
     assert future._manager._subscription == "sub_name_a"
     assert future._manager.flow_control == flow_control
     assert future._manager._scheduler == scheduler
+    assert future._manager._ack_batch_settings == ack_batch_settings
+    assert future._manager.ack_histogram == mock.sentinel.ack_histogram
+    assert future._manager.num_streams == 3
+    assert future._manager._decompress
     manager_open.assert_called_once_with(
         mock.ANY,
         callback=mock.sentinel.callback,
         on_callback_error=future.set_exception,
     )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+@mock.patch(
+    "google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager."
+    "StreamingPullManager.open",
+    autospec=True,
+)
+def test_subscribe_iter(manager_open):
+    creds = mock.Mock(spec=credentials.Credentials)
+    client = subscriber.Client(credentials=creds)
+    flow_control = types.FlowControl(max_bytes=42)
+    loop = asyncio.new_event_loop()
+
+    iterator = client.subscribe_iter("sub_name_a", flow_control=flow_control, loop=loop)
+    loop.close()
+
+    assert isinstance(iterator, async_iterator.AsyncMessageIterator)
+    assert isinstance(iterator.future, futures.StreamingPullFuture)
+
+    manager = iterator.future._manager
+    assert manager._subscription == "sub_name_a"
+    assert manager.flow_control == flow_control
+    assert isinstance(manager._scheduler, scheduler.AsyncioScheduler)
+    manager_open.assert_called_once_with(
+        mock.ANY,
+        callback=iterator._on_message,
+        on_callback_error=iterator.future.set_exception,
+    )
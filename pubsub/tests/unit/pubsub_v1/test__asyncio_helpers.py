@@ -0,0 +1,154 @@
+# Copyright 2020, Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import _asyncio_helpers
+from google.cloud.pubsub_v1 import futures
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_get_event_loop_explicit(loop):
+    assert _asyncio_helpers.get_event_loop(loop) is loop
+
+
+def test_is_awaitable(loop):
+    coroutine = asyncio.sleep(0)
+    assert _asyncio_helpers.is_awaitable(coroutine)
+    assert _asyncio_helpers.is_awaitable(loop.create_future())
+    assert not _asyncio_helpers.is_awaitable(None)
+    assert not _asyncio_helpers.is_awaitable(futures.Future())
+    coroutine.close()
+
+
+def test_run_awaitable_no_running_loop():
+    coroutine = asyncio.sleep(0)
+    with pytest.raises(RuntimeError):
+        _asyncio_helpers.run_awaitable(coroutine)
+
+    # The coroutine should have been closed.
+    assert coroutine.cr_frame is None
+
+
+def test_run_awaitable_in_running_loop(loop):
+    results = []
+
+    def run():
+        results.append(_asyncio_helpers.run_awaitable(asyncio.sleep(0, "result")))
+
+    loop.call_soon(run)
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+    assert loop.run_until_complete(results[0]) == "result"
+
+
+def test_loop_bridge_coalesces_wakeups(loop):
+    bridge = _asyncio_helpers.LoopBridge(loop)
+    calls = []
+
+    with mock.patch.object(
+        loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+    ) as call_soon_threadsafe:
+        for i in range(5):
+            bridge.call_soon(calls.append, i)
+        loop.run_until_complete(asyncio.sleep(0))
+        bridge.call_soon(calls.append, 5)
+        loop.run_until_complete(asyncio.sleep(0))
+
+    assert calls == [0, 1, 2, 3, 4, 5]
+    assert call_soon_threadsafe.call_count == 2
+
+
+def test_loop_bridge_callback_error(loop):
+    bridge = _asyncio_helpers.LoopBridge(loop)
+    calls = []
+
+    with mock.patch.object(_asyncio_helpers, "_LOGGER") as logger:
+        bridge.call_soon(mock.Mock(side_effect=ValueError("meep")))
+        bridge.call_soon(calls.append, 1)
+        loop.run_until_complete(asyncio.sleep(0))
+
+    logger.exception.assert_called_once()
+    assert calls == [1]
+
+
+def test_loop_bridge_closed_loop():
+    loop = asyncio.new_event_loop()
+    bridge = _asyncio_helpers.LoopBridge(loop)
+    loop.close()
+
+    callback = mock.Mock()
+    bridge.call_soon(callback)
+
+    callback.assert_not_called()
+    assert not bridge._pending
+    assert not bridge._wakeup_scheduled
+
+
+def test_get_loop_bridge_shared(loop):
+    bridge = _asyncio_helpers.get_loop_bridge(loop)
+    assert _asyncio_helpers.get_loop_bridge(loop) is bridge
+    assert bridge.loop is loop
+
+
+def test_wrap_future_result(loop):
+    future = futures.Future()
+    aio_future = _asyncio_helpers.wrap_future(future, loop=loop)
+    assert not aio_future.done()
+
+    thread = threading.Thread(target=future.set_result, args=("message_id",))
+    thread.start()
+    thread.join()
+
+    assert loop.run_until_complete(aio_future) == "message_id"
+
+
+def test_wrap_future_exception(loop):
+    error = ValueError("meep")
+    future = futures.Future()
+    aio_future = _asyncio_helpers.wrap_future(future, loop=loop)
+    future.set_exception(error)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(aio_future)
+
+
+def test_wrap_future_cancelled(loop):
+    future = futures.Future()
+    aio_future = _asyncio_helpers.wrap_future(future, loop=loop)
+    aio_future.cancel()
+
+    future.set_result("message_id")
+    loop.run_until_complete(asyncio.sleep(0))
+
+    assert aio_future.cancelled()
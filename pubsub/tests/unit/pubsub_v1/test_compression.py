@@ -0,0 +1,135 @@
+# Copyright 2020, Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+import os
+
+import mock
+import pytest
+
+from google.cloud.pubsub_v1 import compression
+from google.cloud.pubsub_v1 import types
+
+
+COMPRESSIBLE_DATA = b"The rain in Wales falls mainly on the snails. " * 100
+
+
+def test_compress_disabled():
+    settings = types.CompressionSettings()
+    attributes = {"foo": "bar"}
+
+    data, attrs = compression.compress(COMPRESSIBLE_DATA, attributes, settings)
+
+    assert data is COMPRESSIBLE_DATA
+    assert attrs is attributes
+
+
+def test_compress_gzip_roundtrip():
+    settings = types.CompressionSettings(codec=types.Compression.GZIP)
+    attributes = {"foo": "bar"}
+
+    data, attrs = compression.compress(COMPRESSIBLE_DATA, attributes, settings)
+
+    assert len(data) < len(COMPRESSIBLE_DATA)
+    assert attrs == {"foo": "bar", compression.ENCODING_ATTRIBUTE: "gzip"}
+    # The caller's attributes must not be modified.
+    assert attributes == {"foo": "bar"}
+
+    message = types.PubsubMessage(data=data, attributes=attrs)
+    assert compression.decompress_message(message) is message
+    assert message.data == COMPRESSIBLE_DATA
+    assert dict(message.attributes) == {"foo": "bar"}
+
+
+def test_compress_codec_name():
+    settings = types.CompressionSettings(codec="gzip", level=9)
+
+    data, attrs = compression.compress(COMPRESSIBLE_DATA, {}, settings)
+
+    assert attrs == {compression.ENCODING_ATTRIBUTE: "gzip"}
+    message = types.PubsubMessage(data=data, attributes=attrs)
+    assert compression.decompress_message(message).data == COMPRESSIBLE_DATA
+
+
+def test_compress_below_min_bytes():
+    settings = types.CompressionSettings(
+        codec=types.Compression.GZIP, min_bytes=len(COMPRESSIBLE_DATA) + 1
+    )
+
+    data, attrs = compression.compress(COMPRESSIBLE_DATA, {}, settings)
+
+    assert data is COMPRESSIBLE_DATA
+    assert attrs == {}
+
+
+def test_compress_incompressible():
+    settings = types.CompressionSettings(codec=types.Compression.GZIP, min_bytes=0)
+    random_data = os.urandom(2048)
+
+    data, attrs = compression.compress(random_data, {}, settings)
+
+    assert data is random_data
+    assert attrs == {}
+
+
+def test_compress_zstd_roundtrip():
+    pytest.importorskip("zstandard")
+    settings = types.CompressionSettings(codec=types.Compression.ZSTD)
+
+    data, attrs = compression.compress(COMPRESSIBLE_DATA, {}, settings)
+
+    assert len(data) < len(COMPRESSIBLE_DATA)
+    assert attrs == {compression.ENCODING_ATTRIBUTE: "zstd"}
+    message = types.PubsubMessage(data=data, attributes=attrs)
+    assert compression.decompress_message(message).data == COMPRESSIBLE_DATA
+
+
+def test_validate_settings():
+    compression.validate_settings(types.CompressionSettings())
+    compression.validate_settings(
+        types.CompressionSettings(codec=types.Compression.GZIP)
+    )
+
+    with pytest.raises(ValueError):
+        compression.validate_settings(types.CompressionSettings(codec="brotli"))
+
+
+def test_validate_settings_zstd_not_installed():
+    settings = types.CompressionSettings(codec=types.Compression.ZSTD)
+
+    with mock.patch.object(compression, "zstandard", new=None):
+        with pytest.raises(ImportError):
+            compression.validate_settings(settings)
+
+
+def test_decompress_message_not_compressed():
+    message = types.PubsubMessage(data=b"foo", attributes={"bar": "baz"})
+
+    assert compression.decompress_message(message) is message
+    assert message.data == b"foo"
+    assert dict(message.attributes) == {"bar": "baz"}
+
+
+def test_decompress_message_unknown_codec():
+    message = types.PubsubMessage(
+        data=b"foo", attributes={compression.ENCODING_ATTRIBUTE: "brotli"}
+    )
+
+    with pytest.raises(ValueError):
+        compression.decompress_message(message)
+
+    # The message is left as it was received.
+    assert message.data == b"foo"
+    assert compression.ENCODING_ATTRIBUTE in message.attributes